@@ -13,15 +13,64 @@ All examples in this doc depend on:
 >>> connection = Connection("us-west-2", EnvironmentCredentials())
 """
 
-from .actions import *
+from . import attribute_types as _attribute_types
+from . import exceptions as _exceptions
 from .attribute_types import *
-from .compounds import *
-from .connection import *
 from .exceptions import *
+from .lazy import lazy_exports as _lazy_exports
+
+# Actions, compounds, connections and tables are imported on first use, so that "import LowVoltage" stays cheap
+__getattr__, __dir__, __all__ = _lazy_exports(
+    __name__,
+    {
+        ".actions": [
+            "BatchGetItem", "BatchGetItemResponse",
+            "BatchWriteItem", "BatchWriteItemResponse",
+            "Compressed", "compress_item", "decompress_item",
+            "CreateTable", "CreateTableResponse",
+            "DeleteItem", "DeleteItemResponse",
+            "DeleteTable", "DeleteTableResponse",
+            "DescribeTable", "DescribeTableResponse",
+            "GetItem", "GetItemResponse",
+            "ListTables", "ListTablesResponse",
+            "PutItem", "PutItemResponse",
+            "Query", "QueryResponse",
+            "Scan", "ScanResponse",
+            "UpdateItem", "UpdateItemResponse",
+            "UpdateTable", "UpdateTableResponse",
+        ],
+        ".compounds": [
+            "batch_delete_item",
+            "batch_get_item", "iterate_ordered_batch_get_item",
+            "iterate_batch_get_item",
+            "batch_put_item",
+            "BatchWriter",
+            "put_chunked_value", "iterate_chunked_value", "get_chunked_value", "delete_chunked_value",
+            "iterate_list_tables",
+            "iterate_query",
+            "iterate_scan", "parallelize_scan", "parallel_scan",
+            "OptimisticLocking", "LockingStats",
+            "wait_for_table_activation",
+            "wait_for_table_deletion",
+            "WriteSharding",
+        ],
+        ".connection": [
+            "Connection",
+            "BatchingConnection",
+            "CachingConnection",
+            "SchedulingConnection",
+            "ExponentialBackoffRetryPolicy",
+            "StaticCredentials", "EnvironmentCredentials", "Ec2RoleCredentials",
+            "HotKeyTracker", "HotKey",
+            "CapacityMonitor", "Autoscaler", "ScalingDecision",
+        ],
+        ".table": ["Table"],
+    },
+    eager=[_attribute_types, _exceptions],
+)
 
 # @todo __str__ and __repr__
 # @todo create builder for attribute paths
 # @todo improve builder for expressions
 # @todo metrics
 # @todo debug logging
-# @todo Table abstraction (will DescribeTable to know the keys and indexes available, and choose the right index to Query, maybe even do a GetItem if the query is key_eq on ha&sh and range.) Higher level than compounds.
@@ -2,16 +2,21 @@
 
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
-from .batch_get_item import BatchGetItem, BatchGetItemResponse
-from .batch_write_item import BatchWriteItem, BatchWriteItemResponse
-from .create_table import CreateTable, CreateTableResponse
-from .delete_item import DeleteItem, DeleteItemResponse
-from .delete_table import DeleteTable, DeleteTableResponse
-from .describe_table import DescribeTable, DescribeTableResponse
-from .get_item import GetItem, GetItemResponse
-from .list_tables import ListTables, ListTablesResponse
-from .put_item import PutItem, PutItemResponse
-from .query import Query, QueryResponse
-from .scan import Scan, ScanResponse
-from .update_item import UpdateItem, UpdateItemResponse
-from .update_table import UpdateTable, UpdateTableResponse
+from LowVoltage.lazy import lazy_exports as _lazy_exports
+
+__getattr__, __dir__, __all__ = _lazy_exports(__name__, {
+    ".batch_get_item": ["BatchGetItem", "BatchGetItemResponse"],
+    ".batch_write_item": ["BatchWriteItem", "BatchWriteItemResponse"],
+    ".conversion": ["Compressed", "compress_item", "decompress_item"],
+    ".create_table": ["CreateTable", "CreateTableResponse"],
+    ".delete_item": ["DeleteItem", "DeleteItemResponse"],
+    ".delete_table": ["DeleteTable", "DeleteTableResponse"],
+    ".describe_table": ["DescribeTable", "DescribeTableResponse"],
+    ".get_item": ["GetItem", "GetItemResponse"],
+    ".list_tables": ["ListTables", "ListTablesResponse"],
+    ".put_item": ["PutItem", "PutItemResponse"],
+    ".query": ["Query", "QueryResponse"],
+    ".scan": ["Scan", "ScanResponse"],
+    ".update_item": ["UpdateItem", "UpdateItemResponse"],
+    ".update_table": ["UpdateTable", "UpdateTableResponse"],
+})
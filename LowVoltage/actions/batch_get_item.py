@@ -13,7 +13,7 @@ Responses are accessed like this:
 >>> connection(
 ...   BatchGetItem().table(table).keys({"h": 0})
 ... ).responses[table]
-[{u'h': 0, u'gr': 10, u'gh': 0}]
+[{'h': 0, 'gr': 10, 'gh': 0}]
 
 Note that responses are in an undefined order.
 
@@ -21,7 +21,6 @@ See also the :func:`.iterate_batch_get_item` compound. And :ref:`actions-vs-comp
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy, variadic
@@ -46,11 +45,13 @@ class BatchGetItemResponse(object):
         ConsumedCapacity=None,
         Responses=None,
         UnprocessedKeys=None,
+        compressed_attributes=(),
         **dummy
     ):
         self.__consumed_capacity = ConsumedCapacity
         self.__responses = Responses
         self.__unprocessed_keys = UnprocessedKeys
+        self.__compressed_attributes = compressed_attributes
 
     @property
     def consumed_capacity(self):
@@ -66,11 +67,12 @@ class BatchGetItemResponse(object):
     def responses(self):
         """
         The items you just got.
+        Attributes listed in the ``compressed_attributes`` of the :class:`.Connection` are returned decompressed.
 
         :type: ``None`` or dict of string (table name) to list of dict
         """
         if _is_dict(self.__responses):
-            return {t: [_convert_db_to_dict(v) for v in vs] for t, vs in self.__responses.items()}
+            return {t: [_convert_db_to_dict(v, self.__compressed_attributes) for v in vs] for t, vs in self.__responses.items()}
 
     @property
     def unprocessed_keys(self):
@@ -200,7 +202,7 @@ class BatchGetItem(Action):
         ...     .return_consumed_capacity_total()
         ... ).consumed_capacity
         >>> c[0].table_name
-        u'LowVoltage.Tests.Doc.1'
+        'LowVoltage.Tests.Doc.1'
         >>> c[0].capacity_units
         1.0
         """
@@ -219,7 +221,7 @@ class BatchGetItem(Action):
         ...     .return_consumed_capacity_total()
         ... ).consumed_capacity
         >>> c[0].table_name
-        u'LowVoltage.Tests.Doc.1'
+        'LowVoltage.Tests.Doc.1'
         >>> c[0].capacity_units
         0.5
         """
@@ -237,7 +239,7 @@ class BatchGetItem(Action):
         ...     .keys({"h": 0})
         ...     .project("h", "gr")
         ... ).responses[table]
-        [{u'h': 0, u'gr': 10}]
+        [{'h': 0, 'gr': 10}]
         """
         self.__check_active_table()
         self.__active_table.projection_expression.add(*names)
@@ -255,7 +257,7 @@ class BatchGetItem(Action):
         ...     .expression_attribute_name("syn", "h")
         ...     .project("#syn")
         ... ).responses[table]
-        [{u'h': 0}]
+        [{'h': 0}]
         """
         self.__check_active_table()
         self.__active_table.expression_attribute_names.add(synonym, name)
@@ -271,11 +273,11 @@ class BatchGetItem(Action):
         ...     .return_consumed_capacity_total()
         ... ).consumed_capacity
         >>> c[0].table_name
-        u'LowVoltage.Tests.Doc.1'
+        'LowVoltage.Tests.Doc.1'
         >>> c[0].capacity_units
         1.5
         >>> c[1].table_name
-        u'LowVoltage.Tests.Doc.2'
+        'LowVoltage.Tests.Doc.2'
         >>> c[1].capacity_units
         1.0
         """
@@ -284,12 +286,12 @@ class BatchGetItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   BatchGetItem()
         ...     .table(table)
         ...     .keys({"h": 0}, {"h": 1}, {"h": 2})
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -297,206 +299,3 @@ class BatchGetItem(Action):
     def __check_active_table(self):
         if self.__active_table is None:
             raise _lv.BuilderError("No active table.")
-
-
-class BatchGetItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(BatchGetItem().name, "BatchGetItem")
-
-    def test_empty(self):
-        self.assertEqual(
-            BatchGetItem().payload,
-            {}
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            BatchGetItem().return_consumed_capacity_none().payload,
-            {
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            BatchGetItem().return_consumed_capacity_total().payload,
-            {
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_constructor_with_table(self):
-        self.assertEqual(
-            BatchGetItem("Table").keys({"h": "1"}, {"h": "2"}).payload,
-            {
-                "RequestItems": {
-                    "Table": {
-                        "Keys": [
-                            {"h": {"S": "1"}},
-                            {"h": {"S": "2"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_constructor_with_keys(self):
-        self.assertEqual(
-            BatchGetItem("Table", {"h": "1"}, {"h": "2"}).payload,
-            {
-                "RequestItems": {
-                    "Table": {
-                        "Keys": [
-                            {"h": {"S": "1"}},
-                            {"h": {"S": "2"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_constructor_with_keys_in_list(self):
-        self.assertEqual(
-            BatchGetItem("Table", [{"h": "1"}, {"h": "2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": {
-                        "Keys": [
-                            {"h": {"S": "1"}},
-                            {"h": {"S": "2"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_table_keys(self):
-        self.assertEqual(
-            BatchGetItem().table("Table", {"h": "1"}, {"h": "2"}).payload,
-            {
-                "RequestItems": {
-                    "Table": {
-                        "Keys": [
-                            {"h": {"S": "1"}},
-                            {"h": {"S": "2"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_table_keys_twice(self):
-        self.assertEqual(
-            BatchGetItem().table("Table", {"h": "1"}).table("Table", {"h": "2"}).payload,
-            {
-                "RequestItems": {
-                    "Table": {
-                        "Keys": [
-                            {"h": {"S": "1"}},
-                            {"h": {"S": "2"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_keys(self):
-        self.assertEqual(
-            BatchGetItem().table("Table2").keys({"hash": "h21"}).table("Table1").keys({"hash": "h11"}, {"hash": "h12"}).table("Table2").keys([{"hash": "h22"}, {"hash": "h23"}]).payload,
-            {
-                "RequestItems": {
-                    "Table1": {
-                        "Keys": [
-                            {"hash": {"S": "h11"}},
-                            {"hash": {"S": "h12"}},
-                        ]
-                    },
-                    "Table2": {
-                        "Keys": [
-                            {"hash": {"S": "h21"}},
-                            {"hash": {"S": "h22"}},
-                            {"hash": {"S": "h23"}},
-                        ]
-                    },
-                }
-            }
-        )
-
-    def test_consistent_read(self):
-        self.assertEqual(
-            BatchGetItem().table("Table1").consistent_read_true().table("Table2").consistent_read_false().payload,
-            {
-                "RequestItems": {
-                    "Table1": {
-                        "ConsistentRead": True,
-                    },
-                    "Table2": {
-                        "ConsistentRead": False,
-                    },
-                }
-            }
-        )
-
-    def test_project(self):
-        self.assertEqual(
-            BatchGetItem().table("Table1").project("a").payload,
-            {
-                "RequestItems": {
-                    "Table1": {
-                        "ProjectionExpression": "a",
-                    },
-                }
-            }
-        )
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(
-            BatchGetItem().table("Table1").expression_attribute_name("a", "p").payload,
-            {
-                "RequestItems": {
-                    "Table1": {
-                        "ExpressionAttributeNames": {"#a": "p"},
-                    },
-                }
-            }
-        )
-
-    def test_keys_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchGetItem().keys({"h": 0})
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-    def test_consistent_read_true_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchGetItem().consistent_read_true()
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-    def test_consistent_read_false_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchGetItem().consistent_read_false()
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-    def test_project_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchGetItem().project("a")
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-    def test_expression_attribute_name_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchGetItem().expression_attribute_name("a", "b")
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-
-class BatchGetItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = BatchGetItemResponse()
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.responses)
-        self.assertIsNone(r.unprocessed_keys)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = BatchGetItemResponse(ConsumedCapacity=[{}], Responses={"A": [{"h": {"S": "a"}}]}, UnprocessedKeys=unprocessed_keys)
-        self.assertIsInstance(r.consumed_capacity[0], ConsumedCapacity)
-        self.assertEqual(r.responses, {"A": [{"h": "a"}]})
-        self.assertIs(r.unprocessed_keys, unprocessed_keys)
@@ -14,7 +14,6 @@ See also the :func:`.batch_put_item` and :func:`.batch_delete_item` compounds. A
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db
 from .next_gen_mixins import proxy, variadic
@@ -206,7 +205,7 @@ class BatchWriteItem(Action):
         ...     .return_consumed_capacity_total()
         ... ).consumed_capacity
         >>> c[0].table_name
-        u'LowVoltage.Tests.Doc.1'
+        'LowVoltage.Tests.Doc.1'
         >>> c[0].capacity_units
         2.0
         """
@@ -232,10 +231,10 @@ class BatchWriteItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   BatchWriteItem().table(table).delete({"h": 5})
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -249,7 +248,7 @@ class BatchWriteItem(Action):
         ...     .return_item_collection_metrics_size()
         ... ).item_collection_metrics
         >>> m[table2][0].item_collection_key
-        {u'h': 0}
+        {'h': 0}
         >>> m[table2][0].size_estimate_range_gb
         [0.0, 1.0]
         """
@@ -258,11 +257,11 @@ class BatchWriteItem(Action):
     @proxy
     def return_item_collection_metrics_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   BatchWriteItem().table(table2)
         ...     .put({"h": 1, "r1": 0, "r2": 0})
         ...     .return_item_collection_metrics_none()
-        ... ).item_collection_metrics
+        ... ).item_collection_metrics)
         None
         """
         return self.__return_item_collection_metrics.none()
@@ -270,226 +269,3 @@ class BatchWriteItem(Action):
     def __check_active_table(self):
         if self.__active_table is None:
             raise _lv.BuilderError("No active table.")
-
-
-class BatchWriteItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(BatchWriteItem().name, "BatchWriteItem")
-
-    def test_empty(self):
-        self.assertEqual(
-            BatchWriteItem().payload,
-            {}
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            BatchWriteItem().return_consumed_capacity_none().payload,
-            {
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_consumed_capacity_indexes(self):
-        self.assertEqual(
-            BatchWriteItem().return_consumed_capacity_indexes().payload,
-            {
-                "ReturnConsumedCapacity": "INDEXES",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            BatchWriteItem().return_consumed_capacity_total().payload,
-            {
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_return_item_collection_metrics_none(self):
-        self.assertEqual(
-            BatchWriteItem().return_item_collection_metrics_none().payload,
-            {
-                "ReturnItemCollectionMetrics": "NONE",
-            }
-        )
-
-    def test_return_item_collection_metrics_size(self):
-        self.assertEqual(
-            BatchWriteItem().return_item_collection_metrics_size().payload,
-            {
-                "ReturnItemCollectionMetrics": "SIZE",
-            }
-        )
-
-    def test_table(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table").payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                    ],
-                },
-            }
-        )
-
-    def test_constuctor_with_table(self):
-        self.assertEqual(
-            BatchWriteItem("Table").delete({"hash": "h1"}).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_constuctor_with_table_and_delete(self):
-        self.assertEqual(
-            BatchWriteItem("Table", delete=[{"hash": "h1"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_constuctor_with_table_and_put(self):
-        self.assertEqual(
-            BatchWriteItem("Table", put=[{"hash": "h1"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_table_with_delete(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table", delete=[{"hash": "h1"}, {"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_table_with_delete_twice(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table", delete=[{"hash": "h1"}]).table("Table", delete=[{"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_table_with_put(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table", put=[{"hash": "h1"}, {"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
-                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_table_with_put_twice(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table", put=[{"hash": "h1"}]).table("Table", put=[{"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
-                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_delete(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table").delete({"hash": "h1"}).table("Table").delete([{"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_put(self):
-        self.assertEqual(
-            BatchWriteItem().table("Table").put({"hash": "h1"}, [{"hash": "h2"}]).payload,
-            {
-                "RequestItems": {
-                    "Table": [
-                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
-                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_alternate_between_tables_and_put_delete(self):
-        self.assertEqual(
-            BatchWriteItem()
-                .table("Table1").delete({"hash": "h1"})
-                .table("Table2").put([{"hash": "h2"}])
-                .table("Table1").put({"hash": "h11"})
-                .table("Table2").delete({"hash": "h22"})
-                .payload,
-            {
-                "RequestItems": {
-                    "Table1": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
-                        {"PutRequest": {"Item": {"hash": {"S": "h11"}}}},
-                    ],
-                    "Table2": [
-                        {"DeleteRequest": {"Key": {"hash": {"S": "h22"}}}},
-                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
-                    ],
-                },
-            }
-        )
-
-    def test_put_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchWriteItem().put({"h": 0})
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-    def test_delete_without_active_table(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            BatchWriteItem().delete({"h": 0})
-        self.assertEqual(catcher.exception.args, ("No active table.",))
-
-
-class BatchWriteItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = BatchWriteItemResponse()
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.item_collection_metrics)
-        self.assertIsNone(r.unprocessed_items)
-
-    def test_all_set(self):
-        unprocessed_items = object()
-        r = BatchWriteItemResponse(ConsumedCapacity=[{}], ItemCollectionMetrics={"A": [{}]}, UnprocessedItems=unprocessed_items)
-        self.assertIsInstance(r.consumed_capacity[0], ConsumedCapacity)
-        self.assertIsInstance(r.item_collection_metrics["A"][0], ItemCollectionMetrics)
-        self.assertIs(r.unprocessed_items, unprocessed_items)
@@ -11,65 +11,63 @@ LowVoltage translates some Python types to be stored in DynamoDB:
 >>> connection(PutItem(table, {"h": 0, "number": 10}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'number': 10}
+{'h': 0, 'number': 10}
 
-- unicode ``u"foobar"`` is stored as ``"S"`` (string, properly utf8-encoded)
+- str ``"foobar"`` is stored as ``"S"`` (string, properly utf8-encoded)
 
->>> connection(PutItem(table, {"h": 0, "unicode": u"foobar"}))
+>>> connection(PutItem(table, {"h": 0, "str": "foobar"}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'unicode': u'foobar'}
+{'h': 0, 'str': 'foobar'}
 
 - bytes ``b"barbaz"`` is stored as ``"B"`` (binary, properly base64-encoded)
 
 >>> connection(PutItem(table, {"h": 0, "bytes": b"barbaz"}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'bytes': 'barbaz'}
-
-Note that strings are bytes in Python 2 and unicode in Python 3. You may want to avoid them.
+{'h': 0, 'bytes': b'barbaz'}
 
 - booleans ``True`` and ``False`` are stored as ``"BOOL"``
 
 >>> connection(PutItem(table, {"h": 0, "boolean": True}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'boolean': True}
+{'h': 0, 'boolean': True}
 
 - ``None`` is stored as ``"NULL"``
 
 >>> connection(PutItem(table, {"h": 0, "none": None}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'none': None}
+{'h': 0, 'none': None}
 
 - an homogeneous set of numbers ``{24, 57}`` is stored as ``"NS"`` (number set)
 
 >>> connection(PutItem(table, {"h": 0, "set_of_number": {24, 57}}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'set_of_number': set([24, 57])}
+{'h': 0, 'set_of_number': {24, 57}}
 
-- an homogeneous set of unicodes ``{u"foo", u"bar"}`` is stored as ``"SS"`` (string set)
+- an homogeneous set of strs ``{"foo", "bar"}`` is stored as ``"SS"`` (string set)
 
->>> connection(PutItem(table, {"h": 0, "set_of_unicode": {u"foo", u"bar"}}))
+>>> connection(PutItem(table, {"h": 0, "set_of_str": {"foo", "bar"}}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
->>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'set_of_unicode': set([u'foo', u'bar'])}
+>>> connection(GetItem(table, {"h": 0})).item["set_of_str"] == {"foo", "bar"}
+True
 
 - an homogeneous set of bytes ``{b"bar", b"baz"}`` is stored as ``"BS"`` (binary set)
 
 >>> connection(PutItem(table, {"h": 0, "set_of_bytes": {b"bar", b"baz"}}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
->>> connection(GetItem(table, {"h": 0})).item
-{u'set_of_bytes': set(['baz', 'bar']), u'h': 0}
+>>> connection(GetItem(table, {"h": 0})).item["set_of_bytes"] == {b"bar", b"baz"}
+True
 
 - a list ``["a", {"b": "c"}, 42]`` is stored as ``"L"`` (list)
 
 >>> connection(PutItem(table, {"h": 0, "list": ["a", {"b": "c"}, 42]}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'list': ['a', {u'b': 'c'}, 42]}
+{'h': 0, 'list': ['a', {'b': 'c'}, 42]}
 
 Note that lists are stored as ``"L"`` even if they are homogeneous, so you have to use sets if you plan to use :meth:`.UpdateItem.add` and :meth:`.UpdateItem.delete`.
 
@@ -78,7 +76,32 @@ Note that lists are stored as ``"L"`` even if they are homogeneous, so you have
 >>> connection(PutItem(table, {"h": 0, "dict": {"a": "b", "c": 42}}))
 <LowVoltage.actions.put_item.PutItemResponse ...>
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'dict': {u'a': 'b', u'c': 42}}
+{'h': 0, 'dict': {'a': 'b', 'c': 42}}
+
+- a :class:`Compressed` str or bytes is compressed with zlib and stored as ``"B"``.
+  List the names of the compressed attributes in the ``compressed_attributes`` of the :class:`.Connection`
+  to read back their original values from :class:`.GetItem`, :class:`.Query`, :class:`.Scan` and :class:`.BatchGetItem`.
+  Only these attributes are decoded, so your own binary values are never mistaken for compressed ones.
+
+>>> compressing_connection = Connection("us-west-2", EnvironmentCredentials(), compressed_attributes=["document", "title"])
+>>> compressing_connection(PutItem(table, {"h": 0, "document": Compressed("x" * 100000)}).return_consumed_capacity_total()).consumed_capacity.capacity_units
+1.0
+>>> len(compressing_connection(GetItem(table, {"h": 0})).item["document"])
+100000
+
+Other connections read them back as the stored bytes. Pass the names of the compressed attributes to :func:`decompress_item` to get their original values:
+
+>>> len(decompress_item(connection(GetItem(table, {"h": 0})).item, ["document"])["document"])
+100000
+
+:func:`compress_item` compresses designated attributes, or all str and bytes attributes over a size threshold:
+
+>>> connection(PutItem(table, compress_item({"h": 0, "document": "x" * 100000, "title": "foobar"}, threshold=1024)))
+<LowVoltage.actions.put_item.PutItemResponse ...>
+>>> compressing_connection(GetItem(table, {"h": 0})).item["title"]
+'foobar'
+
+Compressed attributes can't be used in keys, conditions, filters or update expressions.
 
 - everything else will raise a :exc:`TypeError`:
 
@@ -91,8 +114,55 @@ TypeError: ...
 import base64
 import numbers
 import sys
+import zlib
+
+
+# Compressed values are stored as "B" values starting with this header, then "S" or "B" for the type of the original value
+_COMPRESSED_HEADER = b"\x00LVz"
+
 
-import LowVoltage.testing as _tst
+class Compressed(object):
+    """
+    Wrap a str or bytes ``value`` to store it compressed with zlib at ``level``.
+    """
+
+    def __init__(self, value, level=6):
+        if not isinstance(value, (str, bytes)):
+            raise TypeError("Compressed values must be unicode or bytes")
+        self.value = value
+        self.level = level
+
+
+def compress_item(item, attributes=(), threshold=None, level=6):
+    """
+    Return a copy of ``item`` where the top-level attributes named in ``attributes``,
+    and (if ``threshold`` is not ``None``) all str and bytes attributes longer than ``threshold`` bytes, are :class:`Compressed`.
+    Make sure ``threshold`` is larger than the values of the key attributes.
+    """
+    compressed = dict(item)
+    for name, value in item.items():
+        if isinstance(value, (str, bytes)):
+            size = len(value.encode("utf8")) if isinstance(value, str) else len(value)
+            if name in attributes or (threshold is not None and size > threshold):
+                compressed[name] = Compressed(value, level)
+    return compressed
+
+
+def decompress_item(item, attributes):
+    """
+    Return a copy of ``item`` where the top-level attributes named in ``attributes`` that were stored :class:`Compressed`
+    are replaced by their original value. Other attributes, and values that were not compressed, are returned as they are.
+    """
+    decompressed = dict(item)
+    _decompress_attributes(decompressed, attributes)
+    return decompressed
+
+
+def _decompress_attributes(item, attributes):
+    for name in attributes:
+        value = item.get(name)
+        if isinstance(value, bytes) and value.startswith(_COMPRESSED_HEADER):
+            item[name] = _decompress(value[len(_COMPRESSED_HEADER):], value)
 
 
 def _convert_dict_to_db(attributes):
@@ -128,15 +198,23 @@ def _convert_value_to_db(value):
         return {"L": [_convert_value_to_db(v) for v in value]}
     elif isinstance(value, dict):
         return {"M": {n: _convert_value_to_db(v) for n, v in value.items()}}
+    elif isinstance(value, Compressed):
+        if isinstance(value.value, str):
+            data = b"S" + zlib.compress(value.value.encode("utf8"), value.level)
+        else:
+            data = b"B" + zlib.compress(value.value, value.level)
+        return {"B": base64.b64encode(_COMPRESSED_HEADER + data).decode("utf8")}
     else:
         raise TypeError
 
 
-def _convert_db_to_dict(attributes):
-    return {
+def _convert_db_to_dict(attributes, compressed_attributes=()):
+    item = {
         key: _convert_db_to_value(val)
         for key, val in attributes.items()
     }
+    _decompress_attributes(item, compressed_attributes)
+    return item
 
 
 def _convert_db_to_value(value):
@@ -164,108 +242,13 @@ def _convert_db_to_value(value):
         raise TypeError
 
 
-class ConversionUnitTests(_tst.UnitTests):
-    def test_convert_unicode_value_to_db(self):
-        self.assertEqual(_convert_value_to_db("éoà"), {"S": "éoà"})
-
-    def test_convert_bytes_value_to_db(self):
-        self.assertEqual(_convert_value_to_db(b"\xFF\x00\xAB"), {"B": "/wCr"})
-
-    def test_convert_bool_value_to_db(self):
-        self.assertEqual(_convert_value_to_db(True), {"BOOL": True})
-        self.assertEqual(_convert_value_to_db(False), {"BOOL": False})
-
-    def test_convert_int_value_to_db(self):
-        self.assertEqual(_convert_value_to_db(42), {"N": "42"})
-
-    def test_convert_none_value_to_db(self):
-        self.assertEqual(_convert_value_to_db(None), {"NULL": True})
-
-    def test_convert_set_of_int_value_to_db(self):
-        self.assertIn(_convert_value_to_db(set([42, 43])), [{"NS": ["42", "43"]}, {"NS": ["43", "42"]}])
-
-    def test_convert_frozenset_value_to_db(self):
-        self.assertIn(_convert_value_to_db(frozenset([42, 43])), [{"NS": ["42", "43"]}, {"NS": ["43", "42"]}])
-
-    def test_convert_set_of_unicode_value_to_db(self):
-        self.assertIn(_convert_value_to_db(set(["éoà", "bar"])), [{"SS": ["éoà", "bar"]}, {"SS": ["bar", "éoà"]}])
-
-    def test_convert_set_of_byte_value_to_db(self):
-        self.assertIn(_convert_value_to_db(set([b"\xFF\x00\xAB", b"bar"])), [{"BS": ["/wCr", "YmFy"]}, {"BS": ["YmFy", "/wCr"]}])
-
-    def test_convert_list_value_to_db(self):
-        self.assertEqual(_convert_value_to_db([True, 42]), {"L": [{"BOOL": True}, {"N": "42"}]})
-
-    def test_convert_dict_value_to_db(self):
-        self.assertEqual(_convert_value_to_db({"a": True, "b": 42}), {"M": {"a": {"BOOL": True}, "b": {"N": "42"}}})
-
-    def test_convert_empty_set_value_to_db(self):
-        with self.assertRaises(TypeError):
-            _convert_value_to_db(set())
-
-    def test_convert_set_of_tuple_value_to_db(self):
-        with self.assertRaises(TypeError):
-            _convert_value_to_db(set([(1, 2)]))
-
-    def test_convert_heterogenous_set_value_to_db(self):
-        with self.assertRaises(TypeError):
-            _convert_value_to_db(set([1, "2"]))
-
-    def test_convert_tuple_value_to_db(self):
-        with self.assertRaises(TypeError):
-            _convert_value_to_db((1, 2))
-
-    def test_convert_db_to_unicode_value(self):
-        self.assertEqual(_convert_db_to_value({"S": "éoà"}), "éoà")
-
-    def test_convert_db_to_bytes_value(self):
-        self.assertEqual(_convert_db_to_value({"B": "/wCr"}), b"\xFF\x00\xAB")
-
-    def test_convert_db_to_bool_value(self):
-        self.assertEqual(_convert_db_to_value({"BOOL": True}), True)
-        self.assertEqual(_convert_db_to_value({"BOOL": False}), False)
-
-    def test_convert_db_to_int_value(self):
-        self.assertEqual(_convert_db_to_value({"N": "42"}), 42)
-
-    def test_convert_db_to_none_value(self):
-        self.assertEqual(_convert_db_to_value({"NULL": True}), None)
-
-    def test_convert_db_to_set_of_int_value(self):
-        self.assertEqual(_convert_db_to_value({"NS": ["42", "43"]}), set([42, 43]))
-
-    def test_convert_db_to_set_of_unicode_value(self):
-        self.assertEqual(_convert_db_to_value({"SS": ["éoà", "bar"]}), set(["éoà", "bar"]))
-
-    def test_convert_db_to_set_of_byte_value(self):
-        self.assertEqual(_convert_db_to_value({"BS": ["/wCr", "YmFy"]}), set([b"\xFF\x00\xAB", b"bar"]))
-
-    def test_convert_db_to_list_value(self):
-        self.assertEqual(_convert_db_to_value({"L": [{"BOOL": True}, {"N": "42"}]}), [True, 42])
-
-    def test_convert_db_to_dict_value(self):
-        self.assertEqual(_convert_db_to_value({"M": {"a": {"BOOL": True}, "b": {"N": "42"}}}), {"a": True, "b": 42})
-
-    def test_convert_db_to_empty_dict_value(self):
-        with self.assertRaises(TypeError):
-            _convert_db_to_value({})
-
-    def test_convert_db_to_empty_list_value(self):
-        with self.assertRaises(TypeError):
-            _convert_db_to_value([])
-
-    def test_convert_db_to_string_value(self):
-        with self.assertRaises(TypeError):
-            _convert_db_to_value("SSS")
-
-    def test_convert_empty_dict_to_db(self):
-        self.assertEqual(_convert_dict_to_db({}), {})
-
-    def test_convert_dict_to_db(self):
-        self.assertEqual(_convert_dict_to_db({"a": 42}), {"a": {"N": "42"}})
-
-    def test_convert_db_to_empty_dict(self):
-        self.assertEqual(_convert_db_to_dict({}), {})
-
-    def test_convert_db_to_dict(self):
-        self.assertEqual(_convert_db_to_dict({"a": {"N": "42"}}), {"a": 42})
+def _decompress(data, default):
+    # Binary values that merely start like a compressed one are returned as-is
+    try:
+        if data[:1] == b"S":
+            return zlib.decompress(data[1:]).decode("utf8")
+        elif data[:1] == b"B":
+            return zlib.decompress(data[1:])
+    except (zlib.error, UnicodeDecodeError):
+        pass
+    return default
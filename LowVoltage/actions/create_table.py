@@ -20,7 +20,7 @@ When given a :class:`CreateTable`, the connection will return a :class:`CreateTa
 >>> r
 <LowVoltage.actions.create_table.CreateTableResponse ...>
 >>> r.table_description.table_status
-u'CREATING'
+'CREATING'
 
 Note that you can use the :func:`.wait_for_table_activation` compound to poll the table status until it's usable. See :ref:`actions-vs-compounds` in the user guide.
 
@@ -43,7 +43,6 @@ Note that you can use the :func:`.wait_for_table_activation` compound to poll th
 import datetime
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .next_gen_mixins import variadic, proxy
 from .next_gen_mixins import (
@@ -317,255 +316,3 @@ class CreateTable(Action):
     def __check_active_index(self):
         if self.__active_index is self:
             raise _lv.BuilderError("No active index.")
-
-
-class CreateTableUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(CreateTable("Foo").name, "CreateTable")
-
-    def test_constructor(self):
-        self.assertEqual(CreateTable("Foo").payload, {"TableName": "Foo"})
-
-    def test_table_name(self):
-        self.assertEqual(CreateTable().table_name("Foo").payload, {"TableName": "Foo"})
-
-    def test_hash_key(self):
-        self.assertEqual(
-            CreateTable("Foo").hash_key("h").payload,
-            {
-                "TableName": "Foo",
-                "KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}],
-            }
-        )
-
-    def test_hash_key_with_type(self):
-        self.assertEqual(
-            CreateTable("Foo").hash_key("h", _lv.STRING).payload,
-            {
-                "TableName": "Foo",
-                "AttributeDefinitions": [{"AttributeName": "h", "AttributeType": "S"}],
-                "KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}],
-            }
-        )
-
-    def test_attribute_definition(self):
-        self.assertEqual(
-            CreateTable("Foo").attribute_definition("h", _lv.STRING).payload,
-            {
-                "TableName": "Foo",
-                "AttributeDefinitions": [{"AttributeName": "h", "AttributeType": "S"}],
-            }
-        )
-
-    def test_range_key(self):
-        self.assertEqual(
-            CreateTable("Foo").range_key("r").payload,
-            {
-                "TableName": "Foo",
-                "KeySchema": [{"AttributeName": "r", "KeyType": "RANGE"}],
-            }
-        )
-
-    def test_range_key_with_type(self):
-        self.assertEqual(
-            CreateTable("Foo").range_key("r", _lv.STRING).payload,
-            {
-                "TableName": "Foo",
-                "AttributeDefinitions": [{"AttributeName": "r", "AttributeType": "S"}],
-                "KeySchema": [{"AttributeName": "r", "KeyType": "RANGE"}],
-            }
-        )
-
-    def test_throughput(self):
-        self.assertEqual(
-            CreateTable("Foo").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43},
-            }
-        )
-
-    def test_global_secondary_index(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [{"IndexName": "foo"}],
-            }
-        )
-
-    def test_local_secondary_index(self):
-        self.assertEqual(
-            CreateTable("Foo").local_secondary_index("foo").payload,
-            {
-                "TableName": "Foo",
-                "LocalSecondaryIndexes": [{"IndexName": "foo"}],
-            }
-        )
-
-    def test_global_secondary_index_hash_key(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").hash_key("hh").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "KeySchema": [{"AttributeName": "hh", "KeyType": "HASH"}]},
-                ],
-            }
-        )
-
-    def test_global_secondary_index_range_key(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").range_key("rr").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "KeySchema": [{"AttributeName": "rr", "KeyType": "RANGE"}]},
-                ],
-            }
-        )
-
-    def test_global_secondary_index_hash_key_with_type(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").hash_key("hh", _lv.STRING).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "KeySchema": [{"AttributeName": "hh", "KeyType": "HASH"}]},
-                ],
-                "AttributeDefinitions": [{"AttributeName": "hh", "AttributeType": "S"}],
-            }
-        )
-
-    def test_global_secondary_index_range_key_with_type(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").range_key("rr", _lv.STRING).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "KeySchema": [{"AttributeName": "rr", "KeyType": "RANGE"}]},
-                ],
-                "AttributeDefinitions": [{"AttributeName": "rr", "AttributeType": "S"}],
-            }
-        )
-
-    def test_global_secondary_index_throughput(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43}},
-                ],
-            }
-        )
-
-    def test_global_secondary_index_project_all(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").project_all().payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "Projection": {"ProjectionType": "ALL"}},
-                ],
-            }
-        )
-
-    def test_global_secondary_index_project_keys_only(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").project_keys_only().payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "Projection": {"ProjectionType": "KEYS_ONLY"}},
-                ],
-            }
-        )
-
-    def test_global_secondary_index_project_include(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").project("toto", "titi").project(["tutu"]).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["toto", "titi", "tutu"]}},
-                ],
-            }
-        )
-
-    def test_back_to_table_after_gsi(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").table().provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [{"IndexName": "foo"}],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43},
-            }
-        )
-
-    def test_implicit_back_to_table_after_gsi(self):
-        self.assertEqual(
-            CreateTable("Foo").global_secondary_index("foo").attribute_definition("bar", _lv.NUMBER).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [{"IndexName": "foo"}],
-                "AttributeDefinitions": [{"AttributeName": "bar", "AttributeType": "N"}],
-            }
-        )
-
-    def test_back_to_gsi_after_back_to_table(self):
-        self.assertEqual(
-            CreateTable("Foo")
-                .global_secondary_index("foo")
-                .table().provisioned_throughput(42, 43)
-                .global_secondary_index("foo").provisioned_throughput(12, 13)
-                .payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexes": [
-                    {"IndexName": "foo", "ProvisionedThroughput": {"ReadCapacityUnits": 12, "WriteCapacityUnits": 13}}
-                ],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43},
-            }
-        )
-
-    def test_back_to_lsi_after_back_to_table(self):
-        self.assertEqual(
-            CreateTable("Foo")
-                .local_secondary_index("foo")
-                .table().provisioned_throughput(42, 43)
-                .local_secondary_index("foo").project_all()
-                .payload,
-            {
-                "TableName": "Foo",
-                "LocalSecondaryIndexes": [
-                    {"IndexName": "foo", "Projection": {"ProjectionType": "ALL"}}
-                ],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43},
-            }
-        )
-
-    def test_project_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            CreateTable("Foo").project("a")
-        self.assertEqual(catcher.exception.args, ("No active index.",))
-
-    def test_project_all_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            CreateTable("Foo").project_all()
-        self.assertEqual(catcher.exception.args, ("No active index.",))
-
-    def test_project_keys_only_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            CreateTable("Foo").project_keys_only()
-        self.assertEqual(catcher.exception.args, ("No active index.",))
-
-
-class CreateTableResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = CreateTableResponse()
-        self.assertIsNone(r.table_description)
-
-    def test_all_set(self):
-        r = CreateTableResponse(TableDescription={})
-        self.assertIsInstance(r.table_description, TableDescription)
@@ -14,16 +14,15 @@ Note that deleting the same item twice is not an error (deleting is idempotent).
 ...   DeleteItem(table, {"h": 1})
 ...     .return_values_all_old()
 ... ).attributes
-{u'h': 1, u'gr': 8, u'gh': 1}
->>> print connection(
+{'h': 1, 'gr': 8, 'gh': 1}
+>>> print(connection(
 ...   DeleteItem(table, {"h": 1})
 ...     .return_values_all_old()
-... ).attributes
+... ).attributes)
 None
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -201,10 +200,10 @@ class DeleteItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   DeleteItem(table, {"h": 7})
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -217,7 +216,7 @@ class DeleteItem(Action):
         ...     .return_item_collection_metrics_size()
         ... ).item_collection_metrics
         >>> m.item_collection_key
-        {u'h': 0}
+        {'h': 0}
         >>> m.size_estimate_range_gb
         [0.0, 1.0]
         """
@@ -226,10 +225,10 @@ class DeleteItem(Action):
     @proxy
     def return_item_collection_metrics_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   DeleteItem(table2, {"h": 1, "r1": 0})
         ...     .return_item_collection_metrics_none()
-        ... ).item_collection_metrics
+        ... ).item_collection_metrics)
         None
         """
         return self.__return_item_collection_metrics.none()
@@ -241,155 +240,17 @@ class DeleteItem(Action):
         ...   DeleteItem(table, {"h": 3})
         ...     .return_values_all_old()
         ... ).attributes
-        {u'h': 3, u'gr': 4, u'gh': 9}
+        {'h': 3, 'gr': 4, 'gh': 9}
         """
         return self.__return_values.all_old()
 
     @proxy
     def return_values_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   DeleteItem(table, {"h": 4})
         ...     .return_values_none()
-        ... ).attributes
+        ... ).attributes)
         None
         """
         return self.__return_values.none()
-
-
-class DeleteItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(DeleteItem("Table", {"hash": 42}).name, "DeleteItem")
-
-    def test_table_name_and_key(self):
-        self.assertEqual(
-            DeleteItem().table_name("Table").key({"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_constructor(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_return_values_none(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_values_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "NONE",
-            }
-        )
-
-    def test_return_values_all_old(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_values_all_old().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "ALL_OLD",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_return_consumed_capacity_indexes(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_consumed_capacity_indexes().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "INDEXES",
-            }
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_item_collection_metrics_size(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_item_collection_metrics_size().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "SIZE",
-            }
-        )
-
-    def test_return_item_collection_metrics_none(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": "h"}).return_item_collection_metrics_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "NONE",
-            }
-        )
-
-    def test_expression_attribute_value(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": 42}).expression_attribute_value("v", "value").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ExpressionAttributeValues": {":v": {"S": "value"}},
-            }
-        )
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ExpressionAttributeNames": {"#n": "path"},
-            }
-        )
-
-    def test_condition_expression(self):
-        self.assertEqual(
-            DeleteItem("Table", {"hash": 42}).condition_expression("a=b").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ConditionExpression": "a=b",
-            }
-        )
-
-
-class DeleteItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = DeleteItemResponse()
-        self.assertIsNone(r.attributes)
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.item_collection_metrics)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = DeleteItemResponse(Attributes={"h": {"S": "a"}}, ConsumedCapacity={}, ItemCollectionMetrics={})
-        self.assertEqual(r.attributes, {"h": "a"})
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertIsInstance(r.item_collection_metrics, ItemCollectionMetrics)
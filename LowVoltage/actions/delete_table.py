@@ -18,7 +18,7 @@ When given a :class:`DeleteTable`, the connection will return a :class:`DeleteTa
 >>> r
 <LowVoltage.actions.delete_table.DeleteTableResponse ...>
 >>> r.table_description.table_status
-u'DELETING'
+'DELETING'
 
 Note that you can use the :func:`.wait_for_table_deletion` compound to poll the table status until it's deleted. See :ref:`actions-vs-compounds` in the user guide.
 
@@ -31,7 +31,6 @@ Note that you can use the :func:`.wait_for_table_deletion` compound to poll the
 import datetime
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .return_types import TableDescription, _is_dict
 from .next_gen_mixins import proxy
@@ -90,24 +89,3 @@ class DeleteTable(Action):
         <LowVoltage.actions.delete_table.DeleteTableResponse ...>
         """
         return self.__table_name.set(table_name)
-
-
-class DeleteTableUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(DeleteTable("Foo").name, "DeleteTable")
-
-    def test_table_name(self):
-        self.assertEqual(DeleteTable().table_name("Foo").payload, {"TableName": "Foo"})
-
-    def test_constructor(self):
-        self.assertEqual(DeleteTable("Foo").payload, {"TableName": "Foo"})
-
-
-class DeleteTableResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = DeleteTableResponse()
-        self.assertIsNone(r.table_description)
-
-    def test_all_set(self):
-        r = DeleteTableResponse(TableDescription={})
-        self.assertIsInstance(r.table_description, TableDescription)
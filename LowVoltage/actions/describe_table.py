@@ -9,17 +9,16 @@ When given a :class:`DescribeTable`, the connection will return a :class:`Descri
 >>> r
 <LowVoltage.actions.describe_table.DescribeTableResponse ...>
 >>> r.table.table_status
-u'ACTIVE'
+'ACTIVE'
 >>> r.table.key_schema[0].attribute_name
-u'h'
+'h'
 >>> r.table.key_schema[0].key_type
-u'HASH'
+'HASH'
 """
 
 import datetime
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .return_types import TableDescription, _is_dict
 from .next_gen_mixins import proxy
@@ -78,24 +77,3 @@ class DescribeTable(Action):
         <LowVoltage.actions.describe_table.DescribeTableResponse ...>
         """
         return self.__table_name.set(table_name)
-
-
-class DescribeTableUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(DescribeTable("Foo").name, "DescribeTable")
-
-    def test_table_name(self):
-        self.assertEqual(DescribeTable().table_name("Foo").payload, {"TableName": "Foo"})
-
-    def test_constuctor(self):
-        self.assertEqual(DescribeTable("Foo").payload, {"TableName": "Foo"})
-
-
-class DescribeTableResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = DescribeTableResponse()
-        self.assertIsNone(r.table)
-
-    def test_all_set(self):
-        r = DescribeTableResponse(Table={})
-        self.assertIsInstance(r.table, TableDescription)
@@ -11,16 +11,14 @@ When given a :class:`GetItem`, the connection will return a :class:`GetItemRespo
 The item is accessed like this:
 
 >>> connection(GetItem(table, {"h": 0})).item
-{u'h': 0, u'gr': 10, u'gh': 0}
+{'h': 0, 'gr': 10, 'gh': 0}
 
 Note that getting an unexisting item does not raise an exception:
 
->>> print connection(GetItem(table, {"h": -1})).item
+>>> print(connection(GetItem(table, {"h": -1})).item)
 None
 """
 
-import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -46,10 +44,12 @@ class GetItemResponse(object):
         self,
         ConsumedCapacity=None,
         Item=None,
+        compressed_attributes=(),
         **dummy
     ):
         self.__consumed_capacity = ConsumedCapacity
         self.__item = Item
+        self.__compressed_attributes = compressed_attributes
 
     @property
     def consumed_capacity(self):
@@ -65,11 +65,12 @@ class GetItemResponse(object):
     def item(self):
         """
         The item you just got. None if the item is not in the table.
+        Attributes listed in the ``compressed_attributes`` of the :class:`.Connection` are returned decompressed.
 
         :type: ``None`` or dict
         """
         if _is_dict(self.__item):
-            return _convert_db_to_dict(self.__item)
+            return _convert_db_to_dict(self.__item, self.__compressed_attributes)
 
 
 class GetItem(Action):
@@ -155,7 +156,7 @@ class GetItem(Action):
         ...     .expression_attribute_name("syn", "gr")
         ...     .project("#syn")
         ... ).item
-        {u'gr': 10}
+        {'gr': 10}
         """
         return self.__expression_attribute_names.add(synonym, name)
 
@@ -166,7 +167,7 @@ class GetItem(Action):
         ...   GetItem(table, {"h": 0})
         ...     .project("gr")
         ... ).item
-        {u'gr': 10}
+        {'gr': 10}
         """
         return self.__projection_expression.add(*names)
 
@@ -184,122 +185,10 @@ class GetItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   GetItem(table, {"h": 0})
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
-
-
-class GetItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(GetItem("Table", {"hash": 42}).name, "GetItem")
-
-    def test_missing_table_name(self):
-        with self.assertRaises(_lv.BuilderError):
-            GetItem().key({"h": 42}).payload
-
-    def test_bad_table_name(self):
-        with self.assertRaises(TypeError):
-            GetItem().table_name(42)
-
-    def test_bad_key(self):
-        with self.assertRaises(TypeError):
-            GetItem().key(42)
-
-    def test_missing_key(self):
-        with self.assertRaises(_lv.BuilderError):
-            GetItem().table_name("Foo").payload
-
-    def test_table_name_and_key(self):
-        self.assertEqual(
-            GetItem().table_name("Table").key({"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_constructor(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_consistent_read_true(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": "h"}).consistent_read_true().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ConsistentRead": True,
-            }
-        )
-
-    def test_consistent_read_false(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": "h"}).consistent_read_false().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ConsistentRead": False,
-            }
-        )
-
-    def test_project(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": "h"}).project("abc").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ProjectionExpression": "abc",
-            }
-        )
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(
-            GetItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ExpressionAttributeNames": {"#n": "path"},
-            }
-        )
-
-
-class GetItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = GetItemResponse()
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.item)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = GetItemResponse(ConsumedCapacity={}, Item={"h": {"S": "a"}})
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertEqual(r.item, {"h": "a"})
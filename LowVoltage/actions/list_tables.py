@@ -9,13 +9,12 @@ When given a :class:`ListTables`, the connection will return a :class:`ListTable
 >>> r
 <LowVoltage.actions.list_tables.ListTablesResponse ...>
 >>> r.table_names
-[u'LowVoltage.Tests.Doc.1', u'LowVoltage.Tests.Doc.2']
+['LowVoltage.Tests.Doc.1', 'LowVoltage.Tests.Doc.2']
 
 See also the :func:`.iterate_list_tables` compound. And :ref:`actions-vs-compounds` in the user guide.
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .return_types import _is_str, _is_list_of_str
 from .next_gen_mixins import OptionalIntParameter, OptionalStringParameter
@@ -84,9 +83,9 @@ class ListTables(Action):
 
         >>> r = connection(ListTables().limit(1))
         >>> r.table_names
-        [u'LowVoltage.Tests.Doc.1']
+        ['LowVoltage.Tests.Doc.1']
         >>> r.last_evaluated_table_name
-        u'LowVoltage.Tests.Doc.1'
+        'LowVoltage.Tests.Doc.1'
         """
         return self.__limit.set(limit)
 
@@ -101,33 +100,6 @@ class ListTables(Action):
         ...   ListTables()
         ...     .exclusive_start_table_name("LowVoltage.Tests.Doc.1")
         ... ).table_names
-        [u'LowVoltage.Tests.Doc.2']
+        ['LowVoltage.Tests.Doc.2']
         """
         return self.__exclusive_start_table_name.set(table_name)
-
-
-class ListTablesUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(ListTables().name, "ListTables")
-
-    def test_no_arguments(self):
-        self.assertEqual(ListTables().payload, {})
-
-    def test_limit(self):
-        self.assertEqual(ListTables().limit(42).payload, {"Limit": 42})
-
-    def test_exclusive_start_table_name(self):
-        self.assertEqual(ListTables().exclusive_start_table_name("Bar").payload, {"ExclusiveStartTableName": "Bar"})
-
-
-class ListTablesResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = ListTablesResponse()
-        self.assertIsNone(r.last_evaluated_table_name)
-        self.assertIsNone(r.table_names)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = ListTablesResponse(LastEvaluatedTableName="Foo", TableNames=["Bar"])
-        self.assertEqual(r.last_evaluated_table_name, "Foo")
-        self.assertEqual(r.table_names, ["Bar"])
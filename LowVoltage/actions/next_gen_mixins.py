@@ -6,7 +6,6 @@ import numbers
 import inspect
 
 import LowVoltage.exceptions as _exn
-import LowVoltage.testing as _tst
 from LowVoltage.variadic import variadic
 from .conversion import _convert_value_to_db, _convert_dict_to_db
 
@@ -401,7 +400,7 @@ def proxy(*proxy_args):
 
     def patch(method, format_args):
         base = bases[method.__name__]
-        assert inspect.getargspec(method) == inspect.getargspec(base), method
+        assert inspect.getfullargspec(method) == inspect.getfullargspec(base), method
         method.__doc__ = base.__doc__.format(*format_args) + "\n" + method.__doc__
 
     if len(proxy_args) != 1 or isinstance(proxy_args[0], str):
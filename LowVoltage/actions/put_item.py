@@ -9,7 +9,6 @@ When given a :class:`PutItem`, the connection will return a :class:`PutItemRespo
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -187,10 +186,10 @@ class PutItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   PutItem(table, {"h": 6})
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -203,7 +202,7 @@ class PutItem(Action):
         ...     .return_item_collection_metrics_size()
         ... ).item_collection_metrics
         >>> m.item_collection_key
-        {u'h': 0}
+        {'h': 0}
         >>> m.size_estimate_range_gb
         [0.0, 1.0]
         """
@@ -212,10 +211,10 @@ class PutItem(Action):
     @proxy
     def return_item_collection_metrics_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   PutItem(table2, {"h": 1, "r1": 0, "r2": 1})
         ...     .return_item_collection_metrics_none()
-        ... ).item_collection_metrics
+        ... ).item_collection_metrics)
         None
         """
         return self.__return_item_collection_metrics.none()
@@ -227,155 +226,17 @@ class PutItem(Action):
         ...   PutItem(table, {"h": 2})
         ...     .return_values_all_old()
         ... ).attributes
-        {u'h': 2, u'gr': 6, u'gh': 4}
+        {'h': 2, 'gr': 6, 'gh': 4}
         """
         return self.__return_values.all_old()
 
     @proxy
     def return_values_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   PutItem(table, {"h": 3})
         ...     .return_values_none()
-        ... ).attributes
+        ... ).attributes)
         None
         """
         return self.__return_values.none()
-
-
-class PutItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(PutItem("Table", {"hash": 42}).name, "PutItem")
-
-    def test_table_name_and_item(self):
-        self.assertEqual(
-            PutItem().table_name("Table").item({"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_constructor(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "value"}).payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "value"}},
-            }
-        )
-
-    def test_return_values_none(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_values_none().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnValues": "NONE",
-            }
-        )
-
-    def test_return_values_all_old(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_values_all_old().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnValues": "ALL_OLD",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_return_consumed_capacity_indexes(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_consumed_capacity_indexes().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "INDEXES",
-            }
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_item_collection_metrics_size(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_item_collection_metrics_size().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "SIZE",
-            }
-        )
-
-    def test_return_item_collection_metrics_none(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": "h"}).return_item_collection_metrics_none().payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "NONE",
-            }
-        )
-
-    def test_expression_attribute_value(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": 42}).expression_attribute_value("v", "value").payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"N": "42"}},
-                "ExpressionAttributeValues": {":v": {"S": "value"}},
-            }
-        )
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"N": "42"}},
-                "ExpressionAttributeNames": {"#n": "path"},
-            }
-        )
-
-    def test_condition_expression(self):
-        self.assertEqual(
-            PutItem("Table", {"hash": 42}).condition_expression("a=b").payload,
-            {
-                "TableName": "Table",
-                "Item": {"hash": {"N": "42"}},
-                "ConditionExpression": "a=b",
-            }
-        )
-
-
-class PutItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = PutItemResponse()
-        self.assertIsNone(r.attributes)
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.item_collection_metrics)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = PutItemResponse(Attributes={"h": {"S": "a"}}, ConsumedCapacity={}, ItemCollectionMetrics={})
-        self.assertEqual(r.attributes, {"h": "a"})
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertIsInstance(r.item_collection_metrics, ItemCollectionMetrics)
@@ -11,13 +11,12 @@ When given a :class:`Query`, the connection will return a :class:`QueryResponse`
 Items are accessed like this:
 
 >>> connection(Query(table2).key_eq("h", 42)).items
-[{u'h': 42, u'r1': 0, u'r2': 10}, {u'h': 42, u'r1': 1, u'r2': 9}, {u'h': 42, u'r1': 2, u'r2': 8}, {u'h': 42, u'r1': 3, u'r2': 7}, {u'h': 42, u'r1': 4, u'r2': 6}, {u'h': 42, u'r1': 5, u'r2': 5}, {u'h': 42, u'r1': 6}, {u'h': 42, u'r1': 7}, {u'h': 42, u'r1': 8}, {u'h': 42, u'r1': 9}]
+[{'h': 42, 'r1': 0, 'r2': 10}, {'h': 42, 'r1': 1, 'r2': 9}, {'h': 42, 'r1': 2, 'r2': 8}, {'h': 42, 'r1': 3, 'r2': 7}, {'h': 42, 'r1': 4, 'r2': 6}, {'h': 42, 'r1': 5, 'r2': 5}, {'h': 42, 'r1': 6}, {'h': 42, 'r1': 7}, {'h': 42, 'r1': 8}, {'h': 42, 'r1': 9}]
 
 See also the :func:`.iterate_query` compound. And :ref:`actions-vs-compounds` in the user guide.
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_value_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -52,6 +51,7 @@ class QueryResponse(object):
         Items=None,
         LastEvaluatedKey=None,
         ScannedCount=None,
+        compressed_attributes=(),
         **dummy
     ):
         self.__consumed_capacity = ConsumedCapacity
@@ -59,6 +59,7 @@ class QueryResponse(object):
         self.__items = Items
         self.__last_evaluated_key = LastEvaluatedKey
         self.__scanned_count = ScannedCount
+        self.__compressed_attributes = compressed_attributes
 
     @property
     def consumed_capacity(self):
@@ -84,11 +85,12 @@ class QueryResponse(object):
     def items(self):
         """
         The items matching the query. Unless you used :meth:`~Query.select_count`.
+        Attributes listed in the ``compressed_attributes`` of the :class:`.Connection` are returned decompressed.
 
         :type: ``None`` or list of dict
         """
         if _is_list_of_dict(self.__items):
-            return [_convert_db_to_dict(i) for i in self.__items]
+            return [_convert_db_to_dict(i, self.__compressed_attributes) for i in self.__items]
 
     @property
     def last_evaluated_key(self):
@@ -188,7 +190,7 @@ class Query(Action):
         ...   Query(table2)
         ...     .key_eq("h", 42)
         ... ).items
-        [{u'h': 42, u'r1': 0, u'r2': 10}, {u'h': 42, u'r1': 1, u'r2': 9}, {u'h': 42, u'r1': 2, u'r2': 8}, ...]
+        [{'h': 42, 'r1': 0, 'r2': 10}, {'h': 42, 'r1': 1, 'r2': 9}, {'h': 42, 'r1': 2, 'r2': 8}, ...]
         """
         return self.__key_conditions.add(name, ("EQ", [value]))
 
@@ -202,7 +204,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .key_le("r1", 1)
         ... ).items
-        [{u'h': 42, u'r1': 0, u'r2': 10}, {u'h': 42, u'r1': 1, u'r2': 9}]
+        [{'h': 42, 'r1': 0, 'r2': 10}, {'h': 42, 'r1': 1, 'r2': 9}]
         """
         return self.__key_conditions.add(name, ("LE", [value]))
 
@@ -216,7 +218,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .key_lt("r1", 2)
         ... ).items
-        [{u'h': 42, u'r1': 0, u'r2': 10}, {u'h': 42, u'r1': 1, u'r2': 9}]
+        [{'h': 42, 'r1': 0, 'r2': 10}, {'h': 42, 'r1': 1, 'r2': 9}]
         """
         return self.__key_conditions.add(name, ("LT", [value]))
 
@@ -230,7 +232,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .key_ge("r1", 7)
         ... ).items
-        [{u'h': 42, u'r1': 7}, {u'h': 42, u'r1': 8}, {u'h': 42, u'r1': 9}]
+        [{'h': 42, 'r1': 7}, {'h': 42, 'r1': 8}, {'h': 42, 'r1': 9}]
         """
         return self.__key_conditions.add(name, ("GE", [value]))
 
@@ -244,7 +246,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .key_gt("r1", 6)
         ... ).items
-        [{u'h': 42, u'r1': 7}, {u'h': 42, u'r1': 8}, {u'h': 42, u'r1': 9}]
+        [{'h': 42, 'r1': 7}, {'h': 42, 'r1': 8}, {'h': 42, 'r1': 9}]
         """
         return self.__key_conditions.add(name, ("GT", [value]))
 
@@ -265,7 +267,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .key_between("r1", 4, 6)
         ... ).items
-        [{u'h': 42, u'r1': 4, u'r2': 6}, {u'h': 42, u'r1': 5, u'r2': 5}, {u'h': 42, u'r1': 6}]
+        [{'h': 42, 'r1': 4, 'r2': 6}, {'h': 42, 'r1': 5, 'r2': 5}, {'h': 42, 'r1': 6}]
         """
         return self.__key_conditions.add(name, ("BETWEEN", [lo, hi]))
 
@@ -280,16 +282,16 @@ class Query(Action):
         ...     .limit(2)
         ... )
         >>> r.items
-        [{u'h': 42, u'r1': 0, u'r2': 10}, {u'h': 42, u'r1': 1, u'r2': 9}]
+        [{'h': 42, 'r1': 0, 'r2': 10}, {'h': 42, 'r1': 1, 'r2': 9}]
         >>> r.last_evaluated_key
-        {u'h': 42, u'r1': 1}
+        {'h': 42, 'r1': 1}
         >>> connection(
         ...   Query(table2)
         ...     .key_eq("h", 42)
         ...     .limit(2)
-        ...     .exclusive_start_key({u'h': 42, u'r1': 1})
+        ...     .exclusive_start_key({'h': 42, 'r1': 1})
         ... ).items
-        [{u'h': 42, u'r1': 2, u'r2': 8}, {u'h': 42, u'r1': 3, u'r2': 7}]
+        [{'h': 42, 'r1': 2, 'r2': 8}, {'h': 42, 'r1': 3, 'r2': 7}]
         """
         return self.__exclusive_start_key.set(key)
 
@@ -309,8 +311,8 @@ class Query(Action):
         ...     .select_count()
         ... )
         >>> r.count
-        10L
-        >>> print r.items
+        10
+        >>> print(r.items)
         None
         """
         return self.__select.count()
@@ -325,7 +327,7 @@ class Query(Action):
         ...     .select_all_attributes()
         ...     .limit(2)
         ... ).items
-        [{u'h': 42, u'r1': 5, u'r2': 5}, {u'h': 42, u'r1': 4, u'r2': 6}]
+        [{'h': 42, 'r1': 5, 'r2': 5}, {'h': 42, 'r1': 4, 'r2': 6}]
         """
         return self.__select.all_attributes()
 
@@ -339,7 +341,7 @@ class Query(Action):
         ...     .select_all_projected_attributes()
         ...     .limit(2)
         ... ).items
-        [{u'h': 42, u'r1': 5, u'r2': 5}, {u'h': 42, u'r1': 4, u'r2': 6}]
+        [{'h': 42, 'r1': 5, 'r2': 5}, {'h': 42, 'r1': 4, 'r2': 6}]
         """
         return self.__select.all_projected_attributes()
 
@@ -351,7 +353,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .index_name("lsi")
         ... ).items
-        [{u'h': 42, u'r1': 5, u'r2': 5}, {u'h': 42, u'r1': 4, u'r2': 6}, {u'h': 42, u'r1': 3, u'r2': 7}, {u'h': 42, u'r1': 2, u'r2': 8}, {u'h': 42, u'r1': 1, u'r2': 9}, {u'h': 42, u'r1': 0, u'r2': 10}]
+        [{'h': 42, 'r1': 5, 'r2': 5}, {'h': 42, 'r1': 4, 'r2': 6}, {'h': 42, 'r1': 3, 'r2': 7}, {'h': 42, 'r1': 2, 'r2': 8}, {'h': 42, 'r1': 1, 'r2': 9}, {'h': 42, 'r1': 0, 'r2': 10}]
         """
         return self.__index_name.set(index_name)
 
@@ -365,7 +367,7 @@ class Query(Action):
         ...     .project("r1")
         ...     .scan_index_forward_true()
         ... ).items
-        [{u'r1': 0}, {u'r1': 1}, {u'r1': 2}, {u'r1': 3}, {u'r1': 4}, {u'r1': 5}, {u'r1': 6}, {u'r1': 7}, {u'r1': 8}, {u'r1': 9}]
+        [{'r1': 0}, {'r1': 1}, {'r1': 2}, {'r1': 3}, {'r1': 4}, {'r1': 5}, {'r1': 6}, {'r1': 7}, {'r1': 8}, {'r1': 9}]
         """
         return self.__scan_index_forward.set(True)
 
@@ -379,7 +381,7 @@ class Query(Action):
         ...     .project("r1")
         ...     .scan_index_forward_false()
         ... ).items
-        [{u'r1': 9}, {u'r1': 8}, {u'r1': 7}, {u'r1': 6}, {u'r1': 5}, {u'r1': 4}, {u'r1': 3}, {u'r1': 2}, {u'r1': 1}, {u'r1': 0}]
+        [{'r1': 9}, {'r1': 8}, {'r1': 7}, {'r1': 6}, {'r1': 5}, {'r1': 4}, {'r1': 3}, {'r1': 2}, {'r1': 1}, {'r1': 0}]
         """
         return self.__scan_index_forward.set(False)
 
@@ -391,7 +393,7 @@ class Query(Action):
         ...     .key_eq("h", 42)
         ...     .project("r2")
         ... ).items
-        [{u'r2': 10}, {u'r2': 9}, {u'r2': 8}, {u'r2': 7}, {u'r2': 6}, {u'r2': 5}, {}, {}, {}, {}]
+        [{'r2': 10}, {'r2': 9}, {'r2': 8}, {'r2': 7}, {'r2': 6}, {'r2': 5}, {}, {}, {}, {}]
         """
         return self.__projection_expression.add(*names)
 
@@ -407,7 +409,7 @@ class Query(Action):
         ...     .expression_attribute_value("val1", 5)
         ...     .expression_attribute_value("val2", 7)
         ... ).items
-        [{u'h': 42, u'r1': 3, u'r2': 7}, {u'h': 42, u'r1': 5, u'r2': 5}]
+        [{'h': 42, 'r1': 3, 'r2': 7}, {'h': 42, 'r1': 5, 'r2': 5}]
         """
         return self.__filter_expression.set(expression)
 
@@ -475,7 +477,7 @@ class Query(Action):
         0.5
         >>> c1.table.capacity_units
         0.5
-        >>> print c1.global_secondary_indexes
+        >>> print(c1.global_secondary_indexes)
         None
 
         >>> c2 = connection(
@@ -496,155 +498,11 @@ class Query(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   Query(table)
         ...     .key_eq("h", 0)
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
-
-
-class QueryUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(Query("Aaa").name, "Query")
-
-    def test_table_name(self):
-        self.assertEqual(Query().table_name("Aaa").payload, {"TableName": "Aaa"})
-
-    def test_constructor(self):
-        self.assertEqual(Query("Aaa").payload, {"TableName": "Aaa"})
-
-    def test_key_eq(self):
-        self.assertEqual(
-            Query("Aaa").key_eq("name", 42).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "42"}]}},
-            }
-        )
-
-    def test_key_le(self):
-        self.assertEqual(
-            Query("Aaa").key_le("name", 42).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "LE", "AttributeValueList": [{"N": "42"}]}},
-            }
-        )
-
-    def test_key_lt(self):
-        self.assertEqual(
-            Query("Aaa").key_lt("name", 42).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "LT", "AttributeValueList": [{"N": "42"}]}},
-            }
-        )
-
-    def test_key_ge(self):
-        self.assertEqual(
-            Query("Aaa").key_ge("name", 42).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "GE", "AttributeValueList": [{"N": "42"}]}},
-            }
-        )
-
-    def test_key_gt(self):
-        self.assertEqual(
-            Query("Aaa").key_gt("name", 42).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "GT", "AttributeValueList": [{"N": "42"}]}},
-            }
-        )
-
-    def test_key_begins_with(self):
-        self.assertEqual(
-            Query("Aaa").key_begins_with("name", "prefix").payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "BEGINS_WITH", "AttributeValueList": [{"S": "prefix"}]}},
-            }
-        )
-
-    def test_key_between(self):
-        self.assertEqual(
-            Query("Aaa").key_between("name", 42, 44).payload,
-            {
-                "TableName": "Aaa",
-                "KeyConditions": {"name": {"ComparisonOperator": "BETWEEN", "AttributeValueList": [{"N": "42"}, {"N": "44"}]}},
-            }
-        )
-
-    def test_exclusive_start_key(self):
-        self.assertEqual(Query("Aaa").exclusive_start_key({"h": "v"}).payload, {"TableName": "Aaa", "ExclusiveStartKey": {"h": {"S": "v"}}})
-
-    def test_limit(self):
-        self.assertEqual(Query("Aaa").limit(4).payload, {"TableName": "Aaa", "Limit": 4})
-
-    def test_select_all_attributes(self):
-        self.assertEqual(Query("Aaa").select_all_attributes().payload, {"TableName": "Aaa", "Select": "ALL_ATTRIBUTES"})
-
-    def test_select_all_projected_attributes(self):
-        self.assertEqual(Query("Aaa").select_all_projected_attributes().payload, {"TableName": "Aaa", "Select": "ALL_PROJECTED_ATTRIBUTES"})
-
-    def test_select_count(self):
-        self.assertEqual(Query("Aaa").select_count().payload, {"TableName": "Aaa", "Select": "COUNT"})
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(Query("Aaa").expression_attribute_name("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeNames": {"#n": "p"}})
-
-    def test_expression_attribute_value(self):
-        self.assertEqual(Query("Aaa").expression_attribute_value("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeValues": {":n": {"S": "p"}}})
-
-    def test_project(self):
-        self.assertEqual(Query("Aaa").project("a").payload, {"TableName": "Aaa", "ProjectionExpression": "a"})
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(Query("Aaa").return_consumed_capacity_total().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "TOTAL"})
-
-    def test_return_consumed_capacity_indexes(self):
-        self.assertEqual(Query("Aaa").return_consumed_capacity_indexes().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "INDEXES"})
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(Query("Aaa").return_consumed_capacity_none().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "NONE"})
-
-    def test_filter_expression(self):
-        self.assertEqual(Query("Aaa").filter_expression("a=b").payload, {"TableName": "Aaa", "FilterExpression": "a=b"})
-
-    def test_consistent_read_true(self):
-        self.assertEqual(Query("Aaa").consistent_read_true().payload, {"TableName": "Aaa", "ConsistentRead": True})
-
-    def test_consistent_read_false(self):
-        self.assertEqual(Query("Aaa").consistent_read_false().payload, {"TableName": "Aaa", "ConsistentRead": False})
-
-    def test_index_name(self):
-        self.assertEqual(Query("Aaa").index_name("foo").payload, {"TableName": "Aaa", "IndexName": "foo"})
-
-    def test_scan_index_forward_true(self):
-        self.assertEqual(Query("Aaa").scan_index_forward_true().payload, {"TableName": "Aaa", "ScanIndexForward": True})
-
-    def test_scan_index_forward_false(self):
-        self.assertEqual(Query("Aaa").scan_index_forward_false().payload, {"TableName": "Aaa", "ScanIndexForward": False})
-
-
-class QueryResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = QueryResponse()
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.count)
-        self.assertIsNone(r.items)
-        self.assertIsNone(r.last_evaluated_key)
-        self.assertIsNone(r.scanned_count)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = QueryResponse(ConsumedCapacity={}, Count=1, Items=[{"h": {"S": "a"}}], LastEvaluatedKey={"h": {"S": "b"}}, ScannedCount=2)
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertEqual(r.count, 1)
-        self.assertEqual(r.items, [{"h": "a"}])
-        self.assertEqual(r.last_evaluated_key, {"h": "b"})
-        self.assertEqual(r.scanned_count, 2)
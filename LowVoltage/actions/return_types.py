@@ -4,7 +4,6 @@
 
 import datetime
 
-import LowVoltage.testing as _tst
 from LowVoltage.actions.conversion import _convert_dict_to_db, _convert_value_to_db, _convert_db_to_dict, _convert_db_to_value
 
 
@@ -147,45 +146,6 @@ class TableDescription(object):
             return self.__table_status
 
 
-class TableDescriptionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = TableDescription()
-        self.assertIsNone(r.attribute_definitions)
-        self.assertIsNone(r.creation_date_time)
-        self.assertIsNone(r.global_secondary_indexes)
-        self.assertIsNone(r.item_count)
-        self.assertIsNone(r.key_schema)
-        self.assertIsNone(r.local_secondary_indexes)
-        self.assertIsNone(r.provisioned_throughput)
-        self.assertIsNone(r.table_name)
-        self.assertIsNone(r.table_size_bytes)
-        self.assertIsNone(r.table_status)
-
-    def test_all_set(self):
-        r = TableDescription(
-            AttributeDefinitions=[{}],
-            CreationDateTime=1430147859.5,
-            GlobalSecondaryIndexes=[{}],
-            ItemCount=1,
-            KeySchema=[{}],
-            LocalSecondaryIndexes=[{}],
-            ProvisionedThroughput={},
-            TableName="Aaa",
-            TableSizeBytes=42,
-            TableStatus="ACTIVE",
-        )
-        self.assertIsInstance(r.attribute_definitions[0], AttributeDefinition)
-        self.assertEqual(r.creation_date_time, datetime.datetime(2015, 4, 27, 15, 17, 39, 500000))
-        self.assertIsInstance(r.global_secondary_indexes[0], GlobalSecondaryIndexDescription)
-        self.assertEqual(r.item_count, 1)
-        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
-        self.assertIsInstance(r.local_secondary_indexes[0], LocalSecondaryIndexDescription)
-        self.assertIsInstance(r.provisioned_throughput, ProvisionedThroughputDescription)
-        self.assertEqual(r.table_name, "Aaa")
-        self.assertEqual(r.table_size_bytes, 42)
-        self.assertEqual(r.table_status, "ACTIVE")
-
-
 class AttributeDefinition(object):
     """
     `AttributeDefinition <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_AttributeDefinition.html>`__.
@@ -217,18 +177,6 @@ class AttributeDefinition(object):
             return self.__attribute_type
 
 
-class AttributeDefinitionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = AttributeDefinition()
-        self.assertIsNone(r.attribute_name)
-        self.assertIsNone(r.attribute_type)
-
-    def test_all_set(self):
-        r = AttributeDefinition(AttributeName="a", AttributeType="b")
-        self.assertEqual(r.attribute_name, "a")
-        self.assertEqual(r.attribute_type, "b")
-
-
 class GlobalSecondaryIndexDescription(object):
     """
     `GlobalSecondaryIndexDescription <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_GlobalSecondaryIndexDescription.html>`__.
@@ -310,36 +258,6 @@ class GlobalSecondaryIndexDescription(object):
             return ProvisionedThroughputDescription(**self.__provisioned_throughput)
 
 
-class GlobalSecondaryIndexDescriptionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = GlobalSecondaryIndexDescription()
-        self.assertIsNone(r.index_name)
-        self.assertIsNone(r.index_size_bytes)
-        self.assertIsNone(r.index_status)
-        self.assertIsNone(r.item_count)
-        self.assertIsNone(r.key_schema)
-        self.assertIsNone(r.projection)
-        self.assertIsNone(r.provisioned_throughput)
-
-    def test_all_set(self):
-        r = GlobalSecondaryIndexDescription(
-            IndexName="a",
-            IndexSizeBytes=42,
-            IndexStatus="ACTIVE",
-            ItemCount=57,
-            KeySchema=[{}],
-            Projection={},
-            ProvisionedThroughput={},
-        )
-        self.assertEqual(r.index_name, "a")
-        self.assertEqual(r.index_size_bytes, 42)
-        self.assertEqual(r.index_status, "ACTIVE")
-        self.assertEqual(r.item_count, 57)
-        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
-        self.assertIsInstance(r.projection, Projection)
-        self.assertIsInstance(r.provisioned_throughput, ProvisionedThroughputDescription)
-
-
 class Projection(object):
     """
     `Projection <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_Projection.html>`__.
@@ -371,18 +289,6 @@ class Projection(object):
             return self.__projection_type
 
 
-class ProjectionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = Projection()
-        self.assertIsNone(r.non_key_attributes)
-        self.assertIsNone(r.projection_type)
-
-    def test_all_set(self):
-        r = Projection(NonKeyAttributes=["a"], ProjectionType="b")
-        self.assertEqual(r.non_key_attributes, ["a"])
-        self.assertEqual(r.projection_type, "b")
-
-
 class ProvisionedThroughputDescription(object):
     """
     `ProvisionedThroughputDescription <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_ProvisionedThroughputDescription.html>`__.
@@ -444,30 +350,6 @@ class ProvisionedThroughputDescription(object):
             return int(self.__write_capacity_units)
 
 
-class ProvisionedThroughputDescriptionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = ProvisionedThroughputDescription()
-        self.assertIsNone(r.last_decrease_date_time)
-        self.assertIsNone(r.last_increase_date_time)
-        self.assertIsNone(r.number_of_decreases_today)
-        self.assertIsNone(r.read_capacity_units)
-        self.assertIsNone(r.write_capacity_units)
-
-    def test_all_set(self):
-        r = ProvisionedThroughputDescription(
-            LastDecreaseDateTime=1430148376.2,
-            LastIncreaseDateTime=1430148384.2,
-            NumberOfDecreasesToday=4,
-            ReadCapacityUnits=5,
-            WriteCapacityUnits=6,
-        )
-        self.assertEqual(r.last_decrease_date_time, datetime.datetime(2015, 4, 27, 15, 26, 16, 200000))
-        self.assertEqual(r.last_increase_date_time, datetime.datetime(2015, 4, 27, 15, 26, 24, 200000))
-        self.assertEqual(r.number_of_decreases_today, 4)
-        self.assertEqual(r.read_capacity_units, 5)
-        self.assertEqual(r.write_capacity_units, 6)
-
-
 class KeySchemaElement(object):
     """
     `KeySchemaElement <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_KeySchemaElement.html>`__.
@@ -499,18 +381,6 @@ class KeySchemaElement(object):
             return self.__key_type
 
 
-class KeySchemaElementUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = KeySchemaElement()
-        self.assertIsNone(r.attribute_name)
-        self.assertIsNone(r.key_type)
-
-    def test_all_set(self):
-        r = KeySchemaElement(AttributeName="a", KeyType="b")
-        self.assertEqual(r.attribute_name, "a")
-        self.assertEqual(r.key_type, "b")
-
-
 class LocalSecondaryIndexDescription(object):
     """
     `LocalSecondaryIndexDescription <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_LocalSecondaryIndexDescription.html>`__.
@@ -572,30 +442,6 @@ class LocalSecondaryIndexDescription(object):
             return Projection(**self.__projection)
 
 
-class LocalSecondaryIndexDescriptionUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = LocalSecondaryIndexDescription()
-        self.assertIsNone(r.index_name)
-        self.assertIsNone(r.index_size_bytes)
-        self.assertIsNone(r.item_count)
-        self.assertIsNone(r.key_schema)
-        self.assertIsNone(r.projection)
-
-    def test_all_set(self):
-        r = LocalSecondaryIndexDescription(
-            IndexName="a",
-            IndexSizeBytes=42,
-            ItemCount=57,
-            KeySchema=[{}],
-            Projection={},
-        )
-        self.assertEqual(r.index_name, "a")
-        self.assertEqual(r.index_size_bytes, 42)
-        self.assertEqual(r.item_count, 57)
-        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
-        self.assertIsInstance(r.projection, Projection)
-
-
 class ConsumedCapacity(object):
     """
     `ConsumedCapacity <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_ConsumedCapacity.html>`__.
@@ -667,30 +513,6 @@ class ConsumedCapacity(object):
             return self.__table_name
 
 
-class ConsumedCapacityUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = ConsumedCapacity()
-        self.assertIsNone(r.capacity_units)
-        self.assertIsNone(r.global_secondary_indexes)
-        self.assertIsNone(r.local_secondary_indexes)
-        self.assertIsNone(r.table)
-        self.assertIsNone(r.table_name)
-
-    def test_all_set(self):
-        r = ConsumedCapacity(
-            CapacityUnits=4.,
-            GlobalSecondaryIndexes={"a": {}},
-            LocalSecondaryIndexes={"b": {}},
-            Table={},
-            TableName="A",
-        )
-        self.assertEqual(r.capacity_units, 4.)
-        self.assertIsInstance(r.global_secondary_indexes["a"], Capacity)
-        self.assertIsInstance(r.local_secondary_indexes["b"], Capacity)
-        self.assertIsInstance(r.table, Capacity)
-        self.assertEqual(r.table_name, "A")
-
-
 class Capacity(object):
     """
     `Capacity <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_Capacity.html>`__.
@@ -714,16 +536,6 @@ class Capacity(object):
             return float(self.__capacity_units)
 
 
-class CapacityUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = Capacity()
-        self.assertIsNone(r.capacity_units)
-
-    def test_all_set(self):
-        r = Capacity(CapacityUnits=4.)
-        self.assertEqual(r.capacity_units, 4.)
-
-
 class ItemCollectionMetrics(object):
     """
     `ItemCollectionMetrics <http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_ItemCollectionMetrics.html>`__.
@@ -757,15 +569,3 @@ class ItemCollectionMetrics(object):
         """
         if _is_list_of_float(self.__size_estimate_range_gb):
             return [float(e) for e in self.__size_estimate_range_gb]
-
-
-class ItemCollectionMetricsUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = ItemCollectionMetrics()
-        self.assertIsNone(r.item_collection_key)
-        self.assertIsNone(r.size_estimate_range_gb)
-
-    def test_all_set(self):
-        r = ItemCollectionMetrics(ItemCollectionKey={"h": {"S": "a"}}, SizeEstimateRangeGB=[0., 1.])
-        self.assertEqual(r.item_collection_key, {"h": "a"})
-        self.assertEqual(r.size_estimate_range_gb, [0., 1.])
@@ -11,7 +11,7 @@ When given a :class:`Scan`, the connection will return a :class:`ScanResponse`:
 Items are accessed like this:
 
 >>> connection(Scan(table)).items
-[{u'a': 0, u'h': 7}, {u'a': 0, u'h': 8}, {u'h': 3, u'gr': 4, u'gh': 9}, {u'h': 2, u'gr': 6, u'gh': 4}, {u'a': 0, u'h': 9}, {u'h': 4, u'gr': 2, u'gh': 16}, {u'h': 6, u'gr': -2, u'gh': 36}, {u'h': 1, u'gr': 8, u'gh': 1}, {u'h': 0, u'gr': 10, u'gh': 0}, {u'h': 5, u'gr': 0, u'gh': 25}]
+[{'a': 0, 'h': 7}, {'a': 0, 'h': 8}, {'h': 3, 'gr': 4, 'gh': 9}, {'h': 2, 'gr': 6, 'gh': 4}, {'a': 0, 'h': 9}, {'h': 4, 'gr': 2, 'gh': 16}, {'h': 6, 'gr': -2, 'gh': 36}, {'h': 1, 'gr': 8, 'gh': 1}, {'h': 0, 'gr': 10, 'gh': 0}, {'h': 5, 'gr': 0, 'gh': 25}]
 
 Note that items are returned in an undefined order.
 
@@ -19,7 +19,6 @@ See also the :func:`.iterate_scan` compound. And :ref:`actions-vs-compounds` in
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -53,6 +52,7 @@ class ScanResponse(object):
         Items=None,
         LastEvaluatedKey=None,
         ScannedCount=None,
+        compressed_attributes=(),
         **dummy
     ):
         self.__consumed_capacity = ConsumedCapacity
@@ -60,6 +60,7 @@ class ScanResponse(object):
         self.__items = Items
         self.__last_evaluated_key = LastEvaluatedKey
         self.__scanned_count = ScannedCount
+        self.__compressed_attributes = compressed_attributes
 
     @property
     def consumed_capacity(self):
@@ -85,11 +86,12 @@ class ScanResponse(object):
     def items(self):
         """
         The items matching the scan. Unless you used :meth:`.Scan.select_count`.
+        Attributes listed in the ``compressed_attributes`` of the :class:`.Connection` are returned decompressed.
 
         :type: ``None`` or list of dict
         """
         if _is_list_of_dict(self.__items):
-            return [_convert_db_to_dict(i) for i in self.__items]
+            return [_convert_db_to_dict(i, self.__compressed_attributes) for i in self.__items]
 
     @property
     def last_evaluated_key(self):
@@ -176,15 +178,15 @@ class Scan(Action):
         ...     .limit(5)
         ... )
         >>> r.items
-        [{u'h': 7}, {u'h': 8}, {u'h': 3}, {u'h': 2}, {u'h': 9}]
+        [{'h': 7}, {'h': 8}, {'h': 3}, {'h': 2}, {'h': 9}]
         >>> r.last_evaluated_key
-        {u'h': 9}
+        {'h': 9}
         >>> connection(
         ...   Scan(table)
         ...     .project("h")
         ...     .exclusive_start_key({"h": 9})
         ... ).items
-        [{u'h': 4}, {u'h': 6}, {u'h': 1}, {u'h': 0}, {u'h': 5}]
+        [{'h': 4}, {'h': 6}, {'h': 1}, {'h': 0}, {'h': 5}]
         """
         return self.__exclusive_start_key.set(key)
 
@@ -222,7 +224,7 @@ class Scan(Action):
         ...   Scan(table)
         ...     .index_name("gsi")
         ... ).items
-        [{u'h': 5, u'gr': 0, u'gh': 25}, {u'h': 3, u'gr': 4, u'gh': 9}, {u'h': 2, u'gr': 6, u'gh': 4}, {u'h': 4, u'gr': 2, u'gh': 16}, {u'h': 6, u'gr': -2, u'gh': 36}, {u'h': 1, u'gr': 8, u'gh': 1}, {u'h': 0, u'gr': 10, u'gh': 0}]
+        [{'h': 5, 'gr': 0, 'gh': 25}, {'h': 3, 'gr': 4, 'gh': 9}, {'h': 2, 'gr': 6, 'gh': 4}, {'h': 4, 'gr': 2, 'gh': 16}, {'h': 6, 'gr': -2, 'gh': 36}, {'h': 1, 'gr': 8, 'gh': 1}, {'h': 0, 'gr': 10, 'gh': 0}]
         """
         return self.__index_name.set(index_name)
 
@@ -237,7 +239,7 @@ class Scan(Action):
     def project(self, *names):
         """
         >>> connection(Scan(table).project("h")).items
-        [{u'h': 7}, {u'h': 8}, {u'h': 3}, {u'h': 2}, {u'h': 9}, {u'h': 4}, {u'h': 6}, {u'h': 1}, {u'h': 0}, {u'h': 5}]
+        [{'h': 7}, {'h': 8}, {'h': 3}, {'h': 2}, {'h': 9}, {'h': 4}, {'h': 6}, {'h': 1}, {'h': 0}, {'h': 5}]
         """
         return self.__projection_expression.add(*names)
 
@@ -255,10 +257,10 @@ class Scan(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   Scan(table)
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -277,13 +279,13 @@ class Scan(Action):
         ...     .project("h")
         ...     .segment(0, 2)
         ... ).items
-        [{u'h': 7}, {u'h': 8}, {u'h': 3}, {u'h': 2}, {u'h': 9}, {u'h': 4}]
+        [{'h': 7}, {'h': 8}, {'h': 3}, {'h': 2}, {'h': 9}, {'h': 4}]
         >>> connection(
         ...   Scan(table)
         ...     .project("h")
         ...     .segment(1, 2)
         ... ).items
-        [{u'h': 6}, {u'h': 1}, {u'h': 0}, {u'h': 5}]
+        [{'h': 6}, {'h': 1}, {'h': 0}, {'h': 5}]
         """
         self.__segment.set(segment)
         return self.__total_segments.set(total_segments)
@@ -293,8 +295,8 @@ class Scan(Action):
         """
         >>> r = connection(Scan(table).select_count())
         >>> r.count
-        10L
-        >>> print r.items
+        10
+        >>> print(r.items)
         None
         """
         return self.__select.count()
@@ -303,72 +305,6 @@ class Scan(Action):
     def select_all_attributes(self):
         """
         >>> connection(Scan(table).select_all_attributes()).items
-        [{u'a': 0, u'h': 7}, {u'a': 0, u'h': 8}, {u'h': 3, u'gr': 4, u'gh': 9}, {u'h': 2, u'gr': 6, u'gh': 4}, {u'a': 0, u'h': 9}, {u'h': 4, u'gr': 2, u'gh': 16}, {u'h': 6, u'gr': -2, u'gh': 36}, {u'h': 1, u'gr': 8, u'gh': 1}, {u'h': 0, u'gr': 10, u'gh': 0}, {u'h': 5, u'gr': 0, u'gh': 25}]
+        [{'a': 0, 'h': 7}, {'a': 0, 'h': 8}, {'h': 3, 'gr': 4, 'gh': 9}, {'h': 2, 'gr': 6, 'gh': 4}, {'a': 0, 'h': 9}, {'h': 4, 'gr': 2, 'gh': 16}, {'h': 6, 'gr': -2, 'gh': 36}, {'h': 1, 'gr': 8, 'gh': 1}, {'h': 0, 'gr': 10, 'gh': 0}, {'h': 5, 'gr': 0, 'gh': 25}]
         """
         return self.__select.all_attributes()
-
-
-class ScanUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(Scan("Aaa").name, "Scan")
-
-    def test_table_name(self):
-        self.assertEqual(Scan().table_name("Aaa").payload, {"TableName": "Aaa"})
-
-    def test_constructor(self):
-        self.assertEqual(Scan("Aaa").payload, {"TableName": "Aaa"})
-
-    def test_segment(self):
-        self.assertEqual(Scan("Aaa").segment(0, 2).payload, {"TableName": "Aaa", "Segment": 0, "TotalSegments": 2})
-
-    def test_exclusive_start_key(self):
-        self.assertEqual(Scan("Aaa").exclusive_start_key({"h": "v"}).payload, {"TableName": "Aaa", "ExclusiveStartKey": {"h": {"S": "v"}}})
-
-    def test_limit(self):
-        self.assertEqual(Scan("Aaa").limit(4).payload, {"TableName": "Aaa", "Limit": 4})
-
-    def test_index_name(self):
-        self.assertEqual(Scan("Aaa").index_name("FooBar").payload, {"TableName": "Aaa", "IndexName": "FooBar"})
-
-    def test_select_all_attributes(self):
-        self.assertEqual(Scan("Aaa").select_all_attributes().payload, {"TableName": "Aaa", "Select": "ALL_ATTRIBUTES"})
-
-    def test_select_count(self):
-        self.assertEqual(Scan("Aaa").select_count().payload, {"TableName": "Aaa", "Select": "COUNT"})
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(Scan("Aaa").expression_attribute_name("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeNames": {"#n": "p"}})
-
-    def test_expression_attribute_value(self):
-        self.assertEqual(Scan("Aaa").expression_attribute_value("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeValues": {":n": {"S": "p"}}})
-
-    def test_project(self):
-        self.assertEqual(Scan("Aaa").project("a").payload, {"TableName": "Aaa", "ProjectionExpression": "a"})
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(Scan("Aaa").return_consumed_capacity_total().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "TOTAL"})
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(Scan("Aaa").return_consumed_capacity_none().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "NONE"})
-
-    def test_filter_expression(self):
-        self.assertEqual(Scan("Aaa").filter_expression("a=b").payload, {"TableName": "Aaa", "FilterExpression": "a=b"})
-
-
-class ScanResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = ScanResponse()
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.count)
-        self.assertIsNone(r.items)
-        self.assertIsNone(r.last_evaluated_key)
-        self.assertIsNone(r.scanned_count)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = ScanResponse(ConsumedCapacity={}, Count=1, Items=[{"h": {"S": "a"}}], LastEvaluatedKey={"h": {"S": "b"}}, ScannedCount=2)
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertEqual(r.count, 1)
-        self.assertEqual(r.items, [{"h": "a"}])
-        self.assertEqual(r.last_evaluated_key, {"h": "b"})
-        self.assertEqual(r.scanned_count, 2)
@@ -0,0 +1,32 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .test_conversion import ConversionUnitTests, CompressionUnitTests
+from .test_expressions import ConditionExpressionUnitTests
+from .test_return_types import (
+    TableDescriptionUnitTests,
+    AttributeDefinitionUnitTests,
+    GlobalSecondaryIndexDescriptionUnitTests,
+    ProjectionUnitTests,
+    ProvisionedThroughputDescriptionUnitTests,
+    KeySchemaElementUnitTests,
+    LocalSecondaryIndexDescriptionUnitTests,
+    ConsumedCapacityUnitTests,
+    CapacityUnitTests,
+    ItemCollectionMetricsUnitTests,
+)
+
+from .test_batch_get_item import BatchGetItemUnitTests, BatchGetItemResponseUnitTests
+from .test_batch_write_item import BatchWriteItemUnitTests, BatchWriteItemResponseUnitTests
+from .test_create_table import CreateTableUnitTests, CreateTableResponseUnitTests
+from .test_delete_item import DeleteItemUnitTests, DeleteItemResponseUnitTests
+from .test_delete_table import DeleteTableUnitTests, DeleteTableResponseUnitTests
+from .test_describe_table import DescribeTableUnitTests, DescribeTableResponseUnitTests
+from .test_get_item import GetItemUnitTests, GetItemResponseUnitTests
+from .test_list_tables import ListTablesUnitTests, ListTablesResponseUnitTests
+from .test_put_item import PutItemUnitTests, PutItemResponseUnitTests
+from .test_query import QueryUnitTests, QueryResponseUnitTests
+from .test_scan import ScanUnitTests, ScanResponseUnitTests
+from .test_update_item import UpdateItemUnitTests, UpdateItemResponseUnitTests
+from .test_update_table import UpdateTableUnitTests, UpdateTableResponseUnitTests
@@ -0,0 +1,211 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity
+from LowVoltage.actions.batch_get_item import BatchGetItemResponse, BatchGetItem
+
+
+class BatchGetItemUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(BatchGetItem().name, "BatchGetItem")
+
+    def test_empty(self):
+        self.assertEqual(
+            BatchGetItem().payload,
+            {}
+        )
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(
+            BatchGetItem().return_consumed_capacity_none().payload,
+            {
+                "ReturnConsumedCapacity": "NONE",
+            }
+        )
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(
+            BatchGetItem().return_consumed_capacity_total().payload,
+            {
+                "ReturnConsumedCapacity": "TOTAL",
+            }
+        )
+
+    def test_constructor_with_table(self):
+        self.assertEqual(
+            BatchGetItem("Table").keys({"h": "1"}, {"h": "2"}).payload,
+            {
+                "RequestItems": {
+                    "Table": {
+                        "Keys": [
+                            {"h": {"S": "1"}},
+                            {"h": {"S": "2"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_constructor_with_keys(self):
+        self.assertEqual(
+            BatchGetItem("Table", {"h": "1"}, {"h": "2"}).payload,
+            {
+                "RequestItems": {
+                    "Table": {
+                        "Keys": [
+                            {"h": {"S": "1"}},
+                            {"h": {"S": "2"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_constructor_with_keys_in_list(self):
+        self.assertEqual(
+            BatchGetItem("Table", [{"h": "1"}, {"h": "2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": {
+                        "Keys": [
+                            {"h": {"S": "1"}},
+                            {"h": {"S": "2"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_table_keys(self):
+        self.assertEqual(
+            BatchGetItem().table("Table", {"h": "1"}, {"h": "2"}).payload,
+            {
+                "RequestItems": {
+                    "Table": {
+                        "Keys": [
+                            {"h": {"S": "1"}},
+                            {"h": {"S": "2"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_table_keys_twice(self):
+        self.assertEqual(
+            BatchGetItem().table("Table", {"h": "1"}).table("Table", {"h": "2"}).payload,
+            {
+                "RequestItems": {
+                    "Table": {
+                        "Keys": [
+                            {"h": {"S": "1"}},
+                            {"h": {"S": "2"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_keys(self):
+        self.assertEqual(
+            BatchGetItem().table("Table2").keys({"hash": "h21"}).table("Table1").keys({"hash": "h11"}, {"hash": "h12"}).table("Table2").keys([{"hash": "h22"}, {"hash": "h23"}]).payload,
+            {
+                "RequestItems": {
+                    "Table1": {
+                        "Keys": [
+                            {"hash": {"S": "h11"}},
+                            {"hash": {"S": "h12"}},
+                        ]
+                    },
+                    "Table2": {
+                        "Keys": [
+                            {"hash": {"S": "h21"}},
+                            {"hash": {"S": "h22"}},
+                            {"hash": {"S": "h23"}},
+                        ]
+                    },
+                }
+            }
+        )
+
+    def test_consistent_read(self):
+        self.assertEqual(
+            BatchGetItem().table("Table1").consistent_read_true().table("Table2").consistent_read_false().payload,
+            {
+                "RequestItems": {
+                    "Table1": {
+                        "ConsistentRead": True,
+                    },
+                    "Table2": {
+                        "ConsistentRead": False,
+                    },
+                }
+            }
+        )
+
+    def test_project(self):
+        self.assertEqual(
+            BatchGetItem().table("Table1").project("a").payload,
+            {
+                "RequestItems": {
+                    "Table1": {
+                        "ProjectionExpression": "a",
+                    },
+                }
+            }
+        )
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(
+            BatchGetItem().table("Table1").expression_attribute_name("a", "p").payload,
+            {
+                "RequestItems": {
+                    "Table1": {
+                        "ExpressionAttributeNames": {"#a": "p"},
+                    },
+                }
+            }
+        )
+
+    def test_keys_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchGetItem().keys({"h": 0})
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+    def test_consistent_read_true_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchGetItem().consistent_read_true()
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+    def test_consistent_read_false_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchGetItem().consistent_read_false()
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+    def test_project_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchGetItem().project("a")
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+    def test_expression_attribute_name_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchGetItem().expression_attribute_name("a", "b")
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+
+class BatchGetItemResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = BatchGetItemResponse()
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.responses)
+        self.assertIsNone(r.unprocessed_keys)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = BatchGetItemResponse(ConsumedCapacity=[{}], Responses={"A": [{"h": {"S": "a"}}]}, UnprocessedKeys=unprocessed_keys)
+        self.assertIsInstance(r.consumed_capacity[0], ConsumedCapacity)
+        self.assertEqual(r.responses, {"A": [{"h": "a"}]})
+        self.assertIs(r.unprocessed_keys, unprocessed_keys)
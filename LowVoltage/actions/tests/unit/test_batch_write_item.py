@@ -0,0 +1,231 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity, ItemCollectionMetrics
+from LowVoltage.actions.batch_write_item import BatchWriteItemResponse, BatchWriteItem
+
+
+class BatchWriteItemUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(BatchWriteItem().name, "BatchWriteItem")
+
+    def test_empty(self):
+        self.assertEqual(
+            BatchWriteItem().payload,
+            {}
+        )
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(
+            BatchWriteItem().return_consumed_capacity_none().payload,
+            {
+                "ReturnConsumedCapacity": "NONE",
+            }
+        )
+
+    def test_return_consumed_capacity_indexes(self):
+        self.assertEqual(
+            BatchWriteItem().return_consumed_capacity_indexes().payload,
+            {
+                "ReturnConsumedCapacity": "INDEXES",
+            }
+        )
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(
+            BatchWriteItem().return_consumed_capacity_total().payload,
+            {
+                "ReturnConsumedCapacity": "TOTAL",
+            }
+        )
+
+    def test_return_item_collection_metrics_none(self):
+        self.assertEqual(
+            BatchWriteItem().return_item_collection_metrics_none().payload,
+            {
+                "ReturnItemCollectionMetrics": "NONE",
+            }
+        )
+
+    def test_return_item_collection_metrics_size(self):
+        self.assertEqual(
+            BatchWriteItem().return_item_collection_metrics_size().payload,
+            {
+                "ReturnItemCollectionMetrics": "SIZE",
+            }
+        )
+
+    def test_table(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table").payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                    ],
+                },
+            }
+        )
+
+    def test_constuctor_with_table(self):
+        self.assertEqual(
+            BatchWriteItem("Table").delete({"hash": "h1"}).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_constuctor_with_table_and_delete(self):
+        self.assertEqual(
+            BatchWriteItem("Table", delete=[{"hash": "h1"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_constuctor_with_table_and_put(self):
+        self.assertEqual(
+            BatchWriteItem("Table", put=[{"hash": "h1"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_table_with_delete(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table", delete=[{"hash": "h1"}, {"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_table_with_delete_twice(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table", delete=[{"hash": "h1"}]).table("Table", delete=[{"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_table_with_put(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table", put=[{"hash": "h1"}, {"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
+                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_table_with_put_twice(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table", put=[{"hash": "h1"}]).table("Table", put=[{"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
+                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_delete(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table").delete({"hash": "h1"}).table("Table").delete([{"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_put(self):
+        self.assertEqual(
+            BatchWriteItem().table("Table").put({"hash": "h1"}, [{"hash": "h2"}]).payload,
+            {
+                "RequestItems": {
+                    "Table": [
+                        {"PutRequest": {"Item": {"hash": {"S": "h1"}}}},
+                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_alternate_between_tables_and_put_delete(self):
+        self.assertEqual(
+            BatchWriteItem()
+                .table("Table1").delete({"hash": "h1"})
+                .table("Table2").put([{"hash": "h2"}])
+                .table("Table1").put({"hash": "h11"})
+                .table("Table2").delete({"hash": "h22"})
+                .payload,
+            {
+                "RequestItems": {
+                    "Table1": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h1"}}}},
+                        {"PutRequest": {"Item": {"hash": {"S": "h11"}}}},
+                    ],
+                    "Table2": [
+                        {"DeleteRequest": {"Key": {"hash": {"S": "h22"}}}},
+                        {"PutRequest": {"Item": {"hash": {"S": "h2"}}}},
+                    ],
+                },
+            }
+        )
+
+    def test_put_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchWriteItem().put({"h": 0})
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+    def test_delete_without_active_table(self):
+        with self.assertRaises(_lv.BuilderError) as catcher:
+            BatchWriteItem().delete({"h": 0})
+        self.assertEqual(catcher.exception.args, ("No active table.",))
+
+
+class BatchWriteItemResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = BatchWriteItemResponse()
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.item_collection_metrics)
+        self.assertIsNone(r.unprocessed_items)
+
+    def test_all_set(self):
+        unprocessed_items = object()
+        r = BatchWriteItemResponse(ConsumedCapacity=[{}], ItemCollectionMetrics={"A": [{}]}, UnprocessedItems=unprocessed_items)
+        self.assertIsInstance(r.consumed_capacity[0], ConsumedCapacity)
+        self.assertIsInstance(r.item_collection_metrics["A"][0], ItemCollectionMetrics)
+        self.assertIs(r.unprocessed_items, unprocessed_items)
@@ -0,0 +1,200 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import base64
+import zlib
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.conversion import _convert_dict_to_db, _convert_value_to_db, _convert_db_to_dict, _convert_db_to_value
+from LowVoltage.actions.conversion import Compressed, compress_item, decompress_item
+from LowVoltage.stand_in import Database, Server
+
+
+class ConversionUnitTests(_tst.UnitTests):
+    def test_convert_unicode_value_to_db(self):
+        self.assertEqual(_convert_value_to_db("éoà"), {"S": "éoà"})
+
+    def test_convert_bytes_value_to_db(self):
+        self.assertEqual(_convert_value_to_db(b"\xFF\x00\xAB"), {"B": "/wCr"})
+
+    def test_convert_bool_value_to_db(self):
+        self.assertEqual(_convert_value_to_db(True), {"BOOL": True})
+        self.assertEqual(_convert_value_to_db(False), {"BOOL": False})
+
+    def test_convert_int_value_to_db(self):
+        self.assertEqual(_convert_value_to_db(42), {"N": "42"})
+
+    def test_convert_none_value_to_db(self):
+        self.assertEqual(_convert_value_to_db(None), {"NULL": True})
+
+    def test_convert_set_of_int_value_to_db(self):
+        self.assertIn(_convert_value_to_db(set([42, 43])), [{"NS": ["42", "43"]}, {"NS": ["43", "42"]}])
+
+    def test_convert_frozenset_value_to_db(self):
+        self.assertIn(_convert_value_to_db(frozenset([42, 43])), [{"NS": ["42", "43"]}, {"NS": ["43", "42"]}])
+
+    def test_convert_set_of_unicode_value_to_db(self):
+        self.assertIn(_convert_value_to_db(set(["éoà", "bar"])), [{"SS": ["éoà", "bar"]}, {"SS": ["bar", "éoà"]}])
+
+    def test_convert_set_of_byte_value_to_db(self):
+        self.assertIn(_convert_value_to_db(set([b"\xFF\x00\xAB", b"bar"])), [{"BS": ["/wCr", "YmFy"]}, {"BS": ["YmFy", "/wCr"]}])
+
+    def test_convert_list_value_to_db(self):
+        self.assertEqual(_convert_value_to_db([True, 42]), {"L": [{"BOOL": True}, {"N": "42"}]})
+
+    def test_convert_dict_value_to_db(self):
+        self.assertEqual(_convert_value_to_db({"a": True, "b": 42}), {"M": {"a": {"BOOL": True}, "b": {"N": "42"}}})
+
+    def test_convert_empty_set_value_to_db(self):
+        with self.assertRaises(TypeError):
+            _convert_value_to_db(set())
+
+    def test_convert_set_of_tuple_value_to_db(self):
+        with self.assertRaises(TypeError):
+            _convert_value_to_db(set([(1, 2)]))
+
+    def test_convert_heterogenous_set_value_to_db(self):
+        with self.assertRaises(TypeError):
+            _convert_value_to_db(set([1, "2"]))
+
+    def test_convert_tuple_value_to_db(self):
+        with self.assertRaises(TypeError):
+            _convert_value_to_db((1, 2))
+
+    def test_convert_db_to_unicode_value(self):
+        self.assertEqual(_convert_db_to_value({"S": "éoà"}), "éoà")
+
+    def test_convert_db_to_bytes_value(self):
+        self.assertEqual(_convert_db_to_value({"B": "/wCr"}), b"\xFF\x00\xAB")
+
+    def test_convert_db_to_bool_value(self):
+        self.assertEqual(_convert_db_to_value({"BOOL": True}), True)
+        self.assertEqual(_convert_db_to_value({"BOOL": False}), False)
+
+    def test_convert_db_to_int_value(self):
+        self.assertEqual(_convert_db_to_value({"N": "42"}), 42)
+
+    def test_convert_db_to_none_value(self):
+        self.assertEqual(_convert_db_to_value({"NULL": True}), None)
+
+    def test_convert_db_to_set_of_int_value(self):
+        self.assertEqual(_convert_db_to_value({"NS": ["42", "43"]}), set([42, 43]))
+
+    def test_convert_db_to_set_of_unicode_value(self):
+        self.assertEqual(_convert_db_to_value({"SS": ["éoà", "bar"]}), set(["éoà", "bar"]))
+
+    def test_convert_db_to_set_of_byte_value(self):
+        self.assertEqual(_convert_db_to_value({"BS": ["/wCr", "YmFy"]}), set([b"\xFF\x00\xAB", b"bar"]))
+
+    def test_convert_db_to_list_value(self):
+        self.assertEqual(_convert_db_to_value({"L": [{"BOOL": True}, {"N": "42"}]}), [True, 42])
+
+    def test_convert_db_to_dict_value(self):
+        self.assertEqual(_convert_db_to_value({"M": {"a": {"BOOL": True}, "b": {"N": "42"}}}), {"a": True, "b": 42})
+
+    def test_convert_db_to_empty_dict_value(self):
+        with self.assertRaises(TypeError):
+            _convert_db_to_value({})
+
+    def test_convert_db_to_empty_list_value(self):
+        with self.assertRaises(TypeError):
+            _convert_db_to_value([])
+
+    def test_convert_db_to_string_value(self):
+        with self.assertRaises(TypeError):
+            _convert_db_to_value("SSS")
+
+    def test_convert_empty_dict_to_db(self):
+        self.assertEqual(_convert_dict_to_db({}), {})
+
+    def test_convert_dict_to_db(self):
+        self.assertEqual(_convert_dict_to_db({"a": 42}), {"a": {"N": "42"}})
+
+    def test_convert_db_to_empty_dict(self):
+        self.assertEqual(_convert_db_to_dict({}), {})
+
+    def test_convert_db_to_dict(self):
+        self.assertEqual(_convert_db_to_dict({"a": {"N": "42"}}), {"a": 42})
+
+
+class CompressionUnitTests(_tst.UnitTests):
+    def test_compress_unicode(self):
+        value = _convert_value_to_db(Compressed("éoà" * 1000))
+        data = base64.b64decode(value["B"])
+        self.assertEqual(data[:5], b"\x00LVzS")
+        self.assertEqual(zlib.decompress(data[5:]), "éoà".encode("utf8") * 1000)
+        self.assertLess(len(value["B"]), 100)
+        self.assertEqual(decompress_item({"a": _convert_db_to_value(value)}, ["a"]), {"a": "éoà" * 1000})
+
+    def test_compress_bytes(self):
+        value = _convert_value_to_db(Compressed(b"\xFF\x00" * 1000, level=9))
+        self.assertEqual(base64.b64decode(value["B"])[:5], b"\x00LVzB")
+        self.assertEqual(decompress_item({"a": _convert_db_to_value(value)}, ["a"]), {"a": b"\xFF\x00" * 1000})
+
+    def test_compress_other(self):
+        with self.assertRaises(TypeError):
+            Compressed(42)
+
+    def test_not_decompressed_by_default(self):
+        item = _convert_db_to_dict(_convert_dict_to_db({"a": Compressed("x"), "m": {"b": Compressed(b"y")}}))
+        self.assertEqual(item["a"][:5], b"\x00LVzS")
+        self.assertEqual(item["m"]["b"][:5], b"\x00LVzB")
+
+    def test_decompress_only_designated_attributes(self):
+        item = _convert_db_to_dict(_convert_dict_to_db({"a": Compressed("x"), "b": Compressed("y"), "c": 42}))
+        item = decompress_item(item, ["a", "c", "d"])
+        self.assertEqual(item["a"], "x")
+        self.assertEqual(item["b"][:5], b"\x00LVzS")
+        self.assertEqual(item["c"], 42)
+        self.assertNotIn("d", item)
+
+    def test_plain_binary(self):
+        self.assertEqual(_convert_db_to_value({"B": base64.b64encode(b"\x00LV").decode("utf8")}), b"\x00LV")
+        self.assertEqual(_convert_db_to_value({"B": base64.b64encode(b"\x00LVzS hello").decode("utf8")}), b"\x00LVzS hello")
+
+    def test_plain_binary_in_designated_attribute(self):
+        item = {"a": b"\x00LVzS hello", "b": b"\x00LVzX" + zlib.compress(b"x"), "c": b"\x00LVzS" + zlib.compress(b"\xFF")}
+        self.assertEqual(decompress_item(item, ["a", "b", "c"]), item)
+
+    def test_compress_item(self):
+        item = compress_item({"h": "a", "b": "b" * 10, "c": b"c" * 11, "d": "é" * 6, "n": 10 ** 20}, attributes=["b"], threshold=10)
+        self.assertEqual(sorted(name for name, value in item.items() if isinstance(value, Compressed)), ["b", "c", "d"])
+        self.assertEqual(item["h"], "a")
+        self.assertEqual(compress_item({"b": "b"}), {"b": "b"})
+
+    def test_responses(self):
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        database(_lv.PutItem("Aaa", compress_item({"h": 0, "doc": "x" * 100000}, threshold=1024)))
+        expected = {"h": 0, "doc": "x" * 100000}
+        self.assertEqual(decompress_item(database(_lv.GetItem("Aaa", {"h": 0})).item, ["doc"]), expected)
+        self.assertEqual([decompress_item(item, ["doc"]) for item in database(_lv.Query("Aaa").key_eq("h", 0)).items], [expected])
+        self.assertEqual([decompress_item(item, ["doc"]) for item in database(_lv.Scan("Aaa")).items], [expected])
+        self.assertLess(database(_lv.Scan("Aaa").return_consumed_capacity_total()).consumed_capacity.capacity_units, 1)
+
+    def test_responses_decompress_designated_attributes(self):
+        item = _convert_dict_to_db({"h": 0, "doc": Compressed("x" * 1000), "bin": Compressed(b"y")})
+        self.assertEqual(_lv.GetItemResponse(Item=item, compressed_attributes=["doc"]).item["doc"], "x" * 1000)
+        self.assertEqual(_lv.GetItemResponse(Item=item, compressed_attributes=["doc"]).item["bin"][:5], b"\x00LVzB")
+        self.assertEqual(_lv.QueryResponse(Items=[item], compressed_attributes=["doc", "bin"]).items[0]["bin"], b"y")
+        self.assertEqual(_lv.ScanResponse(Items=[item], compressed_attributes=["doc"]).items[0]["doc"], "x" * 1000)
+        self.assertEqual(_lv.BatchGetItemResponse(Responses={"Aaa": [item]}, compressed_attributes=["doc"]).responses["Aaa"][0]["doc"], "x" * 1000)
+        self.assertEqual(_lv.GetItemResponse(Item=item).item["doc"][:5], b"\x00LVzS")
+
+    def test_connection_option(self):
+        with Server() as server:
+            connection = server.connection(compressed_attributes=["doc"])
+            connection(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+            connection(_lv.PutItem("Aaa", {"h": 0, "doc": Compressed("x" * 100000), "bin": b"\x00LVzS hello"}))
+            expected = {"h": 0, "doc": "x" * 100000, "bin": b"\x00LVzS hello"}
+            self.assertEqual(connection(_lv.GetItem("Aaa", {"h": 0})).item, expected)
+            self.assertEqual(connection(_lv.Query("Aaa").key_eq("h", 0)).items, [expected])
+            self.assertEqual(connection(_lv.Scan("Aaa")).items, [expected])
+            self.assertEqual(connection(_lv.BatchGetItem().table("Aaa").keys({"h": 0})).responses, {"Aaa": [expected]})
+            caching_connection = _lv.CachingConnection(connection)
+            self.assertEqual(caching_connection(_lv.GetItem("Aaa", {"h": 0})).item, expected)
+            self.assertEqual(caching_connection(_lv.GetItem("Aaa", {"h": 0})).item, expected)
+            self.assertEqual(caching_connection.hits, 1)
+            self.assertEqual(server.connection()(_lv.GetItem("Aaa", {"h": 0})).item["doc"][:5], b"\x00LVzS")
@@ -0,0 +1,28 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import TableDescription
+from LowVoltage.actions.delete_table import DeleteTableResponse, DeleteTable
+
+
+class DeleteTableUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(DeleteTable("Foo").name, "DeleteTable")
+
+    def test_table_name(self):
+        self.assertEqual(DeleteTable().table_name("Foo").payload, {"TableName": "Foo"})
+
+    def test_constructor(self):
+        self.assertEqual(DeleteTable("Foo").payload, {"TableName": "Foo"})
+
+
+class DeleteTableResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = DeleteTableResponse()
+        self.assertIsNone(r.table_description)
+
+    def test_all_set(self):
+        r = DeleteTableResponse(TableDescription={})
+        self.assertIsInstance(r.table_description, TableDescription)
@@ -0,0 +1,28 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import TableDescription
+from LowVoltage.actions.describe_table import DescribeTableResponse, DescribeTable
+
+
+class DescribeTableUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(DescribeTable("Foo").name, "DescribeTable")
+
+    def test_table_name(self):
+        self.assertEqual(DescribeTable().table_name("Foo").payload, {"TableName": "Foo"})
+
+    def test_constuctor(self):
+        self.assertEqual(DescribeTable("Foo").payload, {"TableName": "Foo"})
+
+
+class DescribeTableResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = DescribeTableResponse()
+        self.assertIsNone(r.table)
+
+    def test_all_set(self):
+        r = DescribeTableResponse(Table={})
+        self.assertIsInstance(r.table, TableDescription)
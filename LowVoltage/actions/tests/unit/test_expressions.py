@@ -0,0 +1,93 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.expressions import _BooleanExpression, _BooleanNegation, _ComparisonExpression, Attr, Val, In, Between, AttributeExists, Contains, BeginsWith
+
+
+class ConditionExpressionUnitTests(_tst.UnitTests):
+    def test_atoms_comparison(self):
+        self.assertEqual((Attr("a") == Attr("b")).bool(), "a=b")
+        self.assertEqual((Attr("a") == Val("b")).bool(), "a=:b")
+        self.assertEqual((Val("a") == Attr("b")).bool(), ":a=b")
+        self.assertEqual((Val("a") == Val("b")).bool(), ":a=:b")
+
+    def test_comparisons(self):
+        self.assertEqual((Attr("a") == Attr("b")).bool(), "a=b")
+        self.assertEqual((Attr("a") != Attr("b")).bool(), "a<>b")
+        self.assertEqual((Attr("a") < Attr("b")).bool(), "a<b")
+        self.assertEqual((Attr("a") <= Attr("b")).bool(), "a<=b")
+        self.assertEqual((Attr("a") > Attr("b")).bool(), "a>b")
+        self.assertEqual((Attr("a") >= Attr("b")).bool(), "a>=b")
+
+    def test_boolean_algebra(self):
+        # Too many parentheses are needed because of lower priority of bitwise operators ("&", "|" and "~"),
+        # but we cannot override keywords ("and", "or" and "not") that would have higher priority.
+        self.assertEqual(((Attr("a") == Attr("b")) & (Attr("c") == Attr("d"))).bool(), "(a=b) AND (c=d)")
+        self.assertEqual(((Attr("a") == Attr("b")) | (Attr("c") == Attr("d"))).bool(), "(a=b) OR (c=d)")
+        self.assertEqual((~((Attr("a") == Attr("b")) | (Attr("c") == Attr("d")))).bool(), "NOT ((a=b) OR (c=d))")
+
+    def test_functions(self):
+        # Erf, we cannot redefine list.__contains__ so we cannot obtain the syntax:
+        # Attr("a") in [Val("b"), Val("c")]
+        # And anyway the result of __contains__ is converted to a boolean by "in".
+        # So we cannot implement Attr("a") in Set(Val("b"), Val("c")) either.
+        self.assertEqual(In(Attr("a"), [Val("b"), Val("c")]).bool(), "a IN (:b, :c)")
+        self.assertEqual(Between(Attr("a"), Val("b"), Val("c")).bool(), "a BETWEEN :b AND :c")
+        self.assertEqual(AttributeExists("a").bool(), "attribute_exists(a)")
+        self.assertEqual(Contains(Val("a"), Attr("b")).bool(), "contains(:a, b)")
+        self.assertEqual(BeginsWith(Val("a"), Attr("b")).bool(), "begins_with(:a, b)")
+
+    def test_missing_parentheses_in_boolean_algebra(self):
+        # But at least, missing parentheses are caught early
+        with self.assertRaises(TypeError):
+            Attr("a") == Attr("b") & Attr("c") == Attr("d")
+        with self.assertRaises(TypeError):
+            (Attr("a") == Attr("b")) & Attr("c") == Attr("d")
+        with self.assertRaises(TypeError):
+            Attr("a") == Attr("b") & (Attr("c") == Attr("d"))
+
+    def test_plain_wrong_types(self):
+        with self.assertRaises(TypeError):
+            Attr("a") & (Attr("c") == Attr("d"))
+        with self.assertRaises(TypeError):
+            (Attr("a") == Attr("c")) & Attr("d")
+        with self.assertRaises(TypeError):
+            (Attr("a") == Attr("c")) == Attr("d")
+        with self.assertRaises(TypeError):
+            In("a", [Attr("a")])
+        with self.assertRaises(TypeError):
+            In(Attr("a"), ["a"])
+        with self.assertRaises(TypeError):
+            _BooleanExpression(Attr("a"), "==", Attr("a") == Attr("b"))
+        with self.assertRaises(TypeError):
+            _BooleanExpression(Attr("a") == Attr("b"), 42, Attr("a") == Attr("b"))
+        with self.assertRaises(TypeError):
+            _BooleanNegation(Attr("a"))
+        with self.assertRaises(TypeError):
+            _ComparisonExpression("a", "==", Attr("b"))
+        with self.assertRaises(TypeError):
+            _ComparisonExpression(Attr("a"), 42, Attr("b"))
+        with self.assertRaises(TypeError):
+            _ComparisonExpression(Attr("a"), "==", "b")
+        with self.assertRaises(TypeError):
+            Attr(42)
+        with self.assertRaises(TypeError):
+            Val(42)
+        with self.assertRaises(TypeError):
+            Between("a", Attr("b"), Attr("c"))
+        with self.assertRaises(TypeError):
+            Between(Attr("a"), "b", Attr("c"))
+        with self.assertRaises(TypeError):
+            Between(Attr("a"), Attr("b"), "c")
+        with self.assertRaises(TypeError):
+            AttributeExists(Attr("a"))
+        with self.assertRaises(TypeError):
+            Contains("a", Attr("b"))
+        with self.assertRaises(TypeError):
+            Contains(Attr("a"), "b")
+        with self.assertRaises(TypeError):
+            BeginsWith("a", Attr("b"))
+        with self.assertRaises(TypeError):
+            BeginsWith(Attr("a"), "b")
@@ -0,0 +1,120 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity
+from LowVoltage.actions.get_item import GetItemResponse, GetItem
+
+
+class GetItemUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(GetItem("Table", {"hash": 42}).name, "GetItem")
+
+    def test_missing_table_name(self):
+        with self.assertRaises(_lv.BuilderError):
+            GetItem().key({"h": 42}).payload
+
+    def test_bad_table_name(self):
+        with self.assertRaises(TypeError):
+            GetItem().table_name(42)
+
+    def test_bad_key(self):
+        with self.assertRaises(TypeError):
+            GetItem().key(42)
+
+    def test_missing_key(self):
+        with self.assertRaises(_lv.BuilderError):
+            GetItem().table_name("Foo").payload
+
+    def test_table_name_and_key(self):
+        self.assertEqual(
+            GetItem().table_name("Table").key({"hash": 42}).payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+            }
+        )
+
+    def test_constructor(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": 42}).payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+            }
+        )
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "NONE",
+            }
+        )
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "TOTAL",
+            }
+        )
+
+    def test_consistent_read_true(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": "h"}).consistent_read_true().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ConsistentRead": True,
+            }
+        )
+
+    def test_consistent_read_false(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": "h"}).consistent_read_false().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ConsistentRead": False,
+            }
+        )
+
+    def test_project(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": "h"}).project("abc").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ProjectionExpression": "abc",
+            }
+        )
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(
+            GetItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "ExpressionAttributeNames": {"#n": "path"},
+            }
+        )
+
+
+class GetItemResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = GetItemResponse()
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.item)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = GetItemResponse(ConsumedCapacity={}, Item={"h": {"S": "a"}})
+        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
+        self.assertEqual(r.item, {"h": "a"})
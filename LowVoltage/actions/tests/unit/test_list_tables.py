@@ -0,0 +1,33 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.list_tables import ListTablesResponse, ListTables
+
+
+class ListTablesUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(ListTables().name, "ListTables")
+
+    def test_no_arguments(self):
+        self.assertEqual(ListTables().payload, {})
+
+    def test_limit(self):
+        self.assertEqual(ListTables().limit(42).payload, {"Limit": 42})
+
+    def test_exclusive_start_table_name(self):
+        self.assertEqual(ListTables().exclusive_start_table_name("Bar").payload, {"ExclusiveStartTableName": "Bar"})
+
+
+class ListTablesResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = ListTablesResponse()
+        self.assertIsNone(r.last_evaluated_table_name)
+        self.assertIsNone(r.table_names)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = ListTablesResponse(LastEvaluatedTableName="Foo", TableNames=["Bar"])
+        self.assertEqual(r.last_evaluated_table_name, "Foo")
+        self.assertEqual(r.table_names, ["Bar"])
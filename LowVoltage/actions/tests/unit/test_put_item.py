@@ -0,0 +1,145 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ItemCollectionMetrics, ConsumedCapacity
+from LowVoltage.actions.put_item import PutItemResponse, PutItem
+
+
+class PutItemUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(PutItem("Table", {"hash": 42}).name, "PutItem")
+
+    def test_table_name_and_item(self):
+        self.assertEqual(
+            PutItem().table_name("Table").item({"hash": 42}).payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"N": "42"}},
+            }
+        )
+
+    def test_constructor(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "value"}).payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "value"}},
+            }
+        )
+
+    def test_return_values_none(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_values_none().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnValues": "NONE",
+            }
+        )
+
+    def test_return_values_all_old(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_values_all_old().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnValues": "ALL_OLD",
+            }
+        )
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "TOTAL",
+            }
+        )
+
+    def test_return_consumed_capacity_indexes(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_consumed_capacity_indexes().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "INDEXES",
+            }
+        )
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "NONE",
+            }
+        )
+
+    def test_return_item_collection_metrics_size(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_item_collection_metrics_size().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnItemCollectionMetrics": "SIZE",
+            }
+        )
+
+    def test_return_item_collection_metrics_none(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": "h"}).return_item_collection_metrics_none().payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"S": "h"}},
+                "ReturnItemCollectionMetrics": "NONE",
+            }
+        )
+
+    def test_expression_attribute_value(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": 42}).expression_attribute_value("v", "value").payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"N": "42"}},
+                "ExpressionAttributeValues": {":v": {"S": "value"}},
+            }
+        )
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"N": "42"}},
+                "ExpressionAttributeNames": {"#n": "path"},
+            }
+        )
+
+    def test_condition_expression(self):
+        self.assertEqual(
+            PutItem("Table", {"hash": 42}).condition_expression("a=b").payload,
+            {
+                "TableName": "Table",
+                "Item": {"hash": {"N": "42"}},
+                "ConditionExpression": "a=b",
+            }
+        )
+
+
+class PutItemResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = PutItemResponse()
+        self.assertIsNone(r.attributes)
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.item_collection_metrics)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = PutItemResponse(Attributes={"h": {"S": "a"}}, ConsumedCapacity={}, ItemCollectionMetrics={})
+        self.assertEqual(r.attributes, {"h": "a"})
+        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
+        self.assertIsInstance(r.item_collection_metrics, ItemCollectionMetrics)
@@ -0,0 +1,151 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity
+from LowVoltage.actions.query import QueryResponse, Query
+
+
+class QueryUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(Query("Aaa").name, "Query")
+
+    def test_table_name(self):
+        self.assertEqual(Query().table_name("Aaa").payload, {"TableName": "Aaa"})
+
+    def test_constructor(self):
+        self.assertEqual(Query("Aaa").payload, {"TableName": "Aaa"})
+
+    def test_key_eq(self):
+        self.assertEqual(
+            Query("Aaa").key_eq("name", 42).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "42"}]}},
+            }
+        )
+
+    def test_key_le(self):
+        self.assertEqual(
+            Query("Aaa").key_le("name", 42).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "LE", "AttributeValueList": [{"N": "42"}]}},
+            }
+        )
+
+    def test_key_lt(self):
+        self.assertEqual(
+            Query("Aaa").key_lt("name", 42).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "LT", "AttributeValueList": [{"N": "42"}]}},
+            }
+        )
+
+    def test_key_ge(self):
+        self.assertEqual(
+            Query("Aaa").key_ge("name", 42).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "GE", "AttributeValueList": [{"N": "42"}]}},
+            }
+        )
+
+    def test_key_gt(self):
+        self.assertEqual(
+            Query("Aaa").key_gt("name", 42).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "GT", "AttributeValueList": [{"N": "42"}]}},
+            }
+        )
+
+    def test_key_begins_with(self):
+        self.assertEqual(
+            Query("Aaa").key_begins_with("name", "prefix").payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "BEGINS_WITH", "AttributeValueList": [{"S": "prefix"}]}},
+            }
+        )
+
+    def test_key_between(self):
+        self.assertEqual(
+            Query("Aaa").key_between("name", 42, 44).payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"name": {"ComparisonOperator": "BETWEEN", "AttributeValueList": [{"N": "42"}, {"N": "44"}]}},
+            }
+        )
+
+    def test_exclusive_start_key(self):
+        self.assertEqual(Query("Aaa").exclusive_start_key({"h": "v"}).payload, {"TableName": "Aaa", "ExclusiveStartKey": {"h": {"S": "v"}}})
+
+    def test_limit(self):
+        self.assertEqual(Query("Aaa").limit(4).payload, {"TableName": "Aaa", "Limit": 4})
+
+    def test_select_all_attributes(self):
+        self.assertEqual(Query("Aaa").select_all_attributes().payload, {"TableName": "Aaa", "Select": "ALL_ATTRIBUTES"})
+
+    def test_select_all_projected_attributes(self):
+        self.assertEqual(Query("Aaa").select_all_projected_attributes().payload, {"TableName": "Aaa", "Select": "ALL_PROJECTED_ATTRIBUTES"})
+
+    def test_select_count(self):
+        self.assertEqual(Query("Aaa").select_count().payload, {"TableName": "Aaa", "Select": "COUNT"})
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(Query("Aaa").expression_attribute_name("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeNames": {"#n": "p"}})
+
+    def test_expression_attribute_value(self):
+        self.assertEqual(Query("Aaa").expression_attribute_value("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeValues": {":n": {"S": "p"}}})
+
+    def test_project(self):
+        self.assertEqual(Query("Aaa").project("a").payload, {"TableName": "Aaa", "ProjectionExpression": "a"})
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(Query("Aaa").return_consumed_capacity_total().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "TOTAL"})
+
+    def test_return_consumed_capacity_indexes(self):
+        self.assertEqual(Query("Aaa").return_consumed_capacity_indexes().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "INDEXES"})
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(Query("Aaa").return_consumed_capacity_none().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "NONE"})
+
+    def test_filter_expression(self):
+        self.assertEqual(Query("Aaa").filter_expression("a=b").payload, {"TableName": "Aaa", "FilterExpression": "a=b"})
+
+    def test_consistent_read_true(self):
+        self.assertEqual(Query("Aaa").consistent_read_true().payload, {"TableName": "Aaa", "ConsistentRead": True})
+
+    def test_consistent_read_false(self):
+        self.assertEqual(Query("Aaa").consistent_read_false().payload, {"TableName": "Aaa", "ConsistentRead": False})
+
+    def test_index_name(self):
+        self.assertEqual(Query("Aaa").index_name("foo").payload, {"TableName": "Aaa", "IndexName": "foo"})
+
+    def test_scan_index_forward_true(self):
+        self.assertEqual(Query("Aaa").scan_index_forward_true().payload, {"TableName": "Aaa", "ScanIndexForward": True})
+
+    def test_scan_index_forward_false(self):
+        self.assertEqual(Query("Aaa").scan_index_forward_false().payload, {"TableName": "Aaa", "ScanIndexForward": False})
+
+
+class QueryResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = QueryResponse()
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.count)
+        self.assertIsNone(r.items)
+        self.assertIsNone(r.last_evaluated_key)
+        self.assertIsNone(r.scanned_count)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = QueryResponse(ConsumedCapacity={}, Count=1, Items=[{"h": {"S": "a"}}], LastEvaluatedKey={"h": {"S": "b"}}, ScannedCount=2)
+        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
+        self.assertEqual(r.count, 1)
+        self.assertEqual(r.items, [{"h": "a"}])
+        self.assertEqual(r.last_evaluated_key, {"h": "b"})
+        self.assertEqual(r.scanned_count, 2)
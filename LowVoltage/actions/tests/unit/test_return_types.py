@@ -0,0 +1,207 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import datetime
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import TableDescription, AttributeDefinition, GlobalSecondaryIndexDescription, Projection, ProvisionedThroughputDescription, KeySchemaElement, LocalSecondaryIndexDescription, ConsumedCapacity, Capacity, ItemCollectionMetrics
+
+
+class TableDescriptionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = TableDescription()
+        self.assertIsNone(r.attribute_definitions)
+        self.assertIsNone(r.creation_date_time)
+        self.assertIsNone(r.global_secondary_indexes)
+        self.assertIsNone(r.item_count)
+        self.assertIsNone(r.key_schema)
+        self.assertIsNone(r.local_secondary_indexes)
+        self.assertIsNone(r.provisioned_throughput)
+        self.assertIsNone(r.table_name)
+        self.assertIsNone(r.table_size_bytes)
+        self.assertIsNone(r.table_status)
+
+    def test_all_set(self):
+        r = TableDescription(
+            AttributeDefinitions=[{}],
+            CreationDateTime=1430147859.5,
+            GlobalSecondaryIndexes=[{}],
+            ItemCount=1,
+            KeySchema=[{}],
+            LocalSecondaryIndexes=[{}],
+            ProvisionedThroughput={},
+            TableName="Aaa",
+            TableSizeBytes=42,
+            TableStatus="ACTIVE",
+        )
+        self.assertIsInstance(r.attribute_definitions[0], AttributeDefinition)
+        self.assertEqual(r.creation_date_time, datetime.datetime(2015, 4, 27, 15, 17, 39, 500000))
+        self.assertIsInstance(r.global_secondary_indexes[0], GlobalSecondaryIndexDescription)
+        self.assertEqual(r.item_count, 1)
+        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
+        self.assertIsInstance(r.local_secondary_indexes[0], LocalSecondaryIndexDescription)
+        self.assertIsInstance(r.provisioned_throughput, ProvisionedThroughputDescription)
+        self.assertEqual(r.table_name, "Aaa")
+        self.assertEqual(r.table_size_bytes, 42)
+        self.assertEqual(r.table_status, "ACTIVE")
+
+
+class AttributeDefinitionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = AttributeDefinition()
+        self.assertIsNone(r.attribute_name)
+        self.assertIsNone(r.attribute_type)
+
+    def test_all_set(self):
+        r = AttributeDefinition(AttributeName="a", AttributeType="b")
+        self.assertEqual(r.attribute_name, "a")
+        self.assertEqual(r.attribute_type, "b")
+
+
+class GlobalSecondaryIndexDescriptionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = GlobalSecondaryIndexDescription()
+        self.assertIsNone(r.index_name)
+        self.assertIsNone(r.index_size_bytes)
+        self.assertIsNone(r.index_status)
+        self.assertIsNone(r.item_count)
+        self.assertIsNone(r.key_schema)
+        self.assertIsNone(r.projection)
+        self.assertIsNone(r.provisioned_throughput)
+
+    def test_all_set(self):
+        r = GlobalSecondaryIndexDescription(
+            IndexName="a",
+            IndexSizeBytes=42,
+            IndexStatus="ACTIVE",
+            ItemCount=57,
+            KeySchema=[{}],
+            Projection={},
+            ProvisionedThroughput={},
+        )
+        self.assertEqual(r.index_name, "a")
+        self.assertEqual(r.index_size_bytes, 42)
+        self.assertEqual(r.index_status, "ACTIVE")
+        self.assertEqual(r.item_count, 57)
+        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
+        self.assertIsInstance(r.projection, Projection)
+        self.assertIsInstance(r.provisioned_throughput, ProvisionedThroughputDescription)
+
+
+class ProjectionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = Projection()
+        self.assertIsNone(r.non_key_attributes)
+        self.assertIsNone(r.projection_type)
+
+    def test_all_set(self):
+        r = Projection(NonKeyAttributes=["a"], ProjectionType="b")
+        self.assertEqual(r.non_key_attributes, ["a"])
+        self.assertEqual(r.projection_type, "b")
+
+
+class ProvisionedThroughputDescriptionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = ProvisionedThroughputDescription()
+        self.assertIsNone(r.last_decrease_date_time)
+        self.assertIsNone(r.last_increase_date_time)
+        self.assertIsNone(r.number_of_decreases_today)
+        self.assertIsNone(r.read_capacity_units)
+        self.assertIsNone(r.write_capacity_units)
+
+    def test_all_set(self):
+        r = ProvisionedThroughputDescription(
+            LastDecreaseDateTime=1430148376.2,
+            LastIncreaseDateTime=1430148384.2,
+            NumberOfDecreasesToday=4,
+            ReadCapacityUnits=5,
+            WriteCapacityUnits=6,
+        )
+        self.assertEqual(r.last_decrease_date_time, datetime.datetime(2015, 4, 27, 15, 26, 16, 200000))
+        self.assertEqual(r.last_increase_date_time, datetime.datetime(2015, 4, 27, 15, 26, 24, 200000))
+        self.assertEqual(r.number_of_decreases_today, 4)
+        self.assertEqual(r.read_capacity_units, 5)
+        self.assertEqual(r.write_capacity_units, 6)
+
+
+class KeySchemaElementUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = KeySchemaElement()
+        self.assertIsNone(r.attribute_name)
+        self.assertIsNone(r.key_type)
+
+    def test_all_set(self):
+        r = KeySchemaElement(AttributeName="a", KeyType="b")
+        self.assertEqual(r.attribute_name, "a")
+        self.assertEqual(r.key_type, "b")
+
+
+class LocalSecondaryIndexDescriptionUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = LocalSecondaryIndexDescription()
+        self.assertIsNone(r.index_name)
+        self.assertIsNone(r.index_size_bytes)
+        self.assertIsNone(r.item_count)
+        self.assertIsNone(r.key_schema)
+        self.assertIsNone(r.projection)
+
+    def test_all_set(self):
+        r = LocalSecondaryIndexDescription(
+            IndexName="a",
+            IndexSizeBytes=42,
+            ItemCount=57,
+            KeySchema=[{}],
+            Projection={},
+        )
+        self.assertEqual(r.index_name, "a")
+        self.assertEqual(r.index_size_bytes, 42)
+        self.assertEqual(r.item_count, 57)
+        self.assertIsInstance(r.key_schema[0], KeySchemaElement)
+        self.assertIsInstance(r.projection, Projection)
+
+
+class ConsumedCapacityUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = ConsumedCapacity()
+        self.assertIsNone(r.capacity_units)
+        self.assertIsNone(r.global_secondary_indexes)
+        self.assertIsNone(r.local_secondary_indexes)
+        self.assertIsNone(r.table)
+        self.assertIsNone(r.table_name)
+
+    def test_all_set(self):
+        r = ConsumedCapacity(
+            CapacityUnits=4.,
+            GlobalSecondaryIndexes={"a": {}},
+            LocalSecondaryIndexes={"b": {}},
+            Table={},
+            TableName="A",
+        )
+        self.assertEqual(r.capacity_units, 4.)
+        self.assertIsInstance(r.global_secondary_indexes["a"], Capacity)
+        self.assertIsInstance(r.local_secondary_indexes["b"], Capacity)
+        self.assertIsInstance(r.table, Capacity)
+        self.assertEqual(r.table_name, "A")
+
+
+class CapacityUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = Capacity()
+        self.assertIsNone(r.capacity_units)
+
+    def test_all_set(self):
+        r = Capacity(CapacityUnits=4.)
+        self.assertEqual(r.capacity_units, 4.)
+
+
+class ItemCollectionMetricsUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = ItemCollectionMetrics()
+        self.assertIsNone(r.item_collection_key)
+        self.assertIsNone(r.size_estimate_range_gb)
+
+    def test_all_set(self):
+        r = ItemCollectionMetrics(ItemCollectionKey={"h": {"S": "a"}}, SizeEstimateRangeGB=[0., 1.])
+        self.assertEqual(r.item_collection_key, {"h": "a"})
+        self.assertEqual(r.size_estimate_range_gb, [0., 1.])
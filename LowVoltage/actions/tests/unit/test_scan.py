@@ -0,0 +1,73 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity
+from LowVoltage.actions.scan import ScanResponse, Scan
+
+
+class ScanUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(Scan("Aaa").name, "Scan")
+
+    def test_table_name(self):
+        self.assertEqual(Scan().table_name("Aaa").payload, {"TableName": "Aaa"})
+
+    def test_constructor(self):
+        self.assertEqual(Scan("Aaa").payload, {"TableName": "Aaa"})
+
+    def test_segment(self):
+        self.assertEqual(Scan("Aaa").segment(0, 2).payload, {"TableName": "Aaa", "Segment": 0, "TotalSegments": 2})
+
+    def test_exclusive_start_key(self):
+        self.assertEqual(Scan("Aaa").exclusive_start_key({"h": "v"}).payload, {"TableName": "Aaa", "ExclusiveStartKey": {"h": {"S": "v"}}})
+
+    def test_limit(self):
+        self.assertEqual(Scan("Aaa").limit(4).payload, {"TableName": "Aaa", "Limit": 4})
+
+    def test_index_name(self):
+        self.assertEqual(Scan("Aaa").index_name("FooBar").payload, {"TableName": "Aaa", "IndexName": "FooBar"})
+
+    def test_select_all_attributes(self):
+        self.assertEqual(Scan("Aaa").select_all_attributes().payload, {"TableName": "Aaa", "Select": "ALL_ATTRIBUTES"})
+
+    def test_select_count(self):
+        self.assertEqual(Scan("Aaa").select_count().payload, {"TableName": "Aaa", "Select": "COUNT"})
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(Scan("Aaa").expression_attribute_name("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeNames": {"#n": "p"}})
+
+    def test_expression_attribute_value(self):
+        self.assertEqual(Scan("Aaa").expression_attribute_value("n", "p").payload, {"TableName": "Aaa", "ExpressionAttributeValues": {":n": {"S": "p"}}})
+
+    def test_project(self):
+        self.assertEqual(Scan("Aaa").project("a").payload, {"TableName": "Aaa", "ProjectionExpression": "a"})
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(Scan("Aaa").return_consumed_capacity_total().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "TOTAL"})
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(Scan("Aaa").return_consumed_capacity_none().payload, {"TableName": "Aaa", "ReturnConsumedCapacity": "NONE"})
+
+    def test_filter_expression(self):
+        self.assertEqual(Scan("Aaa").filter_expression("a=b").payload, {"TableName": "Aaa", "FilterExpression": "a=b"})
+
+
+class ScanResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = ScanResponse()
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.count)
+        self.assertIsNone(r.items)
+        self.assertIsNone(r.last_evaluated_key)
+        self.assertIsNone(r.scanned_count)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = ScanResponse(ConsumedCapacity={}, Count=1, Items=[{"h": {"S": "a"}}], LastEvaluatedKey={"h": {"S": "b"}}, ScannedCount=2)
+        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
+        self.assertEqual(r.count, 1)
+        self.assertEqual(r.items, [{"h": "a"}])
+        self.assertEqual(r.last_evaluated_key, {"h": "b"})
+        self.assertEqual(r.scanned_count, 2)
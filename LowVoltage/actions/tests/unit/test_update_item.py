@@ -0,0 +1,266 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.actions.return_types import ConsumedCapacity, ItemCollectionMetrics
+from LowVoltage.actions.update_item import UpdateItemResponse, UpdateItem
+
+
+class UpdateItemUnitTests(_tst.UnitTests):
+    def test_name(self):
+        self.assertEqual(UpdateItem("Table", {"hash": 42}).name, "UpdateItem")
+
+    def test_table_name_and_key(self):
+        self.assertEqual(
+            UpdateItem().table_name("Table").key({"hash": 42}).payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+            }
+        )
+
+    def test_constructor(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+            }
+        )
+
+    def test_set(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).set("a", ":v").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "UpdateExpression": "SET a=:v",
+            }
+        )
+
+    def test_several_sets(self):
+        self.assertIn(
+            UpdateItem("Table", {"hash": 42}).set("a", ":v").set("b", ":w").payload,
+            [
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "SET a=:v, b=:w",
+                },
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "SET b=:w, a=:v",
+                }
+            ]
+        )
+
+    def test_remove(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).remove("a").remove("b").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "UpdateExpression": "REMOVE a, b",
+            }
+        )
+
+    def test_add(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).add("a", "v").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "UpdateExpression": "ADD a :v",
+            }
+        )
+
+    def test_several_adds(self):
+        self.assertIn(
+            UpdateItem("Table", {"hash": 42}).add("a", "v").add("b", "w").payload,
+            [
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "ADD a :v, b :w",
+                },
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "ADD b :w, a :v",
+                }
+            ]
+        )
+
+    def test_delete(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).delete("a", "v").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "UpdateExpression": "DELETE a :v",
+            }
+        )
+
+    def test_several_deletes(self):
+        self.assertIn(
+            UpdateItem("Table", {"hash": 42}).delete("a", "v").delete("b", "w").payload,
+            [
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "DELETE a :v, b :w",
+                },
+                {
+                    "TableName": "Table",
+                    "Key": {"hash": {"N": "42"}},
+                    "UpdateExpression": "DELETE b :w, a :v",
+                }
+            ]
+        )
+
+    def test_expression_attribute_value(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).expression_attribute_value("v", "value").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "ExpressionAttributeValues": {":v": {"S": "value"}},
+            }
+        )
+
+    def test_expression_attribute_name(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "ExpressionAttributeNames": {"#n": "path"},
+            }
+        )
+
+    def test_condition_expression(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": 42}).condition_expression("a=b").payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"N": "42"}},
+                "ConditionExpression": "a=b",
+            }
+        )
+
+    def test_return_values_all_new(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_values_all_new().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnValues": "ALL_NEW",
+            }
+        )
+
+    def test_return_values_all_old(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_values_all_old().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnValues": "ALL_OLD",
+            }
+        )
+
+    def test_return_values_updated_new(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_values_updated_new().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnValues": "UPDATED_NEW",
+            }
+        )
+
+    def test_return_values_updated_old(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_values_updated_old().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnValues": "UPDATED_OLD",
+            }
+        )
+
+    def test_return_values_none(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_values_none().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnValues": "NONE",
+            }
+        )
+
+    def test_return_consumed_capacity_total(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "TOTAL",
+            }
+        )
+
+    def test_return_consumed_capacity_indexes(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_indexes().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "INDEXES",
+            }
+        )
+
+    def test_return_consumed_capacity_none(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnConsumedCapacity": "NONE",
+            }
+        )
+
+    def test_return_item_collection_metrics_size(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_item_collection_metrics_size().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnItemCollectionMetrics": "SIZE",
+            }
+        )
+
+    def test_return_item_collection_metrics_none(self):
+        self.assertEqual(
+            UpdateItem("Table", {"hash": "h"}).return_item_collection_metrics_none().payload,
+            {
+                "TableName": "Table",
+                "Key": {"hash": {"S": "h"}},
+                "ReturnItemCollectionMetrics": "NONE",
+            }
+        )
+
+
+class UpdateItemResponseUnitTests(_tst.UnitTests):
+    def test_all_none(self):
+        r = UpdateItemResponse()
+        self.assertIsNone(r.attributes)
+        self.assertIsNone(r.consumed_capacity)
+        self.assertIsNone(r.item_collection_metrics)
+
+    def test_all_set(self):
+        unprocessed_keys = object()
+        r = UpdateItemResponse(Attributes={"h": {"S": "a"}}, ConsumedCapacity={}, ItemCollectionMetrics={})
+        self.assertEqual(r.attributes, {"h": "a"})
+        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
+        self.assertIsInstance(r.item_collection_metrics, ItemCollectionMetrics)
@@ -10,7 +10,6 @@ When given a :class:`UpdateItem`, the connection will return a :class:`UpdateIte
 """
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .conversion import _convert_dict_to_db, _convert_db_to_dict
 from .next_gen_mixins import proxy
@@ -161,7 +160,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("forty_two", 42)
         ...     .return_values_all_new()
         ... ).attributes
-        {u'a': 42, u'h': 0}
+        {'a': 42, 'h': 0}
         """
         self.__set[attribute_name] = value_name
         return self
@@ -178,7 +177,7 @@ class UpdateItem(Action):
         ...     .remove("a")
         ...     .return_values_all_new()
         ... ).attributes
-        {u'h': 0}
+        {'h': 0}
         """
         self.__remove.append(path)
         return self
@@ -196,7 +195,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("two", 2)
         ...     .return_values_all_new()
         ... ).attributes
-        {u'a': 44, u'h': 0}
+        {'a': 44, 'h': 0}
 
         >>> connection(PutItem(table, {"h": 0, "a": {2, 3}}))
         <LowVoltage.actions.put_item.PutItemResponse ...>
@@ -206,7 +205,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("vals", {1, 2})
         ...     .return_values_all_new()
         ... ).attributes
-        {u'a': set([1, 2, 3]), u'h': 0}
+        {'a': {1, 2, 3}, 'h': 0}
         """
         self.__add[attribute_name] = value_name
         return self
@@ -224,7 +223,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("vals", {1, 2, 4})
         ...     .return_values_all_new()
         ... ).attributes
-        {u'a': set([3]), u'h': 0}
+        {'a': {3}, 'h': 0}
         """
         self.__delete[attribute_name] = value_name
         return self
@@ -287,10 +286,10 @@ class UpdateItem(Action):
     @proxy
     def return_consumed_capacity_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   UpdateItem(table, {"h": 6}).set("gh", "h").set("gr", "h")
         ...     .return_consumed_capacity_none()
-        ... ).consumed_capacity
+        ... ).consumed_capacity)
         None
         """
         return self.__return_consumed_capacity.none()
@@ -303,7 +302,7 @@ class UpdateItem(Action):
         ...     .return_item_collection_metrics_size()
         ... ).item_collection_metrics
         >>> m.item_collection_key
-        {u'h': 0}
+        {'h': 0}
         >>> m.size_estimate_range_gb
         [0.0, 1.0]
         """
@@ -312,10 +311,10 @@ class UpdateItem(Action):
     @proxy
     def return_item_collection_metrics_none(self):
         """
-        >>> print connection(
+        >>> print(connection(
         ...   UpdateItem(table2, {"h": 1, "r1": 0}).set("a", "h")
         ...     .return_item_collection_metrics_none()
-        ... ).item_collection_metrics
+        ... ).item_collection_metrics)
         None
         """
         return self.__return_item_collection_metrics.none()
@@ -331,7 +330,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("v", 2)
         ...     .return_values_all_old()
         ... ).attributes
-        {u'a': 1, u'h': 0, u'b': 2}
+        {'a': 1, 'h': 0, 'b': 2}
         """
         return self.__return_values.all_old()
 
@@ -346,7 +345,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("v", 2)
         ...     .return_values_all_new()
         ... ).attributes
-        {u'a': 2, u'h': 0, u'b': 2}
+        {'a': 2, 'h': 0, 'b': 2}
         """
         return self.__return_values.all_new()
 
@@ -361,7 +360,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("v", 2)
         ...     .return_values_updated_old()
         ... ).attributes
-        {u'a': 1}
+        {'a': 1}
         """
         return self.__return_values.updated_old()
 
@@ -376,7 +375,7 @@ class UpdateItem(Action):
         ...     .expression_attribute_value("v", 2)
         ...     .return_values_updated_new()
         ... ).attributes
-        {u'a': 2}
+        {'a': 2}
         """
         return self.__return_values.updated_new()
 
@@ -385,271 +384,12 @@ class UpdateItem(Action):
         """
         >>> connection(PutItem(table, {"h": 0, "a": 1, "b": 2}))
         <LowVoltage.actions.put_item.PutItemResponse ...>
-        >>> print connection(
+        >>> print(connection(
         ...   UpdateItem(table, {"h": 0})
         ...     .set("a", ":v")
         ...     .expression_attribute_value("v", 2)
         ...     .return_values_none()
-        ... ).attributes
+        ... ).attributes)
         None
         """
         return self.__return_values.none()
-
-
-class UpdateItemUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(UpdateItem("Table", {"hash": 42}).name, "UpdateItem")
-
-    def test_table_name_and_key(self):
-        self.assertEqual(
-            UpdateItem().table_name("Table").key({"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_constructor(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-            }
-        )
-
-    def test_set(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).set("a", ":v").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "UpdateExpression": "SET a=:v",
-            }
-        )
-
-    def test_several_sets(self):
-        self.assertIn(
-            UpdateItem("Table", {"hash": 42}).set("a", ":v").set("b", ":w").payload,
-            [
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "SET a=:v, b=:w",
-                },
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "SET b=:w, a=:v",
-                }
-            ]
-        )
-
-    def test_remove(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).remove("a").remove("b").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "UpdateExpression": "REMOVE a, b",
-            }
-        )
-
-    def test_add(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).add("a", "v").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "UpdateExpression": "ADD a :v",
-            }
-        )
-
-    def test_several_adds(self):
-        self.assertIn(
-            UpdateItem("Table", {"hash": 42}).add("a", "v").add("b", "w").payload,
-            [
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "ADD a :v, b :w",
-                },
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "ADD b :w, a :v",
-                }
-            ]
-        )
-
-    def test_delete(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).delete("a", "v").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "UpdateExpression": "DELETE a :v",
-            }
-        )
-
-    def test_several_deletes(self):
-        self.assertIn(
-            UpdateItem("Table", {"hash": 42}).delete("a", "v").delete("b", "w").payload,
-            [
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "DELETE a :v, b :w",
-                },
-                {
-                    "TableName": "Table",
-                    "Key": {"hash": {"N": "42"}},
-                    "UpdateExpression": "DELETE b :w, a :v",
-                }
-            ]
-        )
-
-    def test_expression_attribute_value(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).expression_attribute_value("v", "value").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ExpressionAttributeValues": {":v": {"S": "value"}},
-            }
-        )
-
-    def test_expression_attribute_name(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).expression_attribute_name("n", "path").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ExpressionAttributeNames": {"#n": "path"},
-            }
-        )
-
-    def test_condition_expression(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": 42}).condition_expression("a=b").payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"N": "42"}},
-                "ConditionExpression": "a=b",
-            }
-        )
-
-    def test_return_values_all_new(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_values_all_new().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "ALL_NEW",
-            }
-        )
-
-    def test_return_values_all_old(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_values_all_old().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "ALL_OLD",
-            }
-        )
-
-    def test_return_values_updated_new(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_values_updated_new().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "UPDATED_NEW",
-            }
-        )
-
-    def test_return_values_updated_old(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_values_updated_old().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "UPDATED_OLD",
-            }
-        )
-
-    def test_return_values_none(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_values_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnValues": "NONE",
-            }
-        )
-
-    def test_return_consumed_capacity_total(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_total().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "TOTAL",
-            }
-        )
-
-    def test_return_consumed_capacity_indexes(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_indexes().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "INDEXES",
-            }
-        )
-
-    def test_return_consumed_capacity_none(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_consumed_capacity_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnConsumedCapacity": "NONE",
-            }
-        )
-
-    def test_return_item_collection_metrics_size(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_item_collection_metrics_size().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "SIZE",
-            }
-        )
-
-    def test_return_item_collection_metrics_none(self):
-        self.assertEqual(
-            UpdateItem("Table", {"hash": "h"}).return_item_collection_metrics_none().payload,
-            {
-                "TableName": "Table",
-                "Key": {"hash": {"S": "h"}},
-                "ReturnItemCollectionMetrics": "NONE",
-            }
-        )
-
-
-class UpdateItemResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = UpdateItemResponse()
-        self.assertIsNone(r.attributes)
-        self.assertIsNone(r.consumed_capacity)
-        self.assertIsNone(r.item_collection_metrics)
-
-    def test_all_set(self):
-        unprocessed_keys = object()
-        r = UpdateItemResponse(Attributes={"h": {"S": "a"}}, ConsumedCapacity={}, ItemCollectionMetrics={})
-        self.assertEqual(r.attributes, {"h": "a"})
-        self.assertIsInstance(r.consumed_capacity, ConsumedCapacity)
-        self.assertIsInstance(r.item_collection_metrics, ItemCollectionMetrics)
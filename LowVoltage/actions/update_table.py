@@ -33,7 +33,7 @@ When given a :class:`UpdateTable`, the connection will return a :class:`UpdateTa
 >>> r
 <LowVoltage.actions.update_table.UpdateTableResponse ...>
 >>> r.table_description.table_status
-u'UPDATING'
+'UPDATING'
 
 Note that you can use the :func:`.wait_for_table_activation` compound to poll the table status until it's updated. See :ref:`actions-vs-compounds` in the user guide.
 
@@ -56,7 +56,6 @@ Note that you can use the :func:`.wait_for_table_activation` compound to poll th
 import datetime
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 from .action import Action
 from .next_gen_mixins import variadic, proxy
 from .next_gen_mixins import (
@@ -314,265 +313,3 @@ class UpdateTable(Action):
     def __check_active_index(self):
         if self.__active_index is self or self.__active_index._verb != "Create":
             raise _lv.BuilderError("No active index or active index not being created.")
-
-
-class UpdateTableUnitTests(_tst.UnitTests):
-    def test_name(self):
-        self.assertEqual(UpdateTable("Foo").name, "UpdateTable")
-
-    def test_constructor(self):
-        self.assertEqual(UpdateTable("Foo").payload, {"TableName": "Foo"})
-
-    def test_table_name(self):
-        self.assertEqual(UpdateTable().table_name("Foo").payload, {"TableName": "Foo"})
-
-    def test_throughput(self):
-        self.assertEqual(
-            UpdateTable("Foo").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43},
-            }
-        )
-
-    def test_attribute_definition(self):
-        self.assertEqual(
-            UpdateTable("Foo").attribute_definition("a", "B").payload,
-            {
-                "TableName": "Foo",
-                "AttributeDefinitions": [{"AttributeName": "a", "AttributeType": "B"}],
-            }
-        )
-
-    def test_create_gsi(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi"}},
-                ],
-            }
-        )
-
-    def test_create_gsi_provisioned_throughput(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").provisioned_throughput(1, 2).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "ProvisionedThroughput": {"ReadCapacityUnits": 1, "WriteCapacityUnits": 2}}},
-                ],
-            }
-        )
-
-    def test_create_gsi_hash_key(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").hash_key("h").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}]}},
-                ],
-            }
-        )
-
-    def test_create_gsi_range_key(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").range_key("r").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "KeySchema": [{"AttributeName": "r", "KeyType": "RANGE"}]}},
-                ],
-            }
-        )
-
-    def test_create_gsi_hash_key_with_type(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").hash_key("h", "S").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}]}},
-                ],
-                "AttributeDefinitions": [{"AttributeName": "h", "AttributeType": "S"}]
-            }
-        )
-
-    def test_create_gsi_range_key_with_type(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").range_key("r", "N").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "KeySchema": [{"AttributeName": "r", "KeyType": "RANGE"}]}},
-                ],
-                "AttributeDefinitions": [{"AttributeName": "r", "AttributeType": "N"}]
-            }
-        )
-
-    def test_create_gsi_project_all(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").project_all().payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "Projection": {"ProjectionType": "ALL"}}},
-                ],
-            }
-        )
-
-    def test_create_gsi_project_keys_only(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").project_keys_only().payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "Projection": {"ProjectionType": "KEYS_ONLY"}}},
-                ],
-            }
-        )
-
-    def test_create_gsi_project(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").project("a", ["b", "c"]).project("d").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["a", "b", "c", "d"]}}},
-                ],
-            }
-        )
-
-    def test_update_gsi(self):
-        self.assertEqual(
-            UpdateTable("Foo").update_global_secondary_index("the_gsi").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Update": {"IndexName": "the_gsi"}},
-                ],
-            }
-        )
-
-    def test_update_gsi_provisioned_throughput(self):
-        self.assertEqual(
-            UpdateTable("Foo").update_global_secondary_index("the_gsi").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Update": {"IndexName": "the_gsi", "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43}}},
-                ],
-            }
-        )
-
-    def test_delete_gsi(self):
-        self.assertEqual(
-            UpdateTable("Foo").delete_global_secondary_index("the_gsi").payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Delete": {"IndexName": "the_gsi"}},
-                ],
-            }
-        )
-
-    def test_back_to_update_gsi_after_back_to_table(self):
-        self.assertEqual(
-            UpdateTable("Foo").update_global_secondary_index("the_gsi").table().provisioned_throughput(12, 13)
-                .update_global_secondary_index("the_gsi").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Update": {"IndexName": "the_gsi", "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43}}},
-                ],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 12, "WriteCapacityUnits": 13},
-            }
-        )
-
-    def test_back_to_create_gsi_after_back_to_table(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").table().provisioned_throughput(12, 13)
-                .create_global_secondary_index("the_gsi").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43}}},
-                ],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 12, "WriteCapacityUnits": 13},
-            }
-        )
-
-    def test_back_to_update_gsi_after_back_to_table_after_create_gsi(self):
-        self.assertEqual(
-            UpdateTable("Foo").create_global_secondary_index("the_gsi").table().provisioned_throughput(12, 13)
-                .update_global_secondary_index("the_gsi").provisioned_throughput(42, 43).payload,
-            {
-                "TableName": "Foo",
-                "GlobalSecondaryIndexUpdates": [
-                    {"Create": {"IndexName": "the_gsi", "ProvisionedThroughput": {"ReadCapacityUnits": 42, "WriteCapacityUnits": 43}}},
-                ],
-                "ProvisionedThroughput": {"ReadCapacityUnits": 12, "WriteCapacityUnits": 13},
-            }
-        )
-
-    def test_hash_key_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").hash_key("h")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_range_key_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").range_key("r")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_all_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").project_all()
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").project("a")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_keys_only_without_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").project_keys_only()
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_hash_key_with_updating_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").update_global_secondary_index("gsi").hash_key("h")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_range_key_with_updating_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").update_global_secondary_index("gsi").range_key("r")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_all_with_updating_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").update_global_secondary_index("gsi").project_all()
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_with_updating_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").update_global_secondary_index("gsi").project("a")
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-    def test_project_keys_only_with_updating_active_index(self):
-        with self.assertRaises(_lv.BuilderError) as catcher:
-            UpdateTable("Foo").update_global_secondary_index("gsi").project_keys_only()
-        self.assertEqual(catcher.exception.args, ("No active index or active index not being created.",))
-
-
-class UpdateTableResponseUnitTests(_tst.UnitTests):
-    def test_all_none(self):
-        r = UpdateTableResponse()
-        self.assertIsNone(r.table_description)
-
-    def test_all_set(self):
-        r = UpdateTableResponse(TableDescription={})
-        self.assertIsInstance(r.table_description, TableDescription)
@@ -0,0 +1,36 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Benchmarks of LowVoltage, to compare the performance of its versions.
+
+Run them with ``python -m LowVoltage.benchmarks [--output results.json] [--baseline previous.json] [group...]``.
+The output is a JSON document with the metadata of the run and a ``"results"`` dict of benchmark names to results.
+Each result has a ``"value"``, lower is better, and a ``"unit"``.
+With ``--baseline``, the command exits with status 1 if a value is more than ``--tolerance`` worse than in the baseline,
+or more than the absolute ``"allowance"`` of the baseline's result if it has one and it is larger.
+
+Groups are:
+
+- ``micro``: timings of the client's hot paths, without network.
+- ``retries``: throughput and tail latency per retry policy, against a :class:`.FaultInjector`.
+- ``memory``: peak memory per million additional items of the iteration and batch compounds, against a stand-in :class:`.Server`.
+  Pass a previous run as ``--baseline`` to fail when memory grows.
+- ``import``: time to import LowVoltage in a fresh interpreter.
+"""
+
+import collections
+
+from . import imports
+from . import memory
+from . import micro
+from . import retries
+
+
+groups = collections.OrderedDict([
+    ("micro", micro.run),
+    ("retries", retries.run),
+    ("memory", memory.run),
+    ("import", imports.run),
+])
@@ -0,0 +1,51 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import argparse
+import collections
+import json
+import sys
+
+from . import groups
+from .harness import compare, metadata
+
+
+def main(argv, stderr=sys.stderr):
+    parser = argparse.ArgumentParser(prog="python -m LowVoltage.benchmarks", description="Run LowVoltage's benchmarks.")
+    parser.add_argument("groups", nargs="*", metavar="group", help="groups of benchmarks to run: {} (default: micro)".format(", ".join(groups.keys())))
+    parser.add_argument("--output", help="file to write the results to, in JSON (default: standard output)")
+    parser.add_argument("--label", help="label of this run, typically the version being benchmarked")
+    parser.add_argument("--baseline", help="results of a previous run, to detect regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="relative worsening considered a regression (default: 0.1)")
+    parser.add_argument("--quick", action="store_true", help="run each benchmark once, to check that it works")
+    args = parser.parse_args(argv)
+    for group in args.groups:
+        if group not in groups:
+            parser.error("unknown group: {}".format(group))
+
+    results = collections.OrderedDict()
+    for group in args.groups or ["micro"]:
+        for name, result in groups[group](quick=args.quick).items():
+            results["{}.{}".format(group, name)] = result
+            stderr.write("{}: {:.3g} {}\n".format("{}.{}".format(group, name), result["value"], result["unit"]))
+    output = json.dumps(collections.OrderedDict([("metadata", metadata(args.label)), ("results", results)]), indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for name, value, limit in regressions:
+            stderr.write("Regression: {} is {:.3g} {}, more than the {:.3g} allowed by {}\n".format(name, value, results[name]["unit"], limit, args.baseline))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,54 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import datetime
+import platform
+import statistics
+import timeit
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """
+    Time ``function``, called without arguments.
+    It is called in a loop long enough to last at least ``min_time`` seconds, and this loop is repeated ``repeat`` times.
+
+    Return a result: a dict whose ``"value"`` is the best time per call in seconds.
+    """
+    timer = timeit.Timer(function)
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+    times = [timer.timeit(loops) / loops for i in range(repeat)]
+    return {"value": min(times), "unit": "s", "median": statistics.median(times), "loops": loops, "repeat": repeat}
+
+
+def metadata(label=None):
+    """
+    Describe the environment of a benchmark run.
+    """
+    return {
+        "label": label,
+        "date": datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return the list of ``(name, value, limit)`` for the results whose value is above the limit computed from ``baseline``:
+    the baseline's value increased by ``tolerance`` times its magnitude,
+    or by its ``"allowance"`` if it has one and it is larger, so that zero and small baselines are compared too.
+    Results are dicts of names to results, like in the ``"results"`` of the output of ``python -m LowVoltage.benchmarks``.
+    Values are such that lower is better.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name in baseline:
+            reference = baseline[name]["value"]
+            limit = reference + max(abs(reference) * tolerance, baseline[name].get("allowance", 0))
+            if result["value"] > limit:
+                regressions.append((name, result["value"], limit))
+    return regressions
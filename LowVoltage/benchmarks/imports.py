@@ -0,0 +1,55 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Time to import LowVoltage in a fresh interpreter, which matters for short-lived processes.
+"""
+
+import collections
+import json
+import subprocess
+import sys
+
+
+_code = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{}
+duration = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({{"duration": duration, "modules": len(loaded), "unittest": "unittest" in loaded}}))
+"""
+
+
+def statements():
+    return collections.OrderedDict([
+        ("LowVoltage", "import LowVoltage"),
+        ("star", "from LowVoltage import *"),
+        ("get_put", "from LowVoltage import Connection, GetItem, PutItem"),
+    ])
+
+
+def measure_import(statement, repeat=10):
+    """
+    Run ``statement`` in ``repeat`` fresh interpreters and return a result: a dict whose ``"value"`` is the best duration in seconds.
+    It also gives the number of ``"modules"`` loaded and whether ``"unittest"`` was loaded.
+    """
+    runs = [
+        json.loads(subprocess.check_output([sys.executable, "-c", _code.format(statement)]).decode("utf8"))
+        for i in range(repeat)
+    ]
+    best = min(runs, key=lambda run: run["duration"])
+    return {"value": best["duration"], "unit": "s", "modules": best["modules"], "unittest": best["unittest"], "repeat": repeat}
+
+
+def run(quick=False):
+    """
+    Measure the import time of LowVoltage and return the results.
+    """
+    repeat = 1 if quick else 10
+    return collections.OrderedDict(
+        (name, measure_import(statement, repeat=repeat))
+        for name, statement in statements().items()
+    )
@@ -0,0 +1,190 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Peak memory of the iteration and batch compounds, against a stand-in :class:`.Server` running in another process,
+so that only the client's memory is measured.
+
+Each scenario is run on ``count`` and on ``2 * count`` items, and its result is the slope between the two peaks:
+the memory each additional million items costs. Fixed costs (buffers, pages in flight, imports) cancel out,
+so streaming scenarios are close to zero whatever ``count`` is, and eager ones grow with the size of their items.
+"""
+
+import collections
+import multiprocessing
+import os
+import threading
+import tracemalloc
+
+import LowVoltage as _lv
+from LowVoltage.stand_in import Database, Server
+from .micro import item
+
+
+def nested_item(i=0, depth=3, width=4):
+    """
+    A large item (about 6kB) made of nested maps and lists.
+    """
+    def nested(depth):
+        if depth == 0:
+            return {"text": "x" * 16, "number": i, "flag": True}
+        else:
+            return {"map": {"key{}".format(k): nested(depth - 1) for k in range(width - 1)}, "list": [nested(depth - 1)]}
+    return {"h": "user-0", "r": i, "nested": nested(depth)}
+
+
+# Variation of the difference between two peaks that is noise rather than a regression, in bytes
+_NOISE = 64 * 1024
+
+
+def _rss():
+    # Resident set size in bytes, or None where /proc is not available
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def measure_memory(function, items):
+    """
+    Call ``function`` without arguments and return a dict whose ``"peak"`` is the peak of memory allocated
+    by Python during the call, traced by :mod:`tracemalloc`, in bytes.
+    The peak increase of the resident set size, sampled every millisecond, is returned as ``"rss"`` when available.
+    """
+    stop = threading.Event()
+    start_rss = _rss()
+    peak_rss = [start_rss]
+
+    def sample():
+        while not stop.wait(0.001):
+            peak_rss[0] = max(peak_rss[0], _rss())
+
+    sampler = threading.Thread(target=sample)
+    if start_rss is not None:
+        sampler.start()
+    tracemalloc.start()
+    try:
+        function()
+        dummy, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        stop.set()
+        if start_rss is not None:
+            sampler.join()
+    return {
+        "peak": peak,
+        "items": items,
+        "rss": None if start_rss is None else peak_rss[0] - start_rss,
+    }
+
+
+def slope(small, large):
+    """
+    Return a result from two :func:`measure_memory` measures of the same scenario on different numbers of items:
+    a dict whose ``"value"`` is the increase of the peak per million additional items.
+    It is close to zero, and can be negative, for streaming scenarios,
+    so its ``"allowance"`` is the absolute increase that is still considered noise (see :func:`.compare`).
+    The measures are kept as ``"small"`` and ``"large"``.
+    """
+    return {
+        "value": (large["peak"] - small["peak"]) * 1000000. / (large["items"] - small["items"]),
+        "unit": "B/1M items",
+        "allowance": _NOISE * 1000000. / (large["items"] - small["items"]),
+        "small": small,
+        "large": large,
+    }
+
+
+def _serve(endpoints, stop, max_page_size):
+    with Server(Database(max_page_size=max_page_size)) as server:
+        endpoints.put(server.endpoint)
+        stop.wait()
+
+
+def _consume(iterable):
+    for dummy in iterable:
+        pass
+
+
+def scenarios(connection, count):
+    """
+    Return a dict of scenario names to pairs of a function processing items through ``connection`` and the number of these items.
+    Scenarios without suffix stream their inputs and outputs; ``.eager`` ones build lists of them.
+    ``.nested`` ones process ten times fewer, but larger, items.
+    Tables "Items", "Nested" and "Sink" suffixed by ``count`` must have been created by :func:`fill` with the same ``count``.
+    """
+    nested_count = _nested_count(count)
+
+    def keys():
+        return ({"h": "user-0", "r": i} for i in range(count))
+
+    def items():
+        return (dict(item(i), h="user-0") for i in range(count))
+
+    items_table, nested_table, sink_table = _tables(count)
+
+    return collections.OrderedDict([
+        ("iterate_scan", (lambda: _consume(_lv.iterate_scan(connection, _lv.Scan(items_table))), count)),
+        ("iterate_scan.eager", (lambda: list(_lv.iterate_scan(connection, _lv.Scan(items_table))), count)),
+        ("iterate_scan.nested", (lambda: _consume(_lv.iterate_scan(connection, _lv.Scan(nested_table))), nested_count)),
+        ("iterate_query", (lambda: _consume(_lv.iterate_query(connection, _lv.Query(items_table).key_eq("h", "user-0"))), count)),
+        ("iterate_query.eager", (lambda: list(_lv.iterate_query(connection, _lv.Query(items_table).key_eq("h", "user-0"))), count)),
+        ("iterate_batch_get_item", (lambda: _consume(_lv.iterate_batch_get_item(connection, items_table, keys())), count)),
+        ("iterate_batch_get_item.eager", (lambda: list(_lv.iterate_batch_get_item(connection, items_table, list(keys()))), count)),
+        ("batch_put_item", (lambda: _lv.batch_put_item(connection, sink_table, items()), count)),
+        ("batch_put_item.eager", (lambda: _lv.batch_put_item(connection, sink_table, list(items())), count)),
+        ("batch_put_item.nested", (lambda: _lv.batch_put_item(connection, sink_table, (nested_item(i) for i in range(nested_count))), nested_count)),
+    ])
+
+
+def _nested_count(count):
+    return max(1, count // 10)
+
+
+def _max_page_size(count):
+    # DynamoDB's 1MB, or less so that scans and queries span several pages even on few items
+    return min(1024 * 1024, 128 * count)
+
+
+def _tables(count):
+    return ["{}{}".format(table, count) for table in ["Items", "Nested", "Sink"]]
+
+
+def fill(connection, count):
+    """
+    Create and fill the tables used by :func:`scenarios` on ``count`` items.
+    """
+    items_table, nested_table, sink_table = _tables(count)
+    for table in [items_table, nested_table, sink_table]:
+        connection(_lv.CreateTable(table).hash_key("h", _lv.STRING).range_key("r", _lv.NUMBER).provisioned_throughput(1, 1))
+    _lv.batch_put_item(connection, items_table, (dict(item(i), h="user-0") for i in range(count)))
+    _lv.batch_put_item(connection, nested_table, (nested_item(i) for i in range(_nested_count(count))))
+
+
+def run(quick=False, count=None):
+    """
+    Run all memory scenarios on ``count`` and ``2 * count`` items and return their :func:`slope`.
+    ``count`` must be at least 10, so that ``.nested`` scenarios process different numbers of items.
+    """
+    if count is None:
+        count = 100 if quick else 10000
+    endpoints = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    server = multiprocessing.Process(target=_serve, args=(endpoints, stop, _max_page_size(count)))
+    server.daemon = True
+    server.start()
+    try:
+        connection = _lv.Connection("us-west-2", _lv.StaticCredentials("DummyKey", "DummySecret"), endpoint=endpoints.get(timeout=30))
+        fill(connection, count)
+        fill(connection, 2 * count)
+        small = scenarios(connection, count)
+        large = scenarios(connection, 2 * count)
+        return collections.OrderedDict(
+            (name, slope(measure_memory(*small[name]), measure_memory(*large[name])))
+            for name in small
+        )
+    finally:
+        stop.set()
+        server.join()
@@ -0,0 +1,115 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Micro-benchmarks of the client's hot paths: conversions, actions, signature, responses and JSON.
+"""
+
+import collections
+import datetime
+import json
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_db_to_dict, _convert_db_to_value, _convert_dict_to_db, _convert_value_to_db
+from LowVoltage.connection.connection import Responder, Signer
+from .harness import measure
+
+
+def item(i=0):
+    """
+    A realistic item, with attributes of all types.
+    """
+    return {
+        "h": "user-{}".format(i),
+        "r": i,
+        "name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "active": True,
+        "deleted": None,
+        "tags": {"admin", "beta", "newsletter"},
+        "scores": {12, 57, 98},
+        "avatar": b"\x89PNG" * 64,
+        "address": {"street": "42 Main Street", "city": "Springfield", "zip": 12345},
+        "history": [{"timestamp": 1420070400 + t, "event": "login"} for t in range(10)],
+    }
+
+
+def key(i=0):
+    return {"h": "user-{}".format(i), "r": i}
+
+
+def actions():
+    """
+    Return a dict of action names to functions building a typical instance of this action.
+    """
+    return collections.OrderedDict([
+        ("CreateTable", lambda: _lv.CreateTable("Aaa").hash_key("h", _lv.STRING).range_key("r", _lv.NUMBER).provisioned_throughput(1, 1).global_secondary_index("gsi").hash_key("email", _lv.STRING).project_all().provisioned_throughput(1, 1)),
+        ("DescribeTable", lambda: _lv.DescribeTable("Aaa")),
+        ("UpdateTable", lambda: _lv.UpdateTable("Aaa").provisioned_throughput(2, 2)),
+        ("DeleteTable", lambda: _lv.DeleteTable("Aaa")),
+        ("ListTables", lambda: _lv.ListTables().limit(10).exclusive_start_table_name("Aaa")),
+        ("GetItem", lambda: _lv.GetItem("Aaa", key()).project("name", "email").consistent_read_true()),
+        ("PutItem", lambda: _lv.PutItem("Aaa", item()).condition_expression("attribute_not_exists(h)").return_values_all_old()),
+        ("DeleteItem", lambda: _lv.DeleteItem("Aaa", key()).condition_expression("#a=:v").expression_attribute_name("a", "active").expression_attribute_value("v", False)),
+        ("UpdateItem", lambda: _lv.UpdateItem("Aaa", key()).set("name", ":n").remove("deleted").add("scores", "s").expression_attribute_value("n", "John Doe").expression_attribute_value("s", {42})),
+        ("BatchGetItem", lambda: _lv.BatchGetItem().table("Aaa").keys(key(i) for i in range(100))),
+        ("BatchWriteItem", lambda: _lv.BatchWriteItem().table("Aaa").put(item(i) for i in range(25))),
+        ("Query", lambda: _lv.Query("Aaa").key_eq("h", "user-0").key_between("r", 0, 100).filter_expression("#a=:v").expression_attribute_name("a", "active").expression_attribute_value("v", True).project("name").limit(100)),
+        ("Scan", lambda: _lv.Scan("Aaa").segment(0, 4).filter_expression("#a=:v").expression_attribute_name("a", "active").expression_attribute_value("v", True).limit(100)),
+    ])
+
+
+class _RequestsResponse(object):
+    # Like the response of the python-requests library
+    def __init__(self, data):
+        self.status_code = 200
+        self.text = json.dumps(data)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def benchmarks():
+    """
+    Return a dict of benchmark names to functions to time.
+    """
+    db_item = _convert_dict_to_db(item())
+    db_value = {"M": db_item}
+    value = item()
+    batch_write_payload = json.dumps(_lv.BatchWriteItem().table("Aaa").put(item(i) for i in range(25)).payload)
+    query_response = {"Count": 100, "ScannedCount": 100, "Items": [_convert_dict_to_db(item(i)) for i in range(100)]}
+    query_text = json.dumps(query_response)
+    signer = Signer("us-west-2", "dynamodb.us-west-2.amazonaws.com")
+    now = datetime.datetime(2015, 1, 1)
+    responder = Responder()
+    get_item_response = _RequestsResponse({"Item": db_item})
+    query_requests_response = _RequestsResponse(query_response)
+
+    benchmarks = collections.OrderedDict([
+        ("conversion.value_to_db", lambda: _convert_value_to_db(value)),
+        ("conversion.db_to_value", lambda: _convert_db_to_value(db_value)),
+        ("conversion.dict_to_db", lambda: _convert_dict_to_db(value)),
+        ("conversion.db_to_dict", lambda: _convert_db_to_dict(db_item)),
+    ])
+    for name, build in actions().items():
+        action = build()
+        benchmarks["actions.{}.build".format(name)] = build
+        benchmarks["actions.{}.payload".format(name)] = lambda action=action: action.payload
+    benchmarks["signer"] = lambda: signer("DummyKey", "DummySecret", now, "BatchWriteItem", batch_write_payload)
+    benchmarks["responder.GetItem"] = lambda: responder(_lv.GetItemResponse, get_item_response).item
+    benchmarks["responder.Query"] = lambda: responder(_lv.QueryResponse, query_requests_response).items
+    benchmarks["json.encode.BatchWriteItem"] = lambda: json.dumps(_lv.BatchWriteItem().table("Aaa").put(item(i) for i in range(25)).payload)
+    benchmarks["json.decode.Query"] = lambda: json.loads(query_text)
+    return benchmarks
+
+
+def run(quick=False):
+    """
+    Run all micro-benchmarks and return their results.
+    """
+    repeat, min_time = (1, 0) if quick else (5, 0.2)
+    return collections.OrderedDict(
+        (name, measure(function, repeat=repeat, min_time=min_time))
+        for name, function in benchmarks().items()
+    )
@@ -0,0 +1,93 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Throughput and tail latency of the full client stack, per retry policy, against a local stand-in injecting faults.
+"""
+
+import collections
+import random
+import threading
+import time
+
+import LowVoltage as _lv
+from LowVoltage.stand_in import Database, FaultInjector, Server
+from .micro import item, key
+
+
+def retry_policies():
+    return collections.OrderedDict([
+        ("no_retry", _lv.ExponentialBackoffRetryPolicy(0, 1, 0)),
+        ("backoff_1ms", _lv.ExponentialBackoffRetryPolicy(0.001, 2, 8)),
+        ("backoff_10ms", _lv.ExponentialBackoffRetryPolicy(0.01, 2, 5)),
+    ])
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def load(connection, actions, threads):
+    """
+    Send ``actions`` through ``connection`` from ``threads`` threads.
+    Return the list of latencies of successful actions, the number of failed actions, and the total duration.
+    """
+    actions = list(actions)
+    lock = threading.Lock()
+    latencies = []
+    failures = [0]
+
+    def work():
+        while True:
+            with lock:
+                if not actions:
+                    return
+                action = actions.pop()
+            start = time.perf_counter()
+            try:
+                connection(action)
+            except _lv.Error:
+                with lock:
+                    failures[0] += 1
+            else:
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=work) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return latencies, failures[0], time.perf_counter() - start
+
+
+def run(quick=False, throttling=0.1, server_errors=0.02, dropped_connections=0.02, seed=0):
+    """
+    Run the same load of :class:`.GetItem` actions with each retry policy and return their results.
+    The value of each result is the 99th percentile of the latencies.
+    """
+    count, threads = (20, 2) if quick else (2000, 8)
+    database = Database()
+    database(_lv.CreateTable("Aaa").hash_key("h", _lv.STRING).range_key("r", _lv.NUMBER).provisioned_throughput(1, 1))
+    database(_lv.PutItem("Aaa", item()))
+    generator = random.Random(seed)
+    injector = FaultInjector(
+        database,
+        throttling=throttling, server_errors=server_errors, dropped_connections=dropped_connections,
+        latency=lambda: generator.lognormvariate(-8, 1), actions=["GetItem"], seed=seed,
+    )
+    results = collections.OrderedDict()
+    with Server(injector) as server:
+        for name, retry_policy in retry_policies().items():
+            latencies, failures, duration = load(server.connection(retry_policy=retry_policy), (_lv.GetItem("Aaa", key()) for i in range(count)), threads)
+            results[name] = {
+                "value": percentile(latencies, 0.99) if latencies else duration,
+                "unit": "s",
+                "p50": percentile(latencies, 0.5) if latencies else None,
+                "throughput": len(latencies) / duration,
+                "failures": failures,
+            }
+    return results
@@ -0,0 +1,10 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .test_main import MainUnitTests
+from .test_harness import HarnessUnitTests
+from .test_imports import ImportsUnitTests
+from .test_memory import MemoryUnitTests
+from .test_micro import MicroUnitTests
+from .test_retries import RetriesUnitTests
@@ -0,0 +1,43 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import platform
+
+import LowVoltage.testing as _tst
+from LowVoltage.benchmarks.harness import measure, metadata, compare
+
+
+class HarnessUnitTests(_tst.UnitTests):
+    def test_measure(self):
+        calls = []
+        result = measure(lambda: calls.append(None), repeat=3, min_time=0)
+        self.assertEqual(result["loops"], 1)
+        self.assertEqual(result["repeat"], 3)
+        self.assertEqual(result["unit"], "s")
+        self.assertLessEqual(result["value"], result["median"])
+        self.assertEqual(len(calls), 4)
+
+    def test_metadata(self):
+        self.assertEqual(metadata("v1")["label"], "v1")
+        self.assertEqual(metadata()["python"], platform.python_version())
+
+    def test_compare(self):
+        self.assertEqual(
+            compare(
+                {"a": {"value": 1.05}, "b": {"value": 1.2}, "c": {"value": 0.5}, "d": {"value": 42}, "e": {"value": 1}},
+                {"a": {"value": 1}, "b": {"value": 1}, "c": {"value": 1}, "e": {"value": 0}},
+                0.1
+            ),
+            [("b", 1.2, 1.1), ("e", 1, 0)]
+        )
+
+    def test_compare_with_allowance(self):
+        self.assertEqual(
+            compare(
+                {"a": {"value": 5}, "b": {"value": 15}, "c": {"value": -5}, "d": {"value": 1000}, "e": {"value": 1200}},
+                {"a": {"value": 0, "allowance": 10}, "b": {"value": 0, "allowance": 10}, "c": {"value": -20, "allowance": 10}, "d": {"value": 900, "allowance": 10}, "e": {"value": 900, "allowance": 10}},
+                0.2
+            ),
+            [("b", 15, 10), ("c", -5, -10), ("e", 1200, 1080)]
+        )
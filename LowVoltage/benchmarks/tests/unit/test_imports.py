@@ -0,0 +1,19 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.benchmarks.imports import measure_import, run
+
+
+class ImportsUnitTests(_tst.UnitTests):
+    def test_no_testing_machinery(self):
+        result = measure_import("from LowVoltage import *", repeat=1)
+        self.assertFalse(result["unittest"])
+        self.assertGreater(result["modules"], 0)
+
+    def test_measure_unittest(self):
+        self.assertTrue(measure_import("import unittest", repeat=2)["unittest"])
+
+    def test_run(self):
+        self.assertEqual(list(run(quick=True).keys()), ["LowVoltage", "star", "get_put"])
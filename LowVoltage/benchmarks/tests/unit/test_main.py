@@ -0,0 +1,45 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import io
+import json
+import os
+import tempfile
+
+import LowVoltage.testing as _tst
+from LowVoltage.benchmarks.__main__ import main
+
+
+class MainUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(MainUnitTests, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.output = os.path.join(self.directory, "results.json")
+        self.baseline = os.path.join(self.directory, "baseline.json")
+        self.stderr = io.StringIO()
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+        super(MainUnitTests, self).tearDown()
+
+    def test_output(self):
+        self.assertEqual(main(["--quick", "--label", "v1", "--output", self.output], stderr=self.stderr), 0)
+        with open(self.output) as f:
+            data = json.load(f)
+        self.assertEqual(data["metadata"]["label"], "v1")
+        self.assertIn("micro.signer", data["results"])
+        self.assertNotIn("retries.no_retry", data["results"])
+
+    def test_regression(self):
+        with open(self.baseline, "w") as f:
+            json.dump({"results": {"micro.signer": {"value": 1e-12}, "micro.json.decode.Query": {"value": 1e6}}}, f)
+        self.assertEqual(main(["--quick", "--output", self.output, "--baseline", self.baseline], stderr=self.stderr), 1)
+        self.assertIn("Regression: micro.signer is", self.stderr.getvalue())
+
+    def test_no_regression(self):
+        with open(self.baseline, "w") as f:
+            json.dump({"results": {"micro.json.decode.Query": {"value": 1e6}}}, f)
+        self.assertEqual(main(["--quick", "--output", self.output, "--baseline", self.baseline], stderr=self.stderr), 0)
@@ -0,0 +1,63 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in import Database
+from LowVoltage.benchmarks.harness import compare
+from LowVoltage.benchmarks.memory import measure_memory, slope, scenarios, fill, run, _max_page_size
+
+
+class MemoryUnitTests(_tst.UnitTests):
+    def test_measure_memory(self):
+        result = measure_memory(lambda: bytearray(1000000), 10)
+        self.assertGreaterEqual(result["peak"], 1000000)
+        self.assertEqual(result["items"], 10)
+
+    def test_slope(self):
+        result = slope({"peak": 5000, "items": 10}, {"peak": 7000, "items": 20})
+        self.assertEqual(result["value"], 200000000)
+        self.assertEqual(result["unit"], "B/1M items")
+        self.assertEqual(result["small"]["peak"], 5000)
+
+    def test_slope_ignores_fixed_cost(self):
+        small = measure_memory(lambda: [bytearray(1000000), [None] * 1000], 1000)
+        large = measure_memory(lambda: [bytearray(1000000), [None] * 2000], 2000)
+        self.assertLess(slope(small, large)["value"], 100000000)
+
+    def test_negative_slope(self):
+        result = slope({"peak": 7000, "items": 10}, {"peak": 5000, "items": 20})
+        self.assertEqual(result["value"], -200000000)
+        self.assertGreater(result["value"] + result["allowance"], 0)
+
+    def test_streaming_regression_is_detected(self):
+        baseline = {"iterate_scan": slope({"peak": 7000, "items": 100}, {"peak": 5000, "items": 200})}
+        streaming = {"iterate_scan": slope({"peak": 6000, "items": 100}, {"peak": 6500, "items": 200})}
+        eager = {"iterate_scan": slope({"peak": 150000, "items": 100}, {"peak": 300000, "items": 200})}
+        self.assertEqual(compare(streaming, baseline, 0.1), [])
+        self.assertEqual([name for name, value, limit in compare(eager, baseline, 0.1)], ["iterate_scan"])
+
+    def test_scenarios(self):
+        database = Database()
+        fill(database, 150)
+        for name, (function, items) in scenarios(database, 150).items():
+            result = function()
+            if name.endswith(".eager") and not name.startswith("batch_put_item"):
+                self.assertEqual(len(result), items)
+        self.assertEqual(len(list(_lv.iterate_scan(database, _lv.Scan("Sink150")))), 150)
+        self.assertEqual(len(list(_lv.iterate_scan(database, _lv.Scan("Nested150")))), 15)
+
+    def test_scenarios_span_several_pages(self):
+        database = Database(max_page_size=_max_page_size(100))
+        fill(database, 100)
+        self.assertLess(database(_lv.Scan("Items100")).count, 20)
+        self.assertLess(database(_lv.Scan("Nested100")).count, 5)
+        self.assertEqual(_max_page_size(10000), 1024 * 1024)
+
+    def test_run(self):
+        results = run(count=30)
+        self.assertEqual(len(results), 10)
+        for result in results.values():
+            self.assertGreater(result["allowance"], 0)
+            self.assertEqual(result["large"]["items"], 2 * result["small"]["items"])
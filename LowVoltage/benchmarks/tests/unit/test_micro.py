@@ -0,0 +1,24 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.benchmarks.micro import actions, run
+
+
+class MicroUnitTests(_tst.UnitTests):
+    def test_actions(self):
+        for name, build in actions().items():
+            action = build()
+            self.assertEqual(action.name, name)
+            self.assertIsInstance(action.payload, dict)
+
+    def test_run(self):
+        results = run(quick=True)
+        self.assertIn("conversion.value_to_db", results)
+        self.assertIn("actions.BatchWriteItem.payload", results)
+        self.assertIn("signer", results)
+        self.assertIn("responder.Query", results)
+        self.assertEqual(len(results), 4 + 2 * 13 + 5)
+        for result in results.values():
+            self.assertGreater(result["value"], 0)
@@ -0,0 +1,20 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.benchmarks.retries import percentile, run
+
+
+class RetriesUnitTests(_tst.UnitTests):
+    def test_percentile(self):
+        self.assertEqual(percentile(list(range(100, 0, -1)), 0.5), 51)
+        self.assertEqual(percentile(list(range(100)), 0.99), 99)
+        self.assertEqual(percentile([1], 0.99), 1)
+
+    def test_run(self):
+        results = run(quick=True, throttling=0.3, server_errors=0, dropped_connections=0)
+        self.assertEqual(list(results.keys()), ["no_retry", "backoff_1ms", "backoff_10ms"])
+        self.assertGreater(results["no_retry"]["failures"], 0)
+        self.assertEqual(results["backoff_1ms"]["failures"], 0)
+        self.assertGreater(results["backoff_1ms"]["throughput"], 0)
@@ -3,10 +3,15 @@
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
 from .batch_delete_item import batch_delete_item
+from .batch_get_item import batch_get_item, iterate_ordered_batch_get_item
 from .iterate_batch_get_item import iterate_batch_get_item
 from .batch_put_item import batch_put_item
+from .batch_writer import BatchWriter
+from .chunked_value import put_chunked_value, iterate_chunked_value, get_chunked_value, delete_chunked_value
 from .iterate_list_tables import iterate_list_tables
 from .iterate_query import iterate_query
-from .iterate_scan import iterate_scan, parallelize_scan
+from .iterate_scan import iterate_scan, parallelize_scan, parallel_scan
+from .optimistic_locking import OptimisticLocking, LockingStats
 from .wait_for_table_activation import wait_for_table_activation
 from .wait_for_table_deletion import wait_for_table_deletion
+from .write_sharding import WriteSharding
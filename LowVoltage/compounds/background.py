@@ -0,0 +1,77 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+import queue
+import threading
+
+
+_ELEMENT = "element"
+_ERROR = "error"
+_DONE = "done"
+
+
+def _iterate_in_background(producers, workers, max_ahead):
+    """
+    Iterate over the iterables returned by the callables in ``producers``, in at most ``workers`` daemon threads.
+    Yield their elements in the order they are produced.
+
+    At most ``max_ahead`` elements are being produced or waiting to be consumed at any time,
+    not counting the element the consumer is processing: its slot is released when it's yielded.
+
+    An exception raised by a producer is re-raised in the consumer, after the elements produced before it.
+    Closing the returned generator (or letting it be garbage-collected) stops the threads after their current element.
+    """
+    producers = collections.deque(producers)
+    lock = threading.Lock()
+    slots = threading.Semaphore(max_ahead)
+    stopping = threading.Event()
+    results = queue.Queue()
+
+    def next_producer():
+        with lock:
+            if len(producers) != 0 and not stopping.is_set():
+                return producers.popleft()
+
+    def work():
+        try:
+            producer = next_producer()
+            while producer is not None:
+                iterator = iter(producer())
+                while True:
+                    slots.acquire()
+                    if stopping.is_set():
+                        return
+                    try:
+                        element = next(iterator)
+                    except StopIteration:
+                        slots.release()
+                        break
+                    results.put((_ELEMENT, element))
+                producer = next_producer()
+        except Exception as e:
+            results.put((_ERROR, e))
+        finally:
+            results.put((_DONE, None))
+
+    threads = [threading.Thread(target=work) for i in range(min(workers, len(producers)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    running = len(threads)
+    try:
+        while running != 0:
+            kind, value = results.get()
+            if kind == _DONE:
+                running -= 1
+            elif kind == _ERROR:
+                raise value
+            else:
+                slots.release()
+                yield value
+    finally:
+        stopping.set()
+        for thread in threads:
+            slots.release()
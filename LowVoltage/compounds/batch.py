@@ -0,0 +1,230 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import itertools
+import queue
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.connection.retry_policies as _retry_policies
+from LowVoltage.actions.conversion import _convert_db_to_dict
+
+
+def _get_retry_policy(retry_policy):
+    if retry_policy is None:
+        return _retry_policies.DEFAULT
+    else:
+        return retry_policy
+
+
+def _throttled(count):
+    # DynamoDB returns unprocessed items/keys when the provisioned throughput is exceeded during a batch action.
+    return _lv.ProvisionedThroughputExceededException("{} unprocessed requests".format(count))
+
+
+def _count_throttle(throttles, processed, unprocessed):
+    """
+    Return the throttles to pass to the retry policy after an action that processed ``processed`` requests
+    and left ``unprocessed`` ones. An action that made progress starts a new streak of throttles,
+    so that the retry policy only gives up on consecutive actions that processed nothing.
+    """
+    if unprocessed == 0:
+        return []
+    elif processed == 0:
+        return throttles + [_throttled(unprocessed)]
+    else:
+        return [_throttled(unprocessed)]
+
+
+def _wait_before_retry(retry_policy, action, throttles):
+    """
+    Sleep as long as ``retry_policy`` says before sending ``action``, after ``throttles`` consecutive throttled actions.
+    Return ``False`` if ``retry_policy`` says to give up.
+    """
+    if len(throttles) != 0:
+        delay = retry_policy.retry(action, throttles)
+        if delay is None:
+            return False
+        time.sleep(delay)
+    return True
+
+
+def _batch_write_item(connection, table, requests, concurrency, retry_policy):
+    """
+    Send ``requests`` (an iterable of ``PutRequest`` or ``DeleteRequest`` exactly as expected by DynamoDB)
+    in as many :class:`.BatchWriteItem` actions as needed, with at most ``concurrency`` actions in flight.
+    ``requests`` is consumed lazily, 25 at a time.
+    Unprocessed items are sent again in later actions: as soon as they fill an action, or after all ``requests``.
+
+    After an action that left unprocessed items, new actions are delayed according to ``retry_policy``.
+    It gives up only on consecutive actions that processed no item at all.
+
+    When an action fails, or when ``retry_policy`` gives up, no new action is started,
+    and :exc:`.IncompleteBatchError` is raised once the actions in flight are done.
+    Requests not yet taken from ``requests`` are not part of the exception.
+    """
+    requests = iter(requests)
+    fresh = list(itertools.islice(requests, 25))
+    unprocessed = []
+    throttles = []
+    errors = []
+    failed = []
+    finished = queue.Queue()
+
+    def send(action, batch):
+        try:
+            r = connection(action)
+        except Exception as e:
+            finished.put((batch, None, e))
+        else:
+            finished.put((batch, r, None))
+
+    in_flight = 0
+    while True:
+        while in_flight < concurrency and len(errors) == 0:
+            if len(fresh) != 0 and len(unprocessed) < 25:
+                batch = fresh
+                fresh = list(itertools.islice(requests, 25))
+            elif len(unprocessed) != 0:
+                batch = unprocessed[:25]
+                del unprocessed[:25]
+            else:
+                break
+            action = _lv.BatchWriteItem().previous_unprocessed_items({table: batch})
+            if not _wait_before_retry(retry_policy, action, throttles):
+                errors.extend(throttles)
+                failed.extend(batch)
+                break
+            in_flight += 1
+            if concurrency == 1:
+                send(action, batch)
+            else:
+                thread = threading.Thread(target=send, args=(action, batch))
+                thread.daemon = True
+                thread.start()
+        if in_flight == 0:
+            break
+        batch, r, e = finished.get()
+        in_flight -= 1
+        if e is None:
+            still_unprocessed = r.unprocessed_items.get(table, []) if isinstance(r.unprocessed_items, dict) else []
+            unprocessed.extend(still_unprocessed)
+            throttles = _count_throttle(throttles, len(batch) - len(still_unprocessed), len(still_unprocessed))
+        else:
+            errors.append(e)
+            failed.extend(batch)
+
+    if len(errors) != 0:
+        raise _lv.IncompleteBatchError(errors, [_unwrap(request) for request in failed + unprocessed + fresh])
+
+
+def _unwrap(request):
+    if "PutRequest" in request:
+        return _convert_db_to_dict(request["PutRequest"]["Item"])
+    else:
+        return _convert_db_to_dict(request["DeleteRequest"]["Key"])
+
+
+def _key_index(key_names, item):
+    return tuple(item[name] for name in key_names)
+
+
+def _batch_get_item(connection, requests, concurrency, retry_policy, may_read=lambda: True):
+    """
+    Get the items for ``requests`` (an iterable of ``(table, key)`` pairs)
+    in as many :class:`.BatchGetItem` actions as needed, with at most ``concurrency`` actions in flight.
+    Yield ``(table, key, item)`` for each request, in the order the actions complete. ``item`` is ``None`` if it doesn't exist.
+
+    ``requests`` is consumed lazily, at most 100 at a time, and only while ``may_read()`` returns ``True``.
+    Identical requests waiting at the same time are sent only once (DynamoDB rejects duplicate keys) but yielded as many times as requested.
+    Unprocessed keys are sent again in later actions, as in :func:`_batch_write_item`.
+    """
+    requests = iter(requests)
+    key_names = {}
+    waiting = {}
+    unprocessed = []
+    throttles = []
+    errors = []
+    failed = []
+    finished = queue.Queue()
+
+    def read():
+        batch = []
+        while len(batch) < 100 and may_read():
+            try:
+                table, key = next(requests)
+            except StopIteration:
+                break
+            names = key_names.setdefault(table, tuple(sorted(key)))
+            request = (table, _key_index(names, key))
+            if request in waiting:
+                waiting[request] += 1
+            else:
+                waiting[request] = 1
+                batch.append((request, key))
+        return batch
+
+    def send(action, batch):
+        try:
+            r = connection(action)
+        except Exception as e:
+            finished.put((batch, None, e))
+        else:
+            finished.put((batch, r, None))
+
+    in_flight = 0
+    while True:
+        while in_flight < concurrency and len(errors) == 0:
+            batch = []
+            if len(unprocessed) < 100:
+                batch = read()
+            if len(batch) == 0:
+                batch = unprocessed[:100]
+                del unprocessed[:100]
+            if len(batch) == 0:
+                break
+            action = _lv.BatchGetItem()
+            for (table, index), key in batch:
+                action.table(table).keys(key)
+            if not _wait_before_retry(retry_policy, action, throttles):
+                errors.extend(throttles)
+                failed.extend(batch)
+                break
+            in_flight += 1
+            if concurrency == 1:
+                send(action, batch)
+            else:
+                thread = threading.Thread(target=send, args=(action, batch))
+                thread.daemon = True
+                thread.start()
+        if in_flight == 0:
+            break
+        batch, r, e = finished.get()
+        in_flight -= 1
+        if e is None:
+            found = {}
+            for table, items in (r.responses or {}).items():
+                for item in items:
+                    found[(table, _key_index(key_names[table], item))] = item
+            still_unprocessed = set()
+            if isinstance(r.unprocessed_keys, dict):
+                for table, keys in r.unprocessed_keys.items():
+                    for key in keys.get("Keys", []):
+                        key = _convert_db_to_dict(key)
+                        request = (table, _key_index(key_names[table], key))
+                        still_unprocessed.add(request)
+                        unprocessed.append((request, key))
+            throttles = _count_throttle(throttles, len(batch) - len(still_unprocessed), len(still_unprocessed))
+            for request, key in batch:
+                if request not in still_unprocessed:
+                    item = found.get(request)
+                    for i in range(waiting.pop(request)):
+                        yield request[0], key, item
+        else:
+            errors.append(e)
+            failed.extend(batch)
+
+    if len(errors) != 0:
+        raise _lv.IncompleteBatchError(errors, [(request[0], key) for request, key in failed + unprocessed])
@@ -2,14 +2,17 @@
 
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
-import LowVoltage as _lv
-import LowVoltage.testing as _tst
-from LowVoltage.variadic import variadic
 
+from LowVoltage.actions.conversion import _convert_dict_to_db
+from LowVoltage.variadic import lazy_flatten
+from .batch import _batch_write_item, _get_retry_policy
 
-@variadic(dict)
-def batch_delete_item(connection, table, *keys):
+
+def batch_delete_item(connection, table, *keys, concurrency=1, retry_policy=None):
     """
+    Note that this function is variadic. See :ref:`variadic-functions`.
+    Its keys are consumed lazily, 25 at a time, so you can pass a generator of any length.
+
     Make as many :class:`.BatchWriteItem` actions as needed to delete all specified keys.
     Including processing :attr:`.BatchWriteItemResponse.unprocessed_items`.
 
@@ -20,93 +23,22 @@ def batch_delete_item(connection, table, *keys):
     ...   {"h": 1},
     ...   {"h": 2}
     ... )
-    """
-    keys = list(keys)
-    unprocessed_items = []
-
-    while len(keys) != 0:
-        r = connection(_lv.BatchWriteItem().table(table).delete(keys[:25]))
-        keys = keys[25:]
-        if isinstance(r.unprocessed_items, dict) and table in r.unprocessed_items:
-            unprocessed_items.extend(r.unprocessed_items[table])
-
-    while len(unprocessed_items) != 0:
-        r = connection(_lv.BatchWriteItem().previous_unprocessed_items({table: unprocessed_items[:25]}))
-        unprocessed_items = unprocessed_items[25:]
-        if isinstance(r.unprocessed_items, dict) and table in r.unprocessed_items:
-            unprocessed_items.extend(r.unprocessed_items[table])
-
-
-class BatchDeleteItemUnitTests(_tst.UnitTestsWithMocks):
-    def setUp(self):
-        super(BatchDeleteItemUnitTests, self).setUp()
-        self.connection = self.mocks.create("connection")
-
-    def test_no_keys(self):
-        batch_delete_item(self.connection.object, "Aaa", [])
 
-    def test_one_page(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"S": "a"}}}}, {"DeleteRequest": {"Key": {"h": {"S": "b"}}}}]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
+    :param concurrency: the number of :class:`.BatchWriteItem` actions to keep in flight at the same time,
+        each one in its own thread. Unprocessed items are sent again in later actions.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) deciding how long to wait
+        before the next action when DynamoDB returned unprocessed items (typically because the table is throttled).
+        Its ``retry`` method receives one :exc:`.ProvisionedThroughputExceededException` per consecutive action with unprocessed items,
+        counting from one again after each action that processed some items.
+        If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
 
-        batch_delete_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})
-
-    def test_several_pages(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(25, 50)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(50, 60)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
-
-        batch_delete_item(self.connection.object, "Aaa", ({"h": i} for i in range(60)))
-
-    def test_one_unprocessed_item(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"S": "a"}}}}, {"DeleteRequest": {"Key": {"h": {"S": "b"}}}}]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"DeleteRequest": {"Key": {"h": {"S": "c"}}}}]})
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"S": "c"}}}}]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
-
-        batch_delete_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})
-
-    def test_several_pages_of_unprocessed_item(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(100, 110)]})
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(25, 35)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(110, 120)]})
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(100, 120)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(120, 130)]})
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": str(i)}}}} for i in range(120, 130)]}})
-        ).andReturn(
-            _lv.BatchWriteItemResponse()
-        )
-
-        batch_delete_item(self.connection.object, "Aaa", [{"h": i} for i in range(35)])
+    :raise: :exc:`.IncompleteBatchError` if an action fails or if the retry policy gives up. No new action is started then,
+        and the exception lists all keys that were taken from ``keys`` but not deleted.
+    """
+    _batch_write_item(
+        connection,
+        table,
+        ({"DeleteRequest": {"Key": _convert_dict_to_db(key)}} for key in lazy_flatten(dict, keys)),
+        concurrency,
+        _get_retry_policy(retry_policy),
+    )
@@ -0,0 +1,98 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+
+import LowVoltage as _lv
+from .batch import _batch_get_item, _get_retry_policy, _key_index
+
+
+def batch_get_item(connection, keys, *, concurrency=1, retry_policy=None):
+    """
+    Make as many :class:`.BatchGetItem` actions as needed to get all specified items from one or several tables.
+    Including processing :attr:`.BatchGetItemResponse.unprocessed_keys`.
+
+    ``keys`` is a dict associating table names to iterables of keys.
+    The returned dict associates each table name to a dict of items indexed by the tuple of their key attributes, sorted by name.
+    Items that don't exist are not in the returned dict.
+
+    >>> items = batch_get_item(connection, {table: [{"h": 0}, {"h": 1}], table2: [{"h": 0, "r": 10}]})
+    >>> items[table][(1,)]
+    {'h': 1, 'gr': 0, 'gh': 0}
+    >>> items[table2][(0, 10)]
+    {'h': 0, 'r': 10}
+
+    :param concurrency: the number of :class:`.BatchGetItem` actions to keep in flight at the same time,
+        each one in its own thread.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) deciding how long to wait
+        before the next action when DynamoDB returned unprocessed keys (typically because the table is throttled).
+        If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
+
+    :raise: :exc:`.IncompleteBatchError` if an action fails or if the retry policy gives up.
+        Its :attr:`~.IncompleteBatchError.remaining` is a list of ``(table, key)`` pairs.
+    """
+    items = {table: {} for table in keys}
+    requests = ((table, key) for table, table_keys in keys.items() for key in table_keys)
+    for table, key, item in _batch_get_item(connection, requests, concurrency, _get_retry_policy(retry_policy)):
+        if item is not None:
+            items[table][_key_index(sorted(key), key)] = item
+    return items
+
+
+def iterate_ordered_batch_get_item(connection, requests, *, concurrency=1, buffer_size=1000, retry_policy=None):
+    """
+    Make as many :class:`.BatchGetItem` actions as needed to get the items for all ``requests``,
+    an iterable of ``(table, key)`` pairs, possibly on several tables.
+    Including processing :attr:`.BatchGetItemResponse.unprocessed_keys`.
+
+    Yield ``(table, key, item)`` triplets in the same order as ``requests``. ``item`` is ``None`` if it doesn't exist.
+
+    >>> for table, key, item in iterate_ordered_batch_get_item(connection, [(table, {"h": 1}), (table2, {"h": 0, "r": 10}), (table, {"h": 0})]):
+    ...   print(item)
+    {'h': 1, 'gr': 0, 'gh': 0}
+    {'h': 0, 'r': 10}
+    {'h': 0, 'gr': 0, 'gh': 0}
+
+    :param concurrency: the number of :class:`.BatchGetItem` actions to keep in flight at the same time,
+        each one in its own thread.
+    :param buffer_size: the maximum number of requests taken from ``requests`` but not yet yielded.
+        Items received out of order wait in this buffer, so it bounds memory usage.
+        No new key is requested while it's full.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) deciding how long to wait
+        before the next action when DynamoDB returned unprocessed keys (typically because the table is throttled).
+        If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
+
+    :raise: :exc:`.IncompleteBatchError` if an action fails or if the retry policy gives up.
+        Its :attr:`~.IncompleteBatchError.remaining` lists all ``(table, key)`` pairs taken from ``requests`` but not yielded.
+    """
+    pending = collections.deque()
+    waiting = {}
+
+    def read():
+        for table, key in requests:
+            request = [table, key, False, None]
+            pending.append(request)
+            waiting.setdefault((table, _key_index(sorted(key), key)), collections.deque()).append(request)
+            yield table, key
+
+    results = _batch_get_item(
+        connection,
+        read(),
+        concurrency,
+        _get_retry_policy(retry_policy),
+        lambda: len(pending) < buffer_size,
+    )
+    try:
+        for table, key, item in results:
+            index = (table, _key_index(sorted(key), key))
+            request = waiting[index].popleft()
+            if len(waiting[index]) == 0:
+                del waiting[index]
+            request[2] = True
+            request[3] = item
+            while len(pending) != 0 and pending[0][2]:
+                table, key, done, item = pending.popleft()
+                yield table, key, item
+    except _lv.IncompleteBatchError as e:
+        raise _lv.IncompleteBatchError(e.errors, [(table, key) for table, key, done, item in pending])
@@ -0,0 +1,238 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+import json
+import threading
+import time
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_dict_to_db, _convert_db_to_dict
+from LowVoltage.variadic import variadic
+from .batch import _count_throttle, _get_retry_policy
+
+
+class BatchWriter(object):
+    """
+    Buffer individual puts and deletes, on any number of tables, and send them in :class:`.BatchWriteItem` actions from a background thread.
+    Including processing :attr:`.BatchWriteItemResponse.unprocessed_items`.
+
+    >>> with BatchWriter(connection) as writer:
+    ...   writer.put(table, {"h": 0, "a": 42}, {"h": 1, "a": 57})
+    ...   writer.delete(table, {"h": 2})
+
+    A :class:`.BatchWriteItem` is sent as soon as 25 writes are buffered, or when they weight ``max_bytes``,
+    or when the oldest one has been waiting for ``max_delay`` seconds.
+    Successive writes to the same key are collapsed: only the last one is sent.
+    If ``max_buffered`` writes are waiting, :meth:`put` and :meth:`delete` block until some are sent.
+
+    Collapsing writes requires knowing the key attributes of each table.
+    They are taken from ``key_names`` (a dict associating table names to lists of attribute names),
+    or from a :class:`.DescribeTable` action the first time a table is written to.
+
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) deciding how long to wait
+        before the next action when DynamoDB returned unprocessed items (typically because the table is throttled).
+        If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
+
+    When an action fails, or when the retry policy gives up, nothing else is sent and
+    all subsequent calls raise an :exc:`.IncompleteBatchError`.
+    Its :attr:`~.IncompleteBatchError.remaining` is a list of ``(table, request)`` pairs
+    with ``request`` like ``{"PutRequest": {"Item": item}}`` or ``{"DeleteRequest": {"Key": key}}``.
+    """
+
+    def __init__(self, connection, key_names=None, max_bytes=1024 * 1024, max_delay=0.1, max_buffered=1000, retry_policy=None):
+        self.__connection = connection
+        self.__key_names = dict(key_names or {})
+        self.__max_bytes = max_bytes
+        self.__max_delay = max_delay
+        self.__max_buffered = max_buffered
+        self.__retry_policy = _get_retry_policy(retry_policy)
+
+        self.__condition = threading.Condition()
+        self.__buffer = collections.OrderedDict()
+        self.__bytes = 0
+        self.__sending = False
+        self.__flushes = 0
+        self.__closed = False
+        self.__errors = []
+        self.__failed = []
+
+        self.__thread = threading.Thread(target=self.__send_forever)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't hide the exception raised in the with-block behind an IncompleteBatchError
+            try:
+                self.close()
+            except _lv.IncompleteBatchError:
+                pass
+        return False
+
+    @variadic(dict)
+    def put(self, table, *items):
+        """
+        Put items in ``table``.
+        """
+        for item in items:
+            self.__add(table, item, {"PutRequest": {"Item": _convert_dict_to_db(item)}})
+
+    @variadic(dict)
+    def delete(self, table, *keys):
+        """
+        Delete items from ``table``.
+        """
+        for key in keys:
+            self.__add(table, key, {"DeleteRequest": {"Key": _convert_dict_to_db(key)}})
+
+    def flush(self):
+        """
+        Wait until all buffered writes are sent.
+        """
+        with self.__condition:
+            self.__flushes += 1
+            self.__condition.notify_all()
+            try:
+                while len(self.__errors) == 0 and (len(self.__buffer) != 0 or self.__sending):
+                    self.__condition.wait()
+            finally:
+                self.__flushes -= 1
+            self.__check_errors()
+
+    def close(self):
+        """
+        Send all buffered writes and stop the background thread.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+        with self.__condition:
+            self.__check_errors()
+
+    def __add(self, table, item, request):
+        if table not in self.__key_names:
+            self.__key_names[table] = [e.attribute_name for e in self.__connection(_lv.DescribeTable(table)).table.key_schema]
+        key = self.__key(table, item)
+        size = len(json.dumps(request))
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("BatchWriter is closed")
+            while len(self.__errors) == 0 and len(self.__buffer) >= self.__max_buffered:
+                self.__condition.wait()
+            self.__check_errors()
+            if key in self.__buffer:
+                self.__bytes -= self.__buffer[key][2]
+                added = self.__buffer[key][3]
+            else:
+                added = time.time()
+            self.__buffer[key] = (table, request, size, added)
+            self.__bytes += size
+            self.__condition.notify_all()
+
+    def __key(self, table, item):
+        return (table, tuple(item[name] for name in self.__key_names[table]))
+
+    def __check_errors(self):
+        if len(self.__errors) != 0:
+            raise _lv.IncompleteBatchError(
+                self.__errors,
+                [(table, _unwrap(request)) for key, (table, request, size, added) in self.__failed + list(self.__buffer.items())]
+            )
+
+    def __send_forever(self):
+        throttles = []
+        while True:
+            with self.__condition:
+                while len(self.__errors) == 0 and not self.__must_send():
+                    if self.__closed and len(self.__buffer) == 0:
+                        return
+                    if len(self.__buffer) == 0:
+                        self.__condition.wait()
+                    else:
+                        oldest = next(iter(self.__buffer.values()))[3]
+                        self.__condition.wait(max(0, oldest + self.__max_delay - time.time()))
+                if len(self.__errors) != 0:
+                    return
+                batch = []
+                while len(batch) < 25 and len(self.__buffer) != 0:
+                    key, entry = self.__buffer.popitem(last=False)
+                    self.__bytes -= entry[2]
+                    batch.append((key, entry))
+                self.__sending = True
+                self.__condition.notify_all()
+
+            request_items = {}
+            for key, (table, request, size, added) in batch:
+                request_items.setdefault(table, []).append(request)
+            action = _lv.BatchWriteItem().previous_unprocessed_items(request_items)
+            error = None
+            unprocessed = {}
+            if len(throttles) != 0:
+                delay = self.__retry_policy.retry(action, throttles)
+                if delay is None:
+                    error = throttles
+                else:
+                    time.sleep(delay)
+            if error is None:
+                try:
+                    r = self.__connection(action)
+                except Exception as e:
+                    error = [e]
+                else:
+                    if isinstance(r.unprocessed_items, dict):
+                        unprocessed = r.unprocessed_items
+
+            with self.__condition:
+                self.__sending = False
+                if error is not None:
+                    self.__errors.extend(error)
+                    self.__failed.extend(batch)
+                elif sum(len(requests) for requests in unprocessed.values()) != 0:
+                    count = sum(len(requests) for requests in unprocessed.values())
+                    throttles = _count_throttle(throttles, len(batch) - count, count)
+                    # Unprocessed requests are matched by key, because DynamoDB may return them in a different representation.
+                    unprocessed_keys = set(
+                        self.__key(table, _attributes(request))
+                        for table, requests in unprocessed.items()
+                        for request in requests
+                    )
+                    # Unprocessed requests are sent first, unless a more recent write to the same key is waiting.
+                    for key, entry in reversed(batch):
+                        if key not in self.__buffer and key in unprocessed_keys:
+                            self.__buffer[key] = entry
+                            self.__buffer.move_to_end(key, last=False)
+                            self.__bytes += entry[2]
+                else:
+                    throttles = []
+                self.__condition.notify_all()
+
+    def __must_send(self):
+        return len(self.__buffer) != 0 and (
+            len(self.__buffer) >= 25
+            or self.__bytes >= self.__max_bytes
+            or self.__flushes != 0
+            or self.__closed
+            or next(iter(self.__buffer.values()))[3] + self.__max_delay <= time.time()
+        )
+
+
+def _attributes(request):
+    if "PutRequest" in request:
+        return _convert_db_to_dict(request["PutRequest"]["Item"])
+    else:
+        return _convert_db_to_dict(request["DeleteRequest"]["Key"])
+
+
+def _unwrap(request):
+    if "PutRequest" in request:
+        return {"PutRequest": {"Item": _convert_db_to_dict(request["PutRequest"]["Item"])}}
+    else:
+        return {"DeleteRequest": {"Key": _convert_db_to_dict(request["DeleteRequest"]["Key"])}}
@@ -0,0 +1,245 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Store values larger than the 400KB limit of DynamoDB items as several chunk items under the same hash key,
+and read them back as a stream of chunks.
+
+The table must have a hash key and a number range key (named ``"chunk"`` by default).
+The value is split in chunks stored in items with range key ``offset + 1`` to ``offset + N``,
+and a manifest is stored in the item with range key ``0``: a ``version`` token, the ``offset`` and number of ``chunks``,
+the ``size`` of the value and the SHA-256 ``digests`` of the chunks.
+Each chunk item also holds the ``version`` of the value it belongs to.
+
+Each new value is written after the chunks of the previous one, which are left untouched until the manifest is replaced.
+The manifest is written after all chunks, so it's the commit point of :func:`put_chunked_value`:
+readers see either the previous value or the new one, and :func:`iterate_chunked_value`
+raises :exc:`.CorruptedValueError` if the chunks it reads don't match the manifest.
+The manifest is only written if it didn't change since the put started, so of two concurrent puts of the same key,
+one fails with :exc:`.ConditionalCheckFailedException`.
+
+>>> put_chunked_value(connection, table2, {"h": 100}, b"x" * 10000, range_key="r1", chunk_size=4000)
+>>> len(get_chunked_value(connection, table2, {"h": 100}, range_key="r1"))
+10000
+>>> [len(chunk) for chunk in iterate_chunked_value(connection, table2, {"h": 100}, range_key="r1")]
+[4000, 4000, 2000]
+>>> delete_chunked_value(connection, table2, {"h": 100}, range_key="r1")
+>>> print(get_chunked_value(connection, table2, {"h": 100}, range_key="r1"))
+None
+"""
+
+import hashlib
+import uuid
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_dict_to_db
+from .batch import _batch_write_item, _get_retry_policy
+from .batch_get_item import iterate_ordered_batch_get_item
+from .iterate_query import iterate_query
+
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def put_chunked_value(connection, table, key, value, *, range_key="chunk", chunk_size=256 * 1024, concurrency=1, retry_policy=None):
+    """
+    Store ``value`` (bytes, or an iterable of bytes pieces of any sizes) in chunks of ``chunk_size`` bytes under ``key``,
+    which must contain only the hash key.
+
+    Pieces are consumed lazily and chunks are written with :class:`.BatchWriteItem` actions as they are formed,
+    so a value produced by a generator is never fully held in memory.
+    They are written under range keys that follow the chunks of the previous value.
+    Then the manifest is written with a :class:`.PutItem`, on the condition that its ``version`` is still
+    the one read before writing the chunks (or that there is still no manifest), and the chunks of the previous value are deleted.
+
+    :param range_key: the name of the number range key of the table.
+    :param chunk_size: the size of the chunks in bytes. Keep it well under 400KB, which includes attribute names.
+    :param concurrency: the number of :class:`.BatchWriteItem` actions to keep in flight at the same time,
+        each one in its own thread. Each action holds up to 25 chunks.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) for the :class:`.BatchWriteItem` actions,
+        as in :func:`.batch_put_item`.
+
+    :raise: :exc:`.IncompleteBatchError` if some chunks could not be written. The manifest is not written then,
+        so the previous value is still readable. The same goes for exceptions raised while iterating ``value``.
+        The chunks already written are not referenced by any manifest; the next put of the same key overwrites them.
+    :raise: :exc:`.ConditionalCheckFailedException` if another put or delete of the same key committed meanwhile.
+        The chunks written by this put are deleted (those not already overwritten by a concurrent put), and the value
+        committed by the other put is left in place.
+    """
+    if isinstance(value, bytes):
+        value = [value]
+    previous = _get_manifest(connection, table, key, range_key)
+    # Write the new chunks where they can't overwrite the chunks of the live value
+    offset = 0 if previous is None else _offset(previous) + int(previous["chunks"])
+    version = uuid.uuid4().hex
+    digests = []
+    size = [0]
+
+    def chunks():
+        for index, chunk in enumerate(_rechunk(value, chunk_size), 1):
+            digests.append(hashlib.sha256(chunk).digest())
+            size[0] += len(chunk)
+            item = _chunk_key(key, range_key, offset + index)
+            item["version"] = version
+            item["data"] = chunk
+            yield {"PutRequest": {"Item": _convert_dict_to_db(item)}}
+
+    retry_policy = _get_retry_policy(retry_policy)
+    _batch_write_item(connection, table, chunks(), concurrency, retry_policy)
+
+    manifest = _chunk_key(key, range_key, 0)
+    manifest.update(version=version, offset=offset, size=size[0], chunks=len(digests), digests=b"".join(digests))
+    action = _lv.PutItem(table, manifest).expression_attribute_name("version", "version")
+    if previous is None:
+        action.condition_expression("attribute_not_exists(#version)")
+    else:
+        action.condition_expression("#version=:previous").expression_attribute_value("previous", previous["version"])
+    try:
+        connection(action)
+    except _lv.ConditionalCheckFailedException:
+        _delete_own_chunks(connection, table, key, range_key, offset, len(digests), version)
+        raise
+
+    if previous is not None:
+        _delete_chunks(connection, table, key, range_key, previous, concurrency, retry_policy)
+
+
+def iterate_chunked_value(connection, table, key, *, range_key="chunk", concurrency=None, buffer_size=16, retry_policy=None):
+    """
+    Read the manifest of the value stored under ``key`` with a consistent :class:`.GetItem`.
+    Return ``None`` if there is no value, or an iterator over the chunks of the value, as bytes.
+
+    The chunks are read lazily: with ``concurrency=None`` (the default) by a single consistent :class:`.Query`
+    (several pages for large values), else with :class:`.BatchGetItem` actions, ``concurrency`` in parallel,
+    keeping at most ``buffer_size`` chunks ahead of the one yielded.
+    :class:`.BatchGetItem` is eventually consistent, so it can return a chunk of the previous value just after a write.
+
+    Each chunk is checked against the manifest (version and SHA-256 digest) before being yielded,
+    and the number of chunks and total size are checked at the end.
+
+    :param range_key: the name of the number range key of the table.
+    :param concurrency: ``None`` or the number of :class:`.BatchGetItem` actions to keep in flight.
+    :param buffer_size: the maximum number of chunks requested but not yet yielded, when ``concurrency`` is not ``None``.
+        Each :class:`.BatchGetItem` response is limited to 16MB, so keep ``buffer_size * chunk_size`` under that.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) for the :class:`.BatchGetItem` actions.
+
+    :raise: :exc:`.CorruptedValueError` during the iteration if a chunk is missing or doesn't match the manifest.
+    """
+    manifest = _get_manifest(connection, table, key, range_key)
+    if manifest is None:
+        return None
+    return _iterate_chunks(connection, table, key, manifest, range_key, concurrency, buffer_size, retry_policy)
+
+
+def get_chunked_value(connection, table, key, *, range_key="chunk", concurrency=None, buffer_size=16, retry_policy=None):
+    """
+    Read the value stored under ``key`` with :func:`iterate_chunked_value` (same options) and return it as bytes,
+    or ``None`` if there is no value.
+    """
+    chunks = iterate_chunked_value(connection, table, key, range_key=range_key, concurrency=concurrency, buffer_size=buffer_size, retry_policy=retry_policy)
+    if chunks is None:
+        return None
+    return b"".join(chunks)
+
+
+def delete_chunked_value(connection, table, key, *, range_key="chunk", concurrency=1, retry_policy=None):
+    """
+    Delete the manifest of the value stored under ``key``, so that it's not readable anymore, then its chunks.
+
+    :param range_key: the name of the number range key of the table.
+    :param concurrency: the number of :class:`.BatchWriteItem` actions to keep in flight at the same time.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) for the :class:`.BatchWriteItem` actions.
+    """
+    r = connection(_lv.DeleteItem(table, _chunk_key(key, range_key, 0)).return_values_all_old())
+    if r.attributes is not None:
+        _delete_chunks(connection, table, key, range_key, r.attributes, concurrency, _get_retry_policy(retry_policy))
+
+
+def _chunk_key(key, range_key, index):
+    key = dict(key)
+    key[range_key] = index
+    return key
+
+
+def _get_manifest(connection, table, key, range_key):
+    return connection(_lv.GetItem(table, _chunk_key(key, range_key, 0)).consistent_read_true()).item
+
+
+def _offset(manifest):
+    # Manifests written before values were versioned by offset have their chunks from range key 1
+    return int(manifest.get("offset", 0))
+
+
+def _delete_chunks(connection, table, key, range_key, manifest, concurrency, retry_policy):
+    offset = _offset(manifest)
+    requests = (
+        {"DeleteRequest": {"Key": _convert_dict_to_db(_chunk_key(key, range_key, offset + index))}}
+        for index in range(1, int(manifest["chunks"]) + 1)
+    )
+    _batch_write_item(connection, table, requests, concurrency, retry_policy)
+
+
+def _delete_own_chunks(connection, table, key, range_key, offset, count, version):
+    # A concurrent put may have written its own chunks under the same range keys: leave them alone
+    for index in range(1, count + 1):
+        action = _lv.DeleteItem(table, _chunk_key(key, range_key, offset + index)).expression_attribute_name("version", "version")
+        action.condition_expression("#version=:version").expression_attribute_value("version", version)
+        try:
+            connection(action)
+        except _lv.ConditionalCheckFailedException:
+            pass
+
+
+def _rechunk(pieces, chunk_size):
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if len(buffer) != 0:
+        yield bytes(buffer)
+
+
+def _iterate_chunks(connection, table, key, manifest, range_key, concurrency, buffer_size, retry_policy):
+    offset = _offset(manifest)
+    count = int(manifest["chunks"])
+    digests = manifest["digests"]
+    if len(digests) != count * _DIGEST_SIZE:
+        raise _lv.CorruptedValueError("manifest has {} chunks but {} bytes of digests".format(count, len(digests)))
+    if count == 0:
+        items = iter([])
+    elif concurrency is None:
+        hash_key, hash_value = list(key.items())[0]
+        items = iterate_query(
+            connection,
+            _lv.Query(table).key_eq(hash_key, hash_value).key_between(range_key, offset + 1, offset + count).consistent_read_true(),
+        )
+    else:
+        items = (
+            item for table_, key_, item in iterate_ordered_batch_get_item(
+                connection,
+                ((table, _chunk_key(key, range_key, offset + index)) for index in range(1, count + 1)),
+                concurrency=concurrency,
+                buffer_size=buffer_size,
+                retry_policy=retry_policy,
+            )
+        )
+
+    size = 0
+    index = 0
+    for index, item in enumerate(items, 1):
+        if item is None or item[range_key] != offset + index:
+            raise _lv.CorruptedValueError("chunk {} is missing".format(index))
+        if item.get("version") != manifest["version"]:
+            raise _lv.CorruptedValueError("chunk {} belongs to another version".format(index))
+        data = item["data"]
+        if hashlib.sha256(data).digest() != digests[(index - 1) * _DIGEST_SIZE:index * _DIGEST_SIZE]:
+            raise _lv.CorruptedValueError("chunk {} doesn't match its digest".format(index))
+        size += len(data)
+        yield data
+    if index != count:
+        raise _lv.CorruptedValueError("chunk {} is missing".format(index + 1))
+    if size != manifest["size"]:
+        raise _lv.CorruptedValueError("value has {} bytes instead of {}".format(size, manifest["size"]))
@@ -3,39 +3,52 @@
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
 import copy
+import functools
 
-import LowVoltage as _lv
-import LowVoltage.testing as _tst
+from .background import _iterate_in_background
 
 
-def iterate_scan(connection, scan):
+def iterate_scan(connection, scan, prefetch=0):
     """
     Make as many :class:`.Scan` actions as needed to iterate over all matching items.
     That is until :attr:`.ScanResponse.last_evaluated_key` is ``None``.
 
     >>> for item in iterate_scan(connection, Scan(table)):
-    ...   print item
-    {u'a': 0, u'h': 7}
-    {u'a': 0, u'h': 8}
-    {u'h': 3, u'gr': 4, u'gh': 9}
-    {u'h': 2, u'gr': 6, u'gh': 4}
-    {u'a': 0, u'h': 9}
-    {u'h': 4, u'gr': 2, u'gh': 16}
-    {u'h': 6, u'gr': -2, u'gh': 36}
-    {u'h': 1, u'gr': 8, u'gh': 1}
-    {u'h': 0, u'gr': 10, u'gh': 0}
-    {u'h': 5, u'gr': 0, u'gh': 25}
+    ...   print(item)
+    {'a': 0, 'h': 7}
+    {'a': 0, 'h': 8}
+    {'h': 3, 'gr': 4, 'gh': 9}
+    {'h': 2, 'gr': 6, 'gh': 4}
+    {'a': 0, 'h': 9}
+    {'h': 4, 'gr': 2, 'gh': 16}
+    {'h': 6, 'gr': -2, 'gh': 36}
+    {'h': 1, 'gr': 8, 'gh': 1}
+    {'h': 0, 'gr': 10, 'gh': 0}
+    {'h': 5, 'gr': 0, 'gh': 25}
 
     The :class:`.Scan` instance passed in must be discarded (it is modified during the iteration).
+
+    If ``prefetch`` is not zero, pages are fetched by a background thread while you process the current one,
+    so that network time and processing time overlap.
+    At most ``prefetch`` pages are fetched ahead of the page you are processing.
+    An exception raised while fetching a page is raised when you reach that page.
     """
+    if prefetch:
+        pages = _iterate_in_background([lambda: _iterate_pages(connection, scan)], 1, prefetch)
+    else:
+        pages = _iterate_pages(connection, scan)
+    for items in pages:
+        for item in items:
+            yield item
+
+
+def _iterate_pages(connection, scan):
     r = connection(scan)
-    for item in r.items:
-        yield item
+    yield r.items
     while r.last_evaluated_key is not None:
         scan.exclusive_start_key(r.last_evaluated_key)
         r = connection(scan)
-        for item in r.items:
-            yield item
+        yield r.items
 
 
 def parallelize_scan(scan, total_segments):
@@ -45,24 +58,25 @@ def parallelize_scan(scan, total_segments):
     >>> segments = parallelize_scan(Scan(table), 3)
 
     Note that you would typically iterate other each segment in a different thread.
+    :func:`parallel_scan` does that for you.
 
     >>> for segment in segments:
-    ...   print "Segment"
+    ...   print("Segment")
     ...   for item in iterate_scan(connection, segment):
-    ...     print item
+    ...     print(item)
     Segment
-    {u'a': 0, u'h': 7}
-    {u'a': 0, u'h': 8}
-    {u'h': 3, u'gr': 4, u'gh': 9}
+    {'a': 0, 'h': 7}
+    {'a': 0, 'h': 8}
+    {'h': 3, 'gr': 4, 'gh': 9}
     Segment
-    {u'h': 2, u'gr': 6, u'gh': 4}
-    {u'a': 0, u'h': 9}
-    {u'h': 4, u'gr': 2, u'gh': 16}
-    {u'h': 6, u'gr': -2, u'gh': 36}
+    {'h': 2, 'gr': 6, 'gh': 4}
+    {'a': 0, 'h': 9}
+    {'h': 4, 'gr': 2, 'gh': 16}
+    {'h': 6, 'gr': -2, 'gh': 36}
     Segment
-    {u'h': 1, u'gr': 8, u'gh': 1}
-    {u'h': 0, u'gr': 10, u'gh': 0}
-    {u'h': 5, u'gr': 0, u'gh': 25}
+    {'h': 1, 'gr': 8, 'gh': 1}
+    {'h': 0, 'gr': 10, 'gh': 0}
+    {'h': 5, 'gr': 0, 'gh': 25}
     """
     return [
         copy.deepcopy(scan).segment(i, total_segments)
@@ -70,45 +84,41 @@ def parallelize_scan(scan, total_segments):
     ]
 
 
-class IterateScanUnitTests(_tst.UnitTestsWithMocks):
-    def setUp(self):
-        super(IterateScanUnitTests, self).setUp()
-        self.connection = self.mocks.create("connection")
-
-    def test_iterate_scan(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker(
-                "Scan",
-                {
-                    "TableName": "Table",
-                }
-            )
-        ).andReturn(
-            _lv.QueryResponse(
-                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}, {"h": {"N": "0"}, "r": {"S": "bar"}}],
-                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "bar"}},
-            )
-        )
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker(
-                "Scan",
-                {
-                    "TableName": "Table",
-                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "bar"}},
-                }
-            )
-        ).andReturn(
-            _lv.QueryResponse(
-                Items=[{"h": {"N": "0"}, "r": {"S": "baz"}}],
-            )
-        )
-
-        self.assertEqual(
-            list(iterate_scan(self.connection.object, _lv.Scan("Table"))),
-            [{'h': 0, 'r': 'foo'}, {'h': 0, 'r': 'bar'}, {'h': 0, 'r': 'baz'}]
-        )
-
-    def test_parallelize_scan(self):
-        s1, s2 = parallelize_scan(_lv.Scan("Table"), 2)
-        self.assertEqual(s1.payload, {"TableName": "Table", "Segment": 0, "TotalSegments": 2})
-        self.assertEqual(s2.payload, {"TableName": "Table", "Segment": 1, "TotalSegments": 2})
+def parallel_scan(connection, scan, total_segments, workers=None, prefetch=None):
+    """
+    Iterate over all matching items using ``total_segments`` segments scanned concurrently
+    by ``workers`` threads (by default, one thread per segment).
+    Segments are built by :func:`parallelize_scan`, and each segment is iterated like in :func:`iterate_scan`.
+
+    .. Warning, this is NOT doctest. Because doctests aren't stable because items order changes.
+
+    ::
+
+        >>> for item in parallel_scan(connection, Scan(table), 3):
+        ...   print(item)
+        {'a': 0, 'h': 7}
+        {'h': 2, 'gr': 6, 'gh': 4}
+        {'h': 1, 'gr': 8, 'gh': 1}
+        ...
+
+    Note that items of different segments are interleaved in an unspecified order.
+
+    At most ``prefetch`` pages (by default, as many as ``workers``) are fetched ahead of the page you are processing,
+    so memory stays bounded even if you process items slower than they are fetched.
+    If fetching a page fails, the other segments are stopped and the exception is raised when you reach that page.
+    If you stop iterating (``break``, exception, or closing the generator), the segments are stopped as well.
+
+    The :class:`.Scan` instance passed in is not modified.
+    """
+    if workers is None:
+        workers = total_segments
+    if prefetch is None:
+        prefetch = workers
+    pages = _iterate_in_background(
+        [functools.partial(_iterate_pages, connection, segment) for segment in parallelize_scan(scan, total_segments)],
+        workers,
+        prefetch,
+    )
+    for items in pages:
+        for item in items:
+            yield item
@@ -0,0 +1,150 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Read-modify-write items protected by a version attribute, retrying on conflicts.
+
+>>> r = connection(DeleteItem(table, {"h": 10}))
+>>> locking = OptimisticLocking(connection)
+>>> locking.update(table, {"h": 10}, lambda item: {"a": 1}, attributes=["a"])
+{'a': 1, 'h': 10, 'version': 1}
+>>> locking.update(table, {"h": 10}, lambda item: {"a": item["a"] + 1}, attributes=["a"])
+{'a': 2, 'h': 10, 'version': 2}
+>>> locking.collect()[table]
+LockingStats(updates=2, attempts=2, conflicts=0, failures=0)
+"""
+
+import collections
+import random
+import threading
+import time
+
+import LowVoltage as _lv
+
+
+class LockingStats(collections.namedtuple("LockingStats", "updates attempts conflicts failures")):
+    """
+    The number of calls to :meth:`OptimisticLocking.update` that succeeded (``updates``) or gave up (``failures``),
+    and the number of :class:`.UpdateItem` actions sent (``attempts``) and of those that hit a concurrent write (``conflicts``).
+    """
+    __slots__ = ()
+
+    @property
+    def conflict_rate(self):
+        """
+        The proportion of ``attempts`` that were ``conflicts``. ``0.`` if there were no attempts.
+
+        :type: float
+        """
+        return float(self.conflicts) / self.attempts if self.attempts else 0.
+
+
+class OptimisticLocking(object):
+    """
+    Update items with optimistic locking: each update sets the number attribute ``version`` to its previous value plus one,
+    on the condition that nobody changed it since the item was read.
+
+    On a :exc:`.ConditionalCheckFailedException`, the item is read again, the changes are computed again,
+    and the update is retried after a random delay between 0 and ``first_wait * multiplier ** (attempt - 1)`` seconds,
+    up to ``max_attempts`` attempts.
+
+    The updates, attempts and conflicts are counted per table and returned by :meth:`collect`.
+    """
+
+    def __init__(self, connection, version="version", max_attempts=5, first_wait=0.02, multiplier=2.):
+        self.__connection = connection
+        self.__version = version
+        self.__max_attempts = max_attempts
+        self.__first_wait = first_wait
+        self.__multiplier = multiplier
+        self.__lock = threading.Lock()
+        self.__stats = {}
+
+        # Dependency injection through monkey-patching
+        self.__sleep = time.sleep
+        self.__random = random.random
+
+    def update(self, table, key, function, attributes=None, item=None):
+        """
+        Call ``function`` with the current item (``None`` if it doesn't exist) and apply the changes it returns.
+
+        ``function`` returns a dict associating attribute names to their new values (``None`` to remove the attribute),
+        or ``None`` to leave the item unchanged. It must not change the key or the version attribute,
+        and it may be called several times.
+
+        :param attributes: the names of the attributes ``function`` needs. If not ``None``, the item is read
+            with a :class:`.GetItem` projected on these attributes and the version attribute. Else the whole item is read.
+        :param item: the current item, if you already read it. It's not read before the first attempt then.
+
+        Return the item after the update (all its attributes, from :meth:`.UpdateItem.return_values_all_new`),
+        or the item as read if ``function`` returned ``None``.
+
+        :raise: :exc:`.ConditionalCheckFailedException` if the item was changed concurrently during all ``max_attempts`` attempts.
+        """
+        if item is None:
+            item = self.__read(table, key, attributes)
+        attempt = 0
+        while True:
+            changes = function(item)
+            if changes is None:
+                self.__record(table, updates=1)
+                return item
+            attempt += 1
+            try:
+                r = self.__connection(self.__action(table, key, item, changes))
+            except _lv.ConditionalCheckFailedException:
+                if attempt >= self.__max_attempts:
+                    self.__record(table, attempts=1, conflicts=1, failures=1)
+                    raise
+                self.__record(table, attempts=1, conflicts=1)
+                self.__sleep(self.__random() * self.__first_wait * self.__multiplier ** (attempt - 1))
+                item = self.__read(table, key, attributes)
+            else:
+                self.__record(table, updates=1, attempts=1)
+                return r.attributes
+
+    def collect(self):
+        """
+        Return the statistics recorded since the previous call, as a dict of table names to :class:`LockingStats`.
+        """
+        with self.__lock:
+            stats, self.__stats = self.__stats, {}
+        return stats
+
+    def __read(self, table, key, attributes):
+        action = _lv.GetItem(table, key).consistent_read_true()
+        if attributes is not None:
+            names = [self.__version] + [name for name in attributes if name != self.__version]
+            for index, name in enumerate(names):
+                action.expression_attribute_name("p{}".format(index), name)
+            action.project(*["#p{}".format(index) for index in range(len(names))])
+        return self.__connection(action).item
+
+    def __action(self, table, key, item, changes):
+        action = _lv.UpdateItem(table, key).return_values_all_new()
+        action.expression_attribute_name("version", self.__version)
+        current = None if item is None else item.get(self.__version)
+        if current is None:
+            action.condition_expression("attribute_not_exists(#version)")
+            action.set("#version", ":version").expression_attribute_value("version", 1)
+        else:
+            action.condition_expression("#version=:current").expression_attribute_value("current", current)
+            action.set("#version", ":version").expression_attribute_value("version", current + 1)
+        for index, (name, value) in enumerate(sorted(changes.items())):
+            action.expression_attribute_name("a{}".format(index), name)
+            if value is None:
+                action.remove("#a{}".format(index))
+            else:
+                action.set("#a{}".format(index), ":a{}".format(index)).expression_attribute_value("a{}".format(index), value)
+        return action
+
+    def __record(self, table, updates=0, attempts=0, conflicts=0, failures=0):
+        with self.__lock:
+            stats = self.__stats.get(table, LockingStats(0, 0, 0, 0))
+            self.__stats[table] = LockingStats(
+                stats.updates + updates,
+                stats.attempts + attempts,
+                stats.conflicts + conflicts,
+                stats.failures + failures,
+            )
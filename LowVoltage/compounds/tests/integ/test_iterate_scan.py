@@ -29,3 +29,15 @@ class ScanIteratorLocalIntegTests(_tst.LocalIntegTestsWithTableH):
         for segment in _lv.parallelize_scan(_lv.Scan("Aaa"), 3):
             keys.extend(item["h"] for item in _lv.iterate_scan(self.connection, segment))
         self.assertEqual(sorted(keys), self.keys)
+
+    def test_scan_with_prefetch(self):
+        self.assertEqual(
+            sorted(item["h"] for item in _lv.iterate_scan(self.connection, _lv.Scan("Aaa"), prefetch=2)),
+            self.keys
+        )
+
+    def test_parallel_scan_in_threads(self):
+        self.assertEqual(
+            sorted(item["h"] for item in _lv.parallel_scan(self.connection, _lv.Scan("Aaa"), 3)),
+            self.keys
+        )
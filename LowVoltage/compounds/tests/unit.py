@@ -1,12 +0,0 @@
-# coding: utf8
-
-# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
-
-from ..batch_delete_item import BatchDeleteItemUnitTests
-from ..batch_put_item import BatchPutItemUnitTests
-from ..iterate_batch_get_item import IterateBatchGetItemUnitTests
-from ..iterate_list_tables import IterateListTablesUnitTests
-from ..iterate_query import IterateQueryUnitTests
-from ..iterate_scan import IterateScanUnitTests
-from ..wait_for_table_activation import WaitForTableActivationUnitTests
-from ..wait_for_table_deletion import WaitForTableDeletionUnitTests
@@ -0,0 +1,18 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .test_background import IterateInBackgroundUnitTests
+from .test_batch_get_item import BatchGetItemUnitTests, IterateOrderedBatchGetItemUnitTests, IterateOrderedBatchGetItemConcurrencyUnitTests, BatchGetItemThrottlingUnitTests
+from .test_batch_delete_item import BatchDeleteItemUnitTests, BatchDeleteItemConcurrencyUnitTests
+from .test_batch_writer import BatchWriterUnitTests
+from .test_batch_put_item import BatchPutItemUnitTests, BatchPutItemConcurrencyUnitTests, BatchPutItemThrottlingUnitTests
+from .test_chunked_value import ChunkedValueUnitTests
+from .test_iterate_batch_get_item import IterateBatchGetItemUnitTests, IterateBatchGetItemThrottlingUnitTests
+from .test_iterate_list_tables import IterateListTablesUnitTests
+from .test_iterate_query import IterateQueryUnitTests
+from .test_iterate_scan import IterateScanUnitTests
+from .test_optimistic_locking import OptimisticLockingUnitTests
+from .test_wait_for_table_activation import WaitForTableActivationUnitTests
+from .test_wait_for_table_deletion import WaitForTableDeletionUnitTests
+from .test_write_sharding import WriteShardingUnitTests
@@ -0,0 +1,80 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.background import _iterate_in_background
+
+
+class IterateInBackgroundUnitTests(_tst.UnitTests):
+    def test_no_producers(self):
+        self.assertEqual(list(_iterate_in_background([], 3, 2)), [])
+
+    def test_one_producer(self):
+        self.assertEqual(list(_iterate_in_background([lambda: range(10)], 1, 2)), list(range(10)))
+
+    def test_several_producers(self):
+        self.assertEqual(
+            sorted(_iterate_in_background([lambda: range(0, 10), lambda: range(10, 20), lambda: range(20, 30)], 2, 3)),
+            list(range(30))
+        )
+
+    def test_max_ahead(self):
+        produced = []
+        consumed = []
+
+        def produce():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        for i in _iterate_in_background([produce], 1, 2):
+            consumed.append(i)
+            self.assertLessEqual(len(produced) - len(consumed), 2)
+
+        self.assertEqual(consumed, list(range(10)))
+
+    def test_produces_while_consuming(self):
+        produced = threading.Event()
+
+        def produce():
+            yield 0
+            produced.set()
+            yield 1
+
+        iterator = _iterate_in_background([produce], 1, 1)
+        self.assertEqual(next(iterator), 0)
+        self.assertTrue(produced.wait(1))
+        self.assertEqual(list(iterator), [1])
+
+    def test_exception_after_produced_elements(self):
+        def produce():
+            yield 0
+            yield 1
+            raise ValueError("expected")
+
+        consumed = []
+        with self.assertRaises(ValueError):
+            for i in _iterate_in_background([produce], 1, 5):
+                consumed.append(i)
+        self.assertEqual(consumed, [0, 1])
+
+    def test_close_stops_producer(self):
+        produced = []
+        finished = threading.Event()
+
+        def produce():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    yield i
+            finally:
+                finished.set()
+
+        iterator = _iterate_in_background([produce], 1, 2)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        self.assertTrue(finished.wait(1))
+        self.assertLess(len(produced), 5)
@@ -0,0 +1,201 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.batch_get_item import batch_get_item, iterate_ordered_batch_get_item
+from LowVoltage.stand_in import Database
+
+
+class BatchGetItemUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(BatchGetItemUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test_no_keys(self):
+        self.assertEqual(batch_get_item(self.connection.object, {"Aaa": []}), {"Aaa": {}})
+
+    def test_several_tables(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {
+                "Aaa": {"Keys": [{"h": {"S": "a"}}, {"h": {"S": "b"}}]},
+                "Bbb": {"Keys": [{"h": {"S": "a"}, "r": {"N": "1"}}]},
+            }})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={
+                "Aaa": [{"h": {"S": "b"}, "x": {"N": "2"}}],
+                "Bbb": [{"h": {"S": "a"}, "r": {"N": "1"}, "x": {"N": "3"}}],
+            })
+        )
+
+        self.assertEqual(
+            batch_get_item(self.connection.object, {"Aaa": [{"h": "a"}, {"h": "b"}], "Bbb": [{"r": 1, "h": "a"}]}),
+            {"Aaa": {("b",): {"h": "b", "x": 2}}, "Bbb": {("a", 1): {"h": "a", "r": 1, "x": 3}}}
+        )
+
+    def test_duplicate_keys_are_requested_once(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "a"}}]})
+        )
+
+        self.assertEqual(
+            batch_get_item(self.connection.object, {"Aaa": [{"h": "a"}, {"h": "a"}]}),
+            {"Aaa": {("a",): {"h": "a"}}}
+        )
+
+    def test_unexpected_keyword(self):
+        with self.assertRaises(TypeError):
+            batch_get_item(self.connection.object, {}, buffer_size=2)
+
+
+class IterateOrderedBatchGetItemUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(IterateOrderedBatchGetItemUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test_no_requests(self):
+        self.assertEqual(list(iterate_ordered_batch_get_item(self.connection.object, [])), [])
+
+    def test_input_order_and_missing_items(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {
+                "Aaa": {"Keys": [{"h": {"S": "b"}}, {"h": {"S": "a"}}]},
+                "Bbb": {"Keys": [{"h": {"S": "c"}}]},
+            }})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Bbb": [{"h": {"S": "c"}}], "Aaa": [{"h": {"S": "b"}}]})
+        )
+
+        self.assertEqual(
+            list(iterate_ordered_batch_get_item(self.connection.object, [("Aaa", {"h": "b"}), ("Bbb", {"h": "c"}), ("Aaa", {"h": "a"}), ("Aaa", {"h": "b"})])),
+            [("Aaa", {"h": "b"}, {"h": "b"}), ("Bbb", {"h": "c"}, {"h": "c"}), ("Aaa", {"h": "a"}, None), ("Aaa", {"h": "b"}, {"h": "b"})]
+        )
+
+    def test_unprocessed_keys_are_reordered(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(100)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(
+                Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1, 100)]},
+                UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": "0"}}]}}
+            )
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(100, 110)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(100, 110)]})
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": "0"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": "0"}}]})
+        )
+
+        self.assertEqual(
+            [key["h"] for table, key, item in iterate_ordered_batch_get_item(self.connection.object, (("Aaa", {"h": i}) for i in range(110)))],
+            list(range(110))
+        )
+
+    def test_buffer_size(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(3)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1, 3)]}, UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": "0"}}]}})
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": "0"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": "0"}}]})
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(3, 6)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(3, 6)]})
+        )
+
+        self.assertEqual(
+            [key["h"] for table, key, item in iterate_ordered_batch_get_item(self.connection.object, (("Aaa", {"h": i}) for i in range(6)), buffer_size=3)],
+            list(range(6))
+        )
+
+    def test_failure_reports_pending_requests(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(3)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": "0"}}, {"h": {"N": "2"}}]}, UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": "1"}}]}})
+        )
+        retry_policy = self.mocks.create("retry_policy")
+        retry_policy.expect.retry.withArguments(lambda args, kwds: len(args[1]) == 1).andReturn(None)
+
+        items = []
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            for table, key, item in iterate_ordered_batch_get_item(self.connection.object, (("Aaa", {"h": i}) for i in range(3)), buffer_size=3, retry_policy=retry_policy.object):
+                items.append(item)
+        self.assertEqual(items, [{"h": 0}])
+        self.assertEqual(catcher.exception.remaining, [("Aaa", {"h": 1}), ("Aaa", {"h": 2})])
+
+    def test_buffer_is_bounded(self):
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        results = iterate_ordered_batch_get_item(database, (("Aaa", {"h": i}) for i in range(2000)), buffer_size=100)
+        for i in range(1000):
+            next(results)
+        self.assertLessEqual(len(results.gi_frame.f_locals["waiting"]), 100)
+        self.assertEqual(len(list(results)), 1000)
+
+
+class IterateOrderedBatchGetItemConcurrencyUnitTests(_tst.UnitTests):
+    class Connection(object):
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def __call__(self, action):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            responses = {}
+            unprocessed = {}
+            for table, request in action.payload["RequestItems"].items():
+                keys = request["Keys"]
+                # The first key of each action is left unprocessed, to be sent again alone
+                if len(keys) > 1 and len(unprocessed) == 0:
+                    unprocessed[table] = {"Keys": keys[:1]}
+                    keys = keys[1:]
+                # Odd keys don't exist
+                responses[table] = [dict(key, t={"S": table}) for key in keys if int(key["h"]["N"]) % 2 == 0]
+            with self.lock:
+                self.in_flight -= 1
+            return _lv.BatchGetItemResponse(Responses=responses, UnprocessedKeys=unprocessed)
+
+    def test(self):
+        connection = self.Connection()
+        requests = [("Aaa" if i % 3 == 0 else "Bbb", {"h": i}) for i in range(1000)]
+        self.assertEqual(
+            list(iterate_ordered_batch_get_item(connection, requests, concurrency=4, buffer_size=300, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 100))),
+            [(table, key, {"h": key["h"], "t": table} if key["h"] % 2 == 0 else None) for table, key in requests]
+        )
+        self.assertGreater(connection.max_in_flight, 1)
+        self.assertLessEqual(connection.max_in_flight, 4)
+
+
+class BatchGetItemThrottlingUnitTests(_tst.UnitTests):
+    def test_partial_progress_is_not_given_up(self):
+        # Each action processes 20 keys out of 100: the retry policy would give up after 4 consecutive throttles
+        database = Database(batch_limit=20)
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        database(_lv.PutItem("Aaa", {"h": 0}))
+        items = batch_get_item(database, {"Aaa": ({"h": i} for i in range(300))}, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 4))
+        self.assertEqual(items, {"Aaa": {(0,): {"h": 0}}})
@@ -0,0 +1,207 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.batch_put_item import batch_put_item
+from LowVoltage.stand_in import Database
+
+
+class BatchPutItemUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(BatchPutItemUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test_no_keys(self):
+        batch_put_item(self.connection.object, "Aaa", [])
+
+    def test_one_page(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"S": "a"}}}}, {"PutRequest": {"Item": {"h": {"S": "b"}}}}]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+
+        batch_put_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})
+
+    def test_several_pages(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(25, 50)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(50, 60)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+
+        batch_put_item(self.connection.object, "Aaa", ({"h": i} for i in range(60)))
+
+    def test_one_unprocessed_item(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"S": "a"}}}}, {"PutRequest": {"Item": {"h": {"S": "b"}}}}]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"S": "c"}}}}]})
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"S": "c"}}}}]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+
+        batch_put_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})
+
+    def test_several_pages_of_unprocessed_item(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(100, 110)]})
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(25, 35)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(110, 120)]})
+        )
+        self.sleep.expect(1.5)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(100, 120)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(120, 130)]})
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(120, 130)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse()
+        )
+
+        batch_put_item(self.connection.object, "Aaa", [{"h": i} for i in range(35)])
+
+    def test_failure_reports_remaining_items(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(100, 103)]})
+        )
+        exception = _lv.ValidationException()
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(25, 50)]}})
+        ).andRaise(
+            exception
+        )
+
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            batch_put_item(self.connection.object, "Aaa", [{"h": i} for i in range(60)])
+        self.assertEqual(catcher.exception.errors, [exception])
+        self.assertEqual(
+            catcher.exception.remaining,
+            [{"h": i} for i in range(25, 50)] + [{"h": i} for i in range(100, 103)] + [{"h": i} for i in range(50, 60)]
+        )
+
+    def test_give_up_after_unprocessed_items(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(0, 25)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(20, 25)]})
+        )
+        retry_policy = self.mocks.create("retry_policy")
+        retry_policy.expect.retry.withArguments(
+            lambda args, kwds: len(args[1]) == 1 and isinstance(args[1][0], _lv.ProvisionedThroughputExceededException)
+        ).andReturn(0.5)
+        self.sleep.expect(0.5)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchWriteItem", {"RequestItems": {"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(25, 30)]}})
+        ).andReturn(
+            _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": str(i)}}}} for i in range(25, 30)]})
+        )
+        retry_policy.expect.retry.withArguments(
+            lambda args, kwds: len(args[1]) == 2
+        ).andReturn(None)
+
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            batch_put_item(self.connection.object, "Aaa", [{"h": i} for i in range(30)], retry_policy=retry_policy.object)
+        self.assertEqual(len(catcher.exception.errors), 2)
+        self.assertEqual(catcher.exception.remaining, [{"h": i} for i in range(20, 30)])
+
+    def test_items_are_consumed_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(60):
+                consumed.append(i)
+                yield {"h": i}
+
+        def check_consumed(count):
+            def check(args, kwds):
+                self.assertLessEqual(len(consumed), count)
+                return True
+            return check
+
+        self.connection.expect._call_.withArguments(check_consumed(50)).andReturn(_lv.BatchWriteItemResponse())
+        self.connection.expect._call_.withArguments(check_consumed(60)).andReturn(_lv.BatchWriteItemResponse())
+        self.connection.expect._call_.withArguments(check_consumed(60)).andReturn(_lv.BatchWriteItemResponse())
+
+        batch_put_item(self.connection.object, "Aaa", items())
+
+    def test_unexpected_keyword(self):
+        with self.assertRaises(TypeError):
+            batch_put_item(self.connection.object, "Aaa", [], concurency=2)
+
+
+class BatchPutItemConcurrencyUnitTests(_tst.UnitTests):
+    class Connection(object):
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.written = []
+
+        def __call__(self, action):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            requests = action.payload["RequestItems"]["Aaa"]
+            # The first request of each action is left unprocessed, to be sent again alone
+            unprocessed = requests[:1] if len(requests) > 1 else []
+            with self.lock:
+                self.in_flight -= 1
+                self.written.extend(int(r["PutRequest"]["Item"]["h"]["N"]) for r in requests[len(unprocessed):])
+            return _lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": unprocessed})
+
+    def test(self):
+        connection = self.Connection()
+        batch_put_item(connection, "Aaa", ({"h": i} for i in range(200)), concurrency=4, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 100))
+        self.assertEqual(sorted(connection.written), list(range(200)))
+        self.assertGreater(connection.max_in_flight, 1)
+        self.assertLessEqual(connection.max_in_flight, 4)
+
+
+class BatchPutItemThrottlingUnitTests(_tst.UnitTests):
+    def test_partial_progress_is_not_given_up(self):
+        # Each action processes 20 items out of 25: the retry policy would give up after 4 consecutive throttles
+        database = Database(batch_limit=20)
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        batch_put_item(database, "Aaa", ({"h": i} for i in range(200)), retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 4))
+        self.assertEqual(len(database(_lv.Scan("Aaa")).items), 200)
+
+    def test_no_progress_is_given_up(self):
+        database = Database(batch_limit=0)
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            batch_put_item(database, "Aaa", ({"h": i} for i in range(30)), retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 4))
+        self.assertEqual(len(catcher.exception.errors), 5)
@@ -0,0 +1,184 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import json
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.conversion import _convert_dict_to_db
+from LowVoltage.compounds.batch_writer import BatchWriter
+from LowVoltage.stand_in import Database
+
+
+class BatchWriterUnitTests(_tst.UnitTests):
+    class Connection(object):
+        def __init__(self, unprocessed=0, error=None, rewrite=lambda request: request):
+            self.lock = threading.Lock()
+            self.actions = []
+            self.unprocessed = unprocessed
+            self.rewrite = rewrite
+            self.error = error
+            self.proceed = threading.Event()
+            self.proceed.set()
+
+        def __call__(self, action):
+            if action.name == "DescribeTable":
+                return _lv.DescribeTableResponse(Table={"KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}]})
+            self.proceed.wait()
+            with self.lock:
+                self.actions.append(action.payload["RequestItems"])
+                if self.error is not None:
+                    raise self.error
+                unprocessed = {}
+                if self.unprocessed != 0:
+                    self.unprocessed -= 1
+                    table = sorted(action.payload["RequestItems"])[0]
+                    unprocessed[table] = [self.rewrite(request) for request in action.payload["RequestItems"][table][:1]]
+            return _lv.BatchWriteItemResponse(UnprocessedItems=unprocessed)
+
+        @property
+        def requests(self):
+            with self.lock:
+                return sorted(
+                    (table, json.dumps(request, sort_keys=True))
+                    for action in self.actions
+                    for table, requests in action.items()
+                    for request in requests
+                )
+
+    def wait_for(self, predicate):
+        deadline = time.time() + 5
+        while not predicate() and time.time() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(predicate())
+
+    def put_request(self, table, item):
+        return (table, json.dumps({"PutRequest": {"Item": _convert_dict_to_db(item)}}, sort_keys=True))
+
+    def delete_request(self, table, key):
+        return (table, json.dumps({"DeleteRequest": {"Key": _convert_dict_to_db(key)}}, sort_keys=True))
+
+    def test_several_tables(self):
+        connection = self.Connection()
+        with BatchWriter(connection, key_names={"Aaa": ["h"], "Bbb": ["h", "r"]}, max_delay=10) as writer:
+            writer.put("Aaa", ({"h": i} for i in range(30)))
+            writer.delete("Bbb", {"h": 0, "r": 0}, {"h": 0, "r": 1})
+        self.assertEqual(len(connection.actions), 2)
+        self.assertEqual(len(connection.actions[0]["Aaa"]), 25)
+        self.assertEqual(
+            connection.requests,
+            sorted([self.put_request("Aaa", {"h": i}) for i in range(30)] + [self.delete_request("Bbb", {"h": 0, "r": r}) for r in range(2)])
+        )
+
+    def test_collapse_writes_to_same_key(self):
+        connection = self.Connection()
+        with BatchWriter(connection, max_delay=10) as writer:
+            writer.put("Aaa", {"h": 1, "a": 1}, {"h": 1, "a": 2}, {"h": 2, "a": 1})
+            writer.delete("Aaa", {"h": 2})
+            writer.put("Aaa", {"h": 3, "a": 1})
+            writer.delete("Aaa", {"h": 3})
+            writer.put("Aaa", {"h": 3, "a": 2})
+        self.assertEqual(len(connection.actions), 1)
+        self.assertEqual(
+            connection.requests,
+            sorted([self.put_request("Aaa", {"h": 1, "a": 2}), self.delete_request("Aaa", {"h": 2}), self.put_request("Aaa", {"h": 3, "a": 2})])
+        )
+
+    def test_flush(self):
+        connection = self.Connection()
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10)
+        writer.put("Aaa", {"h": 0})
+        writer.flush()
+        self.assertEqual(connection.requests, [self.put_request("Aaa", {"h": 0})])
+        writer.put("Aaa", {"h": 1})
+        writer.close()
+        self.assertEqual(len(connection.actions), 2)
+        with self.assertRaises(ValueError):
+            writer.put("Aaa", {"h": 2})
+
+    def test_max_delay(self):
+        connection = self.Connection()
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=0.01)
+        writer.put("Aaa", {"h": 0})
+        self.wait_for(lambda: len(connection.actions) == 1)
+        writer.close()
+
+    def test_max_bytes(self):
+        connection = self.Connection()
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10, max_bytes=1)
+        writer.put("Aaa", {"h": 0}, {"h": 1}, {"h": 2})
+        self.wait_for(lambda: len(connection.requests) == 3)
+        writer.close()
+
+    def test_max_buffered(self):
+        connection = self.Connection()
+        connection.proceed.clear()
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10, max_buffered=25)
+        writer.put("Aaa", ({"h": i} for i in range(50)))
+        producer = threading.Thread(target=writer.put, args=("Aaa", {"h": 50}))
+        producer.start()
+        producer.join(0.05)
+        self.assertTrue(producer.is_alive())
+        connection.proceed.set()
+        producer.join()
+        writer.close()
+        self.assertEqual(connection.requests, sorted(self.put_request("Aaa", {"h": i}) for i in range(51)))
+
+    def test_unprocessed_items(self):
+        connection = self.Connection(unprocessed=3)
+        with BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 3)) as writer:
+            writer.put("Aaa", ({"h": i} for i in range(30)))
+        self.assertEqual(connection.unprocessed, 0)
+        self.assertEqual(sorted(set(connection.requests)), sorted(self.put_request("Aaa", {"h": i}) for i in range(30)))
+
+    def test_unprocessed_items_in_other_representation(self):
+        def rewrite(request):
+            item = request["PutRequest"]["Item"]
+            return {"PutRequest": {"Item": {"h": {"N": "0" + item["h"]["N"]}, "s": {"SS": list(reversed(item["s"]["SS"]))}}}}
+
+        connection = self.Connection(unprocessed=1, rewrite=rewrite)
+        with BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 3)) as writer:
+            writer.put("Aaa", {"h": 0, "s": {"a", "b", "c"}}, {"h": 1, "s": {"d"}})
+        self.assertEqual(len(connection.actions), 2)
+        self.assertEqual(connection.actions[1], {"Aaa": connection.actions[0]["Aaa"][:1]})
+
+    def test_give_up_after_unprocessed_items(self):
+        connection = self.Connection(unprocessed=3)
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 2))
+        writer.put("Aaa", {"h": 0}, {"h": 1})
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            writer.close()
+        self.assertEqual(len(catcher.exception.errors), 3)
+        self.assertEqual(catcher.exception.remaining, [("Aaa", {"PutRequest": {"Item": {"h": 0}}})])
+
+    def test_partial_progress_is_not_given_up(self):
+        # Each action processes 20 items out of 25: the retry policy would give up after 4 consecutive throttles
+        database = Database(batch_limit=20)
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with BatchWriter(database, max_delay=10, retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 4)) as writer:
+            writer.put("Aaa", ({"h": i} for i in range(200)))
+        self.assertEqual(len(database(_lv.Scan("Aaa")).items), 200)
+
+    def test_error_in_with_block(self):
+        connection = self.Connection(error=_lv.ValidationException())
+        with self.assertRaises(ZeroDivisionError):
+            with BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10) as writer:
+                writer.put("Aaa", {"h": 0})
+                1 / 0
+        self.assertEqual(len(connection.actions), 1)
+
+    def test_error(self):
+        exception = _lv.ValidationException()
+        connection = self.Connection(error=exception)
+        writer = BatchWriter(connection, key_names={"Aaa": ["h"]}, max_delay=10)
+        writer.put("Aaa", {"h": 0})
+        writer.delete("Aaa", {"h": 1})
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            writer.flush()
+        self.assertEqual(catcher.exception.errors, [exception])
+        self.assertEqual(catcher.exception.remaining, [("Aaa", {"PutRequest": {"Item": {"h": 0}}}), ("Aaa", {"DeleteRequest": {"Key": {"h": 1}}})])
+        with self.assertRaises(_lv.IncompleteBatchError):
+            writer.put("Aaa", {"h": 2})
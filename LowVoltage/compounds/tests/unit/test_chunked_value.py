@@ -0,0 +1,149 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.chunked_value import put_chunked_value, iterate_chunked_value, get_chunked_value, delete_chunked_value
+from LowVoltage.stand_in import Database
+
+
+class ChunkedValueUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(ChunkedValueUnitTests, self).setUp()
+        self.database = Database()
+        self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.STRING).range_key("chunk", _lv.NUMBER).provisioned_throughput(1, 1))
+        self.value = bytes(bytearray(i % 251 for i in range(1000)))
+
+    def chunks(self):
+        return [item["chunk"] for item in self.database(_lv.Query("Aaa").key_eq("h", "x")).items]
+
+    def test_missing_value(self):
+        self.assertIsNone(iterate_chunked_value(self.database, "Aaa", {"h": "x"}))
+        self.assertIsNone(get_chunked_value(self.database, "Aaa", {"h": "x"}))
+
+    def test_put_and_get(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.assertEqual(self.chunks(), [0, 1, 2, 3, 4])
+        self.assertEqual([len(chunk) for chunk in iterate_chunked_value(self.database, "Aaa", {"h": "x"})], [300, 300, 300, 100])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), self.value)
+
+    def test_get_with_batch_get_item(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=30)
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}, concurrency=3, buffer_size=4), self.value)
+
+    def test_put_pieces(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, (self.value[i:i + 7] for i in range(0, 1000, 7)), chunk_size=300)
+        self.assertEqual(self.chunks(), [0, 1, 2, 3, 4])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), self.value)
+
+    def test_empty_value(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, b"")
+        self.assertEqual(self.chunks(), [0])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), b"")
+
+    def test_overwrite_with_fewer_chunks(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=100)
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, b"abc", chunk_size=100)
+        self.assertEqual(self.chunks(), [0, 11])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), b"abc")
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}, concurrency=1), b"abc")
+
+    def test_failed_put_keeps_previous_value(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+
+        def pieces():
+            for i in range(60):
+                yield b"y" * 10
+            raise Exception("Failure")
+
+        with self.assertRaises(Exception) as catcher:
+            put_chunked_value(self.database, "Aaa", {"h": "x"}, pieces(), chunk_size=10)
+        self.assertEqual(catcher.exception.args, ("Failure",))
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), self.value)
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, b"abc", chunk_size=100)
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), b"abc")
+
+    def concurrently(self, action):
+        # A connection that runs `action` just before the first manifest is written
+        def connection(request):
+            if isinstance(request, _lv.PutItem) and request.payload["Item"]["chunk"] == {"N": "0"} and actions:
+                actions.pop()()
+            return self.database(request)
+        actions = [action]
+        return connection
+
+    def test_concurrent_puts(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        connection = self.concurrently(lambda: put_chunked_value(self.database, "Aaa", {"h": "x"}, b"abcdef", chunk_size=3))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            put_chunked_value(connection, "Aaa", {"h": "x"}, b"x" * 9, chunk_size=3)
+        self.assertEqual(self.chunks(), [0, 5, 6])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), b"abcdef")
+
+    def test_concurrent_first_puts(self):
+        connection = self.concurrently(lambda: put_chunked_value(self.database, "Aaa", {"h": "x"}, b"abc", chunk_size=3))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            put_chunked_value(connection, "Aaa", {"h": "x"}, b"x" * 9, chunk_size=3)
+        self.assertEqual(self.chunks(), [0, 1])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), b"abc")
+
+    def test_concurrent_delete(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        connection = self.concurrently(lambda: delete_chunked_value(self.database, "Aaa", {"h": "x"}))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            put_chunked_value(connection, "Aaa", {"h": "x"}, b"abc")
+        self.assertEqual(self.chunks(), [])
+        self.assertIsNone(get_chunked_value(self.database, "Aaa", {"h": "x"}))
+
+    def test_manifest_without_offset(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.database(_lv.UpdateItem("Aaa", {"h": "x", "chunk": 0}).remove("offset"))
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "x"}), self.value)
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, b"abc")
+        self.assertEqual(self.chunks(), [0, 5])
+
+    def test_delete(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        put_chunked_value(self.database, "Aaa", {"h": "y"}, b"abc")
+        delete_chunked_value(self.database, "Aaa", {"h": "x"})
+        delete_chunked_value(self.database, "Aaa", {"h": "z"})
+        self.assertEqual(self.chunks(), [])
+        self.assertEqual(get_chunked_value(self.database, "Aaa", {"h": "y"}), b"abc")
+
+    def test_other_range_key(self):
+        self.database(_lv.CreateTable("Bbb").hash_key("h", _lv.NUMBER).range_key("r", _lv.NUMBER).provisioned_throughput(1, 1))
+        put_chunked_value(self.database, "Bbb", {"h": 1}, self.value, range_key="r", chunk_size=300)
+        self.assertEqual(get_chunked_value(self.database, "Bbb", {"h": 1}, range_key="r"), self.value)
+
+    def test_unexpected_option(self):
+        with self.assertRaises(TypeError):
+            put_chunked_value(self.database, "Aaa", {"h": "x"}, b"", chunk=1)
+
+    def test_stale_chunk(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.database(_lv.UpdateItem("Aaa", {"h": "x", "chunk": 2}).set("version", ":v").expression_attribute_value("v", "old"))
+        chunks = iterate_chunked_value(self.database, "Aaa", {"h": "x"})
+        self.assertEqual(len(next(chunks)), 300)
+        with self.assertRaises(_lv.CorruptedValueError):
+            next(chunks)
+
+    def test_modified_chunk(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.database(_lv.UpdateItem("Aaa", {"h": "x", "chunk": 4}).set("data", ":d").expression_attribute_value("d", b"a" * 100))
+        with self.assertRaises(_lv.CorruptedValueError):
+            get_chunked_value(self.database, "Aaa", {"h": "x"}, concurrency=2)
+
+    def test_missing_chunk(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.database(_lv.DeleteItem("Aaa", {"h": "x", "chunk": 2}))
+        with self.assertRaises(_lv.CorruptedValueError):
+            get_chunked_value(self.database, "Aaa", {"h": "x"})
+        with self.assertRaises(_lv.CorruptedValueError):
+            get_chunked_value(self.database, "Aaa", {"h": "x"}, concurrency=1)
+
+    def test_missing_last_chunk(self):
+        put_chunked_value(self.database, "Aaa", {"h": "x"}, self.value, chunk_size=300)
+        self.database(_lv.DeleteItem("Aaa", {"h": "x", "chunk": 4}))
+        with self.assertRaises(_lv.CorruptedValueError):
+            get_chunked_value(self.database, "Aaa", {"h": "x"})
@@ -0,0 +1,143 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in import Database
+
+
+class IterateBatchGetItemUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(IterateBatchGetItemUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test_no_keys(self):
+        self.assertEqual(
+            list(_lv.iterate_batch_get_item(self.connection.object, "Aaa", [])),
+            []
+        )
+
+    def test_one_page(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}, {"h": {"S": "b"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "c"}}, {"h": {"S": "d"}}]})
+        )
+
+        self.assertEqual(
+            list(_lv.iterate_batch_get_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})),
+            [{"h": "c"}, {"h": "d"}]
+        )
+
+    def test_one_unprocessed_key(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}, {"h": {"S": "b"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "c"}}]}, UnprocessedKeys={"Aaa": {"Keys": [{"h": {"S": "d"}}]}})
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "d"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "e"}}]})
+        )
+
+        self.assertEqual(
+            list(_lv.iterate_batch_get_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"})),
+            [{"h": "c"}, {"h": "e"}]
+        )
+
+    def test_several_pages(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(0, 100)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1000, 1100)]})
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(100, 200)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1100, 1200)]})
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(200, 250)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1200, 1250)]})
+        )
+
+        self.assertEqual(
+            list(_lv.iterate_batch_get_item(self.connection.object, "Aaa", ({"h": i} for i in range(0, 250)))),
+            [{"h": i} for i in range(1000, 1250)]
+        )
+
+    def test_several_pages_of_unprocessed_keys(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(0, 100)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(
+                Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1000, 1100)]},
+                UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(2000, 2075)]}}
+            )
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(100, 150)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(
+                Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1100, 1150)]},
+                UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(2075, 2150)]}}
+            )
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(2000, 2100)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(
+                Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1150, 1200)]},
+                UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(2150, 2175)]}}
+            )
+        )
+        self.sleep.expect(1)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(2100, 2175)]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(
+                Responses={"Aaa": [{"h": {"N": str(i)}} for i in range(1200, 1250)]},
+            )
+        )
+
+        self.assertEqual(
+            list(_lv.iterate_batch_get_item(self.connection.object, "Aaa", [{"h": i} for i in range(0, 150)])),
+            [{"h": i} for i in range(1000, 1250)]
+        )
+
+    def test_give_up_after_unprocessed_keys(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}, {"h": {"S": "b"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "a"}}]}, UnprocessedKeys={"Aaa": {"Keys": [{"h": {"S": "b"}}]}})
+        )
+        retry_policy = self.mocks.create("retry_policy")
+        retry_policy.expect.retry.withArguments(
+            lambda args, kwds: len(args[1]) == 1 and isinstance(args[1][0], _lv.ProvisionedThroughputExceededException)
+        ).andReturn(None)
+
+        items = []
+        with self.assertRaises(_lv.IncompleteBatchError) as catcher:
+            for item in _lv.iterate_batch_get_item(self.connection.object, "Aaa", {"h": "a"}, {"h": "b"}, retry_policy=retry_policy.object):
+                items.append(item)
+        self.assertEqual(items, [{"h": "a"}])
+        self.assertEqual(catcher.exception.remaining, [{"h": "b"}])
+
+
+class IterateBatchGetItemThrottlingUnitTests(_tst.UnitTests):
+    def test_partial_progress_is_not_given_up(self):
+        # Each action processes 20 keys out of 100: the retry policy would give up after 4 consecutive throttles
+        database = Database(batch_limit=20)
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        _lv.batch_put_item(database, "Aaa", ({"h": i} for i in range(300)))
+        items = _lv.iterate_batch_get_item(database, "Aaa", ({"h": i} for i in range(300)), retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 4))
+        self.assertEqual(sorted(item["h"] for item in items), list(range(300)))
@@ -0,0 +1,96 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.iterate_query import iterate_query
+
+
+class IterateQueryUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(IterateQueryUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+
+    def test(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Query",
+                {
+                    "TableName": "Table",
+                    "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}}
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}, {"h": {"N": "0"}, "r": {"S": "bar"}}],
+                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "bar"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Query",
+                {
+                    "TableName": "Table",
+                    "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}},
+                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "bar"}},
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "baz"}}],
+            )
+        )
+
+        self.assertEqual(
+            list(iterate_query(self.connection.object, _lv.Query("Table").key_eq("h", 0))),
+            [{'h': 0, 'r': 'foo'}, {'h': 0, 'r': 'bar'}, {'h': 0, 'r': 'baz'}]
+        )
+
+    def test_with_prefetch(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Query",
+                {
+                    "TableName": "Table",
+                    "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}}
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}, {"h": {"N": "0"}, "r": {"S": "bar"}}],
+                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "bar"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Query",
+                {
+                    "TableName": "Table",
+                    "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}},
+                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "bar"}},
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "baz"}}],
+            )
+        )
+
+        calls = []
+        second_page_fetched = threading.Event()
+
+        def connection(action):
+            r = self.connection.object(action)
+            calls.append(action)
+            if len(calls) == 2:
+                second_page_fetched.set()
+            return r
+
+        items = iterate_query(connection, _lv.Query("Table").key_eq("h", 0), prefetch=1)
+        self.assertEqual(next(items), {'h': 0, 'r': 'foo'})
+        # The second page is fetched while the first one is processed
+        self.assertTrue(second_page_fetched.wait(1))
+        self.assertEqual(list(items), [{'h': 0, 'r': 'bar'}, {'h': 0, 'r': 'baz'}])
@@ -0,0 +1,194 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.iterate_scan import iterate_scan, parallelize_scan, parallel_scan
+
+
+class IterateScanUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(IterateScanUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+
+    def test_iterate_scan(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}, {"h": {"N": "0"}, "r": {"S": "bar"}}],
+                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "bar"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "bar"}},
+                }
+            )
+        ).andReturn(
+            _lv.QueryResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "baz"}}],
+            )
+        )
+
+        self.assertEqual(
+            list(iterate_scan(self.connection.object, _lv.Scan("Table"))),
+            [{'h': 0, 'r': 'foo'}, {'h': 0, 'r': 'bar'}, {'h': 0, 'r': 'baz'}]
+        )
+
+    def test_parallelize_scan(self):
+        s1, s2 = parallelize_scan(_lv.Scan("Table"), 2)
+        self.assertEqual(s1.payload, {"TableName": "Table", "Segment": 0, "TotalSegments": 2})
+        self.assertEqual(s2.payload, {"TableName": "Table", "Segment": 1, "TotalSegments": 2})
+
+    def test_iterate_scan_with_prefetch(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                }
+            )
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}, {"h": {"N": "0"}, "r": {"S": "bar"}}],
+                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "bar"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "bar"}},
+                }
+            )
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "baz"}}],
+            )
+        )
+
+        self.assertEqual(
+            list(iterate_scan(self.connection.object, _lv.Scan("Table"), prefetch=2)),
+            [{'h': 0, 'r': 'foo'}, {'h': 0, 'r': 'bar'}, {'h': 0, 'r': 'baz'}]
+        )
+
+    def test_iterate_scan_with_prefetch_raises_after_previous_pages(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                }
+            )
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "0"}, "r": {"S": "foo"}}],
+                LastEvaluatedKey={"h": {"N": "0"}, "r": {"S": "foo"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker(
+                "Scan",
+                {
+                    "TableName": "Table",
+                    "ExclusiveStartKey": {"h": {"N": "0"}, "r": {"S": "foo"}},
+                }
+            )
+        ).andRaise(
+            _lv.ProvisionedThroughputExceededException()
+        )
+
+        items = []
+        with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+            for item in iterate_scan(self.connection.object, _lv.Scan("Table"), prefetch=2):
+                items.append(item)
+        self.assertEqual(items, [{'h': 0, 'r': 'foo'}])
+
+    def test_parallel_scan(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Table", "Segment": 0, "TotalSegments": 2})
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "0"}}],
+                LastEvaluatedKey={"h": {"N": "0"}},
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Table", "Segment": 0, "TotalSegments": 2, "ExclusiveStartKey": {"h": {"N": "0"}}})
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "1"}}],
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Table", "Segment": 1, "TotalSegments": 2})
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "2"}}],
+            )
+        )
+
+        scan = _lv.Scan("Table")
+        self.assertEqual(
+            list(parallel_scan(self.connection.object, scan, 2, workers=1)),
+            [{"h": 0}, {"h": 1}, {"h": 2}]
+        )
+        self.assertEqual(scan.payload, {"TableName": "Table"})
+
+    def test_parallel_scan_fetches_in_all_workers(self):
+        started = threading.Semaphore(0)
+        release = threading.Event()
+        second_page_requested = threading.Event()
+
+        def connection(action):
+            segment = action.payload["Segment"]
+            if "ExclusiveStartKey" in action.payload:
+                second_page_requested.set()
+                return _lv.ScanResponse(Items=[{"h": {"N": str(segment + 10)}}])
+            elif segment == 0:
+                started.acquire(timeout=1)
+                started.acquire(timeout=1)
+            else:
+                started.release()
+                release.wait(1)
+            return _lv.ScanResponse(Items=[{"h": {"N": str(segment)}}], LastEvaluatedKey={"h": {"N": str(segment)}})
+
+        items = parallel_scan(connection, _lv.Scan("Table"), 3)
+        self.assertEqual(next(items), {"h": 0})
+        # While this page is processed and two segments are fetching, the third one fetches its next page
+        self.assertTrue(second_page_requested.wait(1))
+        release.set()
+        self.assertEqual(sorted(item["h"] for item in items), [1, 2, 10, 11, 12])
+
+    def test_parallel_scan_raises_after_previous_pages(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Table", "Segment": 0, "TotalSegments": 2})
+        ).andReturn(
+            _lv.ScanResponse(
+                Items=[{"h": {"N": "0"}}],
+            )
+        )
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Table", "Segment": 1, "TotalSegments": 2})
+        ).andRaise(
+            _lv.ProvisionedThroughputExceededException()
+        )
+
+        items = []
+        with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+            for item in parallel_scan(self.connection.object, _lv.Scan("Table"), 2, workers=1):
+                items.append(item)
+        self.assertEqual(items, [{"h": 0}])
@@ -0,0 +1,76 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.optimistic_locking import OptimisticLocking, LockingStats
+from LowVoltage.stand_in import Database
+
+
+class OptimisticLockingUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(OptimisticLockingUnitTests, self).setUp()
+        self.database = Database()
+        self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.STRING).provisioned_throughput(1, 1))
+        self.locking = OptimisticLocking(self.database, max_attempts=3)
+        self.sleeps = []
+        self.locking._OptimisticLocking__sleep = self.sleeps.append
+        self.locking._OptimisticLocking__random = lambda: 0.5
+
+    def increment(self, item):
+        return {"a": (item or {}).get("a", 0) + 1}
+
+    def test_create(self):
+        self.assertEqual(self.locking.update("Aaa", {"h": "x"}, self.increment), {"h": "x", "a": 1, "version": 1})
+        self.assertEqual(self.locking.collect(), {"Aaa": LockingStats(1, 1, 0, 0)})
+        self.assertEqual(self.locking.collect(), {})
+
+    def test_update(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41, "b": "b", "version": 7}))
+        self.assertEqual(self.locking.update("Aaa", {"h": "x"}, self.increment), {"h": "x", "a": 42, "b": "b", "version": 8})
+
+    def test_remove_attribute(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41, "b": "b", "version": 7}))
+        self.assertEqual(self.locking.update("Aaa", {"h": "x"}, lambda item: {"b": None}), {"h": "x", "a": 41, "version": 8})
+
+    def test_item_without_version(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41}))
+        self.assertEqual(self.locking.update("Aaa", {"h": "x"}, self.increment), {"h": "x", "a": 42, "version": 1})
+
+    def test_projection(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41, "b": "b", "version": 7}))
+        seen = []
+        self.locking.update("Aaa", {"h": "x"}, lambda item: seen.append(item), attributes=["a"])
+        self.assertEqual(seen, [{"a": 41, "version": 7}])
+        self.assertEqual(self.locking.collect(), {"Aaa": LockingStats(1, 0, 0, 0)})
+
+    def test_no_change(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41}))
+        self.assertEqual(self.locking.update("Aaa", {"h": "x"}, lambda item: None), {"h": "x", "a": 41})
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": "x"})).item, {"h": "x", "a": 41})
+
+    def test_stale_item(self):
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 41, "version": 7}))
+        item = self.locking.update("Aaa", {"h": "x"}, self.increment, attributes=["a"], item={"a": 10, "version": 6})
+        self.assertEqual(item, {"h": "x", "a": 42, "version": 8})
+        self.assertEqual(self.sleeps, [0.01])
+        self.assertEqual(self.locking.collect(), {"Aaa": LockingStats(1, 2, 1, 0)})
+        self.assertEqual(LockingStats(1, 2, 1, 0).conflict_rate, 0.5)
+
+    def test_concurrent_writes(self):
+        def conflicting(item):
+            self.database(_lv.UpdateItem("Aaa", {"h": "x"}).add("version", "one").expression_attribute_value("one", 1))
+            return self.increment(item)
+
+        self.database(_lv.PutItem("Aaa", {"h": "x", "a": 0, "version": 1}))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            self.locking.update("Aaa", {"h": "x"}, conflicting)
+        self.assertEqual(self.sleeps, [0.01, 0.02])
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": "x"})).item, {"h": "x", "a": 0, "version": 4})
+        stats = self.locking.collect()["Aaa"]
+        self.assertEqual(stats, LockingStats(0, 3, 3, 1))
+        self.assertEqual(stats.conflict_rate, 1.)
+
+    def test_no_attempts(self):
+        self.assertEqual(LockingStats(0, 0, 0, 0).conflict_rate, 0.)
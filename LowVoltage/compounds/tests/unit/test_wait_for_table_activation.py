@@ -0,0 +1,64 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.wait_for_table_activation import wait_for_table_activation
+
+
+class WaitForTableActivationUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(WaitForTableActivationUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test_table_not_yet_created_on_first_describe(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andRaise(
+            _lv.ResourceNotFoundException
+        )
+        self.sleep.expect(3)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE"})
+        )
+        self.sleep.expect(3)
+
+        wait_for_table_activation(self.connection.object, "Table")
+
+    def test_table_creating(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "CREATING"})
+        )
+        self.sleep.expect(3)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE"})
+        )
+        self.sleep.expect(3)
+
+        wait_for_table_activation(self.connection.object, "Table")
+
+    def test_gsi_creating(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE", "GlobalSecondaryIndexes": [{"IndexStatus": "CREATING"}]})
+        )
+        self.sleep.expect(3)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE", "GlobalSecondaryIndexes": [{"IndexStatus": "ACTIVE"}]})
+        )
+        self.sleep.expect(3)
+
+        wait_for_table_activation(self.connection.object, "Table")
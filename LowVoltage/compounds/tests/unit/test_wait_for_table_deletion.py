@@ -0,0 +1,31 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.wait_for_table_deletion import wait_for_table_deletion
+
+
+class WaitForTableDeletionUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(WaitForTableDeletionUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.sleep = self.mocks.replace("time.sleep")
+
+    def test(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={"TableStatus": "DELETING"})
+        )
+        self.sleep.expect(3)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Table"})
+        ).andRaise(
+            _lv.ResourceNotFoundException
+        )
+
+        wait_for_table_deletion(self.connection.object, "Table")
@@ -0,0 +1,83 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.compounds.write_sharding import WriteSharding
+from LowVoltage.stand_in import Database
+
+
+class WriteShardingUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(WriteShardingUnitTests, self).setUp()
+        self.database = Database()
+        self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.STRING).range_key("r", _lv.NUMBER).provisioned_throughput(1, 1))
+
+    def test_random_shards(self):
+        sharding = WriteSharding("h", 4)
+        shards = iter([2, 0])
+        sharding._WriteSharding__randrange = lambda n: next(shards)
+        self.assertEqual(sharding.key({"h": "x", "r": 0, "a": 1}), {"h": "x.2", "r": 0, "a": 1})
+        self.assertEqual(sharding.put_item("Aaa", {"h": "x", "r": 0}).payload, {"TableName": "Aaa", "Item": {"h": {"S": "x.0"}, "r": {"N": "0"}}})
+
+    def test_deterministic_shards(self):
+        sharding = WriteSharding("h", 4, separator="#", shard_by=lambda key: key["r"])
+        shards = set(sharding.shard({"h": "x", "r": r}) for r in range(20))
+        self.assertEqual(shards, set(range(4)))
+        self.assertEqual(sharding.key({"h": "x", "r": 7})["h"], sharding.key({"h": "x", "r": 7, "a": 0})["h"])
+        self.assertEqual(sharding.delete_item("Aaa", {"h": "x", "r": 7}).payload["Key"], _lv.PutItem("Aaa", sharding.key({"h": "x", "r": 7})).payload["Item"])
+
+    def test_delete_item_requires_shard_by(self):
+        with self.assertRaises(TypeError):
+            WriteSharding("h", 4).delete_item("Aaa", {"h": "x", "r": 0})
+
+    def test_values(self):
+        sharding = WriteSharding("h", 3)
+        self.assertEqual(sharding.values("x.y"), ["x.y.0", "x.y.1", "x.y.2"])
+        self.assertEqual(sharding.unshard("x.y.2"), "x.y")
+
+    def test_queries(self):
+        query = _lv.Query("Aaa").key_eq("h", "x").key_gt("r", 3)
+        self.assertEqual(
+            [q.payload["KeyConditions"]["h"] for q in WriteSharding("h", 2).queries(query)],
+            [{"ComparisonOperator": "EQ", "AttributeValueList": [{"S": "x.0"}]}, {"ComparisonOperator": "EQ", "AttributeValueList": [{"S": "x.1"}]}],
+        )
+        self.assertEqual(query.payload["KeyConditions"]["h"]["AttributeValueList"], [{"S": "x"}])
+
+    def fill(self, sharding):
+        for r in range(20):
+            self.database(sharding.put_item("Aaa", {"h": "x", "r": r}))
+        self.database(_lv.PutItem("Aaa", {"h": "y.0", "r": 0}))
+
+    def test_iterate_query(self):
+        sharding = WriteSharding("h", 3, range_key="r")
+        self.fill(sharding)
+        items = list(sharding.iterate_query(self.database, _lv.Query("Aaa").key_eq("h", "x").key_ge("r", 5).limit(2)))
+        self.assertEqual([item["r"] for item in items], list(range(5, 20)))
+        self.assertEqual(set(sharding.unshard(item["h"]) for item in items), {"x"})
+        self.assertGreater(len(set(item["h"] for item in items)), 1)
+
+    def test_iterate_query_backward(self):
+        sharding = WriteSharding("h", 3, range_key="r")
+        self.fill(sharding)
+        items = sharding.iterate_query(self.database, _lv.Query("Aaa").key_eq("h", "x").scan_index_forward_false().limit(3), prefetch=2)
+        self.assertEqual([item["r"] for item in items], list(reversed(range(20))))
+
+    def test_iterate_query_without_range_key(self):
+        sharding = WriteSharding("h", 3)
+        self.fill(sharding)
+        items = sharding.iterate_query(self.database, _lv.Query("Aaa").key_eq("h", "x").limit(3))
+        self.assertEqual(sorted(item["r"] for item in items), list(range(20)))
+
+    def test_iterate_query_stops_early(self):
+        sharding = WriteSharding("h", 3, range_key="r")
+        self.fill(sharding)
+        items = sharding.iterate_query(self.database, _lv.Query("Aaa").key_eq("h", "x").limit(1))
+        self.assertEqual(next(items)["r"], 0)
+        items.close()
+
+    def test_iterate_query_error(self):
+        sharding = WriteSharding("h", 3, range_key="r")
+        with self.assertRaises(_lv.ResourceNotFoundException):
+            list(sharding.iterate_query(self.database, _lv.Query("Bbb").key_eq("h", "x")))
@@ -5,7 +5,6 @@
 import time
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 
 
 def wait_for_table_activation(connection, table):
@@ -22,10 +21,10 @@ def wait_for_table_activation(connection, table):
     ...     .hash_key("h", STRING)
     ...     .provisioned_throughput(1, 1)
     ... ).table_description.table_status
-    u'CREATING'
+    'CREATING'
     >>> wait_for_table_activation(connection, table)
     >>> connection(DescribeTable(table)).table.table_status
-    u'ACTIVE'
+    'ACTIVE'
 
     .. testcleanup::
 
@@ -60,58 +59,3 @@ def _table_is_fully_active(table):
             if gsi.index_status != "ACTIVE":
                 return False
     return table.table_status == "ACTIVE"
-
-
-class WaitForTableActivationUnitTests(_tst.UnitTestsWithMocks):
-    def setUp(self):
-        super(WaitForTableActivationUnitTests, self).setUp()
-        self.connection = self.mocks.create("connection")
-        self.sleep = self.mocks.replace("time.sleep")
-
-    def test_table_not_yet_created_on_first_describe(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andRaise(
-            _lv.ResourceNotFoundException
-        )
-        self.sleep.expect(3)
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andReturn(
-            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE"})
-        )
-        self.sleep.expect(3)
-
-        wait_for_table_activation(self.connection.object, "Table")
-
-    def test_table_creating(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andReturn(
-            _lv.DescribeTableResponse(Table={"TableStatus": "CREATING"})
-        )
-        self.sleep.expect(3)
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andReturn(
-            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE"})
-        )
-        self.sleep.expect(3)
-
-        wait_for_table_activation(self.connection.object, "Table")
-
-    def test_gsi_creating(self):
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andReturn(
-            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE", "GlobalSecondaryIndexes": [{"IndexStatus": "CREATING"}]})
-        )
-        self.sleep.expect(3)
-        self.connection.expect._call_.withArguments(
-            self.ActionChecker("DescribeTable", {"TableName": "Table"})
-        ).andReturn(
-            _lv.DescribeTableResponse(Table={"TableStatus": "ACTIVE", "GlobalSecondaryIndexes": [{"IndexStatus": "ACTIVE"}]})
-        )
-        self.sleep.expect(3)
-
-        wait_for_table_activation(self.connection.object, "Table")
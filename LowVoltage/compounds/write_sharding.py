@@ -0,0 +1,174 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Spread the writes to a hot hash key over several hash keys, to avoid throttling its partition,
+and read them back with a single merged :class:`.Query`.
+See `Using write sharding <http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/GuidelinesForTables.html#GuidelinesForTables.UniformWorkload>`__.
+
+.. Warning, this is NOT doctest. Because doctests aren't stable because shards are random.
+
+::
+
+    >>> sharding = WriteSharding("day", shards=4, range_key="time")
+    >>> for t in range(4):
+    ...   connection(sharding.put_item(table, {"day": "2015-06-01", "time": t}))
+    >>> for item in sharding.iterate_query(connection, Query(table).key_eq("day", "2015-06-01")):
+    ...   print(item)
+    {'day': '2015-06-01.2', 'time': 0}
+    {'day': '2015-06-01.0', 'time': 1}
+    {'day': '2015-06-01.2', 'time': 2}
+    {'day': '2015-06-01.3', 'time': 3}
+"""
+
+import copy
+import functools
+import heapq
+import json
+import random
+import zlib
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_db_to_value
+from .background import _iterate_in_background
+from .iterate_query import _iterate_pages
+
+
+class WriteSharding(object):
+    """
+    Append a shard suffix (``separator`` and a number from ``0`` to ``shards - 1``) to the values of the string hash key ``hash_key``.
+
+    By default, each write picks a random shard.
+    If ``shard_by`` is set, it's called with the item (or key) being written
+    and the shard is computed from a CRC32 of the value it returns, so that the same item always goes to the same shard
+    and can be read, updated or deleted with :meth:`key`.
+    ``shard_by`` must only use attributes of the key if you use :meth:`update_item` or :meth:`delete_item`.
+
+    :param range_key: the name of the range key, used by :meth:`iterate_query` to merge the shards.
+        If ``None``, the shards are not merged and items of different shards are interleaved in an unspecified order.
+    """
+
+    def __init__(self, hash_key, shards, separator=".", shard_by=None, range_key=None):
+        self.__hash_key = hash_key
+        self.__shards = shards
+        self.__separator = separator
+        self.__shard_by = shard_by
+        self.__range_key = range_key
+
+        # Dependency injection through monkey-patching
+        self.__randrange = random.randrange
+
+    def shard(self, item):
+        """
+        Return the shard number of ``item``: a random one, or the one computed with ``shard_by``.
+        """
+        if self.__shard_by is None:
+            return self.__randrange(self.__shards)
+        else:
+            value = json.dumps(self.__shard_by(item), sort_keys=True, default=str)
+            return zlib.crc32(value.encode("utf8")) % self.__shards
+
+    def value(self, value, shard):
+        """
+        Return the hash key value of ``value`` in ``shard``.
+        """
+        return "{}{}{}".format(value, self.__separator, shard)
+
+    def values(self, value):
+        """
+        Return the hash key values of ``value`` in all shards.
+        """
+        return [self.value(value, shard) for shard in range(self.__shards)]
+
+    def unshard(self, value):
+        """
+        Return the hash key value that was sharded into ``value``.
+        """
+        return value.rsplit(self.__separator, 1)[0]
+
+    def key(self, key):
+        """
+        Return a copy of ``key`` (or of an item) with its hash key sharded.
+        """
+        key = dict(key)
+        key[self.__hash_key] = self.value(key[self.__hash_key], self.shard(key))
+        return key
+
+    def put_item(self, table, item):
+        """
+        Return a :class:`.PutItem` action writing ``item`` to a shard.
+        Use :meth:`key` to shard items for :func:`.batch_put_item` or :class:`.BatchWriter`.
+        """
+        return _lv.PutItem(table, self.key(item))
+
+    def update_item(self, table, key):
+        """
+        Return an :class:`.UpdateItem` action for ``key`` in a shard.
+        With random shards, successive updates of the same key go to different items:
+        this is fine for counters, whose total is the sum of the shards.
+        """
+        return _lv.UpdateItem(table, self.key(key))
+
+    def delete_item(self, table, key):
+        """
+        Return a :class:`.DeleteItem` action for ``key`` in its shard. Requires ``shard_by``.
+        """
+        if self.__shard_by is None:
+            raise TypeError("delete_item requires shard_by")
+        return _lv.DeleteItem(table, self.key(key))
+
+    def queries(self, query):
+        """
+        Create one :class:`.Query` per shard from ``query``, which must have a :meth:`~.Query.key_eq` condition on the hash key
+        with the value before sharding.
+
+        The :class:`.Query` instance passed in is not modified.
+        """
+        condition = query.payload["KeyConditions"][self.__hash_key]
+        value = _convert_db_to_value(condition["AttributeValueList"][0])
+        return [
+            copy.deepcopy(query).key_eq(self.__hash_key, sharded)
+            for sharded in self.values(value)
+        ]
+
+    def iterate_query(self, connection, query, prefetch=1):
+        """
+        Query all shards in parallel, one thread per shard, and iterate over their items merged by range key
+        (in descending order if ``query`` uses :meth:`~.Query.scan_index_forward_false`).
+        Items are yielded as they are stored, with their sharded hash key.
+
+        At most ``prefetch`` pages are fetched ahead for each shard.
+        A :meth:`~.Query.limit` applies to each page of each shard.
+        If fetching a page fails, the exception is raised when the merge reaches that page.
+
+        The :class:`.Query` instance passed in is not modified.
+        """
+        queries = self.queries(query)
+        if self.__range_key is None:
+            pages = _iterate_in_background(
+                [functools.partial(_iterate_pages, connection, shard) for shard in queries],
+                len(queries),
+                prefetch * len(queries),
+            )
+            for item in _flatten(pages):
+                yield item
+        else:
+            shards = [
+                _iterate_in_background([functools.partial(_iterate_pages, connection, shard)], 1, prefetch)
+                for shard in queries
+            ]
+            range_key = self.__range_key
+            reverse = query.payload.get("ScanIndexForward", True) is False
+            try:
+                for item in heapq.merge(*[_flatten(pages) for pages in shards], key=lambda item: item[range_key], reverse=reverse):
+                    yield item
+            finally:
+                for pages in shards:
+                    pages.close()
+
+
+def _flatten(pages):
+    for items in pages:
+        for item in items:
+            yield item
@@ -2,6 +2,15 @@
 
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
-from .connection import Connection
-from .retry_policies import ExponentialBackoffRetryPolicy
-from .credentials import StaticCredentials, EnvironmentCredentials, Ec2RoleCredentials
+from LowVoltage.lazy import lazy_exports as _lazy_exports
+
+__getattr__, __dir__, __all__ = _lazy_exports(__name__, {
+    ".connection": ["Connection"],
+    ".batching": ["BatchingConnection"],
+    ".caching": ["CachingConnection"],
+    ".scheduling": ["SchedulingConnection"],
+    ".retry_policies": ["ExponentialBackoffRetryPolicy"],
+    ".credentials": ["StaticCredentials", "EnvironmentCredentials", "Ec2RoleCredentials"],
+    ".hot_keys": ["HotKeyTracker", "HotKey"],
+    ".autoscaling": ["CapacityMonitor", "Autoscaler", "ScalingDecision"],
+})
@@ -0,0 +1,292 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Adjust the provisioned throughput of tables and GSIs to the capacity a :class:`.Connection` consumes.
+
+A :class:`CapacityMonitor` passed to a :class:`.Connection` as ``capacity_monitor`` accumulates the consumed capacity and the throttles.
+An :class:`Autoscaler` periodically turns them into :class:`.UpdateTable` actions.
+
+.. Warning, this is NOT doctest. Because doctests would take minutes waiting for UpdateTable.
+
+::
+
+    >>> monitor = CapacityMonitor()
+    >>> connection = Connection("us-west-2", EnvironmentCredentials(), capacity_monitor=monitor)
+    >>> autoscaler = Autoscaler(connection, monitor, [table], max_units=100)
+    >>> for i in range(100):
+    ...   r = connection(GetItem(table, {"h": i % 10}))
+    >>> autoscaler.step(elapsed=1)
+    [ScalingDecision(table='...', index=None, kind='read', current=1, target=72, reason='high utilization', applied=True)]
+
+See :func:`.simulate_autoscaling` to try the policy offline.
+"""
+
+import collections
+import math
+import threading
+import time
+
+import LowVoltage as _lv
+from LowVoltage.compounds.wait_for_table_activation import _table_is_fully_active
+
+
+_READS = ("GetItem", "BatchGetItem", "Query", "Scan")
+_WRITES = ("PutItem", "UpdateItem", "DeleteItem", "BatchWriteItem")
+
+
+Usage = collections.namedtuple("Usage", "units throttles")
+"""
+The capacity ``units`` consumed and the number of ``throttles`` recorded by a :class:`CapacityMonitor`.
+"""
+
+
+ScalingDecision = collections.namedtuple("ScalingDecision", "table index kind current target reason applied")
+"""
+A change of the provisioned throughput of a table (``index`` is ``None``) or GSI, decided by :meth:`Autoscaler.step`.
+``kind`` is ``"read"`` or ``"write"``, ``current`` and ``target`` are capacity units,
+and ``applied`` is ``False`` in dry-run mode or if DynamoDB refused the change.
+"""
+
+
+class CapacityMonitor(object):
+    """
+    Accumulate the capacity consumed and the throttles seen by a :class:`.Connection`, per table, index and kind (``"read"`` or ``"write"``).
+
+    The :class:`.Connection` asks DynamoDB for the consumed capacity of every read and write action through :meth:`payload`,
+    so actions sent by compounds or by code that doesn't call ``return_consumed_capacity_indexes`` are accounted for too.
+    Without ``IndexName``, the capacity of a :class:`.Query` or :class:`.Scan` is attributed to the table.
+
+    Each :exc:`.ProvisionedThroughputExceededException` counts as a throttle of the tables of the action,
+    and so does each table with unprocessed keys or items in a batch response.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__usage = {}
+
+    def record(self, table, kind, units=0., throttles=0, index=None):
+        """
+        Record ``units`` consumed and ``throttles`` on a table or index.
+        """
+        with self.__lock:
+            units_, throttles_ = self.__usage.get((table, index, kind), (0., 0))
+            self.__usage[(table, index, kind)] = Usage(units_ + units, throttles_ + throttles)
+
+    def collect(self):
+        """
+        Return the usage recorded since the previous call, as a dict of ``(table, index, kind)`` to :class:`Usage`.
+        """
+        with self.__lock:
+            usage, self.__usage = self.__usage, {}
+        return usage
+
+    def payload(self, action):
+        """
+        Return the payload to send for ``action``: its own, with ``ReturnConsumedCapacity`` set to ``"INDEXES"``
+        if it's a read or write action that doesn't ask for its consumed capacity.
+        """
+        payload = action.payload
+        if _kind(action.name) is not None and payload.get("ReturnConsumedCapacity", "NONE") == "NONE":
+            payload = dict(payload, ReturnConsumedCapacity="INDEXES")
+        return payload
+
+    def throttled(self, action):
+        """
+        Record that ``action`` was throttled.
+        """
+        kind = _kind(action.name)
+        if kind is not None:
+            payload = action.payload
+            for table in _tables(payload):
+                self.record(table, kind, throttles=1, index=payload.get("IndexName"))
+
+    def responded(self, action, response):
+        """
+        Record the capacity consumed by ``action``, and its unprocessed keys or items.
+        """
+        kind = _kind(action.name)
+        if kind is None:
+            return
+        for table in (getattr(response, "unprocessed_keys", None) or getattr(response, "unprocessed_items", None) or {}):
+            self.record(table, kind, throttles=1)
+        consumed = getattr(response, "consumed_capacity", None)
+        if consumed is None:
+            return
+        for capacity in consumed if isinstance(consumed, list) else [consumed]:
+            if capacity.table is not None or capacity.global_secondary_indexes is not None:
+                if capacity.table is not None:
+                    self.record(capacity.table_name, kind, capacity.table.capacity_units or 0.)
+                for index, index_capacity in (capacity.global_secondary_indexes or {}).items():
+                    self.record(capacity.table_name, kind, index_capacity.capacity_units or 0., index=index)
+            elif capacity.capacity_units is not None:
+                self.record(capacity.table_name, kind, capacity.capacity_units, index=action.payload.get("IndexName"))
+
+
+class Autoscaler(object):
+    """
+    Adjust the provisioned throughput of ``tables`` and their GSIs to the usage collected from ``monitor``.
+
+    At each :meth:`step`, for each table, GSI and kind, the utilization is the consumed capacity per second divided by the provisioned capacity.
+    The target capacity keeps the utilization at ``target_utilization``, within ``min_units`` and ``max_units``, but to avoid oscillations:
+
+    - the capacity is increased only if the utilization is above ``upper_utilization``, or if there were throttles;
+      after throttles, it's increased by at least ``throttled_factor`` because throttled requests didn't consume capacity;
+    - it's decreased only if the utilization stayed below ``lower_utilization`` during ``scale_down_periods`` consecutive steps,
+      and if the table or GSI was decreased less than ``decreases_per_day`` times today (DynamoDB's limit is four).
+
+    The changes of a table and its GSIs are sent in a single :class:`.UpdateTable`,
+    then :meth:`step` waits for the table to be active again, polling every ``poll_interval`` seconds.
+    If ``dry_run`` is ``True``, decisions are only returned.
+    """
+
+    def __init__(
+        self, connection, monitor, tables,
+        min_units=1, max_units=1000,
+        target_utilization=0.7, upper_utilization=0.9, lower_utilization=0.3,
+        scale_down_periods=3, throttled_factor=2., decreases_per_day=4,
+        dry_run=False, poll_interval=3,
+    ):
+        self.__connection = connection
+        self.__monitor = monitor
+        self.__tables = list(tables)
+        self.__min_units = min_units
+        self.__max_units = max_units
+        self.__target_utilization = target_utilization
+        self.__upper_utilization = upper_utilization
+        self.__lower_utilization = lower_utilization
+        self.__scale_down_periods = scale_down_periods
+        self.__throttled_factor = throttled_factor
+        self.__decreases_per_day = decreases_per_day
+        self.__dry_run = dry_run
+        self.__poll_interval = poll_interval
+        self.__low_periods = collections.Counter()
+
+        # Dependency injection through monkey-patching
+        self.__now = time.time
+        self.__sleep = time.sleep
+
+        self.__last_step = self.__now()
+
+    def step(self, elapsed=None):
+        """
+        Collect the usage from the monitor, decide the new provisioned throughputs, apply them (unless in dry-run mode),
+        and return the list of :class:`ScalingDecision`.
+
+        :param elapsed: the duration in seconds covered by the usage. If ``None``, the time since the previous step.
+        """
+        now = self.__now()
+        if elapsed is None:
+            elapsed = now - self.__last_step
+        self.__last_step = now
+        usage = self.__monitor.collect()
+
+        decisions = []
+        for table in self.__tables:
+            description = self.__connection(_lv.DescribeTable(table)).table
+            gsis = collections.OrderedDict(
+                (gsi.index_name, gsi.provisioned_throughput)
+                for gsi in description.global_secondary_indexes or []
+            )
+            table_decisions = self.__decide(table, None, description.provisioned_throughput, usage, elapsed, set(gsis))
+            for index, throughput in gsis.items():
+                table_decisions += self.__decide(table, index, throughput, usage, elapsed, set())
+            if table_decisions:
+                decisions += self.__apply(table, description, gsis, table_decisions)
+        return decisions
+
+    def run(self, interval, stop):
+        """
+        Call :meth:`step` every ``interval`` seconds until the :class:`threading.Event` ``stop`` is set.
+        """
+        while not stop.wait(interval):
+            self.step()
+
+    def __decide(self, table, index, throughput, usage, elapsed, other_indexes):
+        targets = {}
+        for kind in ("read", "write"):
+            units, throttles = 0., 0
+            for (t, i, k), u in usage.items():
+                # Capacity of LSIs (or of unknown indexes) is attributed to the table
+                if t == table and k == kind and (i == index or (index is None and i is not None and i not in other_indexes)):
+                    units += u.units
+                    throttles += u.throttles
+            current = throughput.read_capacity_units if kind == "read" else throughput.write_capacity_units
+            targets[kind] = (current,) + self.__target(table, index, kind, current, units / elapsed, throttles)
+
+        decreasing = any(target < current for current, target, reason in targets.values())
+        if decreasing and (throughput.number_of_decreases_today or 0) >= self.__decreases_per_day:
+            # Keep the increases, cancel the decreases
+            targets = {kind: (current, max(current, target), reason) for kind, (current, target, reason) in targets.items()}
+        return [
+            ScalingDecision(table, index, kind, current, target, reason, False)
+            for kind, (current, target, reason) in sorted(targets.items())
+            if target != current
+        ]
+
+    def __target(self, table, index, kind, current, rate, throttles):
+        utilization = rate / current
+        wanted = int(math.ceil(rate / self.__target_utilization))
+        if throttles:
+            self.__low_periods[(table, index, kind)] = 0
+            return self.__clamp(max(wanted, int(math.ceil(current * self.__throttled_factor)))), "throttled"
+        elif utilization > self.__upper_utilization:
+            self.__low_periods[(table, index, kind)] = 0
+            return self.__clamp(max(wanted, current)), "high utilization"
+        elif utilization < self.__lower_utilization:
+            self.__low_periods[(table, index, kind)] += 1
+            if self.__low_periods[(table, index, kind)] >= self.__scale_down_periods:
+                return self.__clamp(min(wanted, current)), "low utilization"
+        else:
+            self.__low_periods[(table, index, kind)] = 0
+        return self.__clamp(current), "out of bounds"
+
+    def __clamp(self, units):
+        return min(self.__max_units, max(self.__min_units, units))
+
+    def __apply(self, table, description, gsis, decisions):
+        if self.__dry_run:
+            return decisions
+
+        targets = {(d.index, d.kind): d.target for d in decisions}
+
+        def throughput(index, current):
+            return (
+                targets.get((index, "read"), current.read_capacity_units),
+                targets.get((index, "write"), current.write_capacity_units),
+            )
+
+        update = _lv.UpdateTable(table)
+        if any(d.index is None for d in decisions):
+            update.provisioned_throughput(*throughput(None, description.provisioned_throughput))
+        for index, current in gsis.items():
+            if any(d.index == index for d in decisions):
+                update.update_global_secondary_index(index).provisioned_throughput(*throughput(index, current))
+        try:
+            self.__connection(update)
+        except _lv.LimitExceededException:
+            return decisions
+        while not _table_is_fully_active(self.__connection(_lv.DescribeTable(table)).table):
+            self.__sleep(self.__poll_interval)
+        for d in decisions:
+            # Bring decreased resources out of their low utilization streak
+            if d.target < d.current:
+                self.__low_periods[(d.table, d.index, d.kind)] = 0
+        return [d._replace(applied=True) for d in decisions]
+
+
+def _kind(name):
+    if name in _READS:
+        return "read"
+    elif name in _WRITES:
+        return "write"
+
+
+def _tables(payload):
+    if "RequestItems" in payload:
+        return list(payload["RequestItems"].keys())
+    elif "TableName" in payload:
+        return [payload["TableName"]]
+    else:
+        return []
@@ -0,0 +1,234 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A :class:`BatchingConnection` coalesces :class:`.GetItem` actions sent concurrently by several threads into :class:`.BatchGetItem` actions.
+
+>>> batching_connection = BatchingConnection(connection)
+>>> batching_connection(GetItem(table, {"h": 0})).item
+{'h': 0, 'gr': 10, 'gh': 0}
+"""
+
+import re
+import threading
+import time
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_value_to_db
+from . import retry_policies
+
+
+class BatchingConnection(object):
+    """
+    Wrap a :class:`.Connection` and send the :class:`.GetItem` actions it receives
+    in :class:`.BatchGetItem` actions. Other actions are sent as-is.
+
+    The first :class:`.GetItem` waits at most ``window`` seconds for other :class:`.GetItem` actions to arrive from other threads.
+    Then all of them (at most ``max_keys``) are sent together, and each caller receives its own :class:`.GetItemResponse`.
+    :attr:`.BatchGetItemResponse.unprocessed_keys` are sent again in subsequent :class:`.BatchGetItem` actions.
+
+    :class:`.GetItem` actions with different consistency or projections on the same table are sent in separate :class:`.BatchGetItem` actions.
+    :class:`.GetItem` actions using :meth:`~.GetItem.return_consumed_capacity_total` are sent as-is,
+    because the capacity consumed by a :class:`.BatchGetItem` can't be split between them.
+
+    :param connection: the :class:`.Connection` to wrap.
+    :param window: the maximum duration (in seconds) a :class:`.GetItem` waits for others.
+    :param max_keys: the maximum number of keys in a single :class:`.BatchGetItem`. At most 100.
+    :param retry_policy: a retry policy (see :mod:`.retry_policies`) deciding how long to wait before sending unprocessed keys again.
+        If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
+        When it gives up, callers with unprocessed keys receive a :exc:`.ProvisionedThroughputExceededException`.
+    """
+
+    def __init__(self, connection, window=0.002, max_keys=100, retry_policy=None):
+        if retry_policy is None:
+            retry_policy = retry_policies.DEFAULT
+
+        self.__connection = connection
+        self.__window = window
+        self.__max_keys = max_keys
+        self.__retry_policy = retry_policy
+        self.__condition = threading.Condition()
+        self.__pending = []
+        self.__leader = None
+
+    def __call__(self, action):
+        """
+        Send the action, possibly batched with others, and return its response.
+        """
+        if action.name != "GetItem" or "ReturnConsumedCapacity" in action.payload:
+            return self.__connection(action)
+
+        get = _PendingGetItem(action.payload)
+        with self.__condition:
+            self.__pending.append(get)
+            if self.__leader is None:
+                self.__leader = get
+                get.event.set()
+            elif len(self.__pending) >= self.__max_keys:
+                self.__condition.notify()
+        get.event.wait()
+        if get.is_leader:
+            self.__lead()
+        return get.result()
+
+    def __lead(self):
+        # The leader waits for others, then sends its batch itself. The next pending GetItem becomes the next leader.
+        batch = []
+        try:
+            with self.__condition:
+                deadline = time.time() + self.__window
+                while len(self.__pending) < self.__max_keys:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self.__condition.wait(remaining)
+                batch = self.__pending[:self.__max_keys]
+                del self.__pending[:self.__max_keys]
+                if len(self.__pending) == 0:
+                    self.__leader = None
+                else:
+                    self.__leader = self.__pending[0]
+                    self.__leader.event.set()
+            for groups in _split_in_actions(batch):
+                self.__send(groups)
+        except Exception as e:
+            # Callers waiting for this batch (including the leader) must not block forever
+            for get in batch:
+                if not get.settled:
+                    get.fail(e)
+
+    def __send(self, groups):
+        waiting = {}
+        request_items = {}
+        for group in groups:
+            waiting[group.table] = group.gets
+            request_items[group.table] = group.request
+        throttles = []
+        while len(request_items) != 0:
+            action = _lv.BatchGetItem().previous_unprocessed_keys(request_items)
+            if len(throttles) != 0:
+                delay = self.__retry_policy.retry(action, throttles)
+                if delay is None:
+                    _fail(waiting, throttles[-1])
+                    return
+                time.sleep(delay)
+            try:
+                r = self.__connection(action)
+            except Exception as e:
+                _fail(waiting, e)
+                return
+            for group in groups:
+                for item in (r.responses or {}).get(group.table, []):
+                    item = {n: _convert_value_to_db(v) for n, v in item.items()}
+                    for get in waiting[group.table].pop(_index(group.key_names, item), []):
+                        get.resolve(_lv.GetItemResponse(Item=group.strip(item)))
+            request_items = r.unprocessed_keys if isinstance(r.unprocessed_keys, dict) else {}
+            unprocessed = set(
+                (table, _index(sorted(key), key))
+                for table, request in request_items.items()
+                for key in request.get("Keys", [])
+            )
+            for table, gets in waiting.items():
+                for index in list(gets):
+                    if (table, index) not in unprocessed:
+                        for get in gets.pop(index):
+                            get.resolve(_lv.GetItemResponse())
+            if len(request_items) != 0:
+                throttles.append(_lv.ProvisionedThroughputExceededException("{} unprocessed keys".format(len(unprocessed))))
+            else:
+                throttles = []
+
+
+class _PendingGetItem(object):
+    def __init__(self, payload):
+        self.table = payload["TableName"]
+        self.key = payload["Key"]
+        self.options = {name: payload[name] for name in ("ConsistentRead", "ProjectionExpression", "ExpressionAttributeNames") if name in payload}
+        self.event = threading.Event()
+        self.is_leader = True
+        self.settled = False
+        self.__response = None
+        self.__exception = None
+
+    def resolve(self, response):
+        self.__response = response
+        self.is_leader = False
+        self.settled = True
+        self.event.set()
+
+    def fail(self, exception):
+        self.__exception = exception
+        self.is_leader = False
+        self.settled = True
+        self.event.set()
+
+    def result(self):
+        if self.__exception is not None:
+            raise self.__exception
+        return self.__response
+
+
+class _Group(object):
+    # GetItems on the same table with the same options, sent in the same BatchGetItem.
+    def __init__(self, table, options, key_names):
+        self.table = table
+        self.key_names = key_names
+        self.gets = {}
+        self.__keys = []
+        self.__options = dict(options)
+        self.__projected = None
+        if "ProjectionExpression" in options:
+            # Key attributes are needed to match items with keys, so we project them as well, and remove them if they were not projected.
+            names = options.get("ExpressionAttributeNames", {})
+            self.__projected = set(names.get(n, n) for n in (re.split(r"[.\[]", p.strip())[0] for p in options["ProjectionExpression"].split(",")))
+            extra_names = {"#lvkey{}".format(i): name for i, name in enumerate(key_names)}
+            self.__options["ProjectionExpression"] = ", ".join([options["ProjectionExpression"]] + sorted(extra_names))
+            self.__options["ExpressionAttributeNames"] = dict(names, **extra_names)
+
+    def add(self, get):
+        index = _index(self.key_names, get.key)
+        if index not in self.gets:
+            self.gets[index] = []
+            self.__keys.append(get.key)
+        self.gets[index].append(get)
+
+    @property
+    def request(self):
+        return dict(self.__options, Keys=self.__keys)
+
+    def strip(self, item):
+        if self.__projected is None:
+            return item
+        else:
+            return {n: v for n, v in item.items() if n not in self.key_names or n in self.__projected}
+
+
+def _index(key_names, key):
+    # key (or item) is in DynamoDB format
+    return tuple(tuple(sorted(key[name].items())) for name in key_names)
+
+
+def _split_in_actions(batch):
+    groups = {}
+    for get in batch:
+        group_key = (get.table, repr(sorted(get.options.items())))
+        if group_key not in groups:
+            groups[group_key] = _Group(get.table, get.options, sorted(get.key))
+        groups[group_key].add(get)
+    actions = []
+    for group in sorted(groups.values(), key=lambda g: g.table):
+        for action in actions:
+            if all(g.table != group.table for g in action):
+                action.append(group)
+                break
+        else:
+            actions.append([group])
+    return actions
+
+
+def _fail(waiting, exception):
+    for gets in waiting.values():
+        for index_gets in gets.values():
+            for get in index_gets:
+                get.fail(exception)
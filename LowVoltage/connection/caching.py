@@ -0,0 +1,354 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A :class:`CachingConnection` serves eventually consistent reads from a client-side cache of items (and optionally of :class:`.Query` and :class:`.Scan` pages).
+
+>>> caching_connection = CachingConnection(connection, ttl=60)
+>>> caching_connection(GetItem(table, {"h": 0})).item
+{'h': 0, 'gr': 10, 'gh': 0}
+>>> caching_connection(GetItem(table, {"h": 0})).item
+{'h': 0, 'gr': 10, 'gh': 0}
+>>> caching_connection.hits, caching_connection.misses
+(1, 1)
+"""
+
+import collections
+import json
+import threading
+import time
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_dict_to_db
+
+
+class CachingConnection(object):
+    """
+    Wrap a :class:`.Connection` and keep the items it gets in a bounded LRU cache.
+
+    Eventually consistent :class:`.GetItem` and :class:`.BatchGetItem` actions are served from the cache when possible.
+    Actions using :meth:`~.GetItem.project` or :meth:`~.GetItem.return_consumed_capacity_total` always reach DynamoDB.
+    Items that don't exist are cached as well, unless ``cache_missing`` is ``False``.
+
+    :class:`.PutItem` and :class:`.DeleteItem` actions sent through the same connection update the cache;
+    :class:`.UpdateItem` and :class:`.BatchWriteItem` invalidate the items they modify; :class:`.DeleteTable` invalidates a whole table.
+    Writes that don't go through this connection are only seen when cached items expire.
+    Responses of reads that overlap a write to the same table through this connection are not cached, as they may predate the write.
+
+    If ``max_pages`` is not zero, eventually consistent :class:`.Query` and :class:`.Scan` responses are cached as well,
+    indexed by their whole payload (including :meth:`~.Query.exclusive_start_key`), so repeated calls to :func:`.iterate_query` are served locally.
+    Any write to a table through this connection invalidates all its cached pages.
+
+    :param connection: the :class:`.Connection` to wrap.
+    :param max_items: the maximum number of items in the cache. The least recently used are evicted first.
+    :param ttl: the duration (in seconds) items stay in the cache.
+    :param table_ttls: a dict associating table names to durations, overriding ``ttl`` for those tables.
+    :param cache_missing: whether to cache the fact that an item doesn't exist.
+    :param max_pages: the maximum number of :class:`.Query` and :class:`.Scan` responses in the cache.
+        They expire like items.
+    """
+
+    def __init__(self, connection, max_items=10000, ttl=60, table_ttls=None, cache_missing=True, max_pages=0):
+        self.__connection = connection
+        self.__max_items = max_items
+        self.__ttl = ttl
+        self.__table_ttls = dict(table_ttls or {})
+        self.__cache_missing = cache_missing
+        self.__max_pages = max_pages
+        self.__lock = threading.Lock()
+        self.__items = collections.OrderedDict()
+        self.__pages = collections.OrderedDict()
+        self.__key_names = {}
+        # Incremented when a write to the table starts and ends, so that reads overlapping a write don't cache their response
+        self.__generations = collections.Counter()
+        self.__hits = 0
+        self.__misses = 0
+        self.__page_hits = 0
+        self.__page_misses = 0
+
+        # Dependency injection through monkey-patching
+        self.__now = time.time
+
+    @property
+    def hits(self):
+        """
+        The number of items served from the cache.
+
+        :type: int
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        The number of items that were requested to DynamoDB by cacheable actions.
+
+        :type: int
+        """
+        return self.__misses
+
+    @property
+    def page_hits(self):
+        """
+        The number of :class:`.Query` and :class:`.Scan` responses served from the cache.
+
+        :type: int
+        """
+        return self.__page_hits
+
+    @property
+    def page_misses(self):
+        """
+        The number of cacheable :class:`.Query` and :class:`.Scan` actions sent to DynamoDB.
+
+        :type: int
+        """
+        return self.__page_misses
+
+    def invalidate(self, table):
+        """
+        Remove all items and pages of ``table`` from the cache.
+        """
+        with self.__lock:
+            for key in [key for key in self.__items if key[0] == table]:
+                del self.__items[key]
+        self.__invalidate_pages(table)
+
+    def __call__(self, action):
+        """
+        Send the action, or serve it from the cache, and return its response.
+        """
+        handler = getattr(self, "_CachingConnection__" + action.name, None)
+        if handler is None:
+            return self.__connection(action)
+        else:
+            return handler(action, action.payload)
+
+    def __GetItem(self, action, payload):
+        table = payload["TableName"]
+        if _is_cacheable(payload):
+            found, item = self.__get(table, payload["Key"])
+            if found:
+                return _lv.GetItemResponse(Item=item)
+        generation = self.__generation(table)
+        r = self.__connection(action)
+        if "ProjectionExpression" not in payload:
+            self.__learn_key_names(table, payload["Key"])
+            if r.item is None:
+                self.__set_missing(table, payload["Key"], generation=generation)
+            else:
+                self.__set(table, _convert_dict_to_db(r.item), generation=generation)
+        return r
+
+    def __BatchGetItem(self, action, payload):
+        if "ReturnConsumedCapacity" in payload:
+            return self.__connection(action)
+        responses = {}
+        request_items = {}
+        for table, request in payload.get("RequestItems", {}).items():
+            keys = []
+            if _is_cacheable(request):
+                for key in request.get("Keys", []):
+                    found, item = self.__get(table, key)
+                    if not found:
+                        keys.append(key)
+                    elif item is not None:
+                        responses.setdefault(table, []).append(item)
+            else:
+                keys = request.get("Keys", [])
+            if len(keys) != 0:
+                request_items[table] = dict(request, Keys=keys)
+        if len(request_items) == 0:
+            return _lv.BatchGetItemResponse(Responses=responses)
+
+        generations = {table: self.__generation(table) for table in request_items}
+        r = self.__connection(_lv.BatchGetItem().previous_unprocessed_keys(request_items))
+        for table, items in (r.responses or {}).items():
+            for item in items:
+                item = _convert_dict_to_db(item)
+                responses.setdefault(table, []).append(item)
+                if "ProjectionExpression" not in request_items[table]:
+                    self.__learn_key_names(table, request_items[table]["Keys"][0])
+                    self.__set(table, item, generation=generations[table])
+        unprocessed = r.unprocessed_keys if isinstance(r.unprocessed_keys, dict) else {}
+        for table, request in request_items.items():
+            if "ProjectionExpression" not in request:
+                names = self.__learn_key_names(table, request["Keys"][0])
+                received = set(_index(names, item) for item in responses.get(table, []))
+                received.update(_index(names, key) for key in unprocessed.get(table, {}).get("Keys", []))
+                for key in request["Keys"]:
+                    if _index(names, key) not in received:
+                        self.__set_missing(table, key, generation=generations[table])
+        return _lv.BatchGetItemResponse(Responses=responses, UnprocessedKeys=r.unprocessed_keys)
+
+    def __Query(self, action, payload):
+        return self.__page(action, payload)
+
+    def __Scan(self, action, payload):
+        return self.__page(action, payload)
+
+    def __page(self, action, payload):
+        if self.__max_pages == 0 or not _is_cacheable(payload) or "ReturnConsumedCapacity" in payload:
+            return self.__connection(action)
+        table = payload["TableName"]
+        cache_key = (table, action.name, json.dumps(payload, sort_keys=True))
+        with self.__lock:
+            if cache_key in self.__pages:
+                expires, r = self.__pages[cache_key]
+                if expires > self.__now():
+                    self.__pages.move_to_end(cache_key)
+                    self.__page_hits += 1
+                    return r
+                else:
+                    del self.__pages[cache_key]
+            self.__page_misses += 1
+            generation = self.__generations[table]
+        r = self.__connection(action)
+        with self.__lock:
+            if generation != self.__generations[table]:
+                # A write to the table overlapped the read: the page may be stale
+                return r
+            self.__pages[cache_key] = (self.__now() + self.__table_ttls.get(table, self.__ttl), r)
+            while len(self.__pages) > self.__max_pages:
+                self.__pages.popitem(last=False)
+        return r
+
+    def __PutItem(self, action, payload):
+        table = payload["TableName"]
+        try:
+            self.__bump_generation(table)
+            r = self.__connection(action)
+        except _lv.ConditionalCheckFailedException:
+            raise
+        except Exception:
+            self.__invalidate_item(table, payload["Item"])
+            self.__invalidate_pages(table)
+            raise
+        finally:
+            self.__bump_generation(table)
+        self.__set(table, payload["Item"], only_if_known=True)
+        self.__invalidate_pages(table)
+        return r
+
+    def __DeleteItem(self, action, payload):
+        table = payload["TableName"]
+        try:
+            self.__bump_generation(table)
+            r = self.__connection(action)
+        except _lv.ConditionalCheckFailedException:
+            raise
+        except Exception:
+            self.__invalidate_item(table, payload["Key"])
+            self.__invalidate_pages(table)
+            raise
+        finally:
+            self.__bump_generation(table)
+        self.__set_missing(table, payload["Key"], only_if_known=True)
+        self.__invalidate_pages(table)
+        return r
+
+    def __UpdateItem(self, action, payload):
+        try:
+            self.__bump_generation(payload["TableName"])
+            return self.__connection(action)
+        finally:
+            self.__bump_generation(payload["TableName"])
+            self.__invalidate_item(payload["TableName"], payload["Key"])
+            self.__invalidate_pages(payload["TableName"])
+
+    def __BatchWriteItem(self, action, payload):
+        try:
+            for table in payload.get("RequestItems", {}):
+                self.__bump_generation(table)
+            return self.__connection(action)
+        finally:
+            for table, requests in payload.get("RequestItems", {}).items():
+                self.__bump_generation(table)
+                self.__invalidate_pages(table)
+                for request in requests:
+                    if "PutRequest" in request:
+                        self.__invalidate_item(table, request["PutRequest"]["Item"])
+                    else:
+                        self.__invalidate_item(table, request["DeleteRequest"]["Key"])
+
+    def __DeleteTable(self, action, payload):
+        try:
+            self.__bump_generation(payload["TableName"])
+            return self.__connection(action)
+        finally:
+            self.__bump_generation(payload["TableName"])
+            self.invalidate(payload["TableName"])
+
+    def __learn_key_names(self, table, key):
+        with self.__lock:
+            return self.__key_names.setdefault(table, tuple(sorted(key)))
+
+    def __get(self, table, key):
+        with self.__lock:
+            names = self.__key_names.get(table)
+            cache_key = None if names is None else (table, _index(names, key))
+            if cache_key in self.__items:
+                expires, item = self.__items[cache_key]
+                if expires > self.__now():
+                    self.__items.move_to_end(cache_key)
+                    self.__hits += 1
+                    return True, item
+                else:
+                    del self.__items[cache_key]
+            self.__misses += 1
+            return False, None
+
+    def __generation(self, table):
+        with self.__lock:
+            return self.__generations[table]
+
+    def __bump_generation(self, table):
+        with self.__lock:
+            self.__generations[table] += 1
+
+    def __set(self, table, item, only_if_known=False, generation=None):
+        self.__store(table, item, item, only_if_known, generation)
+
+    def __set_missing(self, table, key, only_if_known=False, generation=None):
+        if self.__cache_missing:
+            self.__store(table, key, None, only_if_known, generation)
+        else:
+            self.__invalidate_item(table, key)
+
+    def __store(self, table, key, item, only_if_known, generation):
+        with self.__lock:
+            names = self.__key_names.get(table)
+            if names is None:
+                # Nothing was ever read from this table through this connection
+                return
+            if generation is not None and generation != self.__generations[table]:
+                # A write to the table overlapped the read: its response may be stale
+                return
+            cache_key = (table, _index(names, key))
+            if only_if_known and cache_key not in self.__items:
+                return
+            self.__items[cache_key] = (self.__now() + self.__table_ttls.get(table, self.__ttl), item)
+            self.__items.move_to_end(cache_key)
+            while len(self.__items) > self.__max_items:
+                self.__items.popitem(last=False)
+
+    def __invalidate_pages(self, table):
+        with self.__lock:
+            for key in [key for key in self.__pages if key[0] == table]:
+                del self.__pages[key]
+
+    def __invalidate_item(self, table, key):
+        with self.__lock:
+            names = self.__key_names.get(table)
+            if names is not None:
+                self.__items.pop((table, _index(names, key)), None)
+
+
+def _is_cacheable(request):
+    return not request.get("ConsistentRead", False) and "ProjectionExpression" not in request and "ReturnConsumedCapacity" not in request
+
+
+def _index(key_names, key):
+    # key (or item) is in DynamoDB format
+    return tuple(tuple(sorted(key[name].items())) for name in key_names)
@@ -3,6 +3,7 @@
 # Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
 import datetime
+import functools
 import hashlib
 import hmac
 import json
@@ -12,7 +13,6 @@ import time
 import requests
 
 import LowVoltage as _lv
-import LowVoltage.testing as _tst
 import LowVoltage.exceptions as _exn
 from . import retry_policies
 
@@ -30,9 +30,15 @@ class Connection(object):
         If left ``None``, it will be computed from the region.
     :param retry_policy: a retry policy. See :mod:`.retry_policies`. If left ``None``, the :obj:`~.retry_policies.DEFAULT` retry policy will be used.
     :param requests_session: a ``Session`` object from the `python-requests <http://python-requests.org>`__ library. Typically not used. Leave it to ``None`` and one will be created for you.
+    :param hot_key_tracker: a :class:`.HotKeyTracker` to record the keys of throttled actions, or ``None``.
+    :param capacity_monitor: a :class:`.CapacityMonitor` to record the consumed capacity and the throttles, or ``None``.
+        Read and write actions then always request their consumed capacity.
+    :param compressed_attributes: the names of the top-level attributes you store :class:`.Compressed`.
+        :class:`.GetItemResponse`, :class:`.QueryResponse`, :class:`.ScanResponse` and :class:`.BatchGetItemResponse`
+        return their original values, like :func:`.decompress_item`. Other attributes are returned as they are stored.
     """
 
-    def __init__(self, region, credentials, endpoint=None, retry_policy=None, requests_session=None):
+    def __init__(self, region, credentials, endpoint=None, retry_policy=None, requests_session=None, hot_key_tracker=None, capacity_monitor=None, compressed_attributes=()):
         if endpoint is None:
             endpoint = "https://dynamodb.{}.amazonaws.com/".format(region)
         if retry_policy is None:
@@ -46,6 +52,9 @@ class Connection(object):
         self.__host = urllib.parse.urlparse(self.__endpoint).hostname
         self.__retry_policy = retry_policy
         self.__session = requests_session
+        self.__hot_key_tracker = hot_key_tracker
+        self.__capacity_monitor = capacity_monitor
+        self.__compressed_attributes = tuple(compressed_attributes)
 
         # Dependency injection through monkey-patching
         self.__signer = Signer(self.__region, self.__host)
@@ -59,8 +68,13 @@ class Connection(object):
         errors = []
         while True:
             try:
-                return self.__request_once(action)
+                r = self.__request_once(action)
             except _exn.Error as e:
+                if isinstance(e, _exn.ProvisionedThroughputExceededException):
+                    if self.__hot_key_tracker is not None:
+                        self.__hot_key_tracker.throttled(action)
+                    if self.__capacity_monitor is not None:
+                        self.__capacity_monitor.throttled(action)
                 if e.retryable:
                     errors.append(e)
                     delay = self.__retry_policy.retry(action, errors)
@@ -70,10 +84,19 @@ class Connection(object):
                         time.sleep(delay)
                 else:
                     raise
+            else:
+                if self.__hot_key_tracker is not None:
+                    self.__hot_key_tracker.unprocessed(r)
+                if self.__capacity_monitor is not None:
+                    self.__capacity_monitor.responded(action, r)
+                return r
 
     def __request_once(self, action):
         key, secret, token = self.__credentials.get()
-        payload = json.dumps(action.payload)
+        if self.__capacity_monitor is None:
+            payload = json.dumps(action.payload)
+        else:
+            payload = json.dumps(self.__capacity_monitor.payload(action))
         headers = self.__signer(key, secret, self.__now(), action.name, payload)
         if token is not None:
             headers["X-Amz-Security-Token"] = token
@@ -84,149 +107,10 @@ class Connection(object):
         except Exception as e:
             raise _exn.UnknownError(e)
 
-        return self.__responder(action.response_class, r)
-
-
-class ConnectionUnitTests(_tst.UnitTestsWithMocks):
-    def setUp(self):
-        super(ConnectionUnitTests, self).setUp()
-        self.credentials = self.mocks.create("credentials")
-        self.retry_policy = self.mocks.create("retry_policy")
-        self.session = self.mocks.create("session")
-        self.connection = Connection(
-            region="us-west-2",
-            credentials=self.credentials.object,
-            endpoint="http://endpoint.com:8000/",
-            retry_policy=self.retry_policy.object,
-            requests_session=self.session.object,
-        )
-        self.now = self.mocks.replace("self.connection._Connection__now")
-        self.signer = self.mocks.replace("self.connection._Connection__signer")
-        self.responder = self.mocks.replace("self.connection._Connection__responder")
-        self.action = self.mocks.create("action")
-
-    def test_identification_with_token(self):
-        self.credentials.expect.get().andReturn(("a", "b", "t"))
-        self.action.expect.payload.andReturn({"d": "e"})
-        self.now.expect().andReturn("f")
-        self.action.expect.name.andReturn("c")
-        self.signer.expect("a", "b", "f", "c", '{"d": "e"}').andReturn({"g": "h"})
-        self.session.expect.post("http://endpoint.com:8000/", data='{"d": "e"}', headers={"g": "h", "X-Amz-Security-Token": "t"}).andReturn("i")
-        self.action.expect.response_class.andReturn("j")
-        self.responder.expect("j", "i").andReturn("k")
-
-        self.assertEqual(self.connection(self.action.object), "k")
-
-    def __expect_post(self):
-        self.credentials.expect.get().andReturn(("a", "b", None))
-        self.action.expect.payload.andReturn({"d": "e"})
-        self.now.expect().andReturn("f")
-        self.action.expect.name.andReturn("c")
-        self.signer.expect("a", "b", "f", "c", '{"d": "e"}').andReturn({"g": "h"})
-        return self.session.expect.post("http://endpoint.com:8000/", data='{"d": "e"}', headers={"g": "h"})
-
-    def test_success_on_first_try(self):
-        self.__expect_post().andReturn("i")
-        self.action.expect.response_class.andReturn("j")
-        self.responder.expect("j", "i").andReturn("k")
-
-        self.assertEqual(self.connection(self.action.object), "k")
-
-    def test_success_on_fourth_try(self):
-        self.__expect_post().andReturn("i")
-        self.action.expect.response_class.andReturn("j")
-        exception1 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("j", "i").andRaise(exception1)
-        self.retry_policy.expect.retry(self.action.object, [exception1]).andReturn(0)
-
-        self.__expect_post().andReturn("k")
-        self.action.expect.response_class.andReturn("l")
-        exception2 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("l", "k").andRaise(exception2)
-        self.retry_policy.expect.retry(self.action.object, [exception1, exception2]).andReturn(0)
-
-        self.__expect_post().andReturn("m")
-        self.action.expect.response_class.andReturn("n")
-        exception3 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("n", "m").andRaise(exception3)
-        self.retry_policy.expect.retry(self.action.object, [exception1, exception2, exception3]).andReturn(0)
-
-        self.__expect_post().andReturn("o")
-        self.action.expect.response_class.andReturn("p")
-        self.responder.expect("p", "o").andReturn("q")
-
-        self.assertEqual(self.connection(self.action.object), "q")
-
-    def test_failure_on_second_try(self):
-        self.__expect_post().andReturn("i")
-        self.action.expect.response_class.andReturn("j")
-        exception1 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("j", "i").andRaise(exception1)
-        self.retry_policy.expect.retry(self.action.object, [exception1]).andReturn(0)
-
-        self.__expect_post().andReturn("k")
-        self.action.expect.response_class.andReturn("l")
-        exception2 = _exn.UnknownClientError()
-        self.responder.expect("l", "k").andRaise(exception2)
-
-        with self.assertRaises(_exn.UnknownClientError) as catcher:
-            self.connection(self.action.object)
-        self.assertIs(catcher.exception, exception2)
-
-    def test_give_up_after_third_try(self):
-        self.__expect_post().andReturn("i")
-        self.action.expect.response_class.andReturn("j")
-        exception1 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("j", "i").andRaise(exception1)
-        self.retry_policy.expect.retry(self.action.object, [exception1]).andReturn(0)
-
-        self.__expect_post().andReturn("k")
-        self.action.expect.response_class.andReturn("l")
-        exception2 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("l", "k").andRaise(exception2)
-        self.retry_policy.expect.retry(self.action.object, [exception1, exception2]).andReturn(0)
-
-        self.__expect_post().andReturn("m")
-        self.action.expect.response_class.andReturn("n")
-        exception3 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("n", "m").andRaise(exception3)
-        self.retry_policy.expect.retry(self.action.object, [exception1, exception2, exception3]).andReturn(None)
-
-        with self.assertRaises(_exn.ProvisionedThroughputExceededException) as catcher:
-            self.connection(self.action.object)
-        self.assertIs(catcher.exception, exception3)
-
-    def test_success_after_network_error(self):
-        exception = requests.exceptions.RequestException()
-        self.__expect_post().andRaise(exception)
-        self.retry_policy.expect.retry.withArguments(lambda args, kwds: args[0] is self.action.object and isinstance(args[1][0], _exn.NetworkError)).andReturn(0)
-
-        self.__expect_post().andReturn("k")
-        self.action.expect.response_class.andReturn("l")
-        exception2 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("l", "k").andReturn("m")
-
-        self.assertEqual(self.connection(self.action.object), "m")
-
-    def test_failure_on_unkown_exception_raised_by_requests(self):
-        exception = Exception()
-        self.__expect_post().andRaise(exception)
-
-        with self.assertRaises(_exn.UnknownError) as catcher:
-            self.connection(self.action.object)
-        self.assertEqual(catcher.exception.args, (exception,))
-
-    def test_success_after_network_error_during_credentials(self):
-        exception = _exn.NetworkError()
-        self.credentials.expect.get().andRaise(exception)
-        self.retry_policy.expect.retry(self.action.object, [exception]).andReturn(0)
-
-        self.__expect_post().andReturn("k")
-        self.action.expect.response_class.andReturn("l")
-        exception2 = _exn.ProvisionedThroughputExceededException()
-        self.responder.expect("l", "k").andReturn("m")
-
-        self.assertEqual(self.connection(self.action.object), "m")
+        response_class = action.response_class
+        if self.__compressed_attributes:
+            response_class = functools.partial(response_class, compressed_attributes=self.__compressed_attributes)
+        return self.__responder(response_class, r)
 
 
 class Signer(object):
@@ -284,21 +168,6 @@ class Signer(object):
         return headers
 
 
-class SignerUnitTests(_tst.UnitTests):
-    def test(self):
-        signer = Signer("us-west-2", "localhost")
-        self.assertEqual(
-            signer("DummyKey", "DummySecret", datetime.datetime(2014, 10, 4, 6, 33, 2), "Operation", '{"Payload": "Value"}'),
-            {
-                "Host": "localhost",
-                "Content-Type": "application/x-amz-json-1.0",
-                "Authorization": "AWS4-HMAC-SHA256 Credential=DummyKey/20141004/us-west-2/dynamodb/aws4_request, SignedHeaders=content-type;host;x-amz-date;x-amz-target, Signature=f47b4025d95692c1623d01bd7db6d53e68f7a8a28264c1ab3393477f0dae520a",
-                "X-Amz-Date": "20141004T063302Z",
-                "X-Amz-Target": "DynamoDB_20120810.Operation",
-            }
-        )
-
-
 class Responder(object):
     def __call__(self, response_class, r):
         status_code = r.status_code
@@ -330,200 +199,3 @@ class Responder(object):
             raise _exn.ServerError(status_code, data)
         else:
             raise _exn.UnknownError(status_code, data)
-
-
-class ResponderUnitTests(_tst.UnitTestsWithMocks):
-    def setUp(self):
-        super(ResponderUnitTests, self).setUp()
-        self.response_class = self.mocks.create("response_class")
-        self.response_instance = object()
-        self.requests_response = self.mocks.create("requests_response")
-        self.json = {"a": 0}
-        self.responder = Responder()
-
-    def test_good_response(self):
-        self.requests_response.expect.status_code.andReturn(200)
-        self.requests_response.expect.json().andReturn(self.json)
-        self.response_class.expect(a=0).andReturn(self.response_instance)
-
-        self.assertIs(self.responder(self.response_class.object, self.requests_response.object), self.response_instance)
-
-    def test_non_json_response_with_good_status(self):
-        self.requests_response.expect.status_code.andReturn(200)
-        self.requests_response.expect.json().andRaise(ValueError)
-        self.requests_response.expect.text.andReturn("foobar")
-
-        with self.assertRaises(_exn.ServerError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (200, "foobar"))
-
-    def test_unknown_client_error_with_correct_json(self):
-        self.requests_response.expect.status_code.andReturn(400)
-        self.requests_response.expect.json().andReturn({"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"})
-
-        with self.assertRaises(_exn.UnknownClientError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (400, {"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"}))
-
-    def test_unknown_client_error_with_json_without_type(self):
-        self.requests_response.expect.status_code.andReturn(400)
-        self.requests_response.expect.json().andReturn({"Message": "tralala"})
-
-        with self.assertRaises(_exn.UnknownClientError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (400, {"Message": "tralala"}))
-
-    def test_unknown_client_error_with_non_dict_json(self):
-        self.requests_response.expect.status_code.andReturn(400)
-        self.requests_response.expect.json().andReturn(["Message", "tralala"])
-
-        with self.assertRaises(_exn.UnknownClientError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (400, ["Message", "tralala"]))
-
-    def test_unknown_client_error_without_json(self):
-        self.requests_response.expect.status_code.andReturn(400)
-        self.requests_response.expect.json().andRaise(ValueError)
-        self.requests_response.expect.text.andReturn("Message: tralala")
-
-        with self.assertRaises(_exn.UnknownClientError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (400, "Message: tralala"))
-
-    def test_server_error_with_correct_json(self):
-        self.requests_response.expect.status_code.andReturn(500)
-        self.requests_response.expect.json().andReturn({"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"})
-
-        with self.assertRaises(_exn.ServerError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (500, {"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"}))
-
-    def test_server_error_with_json_without_type(self):
-        self.requests_response.expect.status_code.andReturn(500)
-        self.requests_response.expect.json().andReturn({"Message": "tralala"})
-
-        with self.assertRaises(_exn.ServerError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (500, {"Message": "tralala"}))
-
-    def test_server_error_with_non_dict_json(self):
-        self.requests_response.expect.status_code.andReturn(500)
-        self.requests_response.expect.json().andReturn(["Message", "tralala"])
-
-        with self.assertRaises(_exn.ServerError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (500, ["Message", "tralala"]))
-
-    def test_server_error_without_json(self):
-        self.requests_response.expect.status_code.andReturn(500)
-        self.requests_response.expect.json().andRaise(ValueError)
-        self.requests_response.expect.text.andReturn("Message: tralala")
-
-        with self.assertRaises(_exn.ServerError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (500, "Message: tralala"))
-
-    def test_unknown_error_with_correct_json(self):
-        self.requests_response.expect.status_code.andReturn(750)
-        self.requests_response.expect.json().andReturn({"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"})
-
-        with self.assertRaises(_exn.UnknownError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (750, {"__type": "NobodyKnewThisCouldHappen", "Message": "tralala"}))
-
-    def test_unknown_error_with_json_without_type(self):
-        self.requests_response.expect.status_code.andReturn(750)
-        self.requests_response.expect.json().andReturn({"Message": "tralala"})
-
-        with self.assertRaises(_exn.UnknownError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (750, {"Message": "tralala"}))
-
-    def test_unknown_error_with_non_dict_json(self):
-        self.requests_response.expect.status_code.andReturn(750)
-        self.requests_response.expect.json().andReturn(["Message", "tralala"])
-
-        with self.assertRaises(_exn.UnknownError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (750, ["Message", "tralala"]))
-
-    def test_unknown_error_without_json(self):
-        self.requests_response.expect.status_code.andReturn(750)
-        self.requests_response.expect.json().andRaise(ValueError)
-        self.requests_response.expect.text.andReturn("Message: tralala")
-
-        with self.assertRaises(_exn.UnknownError) as catcher:
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.assertEqual(catcher.exception.args, (750, "Message: tralala"))
-
-    def test_known_client_errors(self):
-        for type_name, cls in [
-            ("xxx.AccessDeniedException", _exn.AccessDeniedException),
-            ("xxx.ConditionalCheckFailedException", _exn.ConditionalCheckFailedException),
-            ("xxx.IncompleteSignature", _exn.IncompleteSignature),
-            ("xxx.InvalidAction", _exn.InvalidAction),
-            ("xxx.InvalidClientTokenId", _exn.InvalidClientTokenId),
-            ("xxx.InvalidParameterCombination", _exn.InvalidParameterCombination),
-            ("xxx.InvalidParameterValue", _exn.InvalidParameterValue),
-            ("xxx.InvalidQueryParameter", _exn.InvalidQueryParameter),
-            ("xxx.InvalidSignatureException", _exn.InvalidSignatureException),
-            ("xxx.ItemCollectionSizeLimitExceededException", _exn.ItemCollectionSizeLimitExceededException),
-            ("xxx.LimitExceededException", _exn.LimitExceededException),
-            ("xxx.MalformedQueryString", _exn.MalformedQueryString),
-            ("xxx.MissingAction", _exn.MissingAction),
-            ("xxx.MissingAuthenticationToken", _exn.MissingAuthenticationToken),
-            ("xxx.MissingParameter", _exn.MissingParameter),
-            ("xxx.OptInRequired", _exn.OptInRequired),
-            ("xxx.ProvisionedThroughputExceededException", _exn.ProvisionedThroughputExceededException),
-            ("xxx.RequestExpired", _exn.RequestExpired),
-            ("xxx.ResourceInUseException", _exn.ResourceInUseException),
-            ("xxx.ResourceNotFoundException", _exn.ResourceNotFoundException),
-            ("xxx.Throttling", _exn.Throttling),
-            ("xxx.ValidationError", _exn.ValidationError),
-            ("xxx.ValidationException", _exn.ValidationException),
-        ]:
-            self.requests_response.expect.status_code.andReturn(400)
-            self.requests_response.expect.json().andReturn({"__type": type_name, "Message": "tralala"})
-
-            with self.assertRaises(cls) as catcher:
-                self.responder(self.response_class.object, self.requests_response.object)
-
-    def test_different_statuses(self):
-        self.requests_response.expect.status_code.andReturn(400)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ClientError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(453)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ClientError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(499)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ClientError):
-            self.responder(self.response_class.object, self.requests_response.object)
-
-        self.requests_response.expect.status_code.andReturn(500)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ServerError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(547)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ServerError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(599)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.ServerError):
-            self.responder(self.response_class.object, self.requests_response.object)
-
-        self.requests_response.expect.status_code.andReturn(600)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.UnknownError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(612)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.UnknownError):
-            self.responder(self.response_class.object, self.requests_response.object)
-        self.requests_response.expect.status_code.andReturn(9999)
-        self.requests_response.expect.json().andReturn({})
-        with self.assertRaises(_exn.UnknownError):
-            self.responder(self.response_class.object, self.requests_response.object)
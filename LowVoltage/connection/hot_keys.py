@@ -0,0 +1,222 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A :class:`HotKeyTracker` tells which keys are throttled most often.
+Pass it to a :class:`.Connection` as ``hot_key_tracker`` to know if a table throttles because of a few hot keys
+(fix the data model) or uniformly (increase its provisioned throughput).
+
+>>> tracker = HotKeyTracker()
+>>> for i in range(3):
+...   tracker.throttled(GetItem(table, {"h": 0}))
+>>> tracker.throttled(GetItem(table, {"h": 1}))
+>>> report = tracker.report(1)[table]
+>>> report["throttles"]
+4
+>>> report["keys"]
+[HotKey(key={'h': 0}, count=3, error=0)]
+"""
+
+import collections
+import threading
+
+from LowVoltage.actions.conversion import _convert_db_to_dict
+
+
+HotKey = collections.namedtuple("HotKey", "key count error")
+"""
+An entry of :meth:`HotKeyTracker.report`: ``key`` was throttled at least ``count - error`` and at most ``count`` times.
+"""
+
+
+class _SpaceSaving(object):
+    # Metwally, Agrawal and El Abbadi's "space-saving" heavy hitters sketch:
+    # at most `capacity` counters, and a new key replaces the least counted one, inheriting its count as error.
+    def __init__(self, capacity):
+        self.__capacity = capacity
+        self.__counters = {}
+
+    def add(self, key):
+        counter = self.__counters.get(key)
+        if counter is not None:
+            counter[0] += 1
+        elif len(self.__counters) < self.__capacity:
+            self.__counters[key] = [1, 0]
+        else:
+            evicted = min(self.__counters, key=lambda k: self.__counters[k][0])
+            count = self.__counters.pop(evicted)[0]
+            self.__counters[key] = [count + 1, count]
+
+    def top(self, n):
+        return sorted(self.__counters.items(), key=lambda item: (-item[1][0], item[1][1]))[:n]
+
+
+class _Table(object):
+    def __init__(self, capacity):
+        self.throttles = 0
+        self.unattributed = 0
+        self.keys = _SpaceSaving(capacity)
+        self.partitions = _SpaceSaving(capacity)
+        self.prefixes = _SpaceSaving(capacity)
+
+
+class HotKeyTracker(object):
+    """
+    Count the primary keys of throttled actions, per table, in bounded memory.
+
+    For each table, three "space-saving" sketches of ``capacity`` counters each record the full primary keys,
+    the hash keys alone (DynamoDB throttles per partition, so many hot range keys under the same hash key are a hot partition),
+    and, if ``separator`` is set, the prefixes of string hash keys up to each occurrence of ``separator``
+    (with ``separator="#"``, ``"tenant#42#2015-06-01"`` is counted in ``"tenant#"`` and ``"tenant#42#"``).
+    Keys throttled more than ``throttles / capacity`` times are guaranteed to be kept in the sketches.
+
+    An action is recorded once per :exc:`.ProvisionedThroughputExceededException` it receives.
+    Keys of :class:`.BatchGetItem` and :class:`.BatchWriteItem` actions are recorded when the whole action is throttled,
+    and when they are returned as unprocessed.
+    :class:`.Scan` actions, and :class:`.PutItem` actions on tables whose key is unknown, are only counted in ``"throttles"``.
+
+    :param capacity: the number of counters of each sketch, per table.
+    :param separator: the separator of hash key prefixes. If ``None``, prefixes are not counted.
+    :param key_names: a dict of table names to the lists of the names of their key attributes: ``[hash]`` or ``[hash, range]``.
+        The key attributes of other tables are learned from the keys of the actions that use one,
+        and their hash key from :class:`.Query` actions.
+        Until a table's hash key is known, the partitions of its keys with two attributes are not counted.
+    """
+
+    def __init__(self, capacity=100, separator=None, key_names=None):
+        self.__capacity = capacity
+        self.__separator = separator
+        self.__key_names = {}
+        self.__hash_names = {}
+        for table, names in (key_names or {}).items():
+            self.__key_names[table] = set(names)
+            self.__hash_names[table] = names[0]
+        self.__tables = {}
+        self.__lock = threading.Lock()
+
+    def throttled(self, action):
+        """
+        Record that ``action`` was throttled.
+        """
+        payload = action.payload
+        name = action.name
+        with self.__lock:
+            if name in ("GetItem", "DeleteItem", "UpdateItem"):
+                self.__record_key(payload["TableName"], payload["Key"])
+            elif name == "PutItem":
+                self.__record_item(payload["TableName"], payload["Item"])
+            elif name == "Query":
+                self.__record_query(payload)
+            elif name == "BatchGetItem":
+                self.__record_batch_get(payload["RequestItems"])
+            elif name == "BatchWriteItem":
+                self.__record_batch_write(payload["RequestItems"])
+            elif "TableName" in payload:
+                self.__record(payload["TableName"], None)
+
+    def unprocessed(self, response):
+        """
+        Record the unprocessed keys or items of a :class:`.BatchGetItemResponse` or :class:`.BatchWriteItemResponse`.
+        """
+        unprocessed_keys = getattr(response, "unprocessed_keys", None)
+        unprocessed_items = getattr(response, "unprocessed_items", None)
+        if unprocessed_keys or unprocessed_items:
+            with self.__lock:
+                if isinstance(unprocessed_keys, dict):
+                    self.__record_batch_get(unprocessed_keys)
+                if isinstance(unprocessed_items, dict):
+                    self.__record_batch_write(unprocessed_items)
+
+    def report(self, n=10):
+        """
+        Return a dict of table names to dicts describing their throttles:
+        ``"throttles"`` is the number of recorded throttles (each key of batch actions counts for one),
+        ``"unattributed"`` the number of throttles whose key is unknown,
+        and ``"keys"``, ``"partitions"`` and ``"prefixes"`` are lists of the ``n`` most throttled :class:`HotKey`.
+        """
+        with self.__lock:
+            return {
+                name: {
+                    "throttles": table.throttles,
+                    "unattributed": table.unattributed,
+                    "keys": [HotKey(dict(key), count, error) for key, (count, error) in table.keys.top(n)],
+                    "partitions": [HotKey(dict(key), count, error) for key, (count, error) in table.partitions.top(n)],
+                    "prefixes": [HotKey(prefix, count, error) for prefix, (count, error) in table.prefixes.top(n)],
+                }
+                for name, table in self.__tables.items()
+            }
+
+    def reset(self):
+        """
+        Forget all recorded throttles (but not the learned key attributes).
+        """
+        with self.__lock:
+            self.__tables = {}
+
+    def __record_key(self, table, key):
+        self.__key_names.setdefault(table, set(key.keys()))
+        self.__record(table, key)
+
+    def __record_item(self, table, item):
+        names = self.__key_names.get(table)
+        if names is None or not names.issubset(item.keys()):
+            self.__record(table, None)
+        else:
+            self.__record(table, {name: item[name] for name in names})
+
+    def __record_query(self, payload):
+        table = payload["TableName"]
+        conditions = payload.get("KeyConditions", {})
+        # A Query always has an EQ condition on the hash key, and maybe a condition on the range key
+        equalities = [name for name, condition in conditions.items() if condition["ComparisonOperator"] == "EQ"]
+        if len(equalities) == 2:
+            hash_name = self.__hash_names.get(table) if "IndexName" not in payload else None
+            equalities = [hash_name] if hash_name in equalities else []
+        elif len(equalities) == 1 and "IndexName" not in payload:
+            self.__hash_names.setdefault(table, equalities[0])
+        if equalities:
+            name = equalities[0]
+            self.__record(table, {name: conditions[name]["AttributeValueList"][0]}, partition_only=True)
+        else:
+            self.__record(table, None)
+
+    def __record_batch_get(self, request_items):
+        for table, request in request_items.items():
+            for key in request.get("Keys", []):
+                self.__record_key(table, key)
+
+    def __record_batch_write(self, request_items):
+        for table, requests in request_items.items():
+            for request in requests:
+                if "DeleteRequest" in request:
+                    self.__record_key(table, request["DeleteRequest"]["Key"])
+                else:
+                    self.__record_item(table, request["PutRequest"]["Item"])
+
+    def __record(self, name, key, partition_only=False):
+        table = self.__tables.get(name)
+        if table is None:
+            table = self.__tables[name] = _Table(self.__capacity)
+        table.throttles += 1
+        if key is None:
+            table.unattributed += 1
+            return
+
+        key = _convert_db_to_dict(key)
+        if not partition_only:
+            table.keys.add(tuple(sorted(key.items())))
+        if len(key) == 1:
+            hash_name, = key.keys()
+        else:
+            hash_name = self.__hash_names.get(name)
+        if hash_name in key:
+            table.partitions.add(((hash_name, key[hash_name]),))
+            self.__record_prefixes(table, key[hash_name])
+
+    def __record_prefixes(self, table, value):
+        if self.__separator is not None and isinstance(value, str):
+            position = value.find(self.__separator)
+            while position != -1:
+                table.prefixes.add(value[:position + len(self.__separator)])
+                position = value.find(self.__separator, position + 1)
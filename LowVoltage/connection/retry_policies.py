@@ -21,9 +21,6 @@ Retry policies decide if it's worth retrying and how long to wait.
         :type: ``None`` or number (in seconds)
 """
 
-import LowVoltage as _lv
-import LowVoltage.testing as _tst
-
 
 class ExponentialBackoffRetryPolicy(object):
     """
@@ -59,33 +56,3 @@ FAIL_FAST = ExponentialBackoffRetryPolicy(1, 1, 0)
 """
 A retry policy that never retries anything.
 """
-
-
-class ExponentialBackoffRetryPolicyUnitTests(_tst.UnitTests):
-    def setUp(self):
-        self.policy = ExponentialBackoffRetryPolicy(1, 3, 3)
-        super(ExponentialBackoffRetryPolicyUnitTests, self).setUp()
-
-    def test_wait_after_first_failure(self):
-        self.assertEqual(
-            self.policy.retry(object(), [_lv.ServerError()]),
-            1
-        )
-
-    def test_wait_after_second_failure(self):
-        self.assertEqual(
-            self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError()]),
-            3
-        )
-
-    def test_wait_after_third_failure(self):
-        self.assertEqual(
-            self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError(), _lv.ServerError()]),
-            9
-        )
-
-    def test_give_up_after_fourth_failure(self):
-        self.assertIsNone(self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError(), _lv.ServerError(), _lv.ServerError()]))
-
-    def test_repr(self):
-        self.assertEqual(repr(self.policy), "ExponentialBackoffRetryPolicy(1, 3, 3)")
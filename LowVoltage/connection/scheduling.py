@@ -0,0 +1,112 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A :class:`SchedulingConnection` shares a :class:`.Connection` between foreground and background work,
+so that background compounds yield to foreground actions.
+
+>>> scheduling_connection = SchedulingConnection(connection, max_in_flight=8, reserved=2)
+>>> backfill = scheduling_connection.lane("low", tenant="backfill")
+>>> backfill(GetItem(table, {"h": 1})).item
+{'h': 1, 'gr': 8, 'gh': 1}
+>>> scheduling_connection(GetItem(table, {"h": 0})).item
+{'h': 0, 'gr': 10, 'gh': 0}
+"""
+
+import functools
+import heapq
+import itertools
+import threading
+
+
+_PRIORITIES = {"high": 0, "low": 1}
+
+
+class SchedulingConnection(object):
+    """
+    Wrap a :class:`.Connection` and limit the number of actions in flight, choosing which waiting action to send next.
+
+    Each action is sent with a ``priority`` (``"high"`` or ``"low"``) and a ``tenant`` (any hashable, ``None`` by default).
+    Waiting ``"high"`` actions are always sent before ``"low"`` ones, and ``reserved`` of the ``max_in_flight`` slots are
+    kept for ``"high"`` actions, so that they don't wait for slow ``"low"`` actions to finish.
+    Within a priority, tenants share the slots by weighted fair queuing:
+    a tenant with weight 2 (in ``weights``, 1 by default) sends twice as many actions as a busy tenant with weight 1.
+
+    Pass :meth:`lane` to compounds to tag all their actions.
+
+    :param connection: the :class:`.Connection` to wrap.
+    :param max_in_flight: the maximum number of actions sent concurrently.
+    :param reserved: the number of slots that ``"low"`` actions can't use. Less than ``max_in_flight``.
+    :param weights: a dict associating tenants to their weights.
+    """
+
+    def __init__(self, connection, max_in_flight=10, reserved=2, weights=None):
+        if not 0 <= reserved < max_in_flight:
+            raise ValueError("reserved must be between 0 and max_in_flight - 1")
+        self.__connection = connection
+        self.__max_in_flight = max_in_flight
+        self.__reserved = reserved
+        self.__weights = dict(weights or {})
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__virtual_times = {rank: 0. for rank in _PRIORITIES.values()}
+        self.__finish_tags = {}
+
+    @property
+    def waiting(self):
+        """
+        The number of actions waiting to be sent.
+
+        :type: int
+        """
+        with self.__lock:
+            return len(self.__queue)
+
+    def __call__(self, action, priority="high", tenant=None):
+        """
+        Wait for the turn of the action, send it and return its response.
+        """
+        rank = _rank(priority)
+        turn = threading.Event()
+        with self.__lock:
+            # Weighted fair queuing: each action costs 1 / weight of virtual time to its tenant
+            start = max(self.__virtual_times[rank], self.__finish_tags.get((rank, tenant), 0.))
+            finish = start + 1. / self.__weights.get(tenant, 1)
+            self.__finish_tags[(rank, tenant)] = finish
+            heapq.heappush(self.__queue, (rank, finish, next(self.__sequence), start, turn))
+            self.__dispatch()
+        turn.wait()
+        try:
+            return self.__connection(action)
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__dispatch()
+
+    def lane(self, priority="high", tenant=None):
+        """
+        Return a callable that can be used like a :class:`.Connection` to send actions with this ``priority`` and ``tenant``.
+        """
+        _rank(priority)
+        return functools.partial(self, priority=priority, tenant=tenant)
+
+    def __dispatch(self):
+        while len(self.__queue) != 0:
+            rank, finish, sequence, start, turn = self.__queue[0]
+            limit = self.__max_in_flight if rank == _PRIORITIES["high"] else self.__max_in_flight - self.__reserved
+            if self.__in_flight >= limit:
+                break
+            heapq.heappop(self.__queue)
+            self.__in_flight += 1
+            # Start-time fair queuing: virtual time is the start tag of the last action sent
+            self.__virtual_times[rank] = max(self.__virtual_times[rank], start)
+            turn.set()
+
+
+def _rank(priority):
+    if priority not in _PRIORITIES:
+        raise ValueError("priority must be 'high' or 'low'")
+    return _PRIORITIES[priority]
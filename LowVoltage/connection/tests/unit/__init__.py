@@ -0,0 +1,12 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .test_batching import BatchingConnectionUnitTests, BatchingConnectionConcurrencyUnitTests
+from .test_caching import CachingConnectionUnitTests, CachingConnectionPagesUnitTests, CachingConnectionConcurrencyUnitTests
+from .test_connection import ConnectionUnitTests, SignerUnitTests, ResponderUnitTests
+from .test_credentials import StaticCredentialsUnitTests, Ec2RoleCredentialsUnitTests
+from .test_retry_policies import ExponentialBackoffRetryPolicyUnitTests
+from .test_hot_keys import SpaceSavingUnitTests, HotKeyTrackerUnitTests
+from .test_autoscaling import CapacityMonitorUnitTests, AutoscalerUnitTests
+from .test_scheduling import SchedulingConnectionUnitTests
@@ -0,0 +1,206 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.connection.autoscaling import CapacityMonitor, Autoscaler, ScalingDecision, Usage
+from LowVoltage.stand_in import Database, FaultInjector, Server
+
+
+class CapacityMonitorUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(CapacityMonitorUnitTests, self).setUp()
+        self.monitor = CapacityMonitor()
+
+    def test_record_and_collect(self):
+        self.monitor.record("Aaa", "read", 2.)
+        self.monitor.record("Aaa", "read", 1.5, 1)
+        self.monitor.record("Aaa", "write", throttles=2, index="gsi")
+        self.assertEqual(self.monitor.collect(), {("Aaa", None, "read"): Usage(3.5, 1), ("Aaa", "gsi", "write"): Usage(0., 2)})
+        self.assertEqual(self.monitor.collect(), {})
+
+    def test_throttled(self):
+        self.monitor.throttled(_lv.GetItem("Aaa", {"h": 0}))
+        self.monitor.throttled(_lv.Query("Aaa").index_name("gsi").key_eq("gh", 0))
+        self.monitor.throttled(_lv.BatchWriteItem().table("Aaa").delete({"h": 0}).table("Bbb").delete({"h": 0}))
+        self.monitor.throttled(_lv.DescribeTable("Aaa"))
+        self.assertEqual(self.monitor.collect(), {
+            ("Aaa", None, "read"): Usage(0., 1),
+            ("Aaa", "gsi", "read"): Usage(0., 1),
+            ("Aaa", None, "write"): Usage(0., 1),
+            ("Bbb", None, "write"): Usage(0., 1),
+        })
+
+    def test_total_consumed_capacity(self):
+        self.monitor.responded(_lv.GetItem("Aaa", {"h": 0}), _lv.GetItemResponse(ConsumedCapacity={"TableName": "Aaa", "CapacityUnits": 0.5}))
+        self.monitor.responded(_lv.Query("Aaa").index_name("gsi"), _lv.QueryResponse(ConsumedCapacity={"TableName": "Aaa", "CapacityUnits": 2.}))
+        self.monitor.responded(_lv.PutItem("Aaa", {"h": 0}), _lv.PutItemResponse())
+        self.assertEqual(self.monitor.collect(), {("Aaa", None, "read"): Usage(0.5, 0), ("Aaa", "gsi", "read"): Usage(2., 0)})
+
+    def test_indexes_consumed_capacity(self):
+        self.monitor.responded(
+            _lv.PutItem("Aaa", {"h": 0}),
+            _lv.PutItemResponse(ConsumedCapacity={"TableName": "Aaa", "CapacityUnits": 3., "Table": {"CapacityUnits": 1.}, "GlobalSecondaryIndexes": {"gsi": {"CapacityUnits": 2.}}}),
+        )
+        self.assertEqual(self.monitor.collect(), {("Aaa", None, "write"): Usage(1., 0), ("Aaa", "gsi", "write"): Usage(2., 0)})
+
+    def test_batch_responses(self):
+        self.monitor.responded(
+            _lv.BatchWriteItem().table("Aaa").delete({"h": 0}, {"h": 1}),
+            _lv.BatchWriteItemResponse(
+                ConsumedCapacity=[{"TableName": "Aaa", "CapacityUnits": 1.}],
+                UnprocessedItems={"Aaa": [{"DeleteRequest": {"Key": {"h": {"N": "1"}}}}]},
+            ),
+        )
+        self.monitor.responded(_lv.BatchGetItem().table("Bbb").keys({"h": 0}), _lv.BatchGetItemResponse(UnprocessedKeys={"Bbb": {"Keys": [{"h": {"N": "0"}}]}}))
+        self.assertEqual(self.monitor.collect(), {("Aaa", None, "write"): Usage(1., 1), ("Bbb", None, "read"): Usage(0., 1)})
+
+    def test_connection(self):
+        monitor = CapacityMonitor()
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with Server(FaultInjector(database, throttling=1, actions=["GetItem"])) as server:
+            connection = server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 1), capacity_monitor=monitor)
+            connection(_lv.PutItem("Aaa", {"h": 0}).return_consumed_capacity_total())
+            with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+                connection(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(monitor.collect(), {("Aaa", None, "write"): Usage(1., 0), ("Aaa", None, "read"): Usage(0., 2)})
+
+    def test_payload(self):
+        self.assertEqual(self.monitor.payload(_lv.GetItem("Aaa", {"h": 0})), {"TableName": "Aaa", "Key": {"h": {"N": "0"}}, "ReturnConsumedCapacity": "INDEXES"})
+        self.assertEqual(self.monitor.payload(_lv.PutItem("Aaa", {"h": 0}).return_consumed_capacity_total())["ReturnConsumedCapacity"], "TOTAL")
+        self.assertEqual(self.monitor.payload(_lv.DescribeTable("Aaa")), {"TableName": "Aaa"})
+
+    def test_connection_requests_consumed_capacity(self):
+        monitor = CapacityMonitor()
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with Server(database) as server:
+            connection = server.connection(capacity_monitor=monitor)
+            _lv.batch_put_item(connection, "Aaa", ({"h": i} for i in range(3)))
+            connection(_lv.GetItem("Aaa", {"h": 0}).consistent_read_true())
+        self.assertEqual(monitor.collect(), {("Aaa", None, "write"): Usage(3., 0), ("Aaa", None, "read"): Usage(1., 0)})
+
+
+class AutoscalerUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(AutoscalerUnitTests, self).setUp()
+        self.database = Database()
+        self.database._Database__now = lambda: 1234567890.5
+        self.database(
+            _lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(10, 10)
+                .global_secondary_index("gsi").hash_key("gh", _lv.NUMBER).project_all().provisioned_throughput(10, 10)
+        )
+        self.monitor = CapacityMonitor()
+        self.autoscaler = Autoscaler(self.database, self.monitor, ["Aaa"], max_units=100, scale_down_periods=2)
+
+    def throughput(self, index=None):
+        table = self.database(_lv.DescribeTable("Aaa")).table
+        if index is None:
+            throughput = table.provisioned_throughput
+        else:
+            throughput, = [gsi.provisioned_throughput for gsi in table.global_secondary_indexes if gsi.index_name == index]
+        return (throughput.read_capacity_units, throughput.write_capacity_units)
+
+    def test_stable(self):
+        self.monitor.record("Aaa", "read", 50.)
+        self.monitor.record("Aaa", "write", 80.)
+        self.assertEqual(self.autoscaler.step(elapsed=10), [])
+        self.assertEqual(self.throughput(), (10, 10))
+
+    def test_high_utilization(self):
+        self.monitor.record("Aaa", "read", 95.)
+        self.assertEqual(self.autoscaler.step(elapsed=10), [ScalingDecision("Aaa", None, "read", 10, 14, "high utilization", True)])
+        self.assertEqual(self.throughput(), (14, 10))
+
+    def test_throttled(self):
+        self.monitor.record("Aaa", "write", 50., 1, index="gsi")
+        self.assertEqual(self.autoscaler.step(elapsed=10), [ScalingDecision("Aaa", "gsi", "write", 10, 20, "throttled", True)])
+        self.assertEqual(self.throughput("gsi"), (10, 20))
+        self.assertEqual(self.throughput(), (10, 10))
+
+    def test_max_units(self):
+        self.monitor.record("Aaa", "read", 10000.)
+        self.assertEqual(self.autoscaler.step(elapsed=10)[0].target, 100)
+
+    def test_low_utilization(self):
+        self.assertEqual(self.autoscaler.step(elapsed=10), [])
+        self.monitor.record("Aaa", "read", 7.)
+        self.assertEqual(self.autoscaler.step(elapsed=10), [
+            ScalingDecision("Aaa", None, "read", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", None, "write", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", "gsi", "read", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", "gsi", "write", 10, 1, "low utilization", True),
+        ])
+        self.assertEqual(self.throughput(), (1, 1))
+        self.assertEqual(self.throughput("gsi"), (1, 1))
+
+    def test_low_utilization_must_last(self):
+        self.assertEqual(self.autoscaler.step(elapsed=10), [])
+        self.monitor.record("Aaa", "read", 50.)
+        self.assertEqual(self.autoscaler.step(elapsed=10), [
+            ScalingDecision("Aaa", None, "write", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", "gsi", "read", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", "gsi", "write", 10, 1, "low utilization", True),
+        ])
+        self.assertEqual(self.autoscaler.step(elapsed=10), [])
+        self.assertEqual(self.autoscaler.step(elapsed=10), [ScalingDecision("Aaa", None, "read", 10, 1, "low utilization", True)])
+
+    def test_decreases_per_day(self):
+        for i in range(4):
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(20, 20))
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(10, 10))
+        autoscaler = Autoscaler(self.database, self.monitor, ["Aaa"], scale_down_periods=1)
+        self.monitor.record("Aaa", "read", 200.)
+        # The table's increase is kept but its decrease is cancelled, and the GSI is decreased
+        self.assertEqual(autoscaler.step(elapsed=10), [
+            ScalingDecision("Aaa", None, "read", 10, 29, "high utilization", True),
+            ScalingDecision("Aaa", "gsi", "read", 10, 1, "low utilization", True),
+            ScalingDecision("Aaa", "gsi", "write", 10, 1, "low utilization", True),
+        ])
+        self.assertEqual(self.throughput(), (29, 10))
+
+    def test_dry_run(self):
+        autoscaler = Autoscaler(self.database, self.monitor, ["Aaa"], dry_run=True)
+        self.monitor.record("Aaa", "read", 1000.)
+        self.assertEqual(autoscaler.step(elapsed=10), [ScalingDecision("Aaa", None, "read", 10, 143, "high utilization", False)])
+        self.assertEqual(self.throughput(), (10, 10))
+
+    def test_lsi_capacity_goes_to_table(self):
+        self.monitor.record("Aaa", "read", 200., index="lsi")
+        self.assertEqual(self.autoscaler.step(elapsed=10)[0][:5], ("Aaa", None, "read", 10, 29))
+
+    def test_elapsed(self):
+        now = [100.]
+        self.autoscaler._Autoscaler__now = lambda: now[0]
+        self.autoscaler.step()
+        now[0] = 110.
+        self.monitor.record("Aaa", "read", 200.)
+        self.assertEqual(self.autoscaler.step()[0].target, 29)
+
+    def test_wait_for_activation(self):
+        statuses = []
+
+        def connection(action):
+            if action.name == "UpdateTable":
+                statuses.extend(["UPDATING", "UPDATING", "ACTIVE"])
+            if action.name == "DescribeTable" and statuses:
+                return _lv.DescribeTableResponse(Table={"TableName": "Aaa", "TableStatus": statuses.pop(0)})
+            return self.database(action)
+
+        sleeps = []
+        autoscaler = Autoscaler(connection, self.monitor, ["Aaa"], poll_interval=5)
+        autoscaler._Autoscaler__sleep = sleeps.append
+        self.monitor.record("Aaa", "read", 95.)
+        autoscaler.step(elapsed=10)
+        self.assertEqual(sleeps, [5, 5])
+        self.assertEqual(self.throughput(), (14, 10))
+
+    def test_limit_exceeded(self):
+        for i in range(4):
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(20, 20))
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(10, 10))
+        # The decrease was decided before another process used the last decreases of the day
+        autoscaler = Autoscaler(self.database, self.monitor, ["Aaa"], decreases_per_day=5, scale_down_periods=1)
+        self.assertEqual(autoscaler.step(elapsed=10)[0], ScalingDecision("Aaa", None, "read", 10, 1, "low utilization", False))
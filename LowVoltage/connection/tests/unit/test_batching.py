@@ -0,0 +1,178 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.connection.batching import BatchingConnection
+
+
+class BatchingConnectionUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(BatchingConnectionUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.retry_policy = self.mocks.create("retry_policy")
+        self.sleep = self.mocks.replace("time.sleep")
+        self.batching_connection = BatchingConnection(self.connection.object, window=0, retry_policy=self.retry_policy.object)
+
+    def test_other_actions_are_sent_as_is(self):
+        action = _lv.PutItem("Aaa", {"h": "a"})
+        self.connection.expect._call_(action).andReturn("r")
+
+        self.assertEqual(self.batching_connection(action), "r")
+
+    def test_get_item_with_consumed_capacity_is_sent_as_is(self):
+        action = _lv.GetItem("Aaa", {"h": "a"}).return_consumed_capacity_total()
+        self.connection.expect._call_(action).andReturn("r")
+
+        self.assertEqual(self.batching_connection(action), "r")
+
+    def test_get_item(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}], "ConsistentRead": True}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "a"}, "x": {"N": "42"}}]})
+        )
+
+        self.assertEqual(self.batching_connection(_lv.GetItem("Aaa", {"h": "a"}).consistent_read_true()).item, {"h": "a", "x": 42})
+
+    def test_missing_item(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": []})
+        )
+
+        self.assertIsNone(self.batching_connection(_lv.GetItem("Aaa", {"h": "a"})).item)
+
+    def test_projection_includes_key(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {
+                "Keys": [{"h": {"S": "a"}, "r": {"N": "0"}}],
+                "ProjectionExpression": "#p, r, #lvkey0, #lvkey1",
+                "ExpressionAttributeNames": {"#p": "x", "#lvkey0": "h", "#lvkey1": "r"},
+            }}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "a"}, "r": {"N": "0"}, "x": {"N": "42"}}]})
+        )
+
+        self.assertEqual(
+            self.batching_connection(_lv.GetItem("Aaa", {"h": "a", "r": 0}).expression_attribute_name("p", "x").project("#p", "r")).item,
+            {"r": 0, "x": 42}
+        )
+
+    def test_unprocessed_key(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(UnprocessedKeys={"Aaa": {"Keys": [{"h": {"S": "a"}}]}})
+        )
+        self.retry_policy.expect.retry.withArguments(
+            lambda args, kwds: len(args[1]) == 1 and isinstance(args[1][0], _lv.ProvisionedThroughputExceededException)
+        ).andReturn(3)
+        self.sleep.expect(3)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"S": "a"}}]})
+        )
+
+        self.assertEqual(self.batching_connection(_lv.GetItem("Aaa", {"h": "a"})).item, {"h": "a"})
+
+    def test_give_up_after_unprocessed_key(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(UnprocessedKeys={"Aaa": {"Keys": [{"h": {"S": "a"}}]}})
+        )
+        self.retry_policy.expect.retry.withArguments(lambda args, kwds: len(args[1]) == 1).andReturn(None)
+
+        with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+            self.batching_connection(_lv.GetItem("Aaa", {"h": "a"}))
+
+    def test_error(self):
+        exception = _lv.ValidationException()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"S": "a"}}]}}})
+        ).andRaise(
+            exception
+        )
+
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.batching_connection(_lv.GetItem("Aaa", {"h": "a"}))
+        self.assertIs(catcher.exception, exception)
+
+
+class BatchingConnectionConcurrencyUnitTests(_tst.UnitTests):
+    class Connection(object):
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.actions = []
+
+        def __call__(self, action):
+            request_items = action.payload["RequestItems"]
+            with self.lock:
+                self.actions.append(request_items)
+            return _lv.BatchGetItemResponse(Responses={
+                table: [dict(key, t={"S": table}) for key in request["Keys"] if key["h"]["N"] != "0"]
+                for table, request in request_items.items()
+            })
+
+    def get_concurrently(self, batching_connection, actions):
+        responses = [None] * len(actions)
+
+        def get(i):
+            responses[i] = batching_connection(actions[i])
+
+        threads = [threading.Thread(target=get, args=(i,)) for i in range(len(actions))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [r.item for r in responses]
+
+    def test_coalesce(self):
+        connection = self.Connection()
+        items = self.get_concurrently(BatchingConnection(connection, window=10, max_keys=10), [_lv.GetItem("Aaa", {"h": i % 8}) for i in range(10)])
+        self.assertEqual(items, [None if i % 8 == 0 else {"h": i % 8, "t": "Aaa"} for i in range(10)])
+        self.assertEqual(len(connection.actions), 1)
+        self.assertEqual(len(connection.actions[0]["Aaa"]["Keys"]), 8)
+
+    def test_incompatible_options(self):
+        connection = self.Connection()
+        items = self.get_concurrently(
+            BatchingConnection(connection, window=10, max_keys=4),
+            [
+                _lv.GetItem("Aaa", {"h": 1}),
+                _lv.GetItem("Aaa", {"h": 2}).consistent_read_true(),
+                _lv.GetItem("Bbb", {"h": 3}),
+                _lv.GetItem("Aaa", {"h": 4}),
+            ]
+        )
+        self.assertEqual(items, [{"h": 1, "t": "Aaa"}, {"h": 2, "t": "Aaa"}, {"h": 3, "t": "Bbb"}, {"h": 4, "t": "Aaa"}])
+        self.assertEqual(len(connection.actions), 2)
+
+    def test_unexpected_exception(self):
+        def connection(action):
+            # Items without their key attributes can't be matched with the GetItems
+            return _lv.BatchGetItemResponse(Responses={"Aaa": [{"x": {"N": "42"}} for key in action.payload["RequestItems"]["Aaa"]["Keys"]]})
+
+        batching_connection = BatchingConnection(connection, window=10, max_keys=3)
+        errors = []
+
+        def get(i):
+            try:
+                batching_connection(_lv.GetItem("Aaa", {"h": i}))
+            except KeyError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(errors), 3)
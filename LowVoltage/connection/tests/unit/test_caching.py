@@ -0,0 +1,279 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.actions.conversion import _convert_dict_to_db
+from LowVoltage.connection.caching import CachingConnection
+
+
+class CachingConnectionUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(CachingConnectionUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.caching_connection = CachingConnection(self.connection.object, max_items=3, ttl=60, table_ttls={"Bbb": 10})
+        self.now = 0
+        self.caching_connection._CachingConnection__now = lambda: self.now
+
+    def expect_get_item(self, key, item, **options):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("GetItem", dict({"TableName": "Aaa", "Key": _convert_dict_to_db(key)}, **options))
+        ).andReturn(
+            _lv.GetItemResponse(Item=None if item is None else _convert_dict_to_db(item))
+        )
+
+    def get_item(self, key, table="Aaa"):
+        return self.caching_connection(_lv.GetItem(table, key)).item
+
+    def test_other_actions_are_sent_as_is(self):
+        action = _lv.Query("Aaa")
+        self.connection.expect._call_(action).andReturn("r")
+        self.assertEqual(self.caching_connection(action), "r")
+
+    def test_get_item_twice(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1})
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1})
+        self.assertEqual((self.caching_connection.hits, self.caching_connection.misses), (1, 1))
+
+    def test_ttl(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 2})
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1})
+        self.now = 59
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1})
+        self.now = 60
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+
+    def test_table_ttl(self):
+        self.connection.expect._call_.withArguments(lambda args, kwds: args[0].payload["TableName"] == "Bbb").andReturn(_lv.GetItemResponse(Item={"h": {"N": "0"}}))
+        self.connection.expect._call_.withArguments(lambda args, kwds: args[0].payload["TableName"] == "Bbb").andReturn(_lv.GetItemResponse(Item={"h": {"N": "0"}}))
+        self.get_item({"h": 0}, "Bbb")
+        self.now = 10
+        self.get_item({"h": 0}, "Bbb")
+
+    def test_lru(self):
+        for i in range(4):
+            self.expect_get_item({"h": i}, {"h": i})
+        self.expect_get_item({"h": 1}, {"h": 1})
+        for i in [0, 1, 2, 0, 3, 0, 1]:
+            self.assertEqual(self.get_item({"h": i}), {"h": i})
+        self.assertEqual((self.caching_connection.hits, self.caching_connection.misses), (2, 5))
+
+    def test_missing_item(self):
+        self.expect_get_item({"h": 0}, None)
+        self.assertIsNone(self.get_item({"h": 0}))
+        self.assertIsNone(self.get_item({"h": 0}))
+
+    def test_missing_item_not_cached(self):
+        self.caching_connection = CachingConnection(self.connection.object, cache_missing=False)
+        self.expect_get_item({"h": 0}, None)
+        self.expect_get_item({"h": 0}, None)
+        self.assertIsNone(self.get_item({"h": 0}))
+        self.assertIsNone(self.get_item({"h": 0}))
+
+    def test_consistent_read_is_not_served_from_cache(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 2}, ConsistentRead=True)
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1})
+        self.assertEqual(self.caching_connection(_lv.GetItem("Aaa", {"h": 0}).consistent_read_true()).item, {"h": 0, "a": 2})
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+
+    def test_projection_is_not_cached(self):
+        self.expect_get_item({"h": 0}, {"a": 1}, ProjectionExpression="a")
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1, "b": 2})
+        self.assertEqual(self.caching_connection(_lv.GetItem("Aaa", {"h": 0}).project("a")).item, {"a": 1})
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 1, "b": 2})
+
+    def test_batch_get_item(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.expect_get_item({"h": 1}, None)
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": "2"}}, {"h": {"N": "3"}}, {"h": {"N": "4"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": "2"}}]}, UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": "4"}}]}})
+        )
+        self.get_item({"h": 0})
+        self.get_item({"h": 1})
+
+        r = self.caching_connection(_lv.BatchGetItem("Aaa", [{"h": i} for i in range(5)]))
+        self.assertEqual(sorted(item["h"] for item in r.responses["Aaa"]), [0, 2])
+        self.assertEqual(r.unprocessed_keys, {"Aaa": {"Keys": [{"h": {"N": "4"}}]}})
+
+        r = self.caching_connection(_lv.BatchGetItem("Aaa", [{"h": i} for i in range(1, 4)]))
+        self.assertEqual(sorted(item["h"] for item in r.responses["Aaa"]), [2])
+
+    def test_put_item_updates_cached_item(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.connection.expect._call_.withArguments(self.ActionChecker("PutItem", {"TableName": "Aaa", "Item": {"h": {"N": "0"}, "a": {"N": "2"}}})).andReturn(_lv.PutItemResponse())
+        self.get_item({"h": 0})
+        self.caching_connection(_lv.PutItem("Aaa", {"h": 0, "a": 2}))
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+
+    def test_failed_put_item_invalidates_cached_item(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andRaise(_lv.NetworkError())
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 2})
+        self.get_item({"h": 0})
+        with self.assertRaises(_lv.NetworkError):
+            self.caching_connection(_lv.PutItem("Aaa", {"h": 0, "a": 2}))
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+
+    def test_delete_item_caches_missing_item(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.DeleteItemResponse())
+        self.get_item({"h": 0})
+        self.caching_connection(_lv.DeleteItem("Aaa", {"h": 0}))
+        self.assertIsNone(self.get_item({"h": 0}))
+
+    def test_update_item_invalidates_cached_item(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.UpdateItemResponse())
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 2})
+        self.get_item({"h": 0})
+        self.caching_connection(_lv.UpdateItem("Aaa", {"h": 0}).set("a", "v").expression_attribute_value("v", 2))
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+
+    def test_batch_write_item_invalidates_cached_items(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.expect_get_item({"h": 1}, {"h": 1, "a": 1})
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.BatchWriteItemResponse())
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 2})
+        self.expect_get_item({"h": 1}, None)
+        self.get_item({"h": 0})
+        self.get_item({"h": 1})
+        self.caching_connection(_lv.BatchWriteItem().table("Aaa").put({"h": 0, "a": 2}).delete({"h": 1}))
+        self.assertEqual(self.get_item({"h": 0}), {"h": 0, "a": 2})
+        self.assertIsNone(self.get_item({"h": 1}))
+
+    def test_invalidate_table(self):
+        self.expect_get_item({"h": 0}, {"h": 0, "a": 1})
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.DeleteTableResponse())
+        self.expect_get_item({"h": 0}, None)
+        self.get_item({"h": 0})
+        self.caching_connection(_lv.DeleteTable("Aaa"))
+        self.assertIsNone(self.get_item({"h": 0}))
+
+
+class CachingConnectionPagesUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(CachingConnectionPagesUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.caching_connection = CachingConnection(self.connection.object, ttl=60, max_pages=2)
+        self.now = 0
+        self.caching_connection._CachingConnection__now = lambda: self.now
+
+    def expect_query(self, hash_key):
+        r = _lv.QueryResponse(Items=[{"h": {"N": str(hash_key)}}])
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Query", {"TableName": "Aaa", "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": str(hash_key)}]}}})
+        ).andReturn(r)
+        return r
+
+    def query(self, hash_key):
+        return self.caching_connection(_lv.Query("Aaa").key_eq("h", hash_key))
+
+    def test_query_twice(self):
+        r = self.expect_query(0)
+        self.assertIs(self.query(0), r)
+        self.assertIs(self.query(0), r)
+        self.assertEqual((self.caching_connection.page_hits, self.caching_connection.page_misses), (1, 1))
+
+    def test_scan_with_exclusive_start_key(self):
+        r1 = _lv.ScanResponse(LastEvaluatedKey={"h": {"N": "0"}})
+        r2 = _lv.ScanResponse()
+        self.connection.expect._call_.withArguments(self.ActionChecker("Scan", {"TableName": "Aaa"})).andReturn(r1)
+        self.connection.expect._call_.withArguments(self.ActionChecker("Scan", {"TableName": "Aaa", "ExclusiveStartKey": {"h": {"N": "0"}}})).andReturn(r2)
+        for i in range(2):
+            self.assertIs(self.caching_connection(_lv.Scan("Aaa")), r1)
+            self.assertIs(self.caching_connection(_lv.Scan("Aaa").exclusive_start_key({"h": 0})), r2)
+
+    def test_ttl_and_size(self):
+        self.expect_query(0)
+        self.expect_query(1)
+        self.expect_query(2)
+        self.expect_query(0)
+        self.expect_query(2)
+        self.query(0)
+        self.query(1)
+        self.query(2)
+        self.query(0)
+        self.now = 60
+        self.query(2)
+
+    def test_consistent_read_is_not_cached(self):
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.QueryResponse())
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.QueryResponse())
+        self.caching_connection(_lv.Query("Aaa").key_eq("h", 0).consistent_read_true())
+        self.caching_connection(_lv.Query("Aaa").key_eq("h", 0).consistent_read_true())
+
+    def test_write_invalidates_pages_of_table(self):
+        self.expect_query(0)
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.ScanResponse())
+        self.connection.expect._call_.withArguments(lambda args, kwds: True).andReturn(_lv.PutItemResponse())
+        self.expect_query(0)
+        self.query(0)
+        self.caching_connection(_lv.Scan("Bbb"))
+        self.caching_connection(_lv.PutItem("Aaa", {"h": 0}))
+        self.query(0)
+        self.caching_connection(_lv.Scan("Bbb"))
+
+    def test_invalidate_table(self):
+        self.expect_query(0)
+        self.expect_query(0)
+        self.query(0)
+        self.caching_connection.invalidate("Aaa")
+        self.query(0)
+
+
+class CachingConnectionConcurrencyUnitTests(_tst.UnitTests):
+    class Connection(object):
+        # Reads return the item as it was when they started, after waiting for "proceed"
+        def __init__(self):
+            self.item = {"h": {"N": "0"}, "a": {"N": "1"}}
+            self.reading = threading.Event()
+            self.proceed = threading.Event()
+            self.proceed.set()
+
+        def __call__(self, action):
+            item = self.item
+            if action.name == "PutItem":
+                self.item = action.payload["Item"]
+                return _lv.PutItemResponse()
+            self.reading.set()
+            self.proceed.wait()
+            if action.name == "GetItem":
+                return _lv.GetItemResponse(Item=item)
+            elif action.name == "Query":
+                return _lv.QueryResponse(Items=[item])
+            else:
+                return _lv.BatchGetItemResponse(Responses={"Aaa": [item]})
+
+    def setUp(self):
+        super(CachingConnectionConcurrencyUnitTests, self).setUp()
+        self.connection = self.Connection()
+        self.caching_connection = CachingConnection(self.connection, max_pages=10)
+
+    def read_during_put(self, read):
+        self.connection.proceed.clear()
+        thread = threading.Thread(target=read)
+        thread.start()
+        self.assertTrue(self.connection.reading.wait(1))
+        self.caching_connection(_lv.PutItem("Aaa", {"h": 0, "a": 2}))
+        self.connection.proceed.set()
+        thread.join()
+
+    def test_get_item_overlapping_put_item_is_not_cached(self):
+        self.read_during_put(lambda: self.caching_connection(_lv.GetItem("Aaa", {"h": 0})))
+        self.assertEqual(self.caching_connection(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0, "a": 2})
+
+    def test_batch_get_item_overlapping_put_item_is_not_cached(self):
+        self.read_during_put(lambda: self.caching_connection(_lv.BatchGetItem().table("Aaa").keys({"h": 0})))
+        self.assertEqual(self.caching_connection(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0, "a": 2})
+
+    def test_query_overlapping_put_item_is_not_cached(self):
+        self.read_during_put(lambda: self.caching_connection(_lv.Query("Aaa").key_eq("h", 0)))
+        self.assertEqual(self.caching_connection(_lv.Query("Aaa").key_eq("h", 0)).items, [{"h": 0, "a": 2}])
@@ -0,0 +1,105 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import datetime
+
+import requests
+
+import LowVoltage.testing as _tst
+import LowVoltage.exceptions as _exn
+from LowVoltage.connection.credentials import StaticCredentials, Ec2RoleCredentials
+
+
+class StaticCredentialsUnitTests(_tst.UnitTests):
+    def test_without_token(self):
+        self.assertEqual(
+            StaticCredentials("a", "b").get(),
+            ("a", "b", None)
+        )
+
+    def test_with_token(self):
+        self.assertEqual(
+            StaticCredentials("a", "b", "c").get(),
+            ("a", "b", "c")
+        )
+
+
+class Ec2RoleCredentialsUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(Ec2RoleCredentialsUnitTests, self).setUp()
+        self.session = self.mocks.create("session")
+        self.response = self.mocks.create("response")
+
+    def test_refresh_scenarios(self):
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/").andReturn(self.response.object)
+        self.response.expect.text.andReturn("RoleName")
+
+        credentials = Ec2RoleCredentials(self.session.object)
+
+        self.now = self.mocks.replace("credentials._Ec2RoleCredentials__now")
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 12, 30, 0))
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/RoleName").andReturn(self.response.object)
+        self.response.expect.json().andReturn({"AccessKeyId": "key1", "SecretAccessKey": "secret1", "Token": "token1", "Expiration": "2015-04-24T15:00:30Z"})
+
+        self.assertEqual(credentials.get(), ("key1", "secret1", "token1"))
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 12, 31, 0))
+        self.assertEqual(credentials.get(), ("key1", "secret1", "token1"))
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 13, 29, 0))
+        self.assertEqual(credentials.get(), ("key1", "secret1", "token1"))
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 13, 30, 0))
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/RoleName").andReturn(self.response.object)
+        self.response.expect.json().andReturn({"AccessKeyId": "key2", "SecretAccessKey": "secret2", "Token": "token3", "Expiration": "2015-04-24T14:00:30Z"})
+        self.assertEqual(credentials.get(), ("key2", "secret2", "token3"))
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 13, 45, 0))
+        self.assertEqual(credentials.get(), ("key2", "secret2", "token3"))
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 13, 46, 0))
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/RoleName").andReturn(self.response.object)
+        self.response.expect.json().andReturn({"AccessKeyId": "key3", "SecretAccessKey": "secret3", "Token": "token3", "Expiration": "2015-04-24T18:00:30Z"})
+        self.assertEqual(credentials.get(), ("key3", "secret3", "token3"))
+
+    def test_network_error_during_construction(self):
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/").andRaise(requests.exceptions.RequestException)
+
+        with self.assertRaises(_exn.NetworkError):
+            Ec2RoleCredentials(self.session.object)
+
+    def test_unknown_error_during_construction(self):
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/").andRaise(Exception)
+
+        with self.assertRaises(_exn.UnknownError):
+            Ec2RoleCredentials(self.session.object)
+
+    def test_network_error_during_refresh(self):
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/").andReturn(self.response.object)
+        self.response.expect.text.andReturn("RoleName")
+
+        credentials = Ec2RoleCredentials(self.session.object)
+
+        self.now = self.mocks.replace("credentials._Ec2RoleCredentials__now")
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 12, 30, 0))
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/RoleName").andRaise(requests.exceptions.RequestException)
+
+        with self.assertRaises(_exn.NetworkError):
+            credentials.get()
+
+    def test_unknown_error_during_refresh(self):
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/").andReturn(self.response.object)
+        self.response.expect.text.andReturn("RoleName")
+
+        credentials = Ec2RoleCredentials(self.session.object)
+
+        self.now = self.mocks.replace("credentials._Ec2RoleCredentials__now")
+
+        self.now.expect().andReturn(datetime.datetime(2015, 0o4, 24, 12, 30, 0))
+        self.session.expect.get("http://169.254.169.254/latest/meta-data/iam/security-credentials/RoleName").andRaise(Exception)
+
+        with self.assertRaises(_exn.UnknownError):
+            credentials.get()
@@ -0,0 +1,140 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.connection.hot_keys import HotKeyTracker, HotKey, _SpaceSaving
+from LowVoltage.stand_in import Database, FaultInjector, Server
+
+
+class SpaceSavingUnitTests(_tst.UnitTests):
+    def test_counts(self):
+        sketch = _SpaceSaving(3)
+        for key in "abacab":
+            sketch.add(key)
+        self.assertEqual(sketch.top(2), [("a", [3, 0]), ("b", [2, 0])])
+
+    def test_eviction(self):
+        sketch = _SpaceSaving(2)
+        for key in "aaabc":
+            sketch.add(key)
+        # "b" was evicted by "c", which inherited its count
+        self.assertEqual(sketch.top(3), [("a", [3, 0]), ("c", [2, 1])])
+
+
+class HotKeyTrackerUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(HotKeyTrackerUnitTests, self).setUp()
+        self.tracker = HotKeyTracker(capacity=10, separator="#")
+
+    def test_get_item(self):
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": "x#1#a"}))
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": "x#1#a"}))
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": "x#2#a"}))
+        self.assertEqual(self.tracker.report(), {"Aaa": {
+            "throttles": 3,
+            "unattributed": 0,
+            "keys": [HotKey({"h": "x#1#a"}, 2, 0), HotKey({"h": "x#2#a"}, 1, 0)],
+            "partitions": [HotKey({"h": "x#1#a"}, 2, 0), HotKey({"h": "x#2#a"}, 1, 0)],
+            "prefixes": [HotKey("x#", 3, 0), HotKey("x#1#", 2, 0), HotKey("x#2#", 1, 0)],
+        }})
+
+    def test_report_is_limited(self):
+        for h in range(5):
+            self.tracker.throttled(_lv.DeleteItem("Aaa", {"h": h}))
+        self.assertEqual(len(self.tracker.report(2)["Aaa"]["keys"]), 2)
+
+    def test_partitions_need_hash_key(self):
+        self.tracker.throttled(_lv.UpdateItem("Aaa", {"h": 0, "r": 1}).set("a", ":a").expression_attribute_value("a", 0))
+        self.assertEqual(self.tracker.report()["Aaa"]["keys"], [HotKey({"h": 0, "r": 1}, 1, 0)])
+        self.assertEqual(self.tracker.report()["Aaa"]["partitions"], [])
+
+    def test_hash_key_from_key_names(self):
+        tracker = HotKeyTracker(key_names={"Aaa": ["h", "r"]})
+        tracker.throttled(_lv.GetItem("Aaa", {"h": 0, "r": 1}))
+        tracker.throttled(_lv.GetItem("Aaa", {"h": 0, "r": 2}))
+        self.assertEqual(tracker.report()["Aaa"]["partitions"], [HotKey({"h": 0}, 2, 0)])
+
+    def test_hash_key_from_query(self):
+        self.tracker.throttled(_lv.Query("Aaa").key_eq("h", 0).key_eq("r", 1))
+        self.tracker.throttled(_lv.Query("Aaa").key_eq("h", 0).key_gt("r", 1))
+        self.tracker.throttled(_lv.Query("Aaa").key_eq("h", 0).key_eq("r", 1))
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": 0, "r": 2}))
+        self.assertEqual(self.tracker.report()["Aaa"], {
+            "throttles": 4,
+            "unattributed": 1,
+            "keys": [HotKey({"h": 0, "r": 2}, 1, 0)],
+            "partitions": [HotKey({"h": 0}, 3, 0)],
+            "prefixes": [],
+        })
+
+    def test_query_on_index(self):
+        self.tracker.throttled(_lv.Query("Aaa").index_name("gsi").key_eq("gh", 0))
+        self.tracker.throttled(_lv.Query("Aaa").key_eq("h", 0).key_eq("r", 1))
+        self.assertEqual(self.tracker.report()["Aaa"]["partitions"], [HotKey({"gh": 0}, 1, 0)])
+        self.assertEqual(self.tracker.report()["Aaa"]["unattributed"], 1)
+
+    def test_put_item(self):
+        self.tracker.throttled(_lv.PutItem("Aaa", {"h": 0, "a": 1}))
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": 0}))
+        self.tracker.throttled(_lv.PutItem("Aaa", {"h": 0, "a": 2}))
+        self.assertEqual(self.tracker.report()["Aaa"]["unattributed"], 1)
+        self.assertEqual(self.tracker.report()["Aaa"]["keys"], [HotKey({"h": 0}, 2, 0)])
+
+    def test_scan(self):
+        self.tracker.throttled(_lv.Scan("Aaa"))
+        self.assertEqual(self.tracker.report()["Aaa"]["unattributed"], 1)
+
+    def test_other_actions(self):
+        self.tracker.throttled(_lv.ListTables())
+        self.assertEqual(self.tracker.report(), {})
+
+    def test_batch_get_item(self):
+        self.tracker.throttled(_lv.BatchGetItem().table("Aaa").keys({"h": 0}, {"h": 1}).table("Bbb").keys({"k": 0}))
+        report = self.tracker.report()
+        self.assertEqual(report["Aaa"]["throttles"], 2)
+        self.assertEqual(report["Bbb"]["keys"], [HotKey({"k": 0}, 1, 0)])
+
+    def test_batch_write_item(self):
+        self.tracker.throttled(_lv.BatchWriteItem().table("Aaa").delete({"h": 0}).put({"h": 0, "a": 1}, {"h": 1}))
+        self.assertEqual(self.tracker.report()["Aaa"]["keys"], [HotKey({"h": 0}, 2, 0), HotKey({"h": 1}, 1, 0)])
+
+    def test_unprocessed(self):
+        self.tracker.unprocessed(_lv.BatchGetItemResponse(UnprocessedKeys={"Aaa": {"Keys": [{"h": {"N": "0"}}]}}))
+        self.tracker.unprocessed(_lv.BatchWriteItemResponse(UnprocessedItems={"Aaa": [{"PutRequest": {"Item": {"h": {"N": "0"}}}}]}))
+        self.tracker.unprocessed(_lv.BatchGetItemResponse(UnprocessedKeys={}))
+        self.tracker.unprocessed(_lv.GetItemResponse())
+        self.assertEqual(self.tracker.report()["Aaa"]["keys"], [HotKey({"h": 0}, 2, 0)])
+
+    def test_reset(self):
+        self.tracker.throttled(_lv.GetItem("Aaa", {"h": 0, "r": 1}))
+        self.tracker.throttled(_lv.Query("Aaa").key_eq("h", 0))
+        self.tracker.reset()
+        self.assertEqual(self.tracker.report(), {})
+        # Learned key names are kept
+        self.tracker.throttled(_lv.PutItem("Aaa", {"h": 0, "r": 1, "a": 2}))
+        self.assertEqual(self.tracker.report()["Aaa"]["partitions"], [HotKey({"h": 0}, 1, 0)])
+
+    def test_connection(self):
+        tracker = HotKeyTracker()
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with Server(FaultInjector(database, throttling=1, actions=["GetItem"])) as server:
+            connection = server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 2), hot_key_tracker=tracker)
+            with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+                connection(_lv.GetItem("Aaa", {"h": 0}))
+            connection(_lv.PutItem("Aaa", {"h": 0}))
+        self.assertEqual(tracker.report()["Aaa"]["keys"], [HotKey({"h": 0}, 3, 0)])
+        self.assertEqual(tracker.report()["Aaa"]["throttles"], 3)
+
+    def test_connection_unprocessed(self):
+        tracker = HotKeyTracker()
+        database = Database()
+        database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        with Server(FaultInjector(database, unprocessed=1)) as server:
+            connection = server.connection(hot_key_tracker=tracker)
+            r = connection(_lv.BatchWriteItem().table("Aaa").put({"h": 0}, {"h": 1}))
+        self.assertEqual(len(r.unprocessed_items["Aaa"]), 2)
+        self.assertEqual(tracker.report()["Aaa"]["throttles"], 2)
+        self.assertEqual(tracker.report()["Aaa"]["unattributed"], 2)
@@ -0,0 +1,37 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.connection.retry_policies import ExponentialBackoffRetryPolicy
+
+
+class ExponentialBackoffRetryPolicyUnitTests(_tst.UnitTests):
+    def setUp(self):
+        self.policy = ExponentialBackoffRetryPolicy(1, 3, 3)
+        super(ExponentialBackoffRetryPolicyUnitTests, self).setUp()
+
+    def test_wait_after_first_failure(self):
+        self.assertEqual(
+            self.policy.retry(object(), [_lv.ServerError()]),
+            1
+        )
+
+    def test_wait_after_second_failure(self):
+        self.assertEqual(
+            self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError()]),
+            3
+        )
+
+    def test_wait_after_third_failure(self):
+        self.assertEqual(
+            self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError(), _lv.ServerError()]),
+            9
+        )
+
+    def test_give_up_after_fourth_failure(self):
+        self.assertIsNone(self.policy.retry(object(), [_lv.ServerError(), _lv.ServerError(), _lv.ServerError(), _lv.ServerError()]))
+
+    def test_repr(self):
+        self.assertEqual(repr(self.policy), "ExponentialBackoffRetryPolicy(1, 3, 3)")
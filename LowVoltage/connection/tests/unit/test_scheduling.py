@@ -0,0 +1,123 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import threading
+import time
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.connection.scheduling import SchedulingConnection
+
+
+class _BlockingConnection(object):
+    # Records the order in which actions are sent, and holds them until released
+    def __init__(self):
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.__lock = threading.Lock()
+        self.release = threading.Semaphore(0)
+
+    def __call__(self, action):
+        with self.__lock:
+            self.sent.append(action.payload["Key"]["h"]["S"])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.release.acquire()
+        with self.__lock:
+            self.in_flight -= 1
+        return action.payload["Key"]["h"]["S"]
+
+
+class SchedulingConnectionUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(SchedulingConnectionUnitTests, self).setUp()
+        self.connection = _BlockingConnection()
+        self.threads = []
+
+    def tearDown(self):
+        for thread in self.threads:
+            self.connection.release.release()
+        for thread in self.threads:
+            thread.join()
+        super(SchedulingConnectionUnitTests, self).tearDown()
+
+    def send(self, scheduling_connection, name, *args):
+        thread = threading.Thread(target=scheduling_connection, args=(_lv.GetItem("Aaa", {"h": name}),) + args)
+        thread.start()
+        self.threads.append(thread)
+
+    def wait_for(self, condition):
+        deadline = time.time() + 5
+        while not condition():
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.001)
+
+    def test_send(self):
+        scheduling_connection = SchedulingConnection(self.connection)
+        self.connection.release.release()
+        self.assertEqual(scheduling_connection(_lv.GetItem("Aaa", {"h": "a"})), "a")
+
+    def test_error(self):
+        def connection(action):
+            raise _lv.ValidationException()
+        scheduling_connection = SchedulingConnection(connection, max_in_flight=1, reserved=0)
+        for i in range(2):
+            with self.assertRaises(_lv.ValidationException):
+                scheduling_connection(_lv.GetItem("Aaa", {"h": "a"}))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            SchedulingConnection(self.connection, max_in_flight=2, reserved=2)
+        with self.assertRaises(ValueError):
+            SchedulingConnection(self.connection).lane("urgent")
+
+    def test_max_in_flight(self):
+        scheduling_connection = SchedulingConnection(self.connection, max_in_flight=3, reserved=0)
+        for i in range(5):
+            self.send(scheduling_connection, str(i))
+        self.wait_for(lambda: scheduling_connection.waiting == 2 and len(self.connection.sent) == 3)
+        for i in range(5):
+            self.connection.release.release()
+        self.wait_for(lambda: len(self.connection.sent) == 5)
+        self.assertEqual(self.connection.max_in_flight, 3)
+
+    def test_reserved(self):
+        scheduling_connection = SchedulingConnection(self.connection, max_in_flight=3, reserved=1)
+        low = scheduling_connection.lane("low")
+        for i in range(3):
+            self.send(low, "low{}".format(i))
+        self.wait_for(lambda: scheduling_connection.waiting == 1 and len(self.connection.sent) == 2)
+        # The reserved slot is free for high priority actions
+        self.send(scheduling_connection, "high")
+        self.wait_for(lambda: len(self.connection.sent) == 3)
+        self.assertEqual(self.connection.sent[2], "high")
+        self.assertEqual(scheduling_connection.waiting, 1)
+
+    def test_priority(self):
+        scheduling_connection = SchedulingConnection(self.connection, max_in_flight=1, reserved=0)
+        self.send(scheduling_connection, "first")
+        self.wait_for(lambda: len(self.connection.sent) == 1)
+        for i in range(3):
+            self.send(scheduling_connection.lane("low"), "low{}".format(i))
+            self.wait_for(lambda: scheduling_connection.waiting == 2 * i + 1)
+            self.send(scheduling_connection.lane("high"), "high{}".format(i))
+            self.wait_for(lambda: scheduling_connection.waiting == 2 * i + 2)
+        for i in range(6):
+            self.connection.release.release()
+            self.wait_for(lambda: len(self.connection.sent) == i + 2)
+        self.assertEqual(self.connection.sent, ["first", "high0", "high1", "high2", "low0", "low1", "low2"])
+
+    def test_weighted_fair_queuing(self):
+        scheduling_connection = SchedulingConnection(self.connection, max_in_flight=1, reserved=0, weights={"b": 2})
+        self.send(scheduling_connection, "first")
+        self.wait_for(lambda: len(self.connection.sent) == 1)
+        for tenant, count in (("a", 4), ("b", 4), ("c", 2)):
+            for i in range(count):
+                self.send(scheduling_connection.lane("low", tenant), "{}{}".format(tenant, i))
+                self.wait_for(lambda: scheduling_connection.waiting == len(self.threads) - 1)
+        for i in range(10):
+            self.connection.release.release()
+            self.wait_for(lambda: len(self.connection.sent) == i + 2)
+        self.assertEqual(self.connection.sent, ["first", "b0", "a0", "b1", "c0", "b2", "a1", "b3", "c1", "a2", "a3"])
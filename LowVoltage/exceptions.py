@@ -34,6 +34,30 @@ class NetworkError(Error):
     retryable = True
 
 
+class IncompleteBatchError(Error):
+    """
+    Exception raised by batch compounds (like :func:`.batch_put_item`) when some items could not be processed.
+
+    :attr:`errors` is the list of exceptions raised by the failed actions
+    and :attr:`remaining` is the list of items (or keys) that were not processed.
+    As batch compounds consume their arguments lazily, items that were not yet taken from your iterables are not in :attr:`remaining`.
+    """
+
+    def __init__(self, errors, remaining):
+        super(IncompleteBatchError, self).__init__(errors, remaining)
+        self.errors = errors
+        self.remaining = remaining
+
+
+class CorruptedValueError(Error):
+    """
+    Exception raised by :func:`.iterate_chunked_value` when the chunks of a value don't match its manifest.
+
+    Typically the value was overwritten or deleted during the read, or an eventually consistent read returned a stale chunk.
+    Reading again usually succeeds.
+    """
+
+
 class ClientError(Error):
     """
     Exception raised when the problem can be blamed on the client.
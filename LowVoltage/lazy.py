@@ -0,0 +1,45 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import importlib
+import sys
+import types
+
+
+def lazy_exports(package, exports, eager=()):
+    """
+    Export names from the submodules of a package, importing each submodule on first access to one of its names (see :pep:`562`).
+
+    :param package: the ``__name__`` of the package.
+    :param exports: a dict of submodule names, relative to the package, to the lists of names they export.
+    :param eager: modules already star-imported in the package, whose public names are exported as well.
+
+    Return the ``__getattr__`` and ``__dir__`` functions and the ``__all__`` list to set in the package's namespace.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name):
+        if name not in modules:
+            # Submodules are attributes of their package once imported, like with a regular package
+            try:
+                return importlib.import_module("." + name, package)
+            except ModuleNotFoundError as e:
+                if e.name != package + "." + name:
+                    raise
+                raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
+        value = getattr(importlib.import_module(modules[name], package), name)
+        # Next accesses won't go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(modules))
+
+    names = [
+        name
+        for module in eager
+        for name, value in vars(module).items()
+        if not name.startswith("_") and not isinstance(value, types.ModuleType)
+    ]
+    return __getattr__, __dir__, sorted(names) + sorted(modules)
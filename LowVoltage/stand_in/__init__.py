@@ -0,0 +1,17 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A pure-Python, in-memory stand-in for DynamoDB, to run tests and benchmarks without network access.
+
+Set the ``LOWVOLTAGE_STAND_IN`` environment variable to run the local integration tests against it instead of DynamoDB Local,
+for example ``LOWVOLTAGE_STAND_IN=1 python -m LowVoltage.tests.local``.
+The few tests asserting on the exact wording of DynamoDB Local's error messages
+and on the way it describes provisioned throughputs are then skipped.
+"""
+
+from .database import Database
+from .faults import FaultInjector
+from .server import Server
+from .simulation import simulate_autoscaling
@@ -0,0 +1,616 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+An in-memory emulation of DynamoDB.
+
+>>> from LowVoltage.stand_in import Database
+>>> database = Database()
+>>> r = database(CreateTable("Aaa").hash_key("h", NUMBER).provisioned_throughput(1, 1))
+>>> r = database(PutItem("Aaa", {"h": 0, "a": "x"}))
+>>> database(GetItem("Aaa", {"h": 0})).item
+{'h': 0, 'a': 'x'}
+"""
+
+import bisect
+import collections
+import copy
+import hashlib
+import json
+import math
+import threading
+import time
+
+import LowVoltage.exceptions as _exn
+from .expressions import ExpressionError, comparable, format_number, parse_condition, parse_projection, parse_update
+
+
+# DynamoDB allows four decreases of the provisioned throughput of each table and GSI per UTC day
+_DECREASES_PER_DAY = 4
+
+# DynamoDB returns at most 16MB of items in each BatchGetItem response
+_BATCH_GET_ITEM_MAX_SIZE = 16 * 1024 * 1024
+
+
+class Database(object):
+    """
+    Emulate the actions supported by LowVoltage on tables stored in memory.
+    Key schemas, local and global secondary indexes, condition, filter, update and projection expressions,
+    pagination and parallel scans are supported.
+    Tables are created and updated instantaneously.
+    Provisioned throughput is not enforced (see :class:`.FaultInjector` for throttling),
+    but decreasing it is limited to four times per UTC day for each table and GSI, like on DynamoDB.
+
+    A :class:`Database` can be called like a :class:`.Connection`, or served over HTTP by a :class:`.Server`.
+
+    :param max_page_size: the maximum size in bytes of the items evaluated by a :class:`.Query` or a :class:`.Scan`,
+        like the 1MB limit of DynamoDB.
+    :param batch_limit: if not ``None``, the maximum number of keys (resp. items) processed by each :class:`.BatchGetItem`
+        (resp. :class:`.BatchWriteItem`). The others are returned in :attr:`.BatchGetItemResponse.unprocessed_keys`
+        (resp. :attr:`.BatchWriteItemResponse.unprocessed_items`).
+    """
+
+    def __init__(self, max_page_size=1024 * 1024, batch_limit=None):
+        self.__max_page_size = max_page_size
+        self.__batch_limit = batch_limit
+        self.__lock = threading.Lock()
+        self.__tables = {}
+
+        # Dependency injection through monkey-patching
+        self.__now = time.time
+
+    def __call__(self, action):
+        """
+        Process an action and return its response.
+        """
+        # Round-trip through JSON, like the payload sent by a Connection
+        return action.response_class(**self.handle(action.name, json.loads(json.dumps(action.payload))))
+
+    def handle(self, name, payload):
+        """
+        Process an action given by its name and payload in DynamoDB's format, and return the response in DynamoDB's format.
+
+        :raise: :exc:`.ClientError` with the same arguments as the one raised by a :class:`.Connection` to DynamoDB.
+        """
+        handler = getattr(self, "_Database__" + name, None)
+        if handler is None:
+            raise _error(_exn.UnknownOperationException, "Unknown operation: {}".format(name))
+        for parameter in ("Expected", "AttributeUpdates", "AttributesToGet", "QueryFilter", "ScanFilter", "ConditionalOperator", "KeyConditionExpression"):
+            if parameter in payload:
+                raise _error(_exn.ValidationException, "{} is not supported by LowVoltage's stand-in".format(parameter))
+        with self.__lock:
+            try:
+                return handler(payload)
+            except ExpressionError as e:
+                raise _error(_exn.ValidationException, e.args[0])
+
+    # Admin actions
+
+    def __CreateTable(self, payload):
+        name = payload.get("TableName")
+        if name in self.__tables:
+            raise _error(_exn.ResourceInUseException, "Table already exists: {}".format(name))
+        table = _Table(payload, self.__now())
+        self.__tables[name] = table
+        return {"TableDescription": table.description("ACTIVE")}
+
+    def __DescribeTable(self, payload):
+        table = self.__table(payload)
+        table.reset_decreases(self.__now())
+        return {"Table": table.description("ACTIVE")}
+
+    def __UpdateTable(self, payload):
+        table = self.__table(payload)
+        deleted = table.update(payload, self.__now())
+        return {"TableDescription": table.description("ACTIVE", deleted)}
+
+    def __DeleteTable(self, payload):
+        table = self.__table(payload)
+        del self.__tables[table.name]
+        return {"TableDescription": table.description("DELETING")}
+
+    def __ListTables(self, payload):
+        names = sorted(self.__tables)
+        if "ExclusiveStartTableName" in payload:
+            names = names[bisect.bisect_right(names, payload["ExclusiveStartTableName"]):]
+        limit = payload.get("Limit", 100)
+        response = {"TableNames": names[:limit]}
+        if len(names) > limit:
+            response["LastEvaluatedTableName"] = names[limit - 1]
+        return response
+
+    # Item actions
+
+    def __GetItem(self, payload):
+        table = self.__table(payload)
+        key = table.check_key(payload.get("Key"))
+        item = table.items.get(key)
+        response = _consumed_capacity(payload, table, _read_units([item], payload.get("ConsistentRead")))
+        if item is not None:
+            response["Item"] = _projection(payload)(item)
+        return response
+
+    def __PutItem(self, payload):
+        table = self.__table(payload)
+        item = payload.get("Item")
+        key = table.check_item(item)
+        old = table.items.get(key)
+        _check_condition(payload, old)
+        table.put(key, copy.deepcopy(item))
+        return self.__write_response(payload, table, old, item, None, ("NONE", "ALL_OLD"))
+
+    def __DeleteItem(self, payload):
+        table = self.__table(payload)
+        key = table.check_key(payload.get("Key"))
+        old = table.items.get(key)
+        _check_condition(payload, old)
+        table.delete(key)
+        return self.__write_response(payload, table, old, None, None, ("NONE", "ALL_OLD"))
+
+    def __UpdateItem(self, payload):
+        table = self.__table(payload)
+        key = table.check_key(payload.get("Key"))
+        old = table.items.get(key)
+        _check_condition(payload, old)
+        item = copy.deepcopy(old or payload["Key"])
+        names = set()
+        if "UpdateExpression" in payload:
+            item, names = parse_update(payload["UpdateExpression"], payload.get("ExpressionAttributeNames"), payload.get("ExpressionAttributeValues"))(item)
+            for name in table.key:
+                if name in names:
+                    raise _error(_exn.ValidationException, "One or more parameter values were invalid: Cannot update attribute {}. This attribute is part of the key".format(name))
+        table.check_item(item)
+        table.put(key, item)
+        return self.__write_response(payload, table, old, item, names, ("NONE", "ALL_OLD", "ALL_NEW", "UPDATED_OLD", "UPDATED_NEW"))
+
+    def __write_response(self, payload, table, old, new, names, return_values):
+        return_value = payload.get("ReturnValues", "NONE")
+        if return_value not in return_values:
+            raise _error(_exn.ValidationException, "Return values set to invalid value")
+        response = _consumed_capacity(payload, table, _write_units([old, new]))
+        attributes = None
+        if return_value == "ALL_OLD":
+            attributes = old
+        elif return_value == "ALL_NEW":
+            attributes = new
+        elif return_value == "UPDATED_OLD" and old is not None:
+            attributes = {n: v for n, v in old.items() if n in names}
+        elif return_value == "UPDATED_NEW":
+            attributes = {n: v for n, v in new.items() if n in names}
+        if attributes:
+            response["Attributes"] = attributes
+        return response
+
+    # Batch actions
+
+    def __BatchGetItem(self, payload):
+        requests = payload.get("RequestItems") or {}
+        if sum(len(request.get("Keys", [])) for request in requests.values()) > 100:
+            raise _error(_exn.ValidationException, "Too many items requested for the BatchGetItem call")
+        tables = {}
+        for table_name, request in requests.items():
+            tables[table_name] = table = self.__table({"TableName": table_name})
+            keys = [table.check_key(key) for key in request.get("Keys", [])]
+            if len(set(keys)) != len(keys):
+                raise _error(_exn.ValidationException, "Provided list of item keys contains duplicates")
+        budget = self.__batch_limit
+        size = 0
+        responses = {}
+        unprocessed = {}
+        capacities = []
+        for table_name, request in sorted(requests.items()):
+            table = tables[table_name]
+            project = _projection(request)
+            keys = request.get("Keys", [])
+            remaining = []
+            if budget is not None:
+                keys, remaining = keys[:budget], keys[budget:]
+                budget -= len(keys)
+            items = []
+            for index, key in enumerate(keys):
+                item = table.items.get(table.check_key(key))
+                if item is not None:
+                    if size + _size(item) > _BATCH_GET_ITEM_MAX_SIZE:
+                        # Like DynamoDB, return the keys that would exceed the response size as unprocessed
+                        remaining = keys[index:] + remaining
+                        budget = 0
+                        break
+                    size += _size(item)
+                items.append(item)
+            if remaining:
+                unprocessed[table_name] = dict(request, Keys=remaining)
+            responses[table_name] = [project(item) for item in items if item is not None]
+            capacities.append(_consumed_capacity(payload, table, _read_units(items, request.get("ConsistentRead"))).get("ConsumedCapacity"))
+        response = {"Responses": responses, "UnprocessedKeys": unprocessed}
+        if capacities and capacities[0] is not None:
+            response["ConsumedCapacity"] = capacities
+        return response
+
+    def __BatchWriteItem(self, payload):
+        requests = payload.get("RequestItems") or {}
+        if sum(len(r) for r in requests.values()) > 25:
+            raise _error(_exn.ValidationException, "1 validation error detected: Value at 'requestItems' failed to satisfy constraint: Member must have length less than or equal to 25")
+        operations = []
+        for table_name, table_requests in sorted(requests.items()):
+            table = self.__table({"TableName": table_name})
+            keys = set()
+            for request in table_requests:
+                if "PutRequest" in request:
+                    key = table.check_item(request["PutRequest"].get("Item"))
+                elif "DeleteRequest" in request:
+                    key = table.check_key(request["DeleteRequest"].get("Key"))
+                else:
+                    raise _error(_exn.ValidationException, "Supplied AttributeValue has more than one datatypes set, must contain exactly one of the supported datatypes")
+                if key in keys:
+                    raise _error(_exn.ValidationException, "Provided list of item keys contains duplicates")
+                keys.add(key)
+                operations.append((table_name, table, key, request))
+        if self.__batch_limit is not None:
+            processed, remaining = operations[:self.__batch_limit], operations[self.__batch_limit:]
+        else:
+            processed, remaining = operations, []
+        units = collections.OrderedDict()
+        for table_name, table, key, request in processed:
+            old = table.items.get(key)
+            if "PutRequest" in request:
+                new = copy.deepcopy(request["PutRequest"]["Item"])
+                table.put(key, new)
+            else:
+                new = None
+                table.delete(key)
+            units[table_name] = units.get(table_name, 0) + _write_units([old, new])
+        unprocessed = {}
+        for table_name, table, key, request in remaining:
+            unprocessed.setdefault(table_name, []).append(request)
+        response = {"UnprocessedItems": unprocessed}
+        if payload.get("ReturnConsumedCapacity", "NONE") != "NONE":
+            response["ConsumedCapacity"] = [{"TableName": table_name, "CapacityUnits": u} for table_name, u in units.items()]
+        return response
+
+    def __Query(self, payload):
+        table = self.__table(payload)
+        index = table.index(payload.get("IndexName"))
+        conditions = payload.get("KeyConditions") or {}
+        hash_name = index.key[0]
+        hash_condition = conditions.get(hash_name)
+        if hash_condition is None or hash_condition.get("ComparisonOperator") != "EQ":
+            raise _error(_exn.ValidationException, "Query condition missed key schema element: {}".format(hash_name))
+        for name in conditions:
+            if name not in index.key:
+                raise _error(_exn.ValidationException, "Query condition missed key schema element: {}".format(name))
+        hash_value = comparable(hash_condition["AttributeValueList"][0])
+        range_condition = None
+        if len(index.key) == 2 and index.key[1] in conditions:
+            range_condition = conditions[index.key[1]]
+        sort_keys = []
+        for key, item in table.items.items():
+            if all(name in item for name in index.key) and comparable(item[hash_name]) == hash_value:
+                if range_condition is None or _key_condition(range_condition, item[index.key[1]]):
+                    sort_keys.append((index.sort_key(table, item), key))
+        reverse = not payload.get("ScanIndexForward", True)
+        sort_keys.sort(reverse=reverse)
+        if "ExclusiveStartKey" in payload:
+            start = index.sort_key(table, payload["ExclusiveStartKey"])
+            sort_keys = [(s, k) for s, k in sort_keys if (s < start if reverse else s > start)]
+        return self.__page(payload, table, index, [k for s, k in sort_keys])
+
+    def __Scan(self, payload):
+        table = self.__table(payload)
+        index = table.index(payload.get("IndexName"))
+        sort_keys = table.scan_order()
+        if "ExclusiveStartKey" in payload:
+            sort_keys = sort_keys[bisect.bisect_right(sort_keys, table.scan_sort_key(table.check_key(payload["ExclusiveStartKey"]))):]
+        if "TotalSegments" in payload:
+            segment = payload.get("Segment", 0)
+            total_segments = payload["TotalSegments"]
+            sort_keys = [(bucket, k) for bucket, k in sort_keys if int(bucket, 16) % total_segments == segment]
+        keys = [k for bucket, k in sort_keys if index.name is None or all(name in table.items[k] for name in index.key)]
+        return self.__page(payload, table, index, keys)
+
+    def __page(self, payload, table, index, keys):
+        limit = payload.get("Limit")
+        filter = None
+        if "FilterExpression" in payload:
+            filter = parse_condition(payload["FilterExpression"], payload.get("ExpressionAttributeNames"), payload.get("ExpressionAttributeValues"))
+        project = _projection(payload)
+        items = []
+        evaluated = []
+        size = 0
+        for key in keys:
+            if (limit is not None and len(evaluated) == limit) or size >= self.__max_page_size:
+                break
+            item = index.project(table, table.items[key])
+            evaluated.append(item)
+            size += _size(item)
+            if filter is None or filter(item):
+                items.append(project(item))
+        response = {"Count": len(items), "ScannedCount": len(evaluated)}
+        if payload.get("Select") != "COUNT":
+            response["Items"] = items
+        # Like DynamoDB, return a LastEvaluatedKey when the Limit is reached, even if there are no more items
+        if len(evaluated) < len(keys) or (evaluated and len(evaluated) == limit):
+            last = evaluated[-1]
+            response["LastEvaluatedKey"] = {name: last[name] for name in set(table.key) | set(index.key)}
+        response.update(_consumed_capacity(payload, table, _read_units(evaluated, payload.get("ConsistentRead"))))
+        return response
+
+    def __table(self, payload):
+        name = payload.get("TableName")
+        if name not in self.__tables:
+            raise _error(_exn.ResourceNotFoundException, "Requested resource not found: Table: {} not found".format(name))
+        return self.__tables[name]
+
+
+class _Index(object):
+    def __init__(self, name, key, projection, throughput):
+        self.name = name
+        self.key = key
+        self.projection = projection or {"ProjectionType": "ALL"}
+        self.throughput = throughput
+
+    def sort_key(self, table, item):
+        range_key = tuple(comparable(item[name]) for name in self.key[1:])
+        return (range_key, table.key_of(item))
+
+    def project(self, table, item):
+        typ = self.projection.get("ProjectionType")
+        if self.name is None or typ == "ALL":
+            return item
+        names = set(table.key) | set(self.key)
+        if typ == "INCLUDE":
+            names |= set(self.projection.get("NonKeyAttributes", []))
+        return {n: v for n, v in item.items() if n in names}
+
+
+class _Table(object):
+    def __init__(self, payload, now):
+        self.name = payload.get("TableName")
+        self.attribute_types = collections.OrderedDict()
+        for definition in payload.get("AttributeDefinitions", []):
+            self.attribute_types[definition["AttributeName"]] = definition["AttributeType"]
+        self.key = self.__key_names(payload.get("KeySchema"))
+        self.throughput = self.__throughput(payload)
+        self.creation_date_time = float(now)
+        self.items = {}
+        self.__scan_order = None
+
+        self.__base = _Index(None, self.key, None, None)
+        self.local_indexes = collections.OrderedDict()
+        for index in payload.get("LocalSecondaryIndexes", []):
+            key = self.__key_names(index.get("KeySchema"))
+            if len(self.key) != 2 or len(key) != 2 or key[0] != self.key[0]:
+                raise _error(_exn.ValidationException, "One or more parameter values were invalid: Invalid KeySchema for local secondary index: {}".format(index.get("IndexName")))
+            self.local_indexes[index["IndexName"]] = _Index(index["IndexName"], key, index.get("Projection"), None)
+        self.global_indexes = collections.OrderedDict()
+        for index in payload.get("GlobalSecondaryIndexes", []):
+            self.__create_global_index(index)
+        self.__check_attribute_definitions()
+
+    def __key_names(self, key_schema):
+        if not key_schema or len(key_schema) > 2 or key_schema[0].get("KeyType") != "HASH" or (len(key_schema) == 2 and key_schema[1].get("KeyType") != "RANGE"):
+            raise _error(_exn.ValidationException, "1 validation error detected: Value at 'keySchema' failed to satisfy constraint: Invalid KeySchema")
+        names = [e["AttributeName"] for e in key_schema]
+        for name in names:
+            if name not in self.attribute_types:
+                raise _error(_exn.ValidationException, "One or more parameter values were invalid: Some index key attributes are not defined in AttributeDefinitions. Keys: [{}], AttributeDefinitions: [{}]".format(", ".join(names), ", ".join(self.attribute_types)))
+        return names
+
+    def __throughput(self, payload):
+        throughput = payload.get("ProvisionedThroughput")
+        if throughput is None:
+            raise _error(_exn.ValidationException, "One or more parameter values were invalid: ReadCapacityUnits and WriteCapacityUnits must both be specified")
+        return {"ReadCapacityUnits": throughput["ReadCapacityUnits"], "WriteCapacityUnits": throughput["WriteCapacityUnits"], "NumberOfDecreasesToday": 0}
+
+    def __create_global_index(self, index):
+        name = index.get("IndexName")
+        if name in self.global_indexes or name in self.local_indexes:
+            raise _error(_exn.ValidationException, "One or more parameter values were invalid: Duplicate index name: {}".format(name))
+        self.global_indexes[name] = _Index(name, self.__key_names(index.get("KeySchema")), index.get("Projection"), self.__throughput(index))
+        self.__scan_order = None
+
+    def __used_attributes(self):
+        used = set(self.key)
+        for index in list(self.local_indexes.values()) + list(self.global_indexes.values()):
+            used |= set(index.key)
+        return used
+
+    def __check_attribute_definitions(self):
+        used = self.__used_attributes()
+        if set(self.attribute_types) - used:
+            raise _error(_exn.ValidationException, "One or more parameter values were invalid: Some AttributeDefinitions are not used. AttributeDefinitions: [{}], keys used: [{}]".format(", ".join(self.attribute_types), ", ".join(sorted(used))))
+
+    def update(self, payload, now):
+        deleted = []
+        self.reset_decreases(now)
+        for definition in payload.get("AttributeDefinitions", []):
+            self.attribute_types[definition["AttributeName"]] = definition["AttributeType"]
+        if "ProvisionedThroughput" in payload:
+            self.__update_throughput(self.throughput, payload["ProvisionedThroughput"], now)
+        for update in payload.get("GlobalSecondaryIndexUpdates", []):
+            if "Create" in update:
+                self.__create_global_index(update["Create"])
+            else:
+                verb, = update.keys()
+                name = update[verb].get("IndexName")
+                if name not in self.global_indexes:
+                    raise _error(_exn.ResourceNotFoundException, "Requested resource not found: Index: {} not found".format(name))
+                if verb == "Delete":
+                    deleted.append(self.global_indexes.pop(name))
+                else:
+                    self.__update_throughput(self.global_indexes[name].throughput, update[verb]["ProvisionedThroughput"], now)
+        if deleted:
+            # Like DynamoDB, forget the definitions of attributes that were used only by deleted indexes
+            used = self.__used_attributes()
+            for name in list(self.attribute_types):
+                if name not in used:
+                    del self.attribute_types[name]
+        return deleted
+
+    def __update_throughput(self, throughput, update, now):
+        if update.get("ReadCapacityUnits", 0) < throughput["ReadCapacityUnits"] or update.get("WriteCapacityUnits", 0) < throughput["WriteCapacityUnits"]:
+            if throughput["NumberOfDecreasesToday"] >= _DECREASES_PER_DAY:
+                raise _error(_exn.LimitExceededException, "Subscriber limit exceeded: Provisioned throughput can be decreased only {} times within the same UTC day".format(_DECREASES_PER_DAY))
+            throughput["NumberOfDecreasesToday"] += 1
+            throughput["LastDecreaseDateTime"] = float(now)
+        throughput["ReadCapacityUnits"] = update.get("ReadCapacityUnits", throughput["ReadCapacityUnits"])
+        throughput["WriteCapacityUnits"] = update.get("WriteCapacityUnits", throughput["WriteCapacityUnits"])
+
+    def reset_decreases(self, now):
+        # The number of decreases is reset at midnight UTC
+        for throughput in [self.throughput] + [index.throughput for index in self.global_indexes.values()]:
+            if "LastDecreaseDateTime" in throughput and time.gmtime(throughput["LastDecreaseDateTime"])[:3] != time.gmtime(now)[:3]:
+                throughput["NumberOfDecreasesToday"] = 0
+
+    def index(self, name):
+        if name is None:
+            return self.__base
+        index = self.local_indexes.get(name) or self.global_indexes.get(name)
+        if index is None:
+            raise _error(_exn.ValidationException, "The table does not have the specified index: {}".format(name))
+        return index
+
+    def key_of(self, item):
+        return tuple(comparable(item[name]) for name in self.key)
+
+    def check_key(self, key):
+        if not isinstance(key, dict) or set(key) != set(self.key) or any(list(key[name].keys()) != [self.attribute_types[name]] for name in self.key):
+            raise _error(_exn.ValidationException, "The provided key element does not match the schema")
+        return self.key_of(key)
+
+    def check_item(self, item):
+        if not isinstance(item, dict):
+            raise _error(_exn.ValidationException, "One or more parameter values were invalid: Missing the key {} in the item".format(self.key[0]))
+        for name in self.key:
+            if name not in item:
+                raise _error(_exn.ValidationException, "One or more parameter values were invalid: Missing the key {} in the item".format(name))
+            if list(item[name].keys()) != [self.attribute_types[name]]:
+                raise _error(_exn.ValidationException, "One or more parameter values were invalid: Type mismatch for key {} expected: {} actual: {}".format(name, self.attribute_types[name], list(item[name].keys())[0]))
+        for index in list(self.local_indexes.values()) + list(self.global_indexes.values()):
+            for name in index.key:
+                if name in item and list(item[name].keys()) != [self.attribute_types[name]]:
+                    raise _error(_exn.ValidationException, "One or more parameter values were invalid: Type mismatch for Index Key {} Expected: {} Actual: {} IndexName: {}".format(name, self.attribute_types[name], list(item[name].keys())[0], index.name))
+        return self.key_of(item)
+
+    def put(self, key, item):
+        if key not in self.items:
+            self.__scan_order = None
+        self.items[key] = item
+
+    def delete(self, key):
+        if key in self.items:
+            del self.items[key]
+            self.__scan_order = None
+
+    def scan_sort_key(self, key):
+        hash_value = key[0]
+        if hash_value[0] == "N":
+            hash_value = ("N", format_number(hash_value[1]))
+        return (hashlib.md5(repr(hash_value).encode("utf8")).hexdigest(), key)
+
+    def scan_order(self):
+        # Like DynamoDB, scan items in the order of the hash of their hash key
+        if self.__scan_order is None:
+            self.__scan_order = sorted(self.scan_sort_key(key) for key in self.items)
+        return self.__scan_order
+
+    def description(self, status, deleted_indexes=()):
+        description = {
+            "TableName": self.name,
+            "TableStatus": status,
+            "KeySchema": self.__key_schema(self.key),
+            "AttributeDefinitions": [{"AttributeName": n, "AttributeType": t} for n, t in self.attribute_types.items()],
+            "ProvisionedThroughput": dict(self.throughput),
+            "CreationDateTime": self.creation_date_time,
+            "ItemCount": len(self.items),
+            "TableSizeBytes": sum(_size(item) for item in self.items.values()),
+        }
+        if self.local_indexes:
+            description["LocalSecondaryIndexes"] = [self.__index_description(index) for index in self.local_indexes.values()]
+        # Deleted indexes are removed immediately, but still described once, like DynamoDB does while deleting them
+        global_indexes = [(index, "ACTIVE") for index in self.global_indexes.values()] + [(index, "DELETING") for index in deleted_indexes]
+        if global_indexes:
+            description["GlobalSecondaryIndexes"] = [
+                dict(self.__index_description(index), IndexStatus=index_status, ProvisionedThroughput=dict(index.throughput))
+                for index, index_status in global_indexes
+            ]
+        return description
+
+    def __index_description(self, index):
+        items = [index.project(self, item) for item in self.items.values() if all(name in item for name in index.key)]
+        return {
+            "IndexName": index.name,
+            "KeySchema": self.__key_schema(index.key),
+            "Projection": index.projection,
+            "ItemCount": len(items),
+            "IndexSizeBytes": sum(_size(item) for item in items),
+        }
+
+    def __key_schema(self, key):
+        return [{"AttributeName": name, "KeyType": typ} for name, typ in zip(key, ["HASH", "RANGE"])]
+
+
+def _error(cls, message):
+    if cls is _exn.ValidationException:
+        typ = "com.amazon.coral.validate#ValidationException"
+    else:
+        typ = "com.amazonaws.dynamodb.v20120810#" + cls.__name__
+    return cls({"__type": typ, "message": message})
+
+
+def _check_condition(payload, item):
+    if "ConditionExpression" in payload:
+        condition = parse_condition(payload["ConditionExpression"], payload.get("ExpressionAttributeNames"), payload.get("ExpressionAttributeValues"))
+        if not condition(item or {}):
+            raise _error(_exn.ConditionalCheckFailedException, "The conditional request failed")
+
+
+def _projection(payload):
+    if "ProjectionExpression" in payload:
+        return parse_projection(payload["ProjectionExpression"], payload.get("ExpressionAttributeNames"))
+    else:
+        return lambda item: item
+
+
+def _key_condition(condition, value):
+    operator = condition.get("ComparisonOperator")
+    operands = condition.get("AttributeValueList", [])
+    if operator == "BETWEEN":
+        return comparable(operands[0]) <= comparable(value) <= comparable(operands[1])
+    elif operator == "BEGINS_WITH":
+        value = comparable(value)
+        prefix = comparable(operands[0])
+        return value[0] == prefix[0] and value[1].startswith(prefix[1])
+    elif operator in ("EQ", "LE", "LT", "GE", "GT"):
+        value = comparable(value)
+        operand = comparable(operands[0])
+        return {
+            "EQ": value == operand,
+            "LE": value <= operand,
+            "LT": value < operand,
+            "GE": value >= operand,
+            "GT": value > operand,
+        }[operator]
+    else:
+        raise _error(_exn.ValidationException, "Attempted conditional constraint is not an indexable operation")
+
+
+def _size(item):
+    return len(json.dumps(item))
+
+
+def _read_units(items, consistent_read):
+    size = sum(_size(item) for item in items if item is not None)
+    units = max(1, int(math.ceil(size / 4096.)))
+    return float(units) if consistent_read else units / 2.
+
+
+def _write_units(items):
+    return float(max([1] + [int(math.ceil(_size(item) / 1024.)) for item in items if item is not None]))
+
+
+def _consumed_capacity(payload, table, units):
+    if payload.get("ReturnConsumedCapacity", "NONE") == "NONE":
+        return {}
+    else:
+        return {"ConsumedCapacity": {"TableName": table.name, "CapacityUnits": units}}
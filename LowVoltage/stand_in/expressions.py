@@ -0,0 +1,530 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Evaluation of condition, filter, update and projection expressions on items in DynamoDB's format.
+"""
+
+import base64
+import copy
+import decimal
+import re
+
+
+class ExpressionError(Exception):
+    """
+    Raised for invalid expressions. The :class:`.Database` turns it into a ``ValidationException``.
+    """
+    pass
+
+
+def comparable(value):
+    """
+    Return a hashable Python object such that two values are equal in DynamoDB iff their comparables are equal,
+    and such that numbers, strings and binaries are ordered like in DynamoDB.
+    """
+    (typ, v), = value.items()
+    if typ == "N":
+        return (typ, decimal.Decimal(v))
+    elif typ == "B":
+        return (typ, base64.b64decode(v))
+    elif typ == "NS":
+        return (typ, frozenset(decimal.Decimal(e) for e in v))
+    elif typ == "BS":
+        return (typ, frozenset(base64.b64decode(e) for e in v))
+    elif typ == "SS":
+        return (typ, frozenset(v))
+    elif typ == "L":
+        return (typ, tuple(comparable(e) for e in v))
+    elif typ == "M":
+        return (typ, tuple(sorted((k, comparable(e)) for k, e in v.items())))
+    else:
+        return (typ, v)
+
+
+def format_number(d):
+    if d == d.to_integral_value():
+        return str(int(d))
+    else:
+        return str(d.normalize())
+
+
+def parse_condition(expression, names, values):
+    """
+    Return a function taking an item and returning a bool.
+    """
+    parser = _Parser(expression, names, values)
+    condition = parser.condition()
+    parser.end()
+    return condition
+
+
+def parse_projection(expression, names):
+    """
+    Return a function taking an item and returning the projected item.
+    """
+    parser = _Parser(expression, names, {})
+    paths = [parser.path()]
+    while parser.punctuation(","):
+        paths.append(parser.path())
+    parser.end()
+
+    def project(item):
+        projected = {}
+        for path in paths:
+            value = _get(item, path)
+            if value is not None:
+                _project(projected, path, value)
+        return projected
+    return project
+
+
+def parse_update(expression, names, values):
+    """
+    Return a function taking an item and returning the updated item and the names of the updated top-level attributes.
+    """
+    parser = _Parser(expression, names, values)
+    clauses = []
+    while not parser.at_end():
+        if parser.keyword("SET"):
+            clauses.append(("SET", parser.list(parser.set_action)))
+        elif parser.keyword("REMOVE"):
+            clauses.append(("REMOVE", parser.list(lambda: (parser.path(), None))))
+        elif parser.keyword("ADD"):
+            clauses.append(("ADD", parser.list(parser.path_and_value)))
+        elif parser.keyword("DELETE"):
+            clauses.append(("DELETE", parser.list(parser.path_and_value)))
+        else:
+            raise ExpressionError("Invalid UpdateExpression: Syntax error; token: \"{}\"".format(parser.current))
+    if not clauses:
+        raise ExpressionError("Invalid UpdateExpression: The expression can not be empty")
+    paths = [path for clause, actions in clauses for path, value in actions]
+    for i, one in enumerate(paths):
+        for two in paths[i + 1:]:
+            if one[:len(two)] == two[:len(one)]:
+                raise ExpressionError("Invalid UpdateExpression: Two document paths overlap with each other; must remove or rewrite one of these paths; path one: [{}], path two: [{}]".format(_format_path(one), _format_path(two)))
+
+    def update(item):
+        # All values are computed from the item before the update
+        operations = []
+        for clause, actions in clauses:
+            for path, value in actions:
+                operations.append((clause, path, None if value is None else value(item)))
+        updated = copy.deepcopy(item)
+        for clause, path, value in operations:
+            if clause == "SET":
+                _set(updated, path, value)
+            elif clause == "REMOVE":
+                _remove(updated, path)
+            elif clause == "ADD":
+                _add(updated, path, value)
+            else:
+                _delete(updated, path, value)
+        return updated, set(path[0] for clause, path, value in operations)
+    return update
+
+
+_TOKEN = re.compile(r"\s*(?:(?P<number>\d+)|(?P<name>#?[A-Za-z_][A-Za-z0-9_]*)|(?P<value>:[A-Za-z0-9_]+)|(?P<punctuation><>|<=|>=|[=<>(),.\[\]+-]))")
+
+_COMPARATORS = {
+    "=": lambda l, r: l == r,
+    "<>": lambda l, r: l != r,
+    "<": lambda l, r: l < r,
+    "<=": lambda l, r: l <= r,
+    ">": lambda l, r: l > r,
+    ">=": lambda l, r: l >= r,
+}
+
+
+class _Parser(object):
+    def __init__(self, expression, names, values):
+        self.__names = names or {}
+        self.__values = values or {}
+        self.__tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = _TOKEN.match(expression, position)
+            if match is None:
+                raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(expression[position:].strip()[:1]))
+            kind = match.lastgroup
+            self.__tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.__position = 0
+
+    @property
+    def current(self):
+        if self.at_end():
+            return "<EOF>"
+        return self.__tokens[self.__position][1]
+
+    def at_end(self):
+        return self.__position == len(self.__tokens)
+
+    def end(self):
+        if not self.at_end():
+            raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(self.current))
+
+    def __peek(self, offset=0):
+        if self.__position + offset < len(self.__tokens):
+            return self.__tokens[self.__position + offset]
+        return (None, None)
+
+    def __take(self, kind):
+        token_kind, token = self.__peek()
+        if token_kind != kind:
+            raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(self.current))
+        self.__position += 1
+        return token
+
+    def punctuation(self, p):
+        if self.__peek() == ("punctuation", p):
+            self.__position += 1
+            return True
+        return False
+
+    def __expect(self, p):
+        if not self.punctuation(p):
+            raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(self.current))
+
+    def keyword(self, k):
+        kind, token = self.__peek()
+        if kind == "name" and token.upper() == k:
+            self.__position += 1
+            return True
+        return False
+
+    def list(self, element):
+        elements = [element()]
+        while self.punctuation(","):
+            elements.append(element())
+        return elements
+
+    # Paths and operands
+
+    def __name(self):
+        name = self.__take("name")
+        if name.startswith("#"):
+            if name not in self.__names:
+                raise ExpressionError("An expression attribute name used in the document path is not defined; attribute name: {}".format(name))
+            name = self.__names[name]
+        return name
+
+    def path(self):
+        path = [self.__name()]
+        while True:
+            if self.punctuation("."):
+                path.append(self.__name())
+            elif self.punctuation("["):
+                path.append(int(self.__take("number")))
+                self.__expect("]")
+            else:
+                return tuple(path)
+
+    def __value(self):
+        name = self.__take("value")
+        if name not in self.__values:
+            raise ExpressionError("An expression attribute value used in expression is not defined; attribute value: {}".format(name))
+        value = self.__values[name]
+        return lambda item: value
+
+    def __is_function(self, name):
+        kind, token = self.__peek()
+        return kind == "name" and token == name and self.__peek(1) == ("punctuation", "(")
+
+    def operand(self):
+        kind, token = self.__peek()
+        if kind == "value":
+            return self.__value()
+        elif self.__is_function("size"):
+            self.__position += 2
+            path = self.path()
+            self.__expect(")")
+            return lambda item: _size(_get(item, path))
+        else:
+            path = self.path()
+            return lambda item: _get(item, path)
+
+    # Conditions
+
+    def condition(self):
+        left = self.__conjunction()
+        while self.keyword("OR"):
+            left = _or(left, self.__conjunction())
+        return left
+
+    def __conjunction(self):
+        left = self.__negation()
+        while self.keyword("AND"):
+            left = _and(left, self.__negation())
+        return left
+
+    def __negation(self):
+        if self.keyword("NOT"):
+            return _not(self.__negation())
+        return self.__primary()
+
+    def __primary(self):
+        if self.punctuation("("):
+            condition = self.condition()
+            self.__expect(")")
+            return condition
+        for name, arity in (("attribute_exists", 1), ("attribute_not_exists", 1), ("attribute_type", 2), ("begins_with", 2), ("contains", 2)):
+            if self.__is_function(name):
+                self.__position += 2
+                path = self.path()
+                if arity == 2:
+                    self.__expect(",")
+                    operand = self.operand()
+                self.__expect(")")
+                if name == "attribute_exists":
+                    return lambda item: _get(item, path) is not None
+                elif name == "attribute_not_exists":
+                    return lambda item: _get(item, path) is None
+                elif name == "attribute_type":
+                    return lambda item: _attribute_type(_get(item, path), operand(item))
+                elif name == "begins_with":
+                    return lambda item: _begins_with(_get(item, path), operand(item))
+                else:
+                    return lambda item: _contains(_get(item, path), operand(item))
+        left = self.operand()
+        if self.keyword("BETWEEN"):
+            lo = self.operand()
+            if not self.keyword("AND"):
+                raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(self.current))
+            hi = self.operand()
+            return lambda item: _compare("<=", lo(item), left(item)) and _compare("<=", left(item), hi(item))
+        elif self.keyword("IN"):
+            self.__expect("(")
+            candidates = self.list(self.operand)
+            self.__expect(")")
+            return lambda item: any(_compare("=", left(item), c(item)) for c in candidates)
+        else:
+            kind, comparator = self.__peek()
+            if kind != "punctuation" or comparator not in _COMPARATORS:
+                raise ExpressionError("Invalid expression: Syntax error; token: \"{}\"".format(self.current))
+            self.__position += 1
+            right = self.operand()
+            return lambda item: _compare(comparator, left(item), right(item))
+
+    # Updates
+
+    def set_action(self):
+        path = self.path()
+        self.__expect("=")
+        return (path, self.__set_value())
+
+    def __set_value(self):
+        left = self.__set_term()
+        if self.punctuation("+"):
+            right = self.__set_term()
+            return lambda item: _arithmetic(left(item), right(item), 1)
+        elif self.punctuation("-"):
+            right = self.__set_term()
+            return lambda item: _arithmetic(left(item), right(item), -1)
+        return left
+
+    def __set_term(self):
+        if self.__is_function("if_not_exists"):
+            self.__position += 2
+            path = self.path()
+            self.__expect(",")
+            default = self.__set_value()
+            self.__expect(")")
+            return lambda item: _get(item, path) or default(item)
+        elif self.__is_function("list_append"):
+            self.__position += 2
+            left = self.__set_value()
+            self.__expect(",")
+            right = self.__set_value()
+            self.__expect(")")
+            return lambda item: _list_append(left(item), right(item))
+        else:
+            return self.operand()
+
+    def path_and_value(self):
+        path = self.path()
+        return (path, self.__value())
+
+
+def _or(left, right):
+    return lambda item: left(item) or right(item)
+
+
+def _and(left, right):
+    return lambda item: left(item) and right(item)
+
+
+def _not(condition):
+    return lambda item: not condition(item)
+
+
+def _compare(comparator, left, right):
+    if left is None or right is None:
+        return False
+    left = comparable(left)
+    right = comparable(right)
+    if comparator in ("=", "<>"):
+        return _COMPARATORS[comparator](left, right)
+    elif left[0] == right[0] and left[0] in ("N", "S", "B"):
+        return _COMPARATORS[comparator](left[1], right[1])
+    else:
+        return False
+
+
+def _size(value):
+    if value is None:
+        return None
+    (typ, v), = value.items()
+    if typ == "B":
+        size = len(base64.b64decode(v))
+    elif typ in ("S", "SS", "NS", "BS", "L", "M"):
+        size = len(v)
+    else:
+        raise ExpressionError("Invalid ConditionExpression: Incorrect operand type for operator or function; operator or function: size, operand type: {}".format(typ))
+    return {"N": str(size)}
+
+
+def _attribute_type(value, typ):
+    return value is not None and list(value.keys()) == [typ.get("S")]
+
+
+def _begins_with(value, prefix):
+    if value is None or prefix is None:
+        return False
+    value = comparable(value)
+    prefix = comparable(prefix)
+    return value[0] == prefix[0] and value[0] in ("S", "B") and value[1].startswith(prefix[1])
+
+
+def _contains(value, element):
+    if value is None or element is None:
+        return False
+    (typ, v), = value.items()
+    element = comparable(element)
+    if typ == "S":
+        return element[0] == "S" and element[1] in v
+    elif typ in ("SS", "NS", "BS"):
+        return element[0] == typ[0] and element[1] in comparable(value)[1]
+    elif typ == "L":
+        return element in (comparable(e) for e in v)
+    return False
+
+
+def _arithmetic(left, right, sign):
+    if left is None or right is None or list(left.keys()) != ["N"] or list(right.keys()) != ["N"]:
+        raise ExpressionError("An operand in the update expression has an incorrect data type")
+    return {"N": format_number(decimal.Decimal(left["N"]) + sign * decimal.Decimal(right["N"]))}
+
+
+def _list_append(left, right):
+    if left is None or right is None or list(left.keys()) != ["L"] or list(right.keys()) != ["L"]:
+        raise ExpressionError("An operand in the update expression has an incorrect data type")
+    return {"L": left["L"] + right["L"]}
+
+
+def _format_path(path):
+    return ", ".join("[{}]".format(element) if isinstance(element, int) else element for element in path)
+
+
+def _get(item, path):
+    value = item.get(path[0])
+    for element in path[1:]:
+        if value is None:
+            return None
+        (typ, v), = value.items()
+        if isinstance(element, int):
+            value = v[element] if typ == "L" and element < len(v) else None
+        else:
+            value = v.get(element) if typ == "M" else None
+    return value
+
+
+def _parent(item, path):
+    container = item
+    for i, element in enumerate(path[:-1]):
+        if isinstance(container, dict):
+            value = container.get(element)
+        else:
+            value = container[element] if element < len(container) else None
+        if value is None:
+            raise ExpressionError("The document path provided in the update expression is invalid for update")
+        (typ, container), = value.items()
+        if typ not in ("L", "M") or (typ == "L") != isinstance(path[i + 1], int):
+            raise ExpressionError("The document path provided in the update expression is invalid for update")
+    return container
+
+
+def _set(item, path, value):
+    container = _parent(item, path)
+    if isinstance(container, list):
+        if path[-1] < len(container):
+            container[path[-1]] = value
+        else:
+            container.append(value)
+    else:
+        container[path[-1]] = value
+
+
+def _remove(item, path):
+    try:
+        container = _parent(item, path)
+    except ExpressionError:
+        return
+    if isinstance(container, list):
+        if path[-1] < len(container):
+            del container[path[-1]]
+    else:
+        container.pop(path[-1], None)
+
+
+def _add(item, path, value):
+    if len(path) != 1:
+        raise ExpressionError("Invalid UpdateExpression: The document path provided in the update expression is invalid for update")
+    current = item.get(path[0])
+    (typ, v), = value.items()
+    if current is None:
+        item[path[0]] = value
+    elif typ == "N" and list(current.keys()) == ["N"]:
+        item[path[0]] = _arithmetic(current, value, 1)
+    elif typ in ("SS", "NS", "BS") and list(current.keys()) == [typ]:
+        present = comparable(current)[1]
+        item[path[0]] = {typ: current[typ] + [e for e in v if comparable({typ[0]: e})[1] not in present]}
+    else:
+        raise ExpressionError("An operand in the update expression has an incorrect data type")
+
+
+def _delete(item, path, value):
+    if len(path) != 1:
+        raise ExpressionError("Invalid UpdateExpression: The document path provided in the update expression is invalid for update")
+    current = item.get(path[0])
+    (typ, v), = value.items()
+    if typ not in ("SS", "NS", "BS") or (current is not None and list(current.keys()) != [typ]):
+        raise ExpressionError("An operand in the update expression has an incorrect data type")
+    if current is not None:
+        removed = comparable(value)[1]
+        remaining = [e for e in current[typ] if comparable({typ[0]: e})[1] not in removed]
+        if remaining:
+            item[path[0]] = {typ: remaining}
+        else:
+            del item[path[0]]
+
+
+def _project(projected, path, value):
+    container = projected
+    for element, next_element in zip(path[:-1], path[1:]):
+        if isinstance(container, list):
+            # Elements selected in a list are returned compacted
+            key = len(container)
+            container.append({"L": []} if isinstance(next_element, int) else {"M": {}})
+            child = container[key]
+        else:
+            if element not in container:
+                container[element] = {"L": []} if isinstance(next_element, int) else {"M": {}}
+            child = container[element]
+        (typ, container), = child.items()
+    if isinstance(container, list):
+        container.append(value)
+    else:
+        container[path[-1]] = value
@@ -0,0 +1,164 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Inject faults and latency in a :class:`.Database`, to reproduce throttling storms and slow responses locally.
+
+>>> from LowVoltage.stand_in import Database, FaultInjector, Server
+>>> with Server(FaultInjector(Database(), throttling=0.1, latency=0.001)) as server:
+...   connection = server.connection()
+...   r = connection(CreateTable("Aaa").hash_key("h", NUMBER).provisioned_throughput(1, 1))
+...   connection(ListTables()).table_names
+['Aaa']
+"""
+
+import collections
+import json
+import random
+import threading
+import time
+
+import LowVoltage.exceptions as _exn
+from .database import _error
+
+
+class FaultInjector(object):
+    """
+    Wrap a :class:`.Database` (or anything with a ``handle(name, payload)`` method) and inject faults in its responses.
+    Like a :class:`.Database`, it can be called like a :class:`.Connection` or served by a :class:`.Server`.
+
+    Faults are drawn at random for each action, with the given probabilities:
+
+    :param throttling: the probability of a :exc:`.ProvisionedThroughputExceededException`.
+    :param server_errors: the probability of an HTTP 500 response, raised as a :exc:`.ServerError`.
+    :param dropped_connections: the probability that the :class:`.Server` closes the connection without responding,
+        raised as a :exc:`.NetworkError`.
+    :param unprocessed: the probability that each key of a :class:`.BatchGetItem` (resp. item of a :class:`.BatchWriteItem`)
+        is returned in :attr:`.BatchGetItemResponse.unprocessed_keys` (resp. :attr:`.BatchWriteItemResponse.unprocessed_items`).
+    :param latency: ``None``, or a delay in seconds added before each action, or a function returning such a delay,
+        like ``lambda: random.lognormvariate(-6, 1)``.
+    :param actions: if not ``None``, the names of the actions that faults and latency apply to.
+    :param seed: the seed of the random number generator, to reproduce a sequence of faults.
+    """
+
+    def __init__(self, database, throttling=0., server_errors=0., dropped_connections=0., unprocessed=0., latency=None, actions=None, seed=None):
+        self.__database = database
+        self.__throttling = throttling
+        self.__server_errors = server_errors
+        self.__dropped_connections = dropped_connections
+        self.__unprocessed = unprocessed
+        if latency is None or callable(latency):
+            self.__latency = latency
+        else:
+            self.__latency = lambda: latency
+        self.__actions = None if actions is None else set(actions)
+        self.__lock = threading.Lock()
+        self.__random = random.Random(seed)
+        self.__injected = collections.Counter()
+
+        # Dependency injection through monkey-patching
+        self.__sleep = time.sleep
+
+    @property
+    def injected(self):
+        """
+        The number of faults injected so far, by kind:
+        ``"throttling"``, ``"server_errors"``, ``"dropped_connections"``, ``"unprocessed"`` (number of keys and items)
+        and ``"latency"`` (total seconds).
+
+        :type: dict
+        """
+        with self.__lock:
+            return dict(self.__injected)
+
+    def __call__(self, action):
+        """
+        Process an action and return its response, like :meth:`.Database.__call__`.
+        """
+        return action.response_class(**self.handle(action.name, json.loads(json.dumps(action.payload))))
+
+    def handle(self, name, payload):
+        """
+        Process an action like :meth:`.Database.handle`, or fail.
+        """
+        if self.__actions is not None and name not in self.__actions:
+            return self.__database.handle(name, payload)
+
+        if self.__latency is not None:
+            delay = self.__latency()
+            self.__count("latency", delay)
+            self.__sleep(delay)
+        if self.__draw(self.__dropped_connections):
+            self.__count("dropped_connections")
+            raise _exn.NetworkError("Connection dropped by FaultInjector")
+        if self.__draw(self.__server_errors):
+            self.__count("server_errors")
+            raise _exn.ServerError(500, {"__type": "com.amazonaws.dynamodb.v20120810#InternalServerError", "message": "The server encountered an internal error trying to fulfill the request."})
+        if self.__draw(self.__throttling):
+            self.__count("throttling")
+            raise _error(_exn.ProvisionedThroughputExceededException, "The level of configured provisioned throughput for the table was exceeded. Consider increasing your provisioning level with the UpdateTable API")
+
+        if name == "BatchGetItem" and self.__unprocessed:
+            return self.__batch_get_item(payload)
+        elif name == "BatchWriteItem" and self.__unprocessed:
+            return self.__batch_write_item(payload)
+        else:
+            return self.__database.handle(name, payload)
+
+    def __batch_get_item(self, payload):
+        processed = {}
+        unprocessed = {}
+        for table, request in (payload.get("RequestItems") or {}).items():
+            kept, left = self.__split(request.get("Keys", []))
+            if kept:
+                processed[table] = dict(request, Keys=kept)
+            if left:
+                unprocessed[table] = dict(request, Keys=left)
+        response = {"Responses": {}, "UnprocessedKeys": {}}
+        if processed:
+            response = self.__database.handle("BatchGetItem", dict(payload, RequestItems=processed))
+        for table, request in unprocessed.items():
+            if table in response["UnprocessedKeys"]:
+                response["UnprocessedKeys"][table]["Keys"].extend(request["Keys"])
+            else:
+                response["UnprocessedKeys"][table] = request
+        return response
+
+    def __batch_write_item(self, payload):
+        processed = {}
+        unprocessed = {}
+        for table, requests in (payload.get("RequestItems") or {}).items():
+            kept, left = self.__split(requests)
+            if kept:
+                processed[table] = kept
+            if left:
+                unprocessed[table] = left
+        response = {"UnprocessedItems": {}}
+        if processed:
+            response = self.__database.handle("BatchWriteItem", dict(payload, RequestItems=processed))
+        for table, requests in unprocessed.items():
+            response["UnprocessedItems"].setdefault(table, []).extend(requests)
+        return response
+
+    def __split(self, elements):
+        kept = []
+        left = []
+        for element in elements:
+            if self.__draw(self.__unprocessed):
+                left.append(element)
+            else:
+                kept.append(element)
+        if left:
+            self.__count("unprocessed", len(left))
+        return kept, left
+
+    def __draw(self, probability):
+        if probability:
+            with self.__lock:
+                return self.__random.random() < probability
+        return False
+
+    def __count(self, kind, value=1):
+        with self.__lock:
+            self.__injected[kind] += value
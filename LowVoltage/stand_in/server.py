@@ -0,0 +1,128 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Serve a :class:`.Database` over HTTP, so that a :class:`.Connection` can use it unchanged.
+
+>>> from LowVoltage.stand_in import Server
+>>> with Server() as server:
+...   connection = server.connection()
+...   r = connection(CreateTable("Aaa").hash_key("h", NUMBER).provisioned_throughput(1, 1))
+...   connection(ListTables()).table_names
+['Aaa']
+"""
+
+import http.server
+import json
+import threading
+
+import LowVoltage as _lv
+import LowVoltage.exceptions as _exn
+from .database import Database
+
+
+class Server(object):
+    """
+    An HTTP server listening on localhost, in a background thread.
+    It can be used as a context manager, that starts and stops the server.
+
+    Signatures are not checked: any credentials are accepted.
+
+    :param database: the :class:`.Database` to serve. If ``None``, a new one is created.
+        It can be any object with a ``handle(name, payload)`` method like :meth:`.Database.handle`, like a :class:`.FaultInjector`.
+        If this method raises a :exc:`.ServerError`, its arguments are used as the HTTP status and response.
+        If it raises a :exc:`.NetworkError`, the connection is closed without response.
+    :param port: the port to listen on. If ``0``, a free port is chosen.
+    """
+
+    def __init__(self, database=None, port=0):
+        if database is None:
+            database = Database()
+        self.__database = database
+        self.__port = port
+        self.__server = None
+        self.__thread = None
+
+    @property
+    def database(self):
+        """
+        The database served.
+        """
+        return self.__database
+
+    @property
+    def endpoint(self):
+        """
+        The HTTP endpoint to pass to :class:`.Connection`.
+
+        :type: string
+        """
+        return "http://127.0.0.1:{}/".format(self.__server.server_address[1])
+
+    def connection(self, retry_policy=None, hot_key_tracker=None, capacity_monitor=None, compressed_attributes=()):
+        """
+        Create a :class:`.Connection` to this server.
+        """
+        return _lv.Connection(
+            "us-west-2", _lv.StaticCredentials("DummyKey", "DummySecret"),
+            endpoint=self.endpoint, retry_policy=retry_policy, hot_key_tracker=hot_key_tracker, capacity_monitor=capacity_monitor,
+            compressed_attributes=compressed_attributes,
+        )
+
+    def start(self):
+        self.__server = http.server.ThreadingHTTPServer(("127.0.0.1", self.__port), _RequestHandler)
+        self.__server.daemon_threads = True
+        self.__server.database = self.__database
+        # A short poll interval makes stop fast
+        self.__thread = threading.Thread(target=self.__server.serve_forever, kwargs={"poll_interval": 0.01})
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *dummy):
+        self.stop()
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in a single segment, to avoid waiting for delayed ACKs
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        target = self.headers.get("X-Amz-Target", "")
+        try:
+            try:
+                payload = json.loads(body.decode("utf8"))
+            except ValueError:
+                raise _exn.SerializationException({"__type": "com.amazon.coral.service#SerializationException", "message": "Start of structure or map found where not expected"})
+            self.respond(200, self.server.database.handle(target.split(".")[-1], payload))
+        except _exn.ClientError as e:
+            self.respond(400, e.args[0])
+        except _exn.ServerError as e:
+            self.respond(*e.args)
+        except _exn.NetworkError:
+            self.close_connection = True
+        except Exception as e:
+            self.respond(500, {"__type": "com.amazonaws.dynamodb.v20120810#InternalServerError", "message": "{}: {}".format(e.__class__.__name__, e)})
+
+    def respond(self, status, data):
+        body = json.dumps(data).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/x-amz-json-1.0")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *dummy):
+        pass
@@ -0,0 +1,74 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+Try an :class:`.Autoscaler` policy offline, on a table of a :class:`.Database` with a simulated clock.
+
+>>> from LowVoltage.stand_in import simulate_autoscaling
+>>> periods = simulate_autoscaling(lambda t: (10, 1 if t < 3600 else 0), 120, lower_utilization=0.5)
+>>> [(p.time, p.read_capacity, p.write_capacity) for p in periods if p.decisions]
+[(0, 1, 1), (60, 2, 2), (120, 4, 2), (180, 8, 2), (3720, 16, 2)]
+"""
+
+import collections
+import math
+
+import LowVoltage as _lv
+from .database import Database
+
+
+SimulatedPeriod = collections.namedtuple(
+    "SimulatedPeriod",
+    "time read_demand read_capacity read_throttles write_demand write_capacity write_throttles decisions"
+)
+"""
+A period of :func:`simulate_autoscaling`: the demand, provisioned capacity and throttles during the period starting at ``time``,
+and the :class:`.ScalingDecision` taken at its end.
+"""
+
+
+def simulate_autoscaling(demand, periods, interval=60, throughput=(1, 1), start=0., **kwds):
+    """
+    Simulate ``periods`` steps of an :class:`.Autoscaler`, ``interval`` seconds apart, on a table
+    initially provisioned with ``throughput`` (a pair of read and write capacity units).
+
+    :param demand: a function of the time (in seconds since the beginning of the simulation)
+        returning the read and write capacity units per second the application tries to consume.
+    :param start: the timestamp of the beginning of the simulation. The number of decreases is reset at midnight UTC.
+
+    Other keyword arguments are passed to the :class:`.Autoscaler`.
+
+    During each period, the table consumes its demand up to its provisioned capacity, and each unit above is a throttle.
+    The :class:`.UpdateTable` actions are applied to the :class:`.Database`, so they are subject to the limit on decreases.
+
+    Return a list of :class:`SimulatedPeriod`.
+    """
+    table = "Simulated"
+    database = Database()
+    clock = [start]
+    # Dependency injection through monkey-patching
+    database._Database__now = lambda: clock[0]
+    database(_lv.CreateTable(table).hash_key("h", _lv.STRING).provisioned_throughput(*throughput))
+    monitor = _lv.CapacityMonitor()
+    autoscaler = _lv.Autoscaler(database, monitor, [table], **kwds)
+
+    results = []
+    for period in range(periods):
+        time = period * interval
+        clock[0] = start + time
+        provisioned = database(_lv.DescribeTable(table)).table.provisioned_throughput
+        read_demand, write_demand = demand(time)
+        throttles = {}
+        for kind, wanted, capacity in (("read", read_demand, provisioned.read_capacity_units), ("write", write_demand, provisioned.write_capacity_units)):
+            throttles[kind] = int(math.ceil(max(0., wanted - capacity) * interval))
+            monitor.record(table, kind, min(wanted, capacity) * interval, throttles[kind])
+        clock[0] = start + time + interval
+        decisions = autoscaler.step(elapsed=interval)
+        results.append(SimulatedPeriod(
+            time,
+            read_demand, provisioned.read_capacity_units, throttles["read"],
+            write_demand, provisioned.write_capacity_units, throttles["write"],
+            decisions,
+        ))
+    return results
@@ -0,0 +1,9 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .test_database import DatabaseUnitTests
+from .test_expressions import ExpressionsUnitTests
+from .test_faults import FaultInjectorUnitTests
+from .test_server import ServerUnitTests
+from .test_simulation import SimulationUnitTests
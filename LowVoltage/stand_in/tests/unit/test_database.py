@@ -0,0 +1,290 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import datetime
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in.database import Database
+
+
+class DatabaseUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(DatabaseUnitTests, self).setUp()
+        self.database = Database()
+        self.database._Database__now = lambda: 1234567890.5
+        self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 2))
+        self.database(
+            _lv.CreateTable("Bbb").hash_key("h", _lv.STRING).range_key("r", _lv.NUMBER).provisioned_throughput(1, 2)
+                .local_secondary_index("lsi").hash_key("h").range_key("lr", _lv.NUMBER).project_all()
+                .global_secondary_index("gsi").hash_key("gh", _lv.STRING).range_key("gr", _lv.NUMBER).project("a").provisioned_throughput(3, 4)
+        )
+
+    def test_describe_table(self):
+        self.database(_lv.PutItem("Bbb", {"h": "x", "r": 0, "gh": "y", "gr": 1, "a": 2, "b": 3}))
+        description = self.database(_lv.DescribeTable("Bbb")).table
+        self.assertEqual(description.table_name, "Bbb")
+        self.assertEqual(description.table_status, "ACTIVE")
+        self.assertEqual(description.item_count, 1)
+        self.assertEqual([(e.attribute_name, e.key_type) for e in description.key_schema], [("h", "HASH"), ("r", "RANGE")])
+        self.assertEqual(description.provisioned_throughput.read_capacity_units, 1)
+        self.assertEqual(description.creation_date_time.year, 2009)
+        gsi, = description.global_secondary_indexes
+        self.assertEqual(gsi.index_name, "gsi")
+        self.assertEqual(gsi.index_status, "ACTIVE")
+        self.assertEqual(gsi.item_count, 1)
+        self.assertEqual(gsi.projection.non_key_attributes, ["a"])
+        self.assertEqual(gsi.provisioned_throughput.write_capacity_units, 4)
+        lsi, = description.local_secondary_indexes
+        self.assertEqual(lsi.index_name, "lsi")
+        self.assertEqual(lsi.item_count, 0)
+
+    def test_create_existing_table(self):
+        with self.assertRaises(_lv.ResourceInUseException) as catcher:
+            self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        self.assertEqual(catcher.exception.args, ({"__type": "com.amazonaws.dynamodb.v20120810#ResourceInUseException", "message": "Table already exists: Aaa"},))
+
+    def test_create_table_with_invalid_schema(self):
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.CreateTable("Ccc").hash_key("h", _lv.NUMBER).attribute_definition("x", _lv.NUMBER).provisioned_throughput(1, 1))
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.CreateTable("Ccc").hash_key("h", _lv.NUMBER).range_key("r").provisioned_throughput(1, 1))
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.CreateTable("Ccc").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1).local_secondary_index("lsi").hash_key("h").range_key("r", _lv.NUMBER).project_all())
+        self.assertEqual(self.database(_lv.ListTables()).table_names, ["Aaa", "Bbb"])
+
+    def test_update_table(self):
+        self.database(
+            _lv.UpdateTable("Bbb").provisioned_throughput(5, 6)
+                .create_global_secondary_index("gsi2").hash_key("g2", _lv.NUMBER).project_all().provisioned_throughput(1, 1)
+        )
+        description = self.database(_lv.UpdateTable("Bbb").delete_global_secondary_index("gsi")).table_description
+        self.assertEqual([(i.index_name, i.index_status) for i in description.global_secondary_indexes], [("gsi2", "ACTIVE"), ("gsi", "DELETING")])
+        description = self.database(_lv.DescribeTable("Bbb")).table
+        self.assertEqual(description.provisioned_throughput.read_capacity_units, 5)
+        self.assertEqual([i.index_name for i in description.global_secondary_indexes], ["gsi2"])
+        self.assertEqual(sorted(d.attribute_name for d in description.attribute_definitions), ["g2", "h", "lr", "r"])
+
+    def test_decreases_per_day(self):
+        for units in range(10, 6, -1):
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(units, units))
+        # Fourth decrease
+        self.database(_lv.UpdateTable("Aaa").provisioned_throughput(5, 5))
+        with self.assertRaises(_lv.LimitExceededException):
+            self.database(_lv.UpdateTable("Aaa").provisioned_throughput(4, 4))
+        # GSIs have their own limits
+        self.database(_lv.UpdateTable("Bbb").update_global_secondary_index("gsi").provisioned_throughput(2, 2))
+        throughput = self.database(_lv.DescribeTable("Aaa")).table.provisioned_throughput
+        self.assertEqual((throughput.read_capacity_units, throughput.number_of_decreases_today), (5, 4))
+        self.assertEqual(throughput.last_decrease_date_time, datetime.datetime(2009, 2, 13, 23, 31, 30, 500000))
+        # Next UTC day
+        self.database._Database__now = lambda: 1234567890.5 + 3600
+        self.assertEqual(self.database(_lv.DescribeTable("Aaa")).table.provisioned_throughput.number_of_decreases_today, 0)
+        self.database(_lv.UpdateTable("Aaa").provisioned_throughput(4, 4))
+
+    def test_delete_table(self):
+        self.assertEqual(self.database(_lv.DeleteTable("Aaa")).table_description.table_status, "DELETING")
+        with self.assertRaises(_lv.ResourceNotFoundException):
+            self.database(_lv.DescribeTable("Aaa"))
+
+    def test_list_tables(self):
+        r = self.database(_lv.ListTables().limit(1))
+        self.assertEqual(r.table_names, ["Aaa"])
+        self.assertEqual(r.last_evaluated_table_name, "Aaa")
+        r = self.database(_lv.ListTables().exclusive_start_table_name("Aaa"))
+        self.assertEqual(r.table_names, ["Bbb"])
+        self.assertIsNone(r.last_evaluated_table_name)
+        self.assertEqual(list(_lv.iterate_list_tables(self.database)), ["Aaa", "Bbb"])
+
+    def test_put_get_delete(self):
+        self.assertIsNone(self.database(_lv.GetItem("Aaa", {"h": 0})).item)
+        self.database(_lv.PutItem("Aaa", {"h": 0, "a": [1, "b"], "m": {"x": {"y"}}}))
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0, "a": [1, "b"], "m": {"x": {"y"}}})
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0}).project("h", "m.x")).item, {"h": 0, "m": {"x": {"y"}}})
+        self.assertEqual(self.database(_lv.DeleteItem("Aaa", {"h": 0}).return_values_all_old()).attributes, {"h": 0, "a": [1, "b"], "m": {"x": {"y"}}})
+        self.assertIsNone(self.database(_lv.GetItem("Aaa", {"h": 0})).item)
+
+    def test_put_with_return_values(self):
+        self.assertIsNone(self.database(_lv.PutItem("Aaa", {"h": 0, "a": 1}).return_values_all_old()).attributes)
+        self.assertEqual(self.database(_lv.PutItem("Aaa", {"h": 0, "a": 2}).return_values_all_old()).attributes, {"h": 0, "a": 1})
+
+    def test_consumed_capacity(self):
+        self.assertEqual(self.database(_lv.PutItem("Aaa", {"h": 0}).return_consumed_capacity_total()).consumed_capacity.capacity_units, 1)
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0}).return_consumed_capacity_total()).consumed_capacity.capacity_units, 0.5)
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0}).return_consumed_capacity_total().consistent_read_true()).consumed_capacity.capacity_units, 1)
+
+    def test_invalid_keys(self):
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.GetItem("Aaa", {"h": "0"}))
+        self.assertEqual(catcher.exception.args[0]["message"], "The provided key element does not match the schema")
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.PutItem("Bbb", {"h": "0"}))
+        self.assertEqual(catcher.exception.args[0]["message"], "One or more parameter values were invalid: Missing the key r in the item")
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.PutItem("Bbb", {"h": "0", "r": 0, "gr": "1"}))
+        self.assertEqual(catcher.exception.args[0]["message"], "One or more parameter values were invalid: Type mismatch for Index Key gr Expected: N Actual: S IndexName: gsi")
+        with self.assertRaises(_lv.ResourceNotFoundException):
+            self.database(_lv.GetItem("Ccc", {"h": 0}))
+
+    def test_conditions(self):
+        self.database(_lv.PutItem("Aaa", {"h": 0, "a": 1}))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            self.database(_lv.PutItem("Aaa", {"h": 0}).condition_expression("attribute_not_exists(h)"))
+        with self.assertRaises(_lv.ConditionalCheckFailedException):
+            self.database(_lv.DeleteItem("Aaa", {"h": 0}).condition_expression("a = :v").expression_attribute_value("v", 2))
+        self.database(_lv.DeleteItem("Aaa", {"h": 0}).condition_expression("a = :v").expression_attribute_value("v", 1))
+        self.database(_lv.PutItem("Aaa", {"h": 0}).condition_expression("attribute_not_exists(h)"))
+
+    def test_invalid_expression(self):
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.PutItem("Aaa", {"h": 0}).condition_expression("a = :v"))
+        self.assertEqual(catcher.exception.args[0]["message"], "An expression attribute value used in expression is not defined; attribute value: :v")
+
+    def test_update_item(self):
+        r = self.database(
+            _lv.UpdateItem("Aaa", {"h": 0}).set("a", ":v").add("c", "one").expression_attribute_value("v", "x").expression_attribute_value("one", 1).return_values_all_new()
+        )
+        self.assertEqual(r.attributes, {"h": 0, "a": "x", "c": 1})
+        r = self.database(
+            _lv.UpdateItem("Aaa", {"h": 0}).add("c", "one").remove("a").expression_attribute_value("one", 1).return_values_updated_old()
+        )
+        self.assertEqual(r.attributes, {"a": "x", "c": 1})
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0, "c": 2})
+
+    def test_update_item_without_expression_creates_item(self):
+        self.database(_lv.UpdateItem("Aaa", {"h": 0}))
+        self.assertEqual(self.database(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0})
+
+    def test_update_key(self):
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.UpdateItem("Aaa", {"h": 0}).set("h", ":v").expression_attribute_value("v", 1))
+        self.assertEqual(catcher.exception.args[0]["message"], "One or more parameter values were invalid: Cannot update attribute h. This attribute is part of the key")
+
+    def test_batch_get_item(self):
+        self.database(_lv.PutItem("Aaa", {"h": 0, "a": 1}))
+        self.database(_lv.PutItem("Bbb", {"h": "x", "r": 0}))
+        r = self.database(_lv.BatchGetItem().table("Aaa").keys({"h": 0}, {"h": 1}).project("a").table("Bbb").keys({"h": "x", "r": 0}))
+        self.assertEqual(r.responses, {"Aaa": [{"a": 1}], "Bbb": [{"h": "x", "r": 0}]})
+        self.assertEqual(r.unprocessed_keys, {})
+
+    def test_batch_get_item_with_duplicates(self):
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.BatchGetItem().table("Aaa").keys({"h": 0}, {"h": 0}))
+
+    def test_batch_limit(self):
+        self.database._Database__batch_limit = 3
+        r = self.database(_lv.BatchWriteItem().table("Aaa").put({"h": i} for i in range(5)))
+        self.assertEqual(r.unprocessed_items, {"Aaa": [{"PutRequest": {"Item": {"h": {"N": "3"}}}}, {"PutRequest": {"Item": {"h": {"N": "4"}}}}]})
+        r = self.database(_lv.BatchGetItem().table("Aaa").keys({"h": i} for i in range(5)).project("h"))
+        self.assertEqual(r.responses, {"Aaa": [{"h": 0}, {"h": 1}, {"h": 2}]})
+        self.assertEqual(r.unprocessed_keys, {"Aaa": {"Keys": [{"h": {"N": "3"}}, {"h": {"N": "4"}}], "ProjectionExpression": "h"}})
+        retry_policy = _lv.ExponentialBackoffRetryPolicy(0, 1, 10)
+        _lv.batch_put_item(self.database, "Aaa", ({"h": i} for i in range(10)), retry_policy=retry_policy)
+        self.assertEqual(sorted(item["h"] for item in _lv.iterate_batch_get_item(self.database, "Aaa", ({"h": i} for i in range(10)), retry_policy=retry_policy)), list(range(10)))
+
+    def test_batch_get_item_size(self):
+        for i in range(60):
+            self.database(_lv.PutItem("Aaa", {"h": i, "xs": "x" * 300000}))
+        r = self.database(_lv.BatchGetItem().table("Aaa").keys({"h": i} for i in range(60)))
+        self.assertEqual(len(r.responses["Aaa"]), 55)
+        self.assertEqual(r.unprocessed_keys, {"Aaa": {"Keys": [{"h": {"N": str(i)}} for i in range(55, 60)]}})
+
+    def test_batch_write_item(self):
+        self.database(_lv.PutItem("Aaa", {"h": 0}))
+        r = self.database(_lv.BatchWriteItem().table("Aaa").put({"h": 1}).delete({"h": 0}).return_consumed_capacity_total())
+        self.assertEqual(r.unprocessed_items, {})
+        self.assertEqual(r.consumed_capacity[0].capacity_units, 2)
+        self.assertEqual([item["h"] for item in _lv.iterate_scan(self.database, _lv.Scan("Aaa"))], [1])
+
+    def test_batch_write_item_limits(self):
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.BatchWriteItem().table("Aaa").put({"h": i} for i in range(26)))
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.BatchWriteItem().table("Aaa").put({"h": 0}).delete({"h": 0}))
+
+    def test_query(self):
+        self.database(_lv.BatchWriteItem().table("Bbb").put({"h": "x", "r": r, "lr": 10 - r, "a": r % 2} for r in range(10)).put({"h": "y", "r": 0}))
+        self.assertEqual(
+            [item["r"] for item in self.database(_lv.Query("Bbb").key_eq("h", "x").key_between("r", 3, 6)).items],
+            [3, 4, 5, 6]
+        )
+        self.assertEqual(
+            [item["r"] for item in self.database(_lv.Query("Bbb").key_eq("h", "x").key_gt("r", 6).scan_index_forward_false()).items],
+            [9, 8, 7]
+        )
+        self.assertEqual(
+            [item["r"] for item in self.database(_lv.Query("Bbb").index_name("lsi").key_eq("h", "x").key_le("lr", 2)).items],
+            [9, 8]
+        )
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x").filter_expression("a = :one").expression_attribute_value("one", 1).project("r"))
+        self.assertEqual(r.items, [{"r": 1}, {"r": 3}, {"r": 5}, {"r": 7}, {"r": 9}])
+        self.assertEqual((r.count, r.scanned_count), (5, 10))
+
+    def test_query_pagination(self):
+        self.database(_lv.BatchWriteItem().table("Bbb").put({"h": "x", "r": r} for r in range(10)))
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x").limit(4))
+        self.assertEqual([item["r"] for item in r.items], [0, 1, 2, 3])
+        self.assertEqual(r.last_evaluated_key, {"h": "x", "r": 3})
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x").limit(4).exclusive_start_key({"h": "x", "r": 7}))
+        self.assertEqual([item["r"] for item in r.items], [8, 9])
+        self.assertIsNone(r.last_evaluated_key)
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x").limit(2).exclusive_start_key({"h": "x", "r": 7}))
+        self.assertEqual([item["r"] for item in r.items], [8, 9])
+        self.assertEqual(r.last_evaluated_key, {"h": "x", "r": 9})
+        self.assertEqual([item["r"] for item in _lv.iterate_query(self.database, _lv.Query("Bbb").key_eq("h", "x").limit(3))], list(range(10)))
+
+    def test_query_page_size(self):
+        self.database._Database__max_page_size = 50
+        self.database(_lv.BatchWriteItem().table("Bbb").put({"h": "x", "r": r} for r in range(10)))
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x"))
+        self.assertEqual(len(r.items), 2)
+        self.assertEqual([item["r"] for item in _lv.iterate_query(self.database, _lv.Query("Bbb").key_eq("h", "x"))], list(range(10)))
+
+    def test_query_global_secondary_index(self):
+        self.database(_lv.BatchWriteItem().table("Bbb").put({"h": str(i), "r": i, "gh": "g", "gr": 10 - i, "a": i, "b": i} for i in range(5)))
+        r = self.database(_lv.Query("Bbb").index_name("gsi").key_eq("gh", "g").limit(2))
+        self.assertEqual(r.items, [{"h": "4", "r": 4, "gh": "g", "gr": 6, "a": 4}, {"h": "3", "r": 3, "gh": "g", "gr": 7, "a": 3}])
+        self.assertEqual(r.last_evaluated_key, {"h": "3", "r": 3, "gh": "g", "gr": 7})
+        self.assertEqual([item["a"] for item in _lv.iterate_query(self.database, _lv.Query("Bbb").index_name("gsi").key_eq("gh", "g").limit(2))], [4, 3, 2, 1, 0])
+
+    def test_query_without_hash_key(self):
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database(_lv.Query("Bbb").key_eq("r", 0))
+        self.assertEqual(catcher.exception.args[0]["message"], "Query condition missed key schema element: h")
+        with self.assertRaises(_lv.ValidationException):
+            self.database(_lv.Query("Bbb").index_name("nope").key_eq("h", "x"))
+
+    def test_query_count(self):
+        self.database(_lv.BatchWriteItem().table("Bbb").put({"h": "x", "r": r} for r in range(10)))
+        r = self.database(_lv.Query("Bbb").key_eq("h", "x").select_count())
+        self.assertIsNone(r.items)
+        self.assertEqual(r.count, 10)
+
+    def test_scan(self):
+        self.database(_lv.BatchWriteItem().table("Aaa").put({"h": h, "a": h % 3} for h in range(20)))
+        items = [item["h"] for item in _lv.iterate_scan(self.database, _lv.Scan("Aaa").limit(3))]
+        self.assertEqual(sorted(items), list(range(20)))
+        self.assertNotEqual(items, list(range(20)))
+        self.assertEqual(
+            sorted(item["h"] for item in _lv.iterate_scan(self.database, _lv.Scan("Aaa").filter_expression("a = :z").expression_attribute_value("z", 0))),
+            [0, 3, 6, 9, 12, 15, 18]
+        )
+
+    def test_parallel_scan(self):
+        self.database(_lv.BatchWriteItem().table("Aaa").put({"h": h} for h in range(20)))
+        segments = [
+            [item["h"] for item in _lv.iterate_scan(self.database, _lv.Scan("Aaa").segment(segment, 3).limit(2))]
+            for segment in range(3)
+        ]
+        self.assertEqual(sorted(sum(segments, [])), list(range(20)))
+        self.assertTrue(all(segments))
+
+    def test_unsupported_parameter(self):
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.database.handle("GetItem", {"TableName": "Aaa", "Key": {"h": {"N": "0"}}, "AttributesToGet": ["h"]})
+        self.assertEqual(catcher.exception.args[0]["message"], "AttributesToGet is not supported by LowVoltage's stand-in")
+
+    def test_unknown_operation(self):
+        with self.assertRaises(_lv.UnknownOperationException):
+            self.database.handle("Foo", {})
@@ -0,0 +1,122 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import base64
+import decimal
+
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in.expressions import ExpressionError, comparable, format_number, parse_condition, parse_projection, parse_update
+
+
+class ExpressionsUnitTests(_tst.UnitTests):
+    item = {
+        "h": {"N": "42"},
+        "s": {"S": "foobar"},
+        "ss": {"SS": ["a", "b"]},
+        "ns": {"NS": ["1", "2"]},
+        "l": {"L": [{"N": "1"}, {"S": "two"}]},
+        "m": {"M": {"a": {"N": "3"}, "b": {"M": {"c": {"S": "d"}}}}},
+    }
+
+    def evaluate(self, expression, names=None, values=None):
+        return parse_condition(expression, names, values)(self.item)
+
+    def test_comparisons(self):
+        self.assertTrue(self.evaluate("h = :v", values={":v": {"N": "42.0"}}))
+        self.assertTrue(self.evaluate("h <> :v", values={":v": {"S": "42"}}))
+        self.assertTrue(self.evaluate("h < :v", values={":v": {"N": "100"}}))
+        self.assertFalse(self.evaluate("h < :v", values={":v": {"S": "100"}}))
+        self.assertTrue(self.evaluate("s >= :v", values={":v": {"S": "foo"}}))
+        self.assertFalse(self.evaluate("nope = :v", values={":v": {"S": "foo"}}))
+
+    def test_names(self):
+        self.assertTrue(self.evaluate("#n = :v", names={"#n": "h"}, values={":v": {"N": "42"}}))
+        with self.assertRaises(ExpressionError):
+            self.evaluate("#x = :v", values={":v": {"N": "42"}})
+
+    def test_boolean_operators(self):
+        values = {":a": {"N": "42"}, ":b": {"N": "0"}}
+        self.assertTrue(self.evaluate("h = :a AND NOT h = :b", values=values))
+        self.assertTrue(self.evaluate("h = :b OR h = :a", values=values))
+        self.assertFalse(self.evaluate("h = :b OR (h = :a AND h = :b)", values=values))
+
+    def test_between_and_in(self):
+        values = {":a": {"N": "40"}, ":b": {"N": "50"}, ":c": {"N": "42"}}
+        self.assertTrue(self.evaluate("h BETWEEN :a AND :b", values=values))
+        self.assertTrue(self.evaluate("h IN (:a, :c)", values=values))
+        self.assertFalse(self.evaluate("h IN (:a, :b)", values=values))
+
+    def test_functions(self):
+        self.assertTrue(self.evaluate("attribute_exists(m.b.c) AND attribute_not_exists(m.x)"))
+        self.assertTrue(self.evaluate("attribute_type(ss, :t)", values={":t": {"S": "SS"}}))
+        self.assertTrue(self.evaluate("begins_with(s, :p)", values={":p": {"S": "foo"}}))
+        self.assertTrue(self.evaluate("contains(ss, :e) AND contains(s, :f)", values={":e": {"S": "b"}, ":f": {"S": "oba"}}))
+        self.assertTrue(self.evaluate("contains(ns, :e)", values={":e": {"N": "2.0"}}))
+        self.assertTrue(self.evaluate("size(l) = :two AND size(s) > :two", values={":two": {"N": "2"}}))
+
+    def test_paths(self):
+        self.assertTrue(self.evaluate("l[1] = :v AND m.a = :w", values={":v": {"S": "two"}, ":w": {"N": "3"}}))
+
+    def test_syntax_errors(self):
+        with self.assertRaises(ExpressionError):
+            self.evaluate("h = ")
+        with self.assertRaises(ExpressionError):
+            self.evaluate("h = :v :v", values={":v": {"N": "42"}})
+        with self.assertRaises(ExpressionError):
+            self.evaluate("h = :undefined")
+
+    def test_projection(self):
+        self.assertEqual(
+            parse_projection("h, #m.b, l[1], nope", {"#m": "m"})(self.item),
+            {"h": {"N": "42"}, "m": {"M": {"b": {"M": {"c": {"S": "d"}}}}}, "l": {"L": [{"S": "two"}]}}
+        )
+
+    def test_update(self):
+        update = parse_update(
+            "SET a = :one, h = h + :one, l = list_append(l, :l), m.a = if_not_exists(m.x, :one), n = if_not_exists(h, :one) "
+            "REMOVE s, m.b ADD ss :ss, c :one DELETE ns :ns",
+            {},
+            {":one": {"N": "1"}, ":l": {"L": [{"N": "3"}]}, ":ss": {"SS": ["b", "c"]}, ":ns": {"NS": ["1.0"]}},
+        )
+        updated, names = update(self.item)
+        self.assertEqual(
+            updated,
+            {
+                "a": {"N": "1"},
+                "c": {"N": "1"},
+                "h": {"N": "43"},
+                "n": {"N": "42"},
+                "ss": {"SS": ["a", "b", "c"]},
+                "ns": {"NS": ["2"]},
+                "l": {"L": [{"N": "1"}, {"S": "two"}, {"N": "3"}]},
+                "m": {"M": {"a": {"N": "1"}}},
+            }
+        )
+        self.assertEqual(names, set(["a", "c", "h", "n", "ss", "ns", "l", "m", "s"]))
+        self.assertEqual(self.item["h"], {"N": "42"})
+
+    def test_update_errors(self):
+        with self.assertRaises(ExpressionError):
+            parse_update("SET h = h + :s", {}, {":s": {"S": "x"}})(self.item)
+        with self.assertRaises(ExpressionError):
+            parse_update("SET x.y = :s", {}, {":s": {"S": "x"}})(self.item)
+        with self.assertRaises(ExpressionError):
+            parse_update("", {}, {})
+        with self.assertRaises(ExpressionError):
+            parse_update("FOO h", {}, {})
+        with self.assertRaises(ExpressionError):
+            parse_update("ADD ss :ss DELETE ss :ss", {}, {":ss": {"SS": ["a"]}})
+        with self.assertRaises(ExpressionError):
+            parse_update("SET m.a = :s REMOVE m", {}, {":s": {"S": "x"}})
+
+    def test_comparable(self):
+        self.assertEqual(comparable({"N": "1.50"}), comparable({"N": "1.5"}))
+        self.assertEqual(comparable({"SS": ["a", "b"]}), comparable({"SS": ["b", "a"]}))
+        self.assertEqual(comparable({"M": {"a": {"L": [{"N": "1"}]}}}), comparable({"M": {"a": {"L": [{"N": "1.0"}]}}}))
+        self.assertLess(comparable({"B": base64.b64encode(b"\x01").decode()}), comparable({"B": base64.b64encode(b"\xff").decode()}))
+
+    def test_format_number(self):
+        self.assertEqual(format_number(decimal.Decimal("3.0")), "3")
+        self.assertEqual(format_number(decimal.Decimal("0.10")), "0.1")
+        self.assertEqual(format_number(decimal.Decimal("1E+2")), "100")
@@ -0,0 +1,81 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in.database import Database
+from LowVoltage.stand_in.faults import FaultInjector
+
+
+class FaultInjectorUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(FaultInjectorUnitTests, self).setUp()
+        self.database = Database()
+        self.database(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+
+    def test_no_faults(self):
+        injector = FaultInjector(self.database)
+        injector(_lv.PutItem("Aaa", {"h": 0}))
+        self.assertEqual(injector(_lv.GetItem("Aaa", {"h": 0})).item, {"h": 0})
+        self.assertEqual(injector.injected, {})
+
+    def test_throttling(self):
+        injector = FaultInjector(self.database, throttling=1)
+        with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+            injector(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(injector.injected, {"throttling": 1})
+
+    def test_server_errors(self):
+        injector = FaultInjector(self.database, server_errors=1)
+        with self.assertRaises(_lv.ServerError) as catcher:
+            injector(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(catcher.exception.args[0], 500)
+        self.assertEqual(injector.injected, {"server_errors": 1})
+
+    def test_dropped_connections(self):
+        injector = FaultInjector(self.database, dropped_connections=1)
+        with self.assertRaises(_lv.NetworkError):
+            injector(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(injector.injected, {"dropped_connections": 1})
+
+    def test_actions(self):
+        injector = FaultInjector(self.database, throttling=1, actions=["PutItem"])
+        self.assertIsNone(injector(_lv.GetItem("Aaa", {"h": 0})).item)
+        with self.assertRaises(_lv.ProvisionedThroughputExceededException):
+            injector(_lv.PutItem("Aaa", {"h": 0}))
+
+    def test_latency(self):
+        delays = []
+        injector = FaultInjector(self.database, latency=0.5)
+        injector._FaultInjector__sleep = delays.append
+        injector(_lv.GetItem("Aaa", {"h": 0}))
+        injector(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(delays, [0.5, 0.5])
+        self.assertEqual(injector.injected, {"latency": 1.})
+
+    def test_latency_distribution(self):
+        delays = []
+        injector = FaultInjector(self.database, latency=iter([0.1, 0.2]).__next__)
+        injector._FaultInjector__sleep = delays.append
+        injector(_lv.GetItem("Aaa", {"h": 0}))
+        injector(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(delays, [0.1, 0.2])
+
+    def test_all_unprocessed(self):
+        injector = FaultInjector(self.database, unprocessed=1)
+        r = injector(_lv.BatchWriteItem().table("Aaa").put({"h": 0}, {"h": 1}))
+        self.assertEqual(r.unprocessed_items, {"Aaa": [{"PutRequest": {"Item": {"h": {"N": "0"}}}}, {"PutRequest": {"Item": {"h": {"N": "1"}}}}]})
+        r = injector(_lv.BatchGetItem().table("Aaa").keys({"h": 0}).project("h"))
+        self.assertEqual(r.responses, {})
+        self.assertEqual(r.unprocessed_keys, {"Aaa": {"Keys": [{"h": {"N": "0"}}], "ProjectionExpression": "h"}})
+        self.assertEqual(injector.injected, {"unprocessed": 3})
+        self.assertEqual(list(_lv.iterate_scan(self.database, _lv.Scan("Aaa"))), [])
+
+    def test_partially_unprocessed(self):
+        injector = FaultInjector(self.database, unprocessed=0.5, seed=42)
+        retry_policy = _lv.ExponentialBackoffRetryPolicy(0, 1, 100)
+        _lv.batch_put_item(injector, "Aaa", ({"h": h} for h in range(100)), retry_policy=retry_policy)
+        self.assertEqual(sorted(item["h"] for item in _lv.iterate_scan(self.database, _lv.Scan("Aaa"))), list(range(100)))
+        self.assertEqual(sorted(item["h"] for item in _lv.iterate_batch_get_item(injector, "Aaa", ({"h": h} for h in range(100)), retry_policy=retry_policy)), list(range(100)))
+        self.assertGreater(injector.injected["unprocessed"], 50)
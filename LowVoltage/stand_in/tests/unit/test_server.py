@@ -0,0 +1,54 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in.database import Database
+from LowVoltage.stand_in.faults import FaultInjector
+from LowVoltage.stand_in.server import Server
+
+
+class ServerUnitTests(_tst.UnitTests):
+    def setUp(self):
+        super(ServerUnitTests, self).setUp()
+        self.server = Server()
+        self.server.start()
+        self.connection = self.server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 0))
+
+    def tearDown(self):
+        self.server.stop()
+        super(ServerUnitTests, self).tearDown()
+
+    def test_actions(self):
+        self.connection(_lv.CreateTable("Aaa").hash_key("h", _lv.NUMBER).provisioned_throughput(1, 1))
+        _lv.batch_put_item(self.connection, "Aaa", ({"h": h, "a": "x" * h} for h in range(100)))
+        self.assertEqual(self.connection(_lv.GetItem("Aaa", {"h": 3})).item, {"h": 3, "a": "xxx"})
+        self.assertEqual(sorted(item["h"] for item in _lv.iterate_scan(self.connection, _lv.Scan("Aaa").limit(7))), list(range(100)))
+        self.connection(_lv.DeleteTable("Aaa"))
+
+    def test_client_error(self):
+        with self.assertRaises(_lv.ResourceNotFoundException) as catcher:
+            self.connection(_lv.GetItem("Aaa", {"h": 0}))
+        self.assertEqual(catcher.exception.args, ({"__type": "com.amazonaws.dynamodb.v20120810#ResourceNotFoundException", "message": "Requested resource not found: Table: Aaa not found"},))
+
+    def test_server_error(self):
+        self.server.database.handle = lambda name, payload: 1 / 0
+        with self.assertRaises(_lv.ServerError) as catcher:
+            self.connection(_lv.ListTables())
+        self.assertEqual(catcher.exception.args, (500, {"__type": "com.amazonaws.dynamodb.v20120810#InternalServerError", "message": "ZeroDivisionError: division by zero"}))
+
+    def test_dropped_connection(self):
+        with Server(FaultInjector(Database(), dropped_connections=1)) as server:
+            with self.assertRaises(_lv.NetworkError):
+                server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 0))(_lv.ListTables())
+
+    def test_retries(self):
+        with Server(FaultInjector(Database(), throttling=0.3, server_errors=0.3, dropped_connections=0.3, seed=42)) as server:
+            connection = server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(0, 1, 100))
+            for i in range(10):
+                self.assertEqual(connection(_lv.ListTables()).table_names, [])
+            injected = server.database.injected
+        self.assertGreater(injected["throttling"], 0)
+        self.assertGreater(injected["server_errors"], 0)
+        self.assertGreater(injected["dropped_connections"], 0)
@@ -0,0 +1,31 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import LowVoltage.testing as _tst
+from LowVoltage.stand_in.simulation import simulate_autoscaling
+
+
+class SimulationUnitTests(_tst.UnitTests):
+    def test_steady_demand(self):
+        periods = simulate_autoscaling(lambda t: (5, 0.5), 10, throughput=(10, 10), scale_down_periods=2)
+        self.assertEqual([(p.read_capacity, p.write_capacity) for p in periods], [(10, 10)] * 2 + [(10, 1)] * 8)
+        self.assertEqual(sum(p.read_throttles + p.write_throttles for p in periods), 0)
+
+    def test_spike(self):
+        periods = simulate_autoscaling(lambda t: (100 if 600 <= t < 1200 else 1, 1), 40, interval=60, max_units=200)
+        # Doubled after each throttled period, then decreased three periods after the spike
+        self.assertEqual([p.read_capacity for p in periods[9:24]], [2, 2, 4, 8, 16, 32, 64, 128, 128, 128, 128, 128, 128, 128, 2])
+        self.assertEqual([p.read_throttles > 0 for p in periods[9:18]], [False] + [True] * 6 + [False] * 2)
+
+    def test_decreases_are_limited(self):
+        # Demand oscillating every 10 minutes would need many decreases
+        periods = simulate_autoscaling(lambda t: (100 if (t // 600) % 2 else 1, 1), 24 * 6, interval=60, scale_down_periods=1)
+        decreases = [p.time for p in periods for d in p.decisions if d.kind == "read" and d.target < d.current]
+        self.assertEqual(len(decreases), 4)
+
+    def test_next_day(self):
+        periods = simulate_autoscaling(lambda t: (100 if (t // 600) % 2 else 1, 1), 24 * 6, interval=60, scale_down_periods=1, start=86400 - 3600)
+        decreases = [p.time for p in periods for d in p.decisions if d.kind == "read" and d.target < d.current]
+        # Two decreases before midnight UTC, and four after
+        self.assertEqual(len(decreases), 6)
@@ -0,0 +1,304 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+"""
+A :class:`Table` knows the key schema and indexes of a table and chooses the right action for each request.
+
+>>> t = Table(connection, table)
+>>> t.get({"h": 0})
+{'h': 0, 'gr': 10, 'gh': 0}
+>>> list(t.find({"gh": 4}))
+[{'h': 2, 'gr': 6, 'gh': 4}]
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+import LowVoltage as _lv
+from LowVoltage.actions.conversion import _convert_value_to_db
+from LowVoltage.variadic import variadic
+
+
+# Increment when the structure of the metadata changes
+_METADATA_FORMAT = 2
+
+
+class Table(object):
+    """
+    A table, and its metadata.
+
+    The key schema and the indexes of the table are fetched once, with a :class:`.DescribeTable` action, the first time they are needed.
+    If ``metadata_file`` is not ``None``, they are read from this JSON file instead, and written to it after the :class:`.DescribeTable`.
+    This allows several processes to share them. The same file can be used for several tables.
+    Delete the file when you modify the table.
+    Metadata written in another format (by another version of LowVoltage) is fetched again and overwritten.
+
+    Keys are validated locally: methods raise a :exc:`.ValidationException` for keys that don't match the key schema,
+    without sending any action.
+
+    :param connection: the :class:`.Connection` to use.
+    :param name: the name of the table.
+    :param metadata_file: the path of a JSON file.
+    """
+
+    def __init__(self, connection, name, metadata_file=None):
+        self.__connection = connection
+        self.__name = name
+        self.__metadata_file = metadata_file
+        self.__lock = threading.Lock()
+        self.__metadata = None
+
+    @property
+    def name(self):
+        """
+        :type: string
+        """
+        return self.__name
+
+    @property
+    def key_names(self):
+        """
+        The names of the key attributes: hash key, then range key if any.
+
+        :type: list of string
+        """
+        return list(self._metadata["key"])
+
+    @property
+    def indexes(self):
+        """
+        The names of the key attributes of the local and global secondary indexes.
+
+        :type: dict of string (index name) to list of string
+        """
+        return {name: list(index["key"]) for name, index in self._metadata["indexes"].items()}
+
+    def get(self, key, consistent_read=False):
+        """
+        Get an item with a :class:`.GetItem` action. Return ``None`` if it doesn't exist.
+        """
+        self.validate_key(key)
+        action = _lv.GetItem(self.__name, key)
+        if consistent_read:
+            action.consistent_read_true()
+        return self.__connection(action).item
+
+    @variadic(dict)
+    def batch_get(self, *keys):
+        """
+        Iterate over the items for ``keys``.
+        A single key is sent in a :class:`.GetItem` action, several keys with :func:`.iterate_batch_get_item`.
+        Items are returned in an unspecified order.
+        """
+        for key in keys:
+            self.validate_key(key)
+        if len(keys) == 1:
+            item = self.get(keys[0])
+            if item is not None:
+                yield item
+        elif len(keys) > 1:
+            for item in _lv.iterate_batch_get_item(self.__connection, self.__name, keys):
+                yield item
+
+    def find(self, conditions, attributes=None):
+        """
+        Iterate over the items whose attributes are equal to ``conditions`` (a dict).
+        The action is chosen by :meth:`plan`.
+
+        :param attributes: the names of the attributes to return, or ``None`` for all attributes.
+        """
+        plan = self.plan(conditions, attributes)
+        if isinstance(plan.action, _lv.GetItem):
+            item = self.__connection(plan.action).item
+            if item is not None:
+                yield item
+        elif isinstance(plan.action, _lv.Query):
+            for item in _lv.iterate_query(self.__connection, plan.action):
+                yield item
+        else:
+            for item in _lv.iterate_scan(self.__connection, plan.action):
+                yield item
+
+    def plan(self, conditions, attributes=None):
+        """
+        Choose the cheapest action to find the items whose attributes are equal to ``conditions``.
+        Return a :class:`QueryPlan`.
+
+        If ``conditions`` is exactly the primary key, a :class:`.GetItem` is chosen.
+        Else, the table and each of its indexes whose hash key is in ``conditions`` and whose projection contains
+        the ``attributes`` to return (all attributes if ``None``) and the attributes in ``conditions`` are candidates for a :class:`.Query`.
+        Candidates whose range key is also in ``conditions`` are preferred,
+        then the candidate with the smallest projection (``KEYS_ONLY``, then ``INCLUDE``, then ``ALL``), then the table itself.
+        Conditions that are not on the key of the chosen candidate are sent in a filter expression.
+        If there is no candidate, a :class:`.Scan` with a filter expression is chosen.
+
+        >>> print(Table(connection, table).plan({"gh": 4}, ["h"]).explanation)
+        Query on index gsi (projection ALL) of table LowVoltage.Tests.Doc.1: its key matches the conditions on gh
+        """
+        metadata = self._metadata
+        if attributes is not None:
+            attributes = sorted(attributes)
+
+        if set(conditions) == set(metadata["key"]):
+            self.validate_key(conditions)
+            action = _lv.GetItem(self.__name, conditions)
+            if attributes is not None:
+                action.project(*attributes)
+            return QueryPlan(action, None, "GetItem on table {}: the conditions are its primary key".format(self.__name))
+
+        needed = None if attributes is None else set(attributes) | set(conditions)
+        candidates = []
+        for position, (index_name, index) in enumerate([(None, {"key": metadata["key"], "projection": "ALL"})] + sorted(metadata["indexes"].items())):
+            if index["key"][0] not in conditions:
+                continue
+            projected = _projected_attributes(metadata["key"], index)
+            if projected is not None and (needed is None or not needed <= projected):
+                continue
+            key_conditions = [name for name in index["key"] if name in conditions]
+            size = float("inf") if projected is None else len(projected)
+            candidates.append(((-len(key_conditions), size, position), index_name, index, key_conditions))
+
+        if candidates:
+            _, index_name, index, key_conditions = min(candidates, key=lambda c: c[0])
+            action = _lv.Query(self.__name)
+            if index_name is None:
+                explanation = "Query on table {}".format(self.__name)
+            else:
+                action.index_name(index_name)
+                explanation = "Query on index {} (projection {}) of table {}".format(index_name, index["projection"], self.__name)
+            for name in key_conditions:
+                action.key_eq(name, conditions[name])
+            explanation += ": its key matches the conditions on {}".format(", ".join(key_conditions))
+            filtered = {name: value for name, value in conditions.items() if name not in key_conditions}
+        else:
+            action = _lv.Scan(self.__name)
+            explanation = "Scan of table {} filtered on {}: no key or index matches the conditions and the attributes to return".format(self.__name, ", ".join(sorted(conditions)))
+            filtered = conditions
+        if filtered:
+            _filter(action, filtered)
+            if candidates:
+                explanation += ", filtered on {}".format(", ".join(sorted(filtered)))
+        if attributes is not None:
+            action.project(*attributes)
+        return QueryPlan(action, index_name if candidates else None, explanation)
+
+    def validate_key(self, key):
+        """
+        :raise: :exc:`.ValidationException` if ``key`` doesn't match the key schema of the table.
+        """
+        metadata = self._metadata
+        if set(key) != set(metadata["key"]):
+            raise _lv.ValidationException("The provided key element does not match the schema: expected {}, got {}".format(sorted(metadata["key"]), sorted(key)))
+        for name in metadata["key"]:
+            if list(_convert_value_to_db(key[name]).keys()) != [metadata["types"][name]]:
+                raise _lv.ValidationException("The provided key element does not match the schema: attribute {} should be of type {}".format(name, metadata["types"][name]))
+
+    @property
+    def _metadata(self):
+        with self.__lock:
+            if self.__metadata is None:
+                self.__metadata = self.__read_metadata_file()
+            if self.__metadata is None:
+                self.__metadata = self.__describe()
+                self.__write_metadata_file()
+            return self.__metadata
+
+    def __describe(self):
+        description = self.__connection(_lv.DescribeTable(self.__name)).table
+        indexes = {}
+        for index in (description.local_secondary_indexes or []) + (description.global_secondary_indexes or []):
+            projection = index.projection
+            indexes[index.index_name] = {
+                "key": _key_names(index.key_schema),
+                "projection": "ALL" if projection is None else projection.projection_type,
+                "non_key_attributes": [] if projection is None else (projection.non_key_attributes or []),
+            }
+        return {
+            "format": _METADATA_FORMAT,
+            "key": _key_names(description.key_schema),
+            "indexes": indexes,
+            "types": {d.attribute_name: d.attribute_type for d in description.attribute_definitions},
+        }
+
+    def __read_metadata_file(self):
+        if self.__metadata_file is not None and os.path.exists(self.__metadata_file):
+            with open(self.__metadata_file) as f:
+                metadata = json.load(f).get(self.__name)
+            # Format 1 (no "format" field) had no projections: it's not enough to plan queries
+            if metadata is not None and metadata.get("format") == _METADATA_FORMAT:
+                return metadata
+
+    def __write_metadata_file(self):
+        if self.__metadata_file is not None:
+            metadata = {}
+            if os.path.exists(self.__metadata_file):
+                with open(self.__metadata_file) as f:
+                    metadata = json.load(f)
+            metadata[self.__name] = self.__metadata
+            # Write then rename, so that concurrent processes never read a partial file
+            fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.__metadata_file)))
+            with os.fdopen(fd, "w") as f:
+                json.dump(metadata, f, sort_keys=True)
+            os.replace(temp_file, self.__metadata_file)
+
+
+class QueryPlan(object):
+    """
+    The action chosen by :meth:`Table.plan`.
+    """
+
+    def __init__(self, action, index_name, explanation):
+        self.__action = action
+        self.__index_name = index_name
+        self.__explanation = explanation
+
+    @property
+    def action(self):
+        """
+        The action to send, or to pass to :func:`.iterate_query` or :func:`.iterate_scan`.
+
+        :type: :class:`.GetItem` or :class:`.Query` or :class:`.Scan`
+        """
+        return self.__action
+
+    @property
+    def index_name(self):
+        """
+        :type: ``None`` or string
+        """
+        return self.__index_name
+
+    @property
+    def explanation(self):
+        """
+        Why this action was chosen.
+
+        :type: string
+        """
+        return self.__explanation
+
+
+def _key_names(key_schema):
+    return [e.attribute_name for e in sorted(key_schema, key=lambda e: e.key_type != "HASH")]
+
+
+def _projected_attributes(table_key, index):
+    # None means all attributes
+    if index["projection"] == "ALL":
+        return None
+    projected = set(table_key) | set(index["key"])
+    if index["projection"] == "INCLUDE":
+        projected |= set(index["non_key_attributes"])
+    return projected
+
+
+def _filter(action, conditions):
+    expressions = []
+    for i, (name, value) in enumerate(sorted(conditions.items())):
+        action.expression_attribute_name("lvf{}".format(i), name)
+        action.expression_attribute_value("lvf{}".format(i), value)
+        expressions.append("#lvf{0}=:lvf{0}".format(i))
+    action.filter_expression(" AND ".join(expressions))
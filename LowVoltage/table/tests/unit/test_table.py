@@ -0,0 +1,215 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import json
+import os
+import shutil
+import tempfile
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+from LowVoltage.table.table import Table
+
+
+class TableUnitTests(_tst.UnitTestsWithMocks):
+    def setUp(self):
+        super(TableUnitTests, self).setUp()
+        self.connection = self.mocks.create("connection")
+        self.table = Table(self.connection.object, "Aaa")
+
+    def expect_describe_table(self):
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("DescribeTable", {"TableName": "Aaa"})
+        ).andReturn(
+            _lv.DescribeTableResponse(Table={
+                "KeySchema": [{"AttributeName": "r", "KeyType": "RANGE"}, {"AttributeName": "h", "KeyType": "HASH"}],
+                "AttributeDefinitions": [
+                    {"AttributeName": "h", "AttributeType": "N"},
+                    {"AttributeName": "r", "AttributeType": "S"},
+                    {"AttributeName": "gh", "AttributeType": "S"},
+                    {"AttributeName": "lr", "AttributeType": "N"},
+                ],
+                "GlobalSecondaryIndexes": [
+                    {"IndexName": "gsi", "KeySchema": [{"AttributeName": "gh", "KeyType": "HASH"}], "Projection": {"ProjectionType": "KEYS_ONLY"}},
+                    {"IndexName": "gsi2", "KeySchema": [{"AttributeName": "gh", "KeyType": "HASH"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["a", "b"]}},
+                    {"IndexName": "gsi3", "KeySchema": [{"AttributeName": "gh", "KeyType": "HASH"}], "Projection": {"ProjectionType": "ALL"}},
+                ],
+                "LocalSecondaryIndexes": [
+                    {"IndexName": "lsi", "KeySchema": [{"AttributeName": "h", "KeyType": "HASH"}, {"AttributeName": "lr", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "ALL"}},
+                ],
+            })
+        )
+
+    def test_metadata(self):
+        self.expect_describe_table()
+        self.assertEqual(self.table.key_names, ["h", "r"])
+        self.assertEqual(self.table.indexes, {"gsi": ["gh"], "gsi2": ["gh"], "gsi3": ["gh"], "lsi": ["h", "lr"]})
+
+    def test_describe_table_only_once(self):
+        self.expect_describe_table()
+        self.table.validate_key({"h": 0, "r": "a"})
+        self.table.validate_key({"h": 1, "r": "b"})
+
+    def test_validate_key_with_missing_attribute(self):
+        self.expect_describe_table()
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.table.get({"h": 0})
+        self.assertEqual(catcher.exception.args, ("The provided key element does not match the schema: expected ['h', 'r'], got ['h']",))
+
+    def test_validate_key_with_wrong_type(self):
+        self.expect_describe_table()
+        with self.assertRaises(_lv.ValidationException) as catcher:
+            self.table.get({"h": "0", "r": "a"})
+        self.assertEqual(catcher.exception.args, ("The provided key element does not match the schema: attribute h should be of type N",))
+
+    def test_get(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("GetItem", {"TableName": "Aaa", "Key": {"h": {"N": "0"}, "r": {"S": "a"}}, "ConsistentRead": True})
+        ).andReturn(
+            _lv.GetItemResponse(Item={"h": {"N": "0"}, "r": {"S": "a"}, "a": {"S": "x"}})
+        )
+        self.assertEqual(self.table.get({"h": 0, "r": "a"}, consistent_read=True), {"h": 0, "r": "a", "a": "x"})
+
+    def test_batch_get_single_key(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("GetItem", {"TableName": "Aaa", "Key": {"h": {"N": "0"}, "r": {"S": "a"}}})
+        ).andReturn(
+            _lv.GetItemResponse()
+        )
+        self.assertEqual(list(self.table.batch_get({"h": 0, "r": "a"})), [])
+
+    def test_batch_get_several_keys(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("BatchGetItem", {"RequestItems": {"Aaa": {"Keys": [{"h": {"N": "0"}, "r": {"S": "a"}}, {"h": {"N": "1"}, "r": {"S": "b"}}]}}})
+        ).andReturn(
+            _lv.BatchGetItemResponse(Responses={"Aaa": [{"h": {"N": "1"}, "r": {"S": "b"}}]})
+        )
+        self.assertEqual(list(self.table.batch_get({"h": 0, "r": "a"}, {"h": 1, "r": "b"})), [{"h": 1, "r": "b"}])
+
+    def test_find_full_key(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("GetItem", {"TableName": "Aaa", "Key": {"h": {"N": "0"}, "r": {"S": "a"}}})
+        ).andReturn(
+            _lv.GetItemResponse(Item={"h": {"N": "0"}, "r": {"S": "a"}})
+        )
+        self.assertEqual(list(self.table.find({"h": 0, "r": "a"})), [{"h": 0, "r": "a"}])
+
+    def test_find_with_query(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Query", {"TableName": "Aaa", "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}}})
+        ).andReturn(
+            _lv.QueryResponse(Items=[{"h": {"N": "0"}, "r": {"S": "a"}}])
+        )
+        self.assertEqual(list(self.table.find({"h": 0})), [{"h": 0, "r": "a"}])
+
+    def test_find_with_scan(self):
+        self.expect_describe_table()
+        self.connection.expect._call_.withArguments(
+            self.ActionChecker("Scan", {"TableName": "Aaa", "FilterExpression": "#lvf0=:lvf0", "ExpressionAttributeNames": {"#lvf0": "r"}, "ExpressionAttributeValues": {":lvf0": {"S": "a"}}})
+        ).andReturn(
+            _lv.ScanResponse(Items=[{"h": {"N": "0"}, "r": {"S": "a"}}])
+        )
+        self.assertEqual(list(self.table.find({"r": "a"})), [{"h": 0, "r": "a"}])
+
+    def test_plan_get_item(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"h": 0, "r": "a"}, ["a"])
+        self.assertEqual(plan.action.payload, {"TableName": "Aaa", "Key": {"h": {"N": "0"}, "r": {"S": "a"}}, "ProjectionExpression": "a"})
+        self.assertIsNone(plan.index_name)
+        self.assertEqual(plan.explanation, "GetItem on table Aaa: the conditions are its primary key")
+
+    def test_plan_query_on_table(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"h": 0})
+        self.assertEqual(plan.action.payload, {"TableName": "Aaa", "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}}})
+        self.assertIsNone(plan.index_name)
+        self.assertEqual(plan.explanation, "Query on table Aaa: its key matches the conditions on h")
+
+    def test_plan_prefers_index_matching_range_key(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"h": 0, "lr": 3})
+        self.assertEqual(plan.action.payload, {"TableName": "Aaa", "IndexName": "lsi", "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}, "lr": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "3"}]}}})
+        self.assertEqual(plan.index_name, "lsi")
+        self.assertEqual(plan.explanation, "Query on index lsi (projection ALL) of table Aaa: its key matches the conditions on h, lr")
+
+    def test_plan_filters_other_conditions(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"h": 0, "a": 1, "b": 2})
+        self.assertEqual(
+            plan.action.payload,
+            {
+                "TableName": "Aaa",
+                "KeyConditions": {"h": {"ComparisonOperator": "EQ", "AttributeValueList": [{"N": "0"}]}},
+                "FilterExpression": "#lvf0=:lvf0 AND #lvf1=:lvf1",
+                "ExpressionAttributeNames": {"#lvf0": "a", "#lvf1": "b"},
+                "ExpressionAttributeValues": {":lvf0": {"N": "1"}, ":lvf1": {"N": "2"}},
+            }
+        )
+        self.assertEqual(plan.explanation, "Query on table Aaa: its key matches the conditions on h, filtered on a, b")
+
+    def test_plan_chooses_keys_only_index(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"gh": "x"}, ["h", "r"])
+        self.assertEqual(plan.index_name, "gsi")
+        self.assertEqual(plan.action.payload["ProjectionExpression"], "h, r")
+        self.assertEqual(plan.explanation, "Query on index gsi (projection KEYS_ONLY) of table Aaa: its key matches the conditions on gh")
+
+    def test_plan_chooses_include_index(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"gh": "x"}, ["a"])
+        self.assertEqual(plan.index_name, "gsi2")
+        self.assertEqual(plan.explanation, "Query on index gsi2 (projection INCLUDE) of table Aaa: its key matches the conditions on gh")
+
+    def test_plan_projection_must_contain_filtered_attributes(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"gh": "x", "c": 0}, ["a"])
+        self.assertEqual(plan.index_name, "gsi3")
+        self.assertEqual(plan.explanation, "Query on index gsi3 (projection ALL) of table Aaa: its key matches the conditions on gh, filtered on c")
+
+    def test_plan_chooses_all_index_for_all_attributes(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"gh": "x"})
+        self.assertEqual(plan.index_name, "gsi3")
+
+    def test_plan_scan(self):
+        self.expect_describe_table()
+        plan = self.table.plan({"r": "a"}, ["h"])
+        self.assertEqual(plan.action.payload, {"TableName": "Aaa", "FilterExpression": "#lvf0=:lvf0", "ExpressionAttributeNames": {"#lvf0": "r"}, "ExpressionAttributeValues": {":lvf0": {"S": "a"}}, "ProjectionExpression": "h"})
+        self.assertIsNone(plan.index_name)
+        self.assertEqual(plan.explanation, "Scan of table Aaa filtered on r: no key or index matches the conditions and the attributes to return")
+
+    def test_metadata_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            metadata_file = os.path.join(directory, "metadata.json")
+            self.table = Table(self.connection.object, "Aaa", metadata_file=metadata_file)
+            self.expect_describe_table()
+            self.assertEqual(self.table.key_names, ["h", "r"])
+
+            # No DescribeTable this time
+            other = Table(self.connection.object, "Aaa", metadata_file=metadata_file)
+            self.assertEqual(other.key_names, ["h", "r"])
+            self.assertEqual(other.indexes, {"gsi": ["gh"], "gsi2": ["gh"], "gsi3": ["gh"], "lsi": ["h", "lr"]})
+            self.assertEqual(os.listdir(directory), ["metadata.json"])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_metadata_file_in_previous_format(self):
+        directory = tempfile.mkdtemp()
+        try:
+            metadata_file = os.path.join(directory, "metadata.json")
+            with open(metadata_file, "w") as f:
+                json.dump({"Aaa": {"key": ["h", "r"], "indexes": {"gsi": ["gh"]}, "types": {"h": "N", "r": "S"}}}, f)
+            self.table = Table(self.connection.object, "Aaa", metadata_file=metadata_file)
+            self.expect_describe_table()
+            self.assertEqual(self.table.plan({"gh": "x"}).index_name, "gsi3")
+            with open(metadata_file) as f:
+                self.assertEqual(json.load(f)["Aaa"]["format"], 2)
+        finally:
+            shutil.rmtree(directory)
@@ -9,6 +9,7 @@ import os
 import stat
 import subprocess
 import tarfile
+import unittest
 
 import requests
 try:
@@ -23,6 +24,14 @@ except ImportError:  # pragma no cover (Test code)
 import LowVoltage as _lv
 
 
+# Set LOWVOLTAGE_STAND_IN=1 to run the local integration tests against LowVoltage.stand_in instead of DynamoDB Local
+on_stand_in = bool(os.environ.get("LOWVOLTAGE_STAND_IN"))
+
+
+def skip_on_stand_in(reason):
+    return unittest.skipIf(on_stand_in, "The stand-in " + reason)
+
+
 class DynamoDbLocalResourceManager(TestResourceManager):
     def make(self, dependencies):
         self.__download_if_needed()
@@ -53,8 +62,20 @@ class DynamoDbLocalResourceManager(TestResourceManager):
         self.__process.kill()
 
 
+class StandInResourceManager(TestResourceManager):
+    # Same as DynamoDbLocalResourceManager, without Java nor network access
+    def make(self, dependencies):
+        from LowVoltage.stand_in import Server
+        self.__server = Server()
+        self.__server.start()
+        return self.__server.connection(retry_policy=_lv.ExponentialBackoffRetryPolicy(1, 2, 5))
+
+    def clean(self, resource):
+        self.__server.stop()
+
+
 class LocalIntegTests(ResourcedTestCase):
-    resources = [("connection", DynamoDbLocalResourceManager())]
+    resources = [("connection", StandInResourceManager() if on_stand_in else DynamoDbLocalResourceManager())]
 
     before_start = datetime.datetime.utcnow()
     after_end = before_start + datetime.timedelta(minutes=10)
@@ -4,8 +4,13 @@
 
 import LowVoltage.testing as _tst
 from LowVoltage.actions.tests.unit import *
+from LowVoltage.benchmarks.tests.unit import *
 from LowVoltage.compounds.tests.unit import *
 from LowVoltage.connection.tests.unit import *
+from LowVoltage.stand_in.tests.unit import *
+from LowVoltage.table.tests.unit import *
+from .test_lazy import LazyExportsUnitTests
+from .test_variadic import LazyFlattenTestCase, PurelyVariadicFunctionTestCase, NotOnlyVariadicFunctionTestCase
 
 
 if __name__ == "__main__":  # pragma no branch (Test code)
@@ -0,0 +1,60 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import json
+import subprocess
+import sys
+
+import LowVoltage as _lv
+import LowVoltage.testing as _tst
+
+
+class LazyExportsUnitTests(_tst.UnitTests):
+    def loaded_modules(self, code):
+        code += "\nimport json, sys\nprint(json.dumps(sorted(m for m in sys.modules if m.startswith('LowVoltage'))))"
+        return json.loads(subprocess.check_output([sys.executable, "-c", code]).decode("utf8"))
+
+    def test_import_loads_nothing(self):
+        self.assertEqual(self.loaded_modules("import LowVoltage"), ["LowVoltage", "LowVoltage.attribute_types", "LowVoltage.exceptions", "LowVoltage.lazy"])
+
+    def test_only_used_modules_are_loaded(self):
+        modules = self.loaded_modules("from LowVoltage import Connection, GetItem, PutItem, STRING")
+        self.assertIn("LowVoltage.actions.get_item", modules)
+        self.assertIn("LowVoltage.actions.put_item", modules)
+        self.assertIn("LowVoltage.connection.connection", modules)
+        self.assertNotIn("LowVoltage.actions.create_table", modules)
+        self.assertNotIn("LowVoltage.actions.update_table", modules)
+        self.assertNotIn("LowVoltage.connection.caching", modules)
+        self.assertNotIn("LowVoltage.compounds", modules)
+        self.assertNotIn("LowVoltage.table", modules)
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from LowVoltage import *", namespace)
+        del namespace["__builtins__"]
+        self.assertEqual(sorted(namespace.keys()), sorted(_lv.__all__))
+        self.assertIs(namespace["GetItem"], _lv.actions.get_item.GetItem)
+        self.assertIs(namespace["batch_put_item"], sys.modules["LowVoltage.compounds.batch_put_item"].batch_put_item)
+        self.assertIs(namespace["ServerError"], _lv.exceptions.ServerError)
+        self.assertEqual(namespace["STRING"], "S")
+
+    def test_dir(self):
+        self.assertIn("GetItem", dir(_lv))
+        self.assertIn("iterate_scan", dir(_lv))
+        self.assertIn("ValidationException", dir(_lv))
+        self.assertIn("__doc__", dir(_lv))
+        self.assertIn("Connection", dir(_lv.connection))
+
+    def test_submodules(self):
+        modules = self.loaded_modules("import LowVoltage\nLowVoltage.connection.retry_policies.ExponentialBackoffRetryPolicy")
+        self.assertIn("LowVoltage.connection.retry_policies", modules)
+        self.assertNotIn("LowVoltage.connection.caching", modules)
+        self.assertIs(_lv.connection.retry_policies.ExponentialBackoffRetryPolicy, _lv.ExponentialBackoffRetryPolicy)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError) as catcher:
+            _lv.Foo
+        self.assertEqual(catcher.exception.args, ("module 'LowVoltage' has no attribute 'Foo'",))
+        self.assertFalse(hasattr(_lv.actions, "Bar"))
+        self.assertFalse(hasattr(_lv.connection, "retry_policies_typo"))
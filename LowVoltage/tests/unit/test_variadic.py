@@ -0,0 +1,126 @@
+# coding: utf8
+
+# Copyright 2014-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import inspect
+import unittest
+
+from LowVoltage.variadic import variadic, lazy_flatten
+
+
+class LazyFlattenTestCase(unittest.TestCase):
+    def test_mix(self):
+        self.assertEqual(list(lazy_flatten(int, (1, [2, 3], (4, 5), range(6, 8)))), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_lazy(self):
+        def gen():
+            yield 1
+            raise Exception
+        flat = lazy_flatten(int, (0, gen()))
+        self.assertEqual(next(flat), 0)
+        self.assertEqual(next(flat), 1)
+        with self.assertRaises(Exception):
+            next(flat)
+
+
+class PurelyVariadicFunctionTestCase(unittest.TestCase):
+    def setUp(self):
+        @variadic(int)
+        def f(*xs):
+            "f's doc"
+            return xs
+        self.f = f
+        @variadic(int)
+        def g(*ys):
+            "g's doc"
+            return ys
+        self.g = g
+
+    def test_name_is_preserved(self):
+        self.assertEqual(self.f.__name__, "f")
+        self.assertEqual(self.g.__name__, "g")
+
+    def test_doc_is_preserved(self):
+        self.assertEqual(self.f.__doc__, "Note that this function is variadic. See :ref:`variadic-functions`.\n\nf's doc")
+        self.assertEqual(self.g.__doc__, "Note that this function is variadic. See :ref:`variadic-functions`.\n\ng's doc")
+
+    def test_argspec_keeps_param_name(self):
+        self.assertEqual(inspect.getfullargspec(self.f).varargs, "xs")
+        self.assertEqual(inspect.getfullargspec(self.g).varargs, "ys")
+
+    def test_call_without_arguments(self):
+        self.assertEqual(self.f(), ())
+
+    def test_call_with_one_argument(self):
+        self.assertEqual(self.f(1), (1,))
+
+    def test_call_with_several_arguments(self):
+        self.assertEqual(self.f(1, 2, 3), (1, 2, 3))
+
+    def test_call_with_one_list(self):
+        self.assertEqual(self.f([1, 2, 3]), (1, 2, 3))
+
+    def test_call_with_several_lists(self):
+        self.assertEqual(self.f([1, 2], [3], [4, 5]), (1, 2, 3, 4, 5))
+
+    def test_call_with_lists_and_arguments(self):
+        self.assertEqual(self.f([1, 2], 3, 4, [5, 6], 7), (1, 2, 3, 4, 5, 6, 7))
+
+    def test_call_with_keywords(self):
+        with self.assertRaises(TypeError) as catcher:
+            self.f(a=1)
+        # Since Python 3.10, the message starts with the qualified name of the function
+        self.assertTrue(catcher.exception.args[0].endswith("f() got an unexpected keyword argument 'a'"))
+        with self.assertRaises(TypeError) as catcher:
+            self.g(a=1)
+        self.assertTrue(catcher.exception.args[0].endswith("g() got an unexpected keyword argument 'a'"))
+
+
+class NotOnlyVariadicFunctionTestCase(unittest.TestCase):
+    def test_args_before_varargs(self):
+        @variadic(int)
+        def f(a, b, *xs):
+            return a, b, xs
+        self.assertEqual(f(1, 2, 3, [4, 5], 6), (1, 2, (3, 4, 5, 6)))
+
+    @variadic(int)
+    def f(self, a, b, *xs):
+        return self, a, b, xs
+
+    def test_method(self):
+        self.assertEqual(self.f(1, 2, 3, [4, 5], 6), (self, 1, 2, (3, 4, 5, 6)))
+
+    def test_kwds_after_varargs(self):
+        @variadic(int)
+        def f(a, b, *xs, **kwds):
+            return a, b, xs, kwds
+        self.assertEqual(f(1, 2, 3, [4, 5], 6, c=7, d=8), (1, 2, (3, 4, 5, 6), {"c": 7, "d": 8}))
+
+    def test_defaults_on_args_before_varargs(self):
+        default = object()  # To avoid implementations wich would stringify the default values and feed them to exec.
+        @variadic(int)
+        def f(a=None, b=default, *xs):
+            return a, b, xs
+        self.assertEqual(f(), (None, default, ()))
+
+    def test_keyword_only_args_after_varargs(self):
+        @variadic(int)
+        def f(a, *xs, b, c=3):
+            return a, xs, b, c
+        self.assertEqual(f(1, [2, 3], 4, b=5), (1, (2, 3, 4), 5, 3))
+        self.assertEqual(f(1, b=5, c=6), (1, (), 5, 6))
+        with self.assertRaises(TypeError):
+            f(1, 2)
+
+    def test_closures(self):
+        a = 42
+        @variadic(int)
+        def f(*xs):
+            return a, xs
+        self.assertEqual(f(1, 2), (42, (1, 2)))
+        a = 57
+        self.assertEqual(f(1, 2), (57, (1, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,9 @@
 
 # Copyright 2015 Vincent Jacques <vincent@vincent-jacques.net>
 
-# This file comes from http://github.com/jacquev6/variadic and has been slightly altered to add a remark in the docstring.
+# This file comes from http://github.com/jacquev6/variadic and has been slightly altered to add a remark in the docstring
+# and to expose the flattening function (for functions that need to consume their arguments lazily).
+# Its unit tests have been moved to LowVoltage/tests/unit/test_variadic.py so that importing it doesn't import unittest.
 # Why duplicate instead of depend on? Because I like the idea of a "standalone" client. Might not be my best idea.
 
 """
@@ -28,12 +30,12 @@ So far, no change, but it can also be called with lists (any iterable, in fact)
     ()
     >>> f([1, 2, 3], (4, 5, 6))
     (1, 2, 3, 4, 5, 6)
-    >>> f(xrange(1, 4))
+    >>> f(range(1, 4))
     (1, 2, 3)
 
 And you can even mix them:
 
-    >>> f(1, [2, 3], (4, 5), xrange(6, 8))
+    >>> f(1, [2, 3], (4, 5), range(6, 8))
     (1, 2, 3, 4, 5, 6, 7)
 
 Positional arguments, default values and keyword arguments are OK as well:
@@ -91,10 +93,11 @@ Exception raised by the decorated function
 import ast
 import functools
 import inspect
-import itertools
 import sys
 import types
-import unittest
+
+# FunctionDef nodes have type parameters since Python 3.12 (PEP 695)
+_type_params = {"type_params": []} if sys.version_info >= (3, 12) else {}
 
 # Todo-list:
 # - allow passing the flatten function instead of typ
@@ -123,60 +126,44 @@ def variadic(typ):
         Others will be iterated and their contents will be passed.
     """
     def flatten(args):
-        flat = []
-        for arg in args:
-            if isinstance(arg, typ):
-                flat.append((arg,))
-            else:
-                flat.append(arg)
-        return itertools.chain.from_iterable(flat)
+        return lazy_flatten(typ, args)
 
     def decorator(wrapped):
-        spec = inspect.getargspec(wrapped)
+        spec = inspect.getfullargspec(wrapped)
         name = wrapped.__name__
 
         assert spec.varargs is not None
 
-        # Example was generated with print ast.dump(ast.parse("def f(a, b, *args, **kwds): return call_wrapped((a, b), args, kwds)"), include_attributes=True)
+        # Example was generated with print(ast.dump(ast.parse("def f(a, b, *args, c, **kwds): return wrapped(a, b, *flatten(args), c=c, **kwds)"), include_attributes=True))
         # http://code.activestate.com/recipes/578353-code-to-source-and-back/ helped a lot
         # http://stackoverflow.com/questions/10303248#29927459
-        if sys.hexversion < 0x03000000:
-            wrapper_ast_args = ast.arguments(
-                    args=[ast.Name(id=a, ctx=ast.Param(), lineno=1, col_offset=0) for a in spec.args],
-                    vararg=spec.varargs,
-                    kwarg=spec.keywords,
-                    defaults=[]
-                )
-        else:
-            wrapper_ast_args = ast.arguments(
-                args=[ast.arg(arg=a, annotation=None, lineno=1, col_offset=0) for a in spec.args],
-                vararg=None if spec.varargs is None else ast.arg(arg=spec.varargs, annotation=None, lineno=1, col_offset=0),
-                kwonlyargs=[],
-                kw_defaults=[],
-                kwarg=None if spec.keywords is None else ast.arg(arg=spec.keywords, annotation=None, lineno=1, col_offset=0),
-                defaults=[]
-            )
+        def load(id):
+            return ast.Name(id=id, ctx=ast.Load())
+
         wrapper_ast = ast.Module(body=[ast.FunctionDef(
             name=name,
-            args=wrapper_ast_args,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=a, annotation=None) for a in spec.args],
+                vararg=ast.arg(arg=spec.varargs, annotation=None),
+                kwonlyargs=[ast.arg(arg=a, annotation=None) for a in spec.kwonlyargs],
+                kw_defaults=[None for a in spec.kwonlyargs],
+                kwarg=None if spec.varkw is None else ast.arg(arg=spec.varkw, annotation=None),
+                defaults=[]
+            ),
             body=[ast.Return(value=ast.Call(
-                func=ast.Name(id="wrapped", ctx=ast.Load(), lineno=1, col_offset=0),
-                args=[ast.Name(id=a, ctx=ast.Load(), lineno=1, col_offset=0) for a in spec.args],
-                keywords=[],
-                starargs=ast.Call(
-                    func=ast.Name(id="flatten", ctx=ast.Load(), lineno=1, col_offset=0),
-                    args=[ast.Name(id=spec.varargs, ctx=ast.Load(), lineno=1, col_offset=0)],
-                    keywords=[], starargs=None, kwargs=None, lineno=1, col_offset=0
-                ),
-                kwargs=None if spec.keywords is None else ast.Name(id=spec.keywords, ctx=ast.Load(), lineno=1, col_offset=0),
-                lineno=1, col_offset=0
-            ), lineno=1, col_offset=0)],
+                func=load("wrapped"),
+                args=[load(a) for a in spec.args] + [ast.Starred(value=ast.Call(func=load("flatten"), args=[load(spec.varargs)], keywords=[]), ctx=ast.Load())],
+                keywords=[ast.keyword(arg=a, value=load(a)) for a in spec.kwonlyargs] + ([] if spec.varkw is None else [ast.keyword(arg=None, value=load(spec.varkw))]),
+            ))],
             decorator_list=[],
-            lineno=1,
-            col_offset=0
-        )])
+            returns=None,
+            **_type_params
+        )], type_ignores=[])
+        ast.fix_missing_locations(wrapper_ast)
         wrapper_code = [c for c in compile(wrapper_ast, "<ast_in_variadic_py>", "exec").co_consts if isinstance(c, types.CodeType)][0]
         wrapper = types.FunctionType(wrapper_code, {"wrapped": wrapped, "flatten": flatten}, argdefs=spec.defaults)
+        wrapper.__kwdefaults__ = spec.kwonlydefaults
 
         functools.update_wrapper(wrapper, wrapped)
         if wrapper.__doc__ is not None:
@@ -185,93 +172,20 @@ def variadic(typ):
     return decorator
 
 
-class PurelyVariadicFunctionTestCase(unittest.TestCase):
-    def setUp(self):
-        @variadic(int)
-        def f(*xs):
-            "f's doc"
-            return xs
-        self.f = f
-        @variadic(int)
-        def g(*ys):
-            "g's doc"
-            return ys
-        self.g = g
-
-    def test_name_is_preserved(self):
-        self.assertEqual(self.f.__name__, "f")
-        self.assertEqual(self.g.__name__, "g")
-
-    def test_doc_is_preserved(self):
-        self.assertEqual(self.f.__doc__, "f's doc")
-        self.assertEqual(self.g.__doc__, "g's doc")
-
-    def test_argspec_keeps_param_name(self):
-        self.assertEqual(inspect.getargspec(self.f).varargs, "xs")
-        self.assertEqual(inspect.getargspec(self.g).varargs, "ys")
-
-    def test_call_without_arguments(self):
-        self.assertEqual(self.f(), ())
-
-    def test_call_with_one_argument(self):
-        self.assertEqual(self.f(1), (1,))
-
-    def test_call_with_several_arguments(self):
-        self.assertEqual(self.f(1, 2, 3), (1, 2, 3))
-
-    def test_call_with_one_list(self):
-        self.assertEqual(self.f([1, 2, 3]), (1, 2, 3))
-
-    def test_call_with_several_lists(self):
-        self.assertEqual(self.f([1, 2], [3], [4, 5]), (1, 2, 3, 4, 5))
-
-    def test_call_with_lists_and_arguments(self):
-        self.assertEqual(self.f([1, 2], 3, 4, [5, 6], 7), (1, 2, 3, 4, 5, 6, 7))
-
-    def test_call_with_keywords(self):
-        with self.assertRaises(TypeError) as catcher:
-            self.f(a=1)
-        self.assertEqual(catcher.exception.args, ("f() got an unexpected keyword argument 'a'",))
-        with self.assertRaises(TypeError) as catcher:
-            self.g(a=1)
-        self.assertEqual(catcher.exception.args, ("g() got an unexpected keyword argument 'a'",))
-
-
-class NotOnlyVariadicFunctionTestCase(unittest.TestCase):
-    def test_args_before_varargs(self):
-        @variadic(int)
-        def f(a, b, *xs):
-            return a, b, xs
-        self.assertEqual(f(1, 2, 3, [4, 5], 6), (1, 2, (3, 4, 5, 6)))
-
-    @variadic(int)
-    def f(self, a, b, *xs):
-        return self, a, b, xs
-
-    def test_method(self):
-        self.assertEqual(self.f(1, 2, 3, [4, 5], 6), (self, 1, 2, (3, 4, 5, 6)))
-
-    def test_kwds_after_varargs(self):
-        @variadic(int)
-        def f(a, b, *xs, **kwds):
-            return a, b, xs, kwds
-        self.assertEqual(f(1, 2, 3, [4, 5], 6, c=7, d=8), (1, 2, (3, 4, 5, 6), {"c": 7, "d": 8}))
-
-    def test_defaults_on_args_before_varargs(self):
-        default = object()  # To avoid implementations wich would stringify the default values and feed them to exec.
-        @variadic(int)
-        def f(a=None, b=default, *xs):
-            return a, b, xs
-        self.assertEqual(f(), (None, default, ()))
-
-    def test_closures(self):
-        a = 42
-        @variadic(int)
-        def f(*xs):
-            return a, xs
-        self.assertEqual(f(1, 2), (42, (1, 2)))
-        a = 57
-        self.assertEqual(f(1, 2), (57, (1, 2)))
+def lazy_flatten(typ, args):
+    """
+    Iterate over ``args`` as a function decorated by ``@variadic(typ)`` would receive them, without building a tuple.
+    Iterables in ``args`` are iterated only when needed.
+
+    Useful for functions that must consume a large (or unbounded) number of arguments with a bounded memory footprint:
+    they can be declared like ``def f(*xs)`` (without the decorator) and iterate over ``lazy_flatten(typ, xs)``.
+    """
+    for arg in args:
+        if isinstance(arg, typ):
+            yield arg
+        else:
+            for x in arg:
+                yield x
 
 
 @variadic(int)
@@ -285,7 +199,3 @@ def demo(a, b=None, *xs, **kwds):
     :param kwds: keywords
     """
     pass
-
-
-if __name__ == "__main__":
-    unittest.main()
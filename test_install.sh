@@ -2,13 +2,13 @@
 
 set -e
 
-pip2 install virtualenv
+pip3 install virtualenv
 
 dir=virtualenv_setup_install
 rm -rf $dir
 virtualenv $dir
 . $dir/bin/activate
-python2 setup.py install
+python3 setup.py install
 cd $dir
 python -c "import LowVoltage"
 python -m LowVoltage.tests
@@ -25,7 +25,7 @@ rm -rf $dir
 virtualenv $dir
 cd $dir
 . ./bin/activate
-pip2 install LowVoltage
+pip3 install LowVoltage
 python -c "import LowVoltage"
 python -m LowVoltage.tests
 deactivate